@@ -0,0 +1,90 @@
+'''
+    Measure how much a Python thread progresses while the GL thread reads back data.
+
+    The worker thread counts loop iterations. Its rate during the readbacks is
+    compared to its rate while the main thread sleeps. A ratio close to 1.0 means
+    the readbacks do not hold the GIL.
+
+    Each benchmark runs at least --repeat times and at least --min-time seconds,
+    so that the small sizes last long enough for the worker to be scheduled.
+    The time per call is reported next to the ratio.
+
+    usage: python threaded_readback.py [--size 4096] [--repeat 20] [--min-time 1.0]
+'''
+
+import argparse
+import threading
+import time
+
+import moderngl
+
+
+class Worker(threading.Thread):
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.counter = 0
+        self.running = True
+
+    def run(self):
+        while self.running:
+            self.counter += 1
+
+
+def measure(worker, func, repeat, min_time):
+    calls = 0
+    start_counter, start_time = worker.counter, time.perf_counter()
+    while calls < repeat or time.perf_counter() - start_time < min_time:
+        func()
+        calls += 1
+    elapsed = time.perf_counter() - start_time
+    return elapsed / calls, (worker.counter - start_counter) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=4096)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--min-time', type=float, default=1.0)
+    args = parser.parse_args()
+
+    ctx = moderngl.create_standalone_context()
+    size = (args.size, args.size)
+
+    fbo = ctx.simple_framebuffer(size)
+    fbo.use()
+    fbo.clear(0.25, 0.5, 0.75, 1.0)
+
+    texture = ctx.texture(size, 4)
+    buffer = ctx.buffer(reserve=args.size * args.size * 4)
+    target = bytearray(buffer.size)
+
+    def clear_and_finish():
+        fbo.clear(0.25, 0.5, 0.75, 1.0)
+        ctx.finish()
+
+    benchmarks = [
+        ('Context.finish', clear_and_finish),
+        ('Framebuffer.read', lambda: fbo.read(components=4)),
+        ('Framebuffer.read_into', lambda: fbo.read_into(target, components=4)),
+        ('Texture.read', lambda: texture.read()),
+        ('Buffer.read', lambda: buffer.read()),
+        ('Buffer.read_into', lambda: buffer.read_into(target)),
+        ('Buffer.write', lambda: buffer.write(target)),
+    ]
+
+    worker = Worker()
+    worker.start()
+
+    _, idle = measure(worker, lambda: time.sleep(0.01), args.repeat, args.min_time)
+    print('%-24s %12s %14.0f iterations/s' % ('idle', '', idle))
+
+    for name, func in benchmarks:
+        call_time, rate = measure(worker, func, args.repeat, args.min_time)
+        print('%-24s %9.3f ms %14.0f iterations/s  ratio: %.2f' % (name, call_time * 1000.0, rate, rate / idle))
+
+    worker.running = False
+    worker.join()
+
+
+if __name__ == '__main__':
+    main()
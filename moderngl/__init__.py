@@ -4,15 +4,23 @@
 
 from .error import *
 from .buffer import *
+from .buffer_arena import *
+from .buffer_format import *
 from .compute_shader import *
 from .conditional_render import *
 from .context import *
+from .draw_stats import *
 from .framebuffer import *
+from .multi_buffer import *
+from .pipeline_state import *
 from .program import *
 from .program_members import *
 from .query import *
+from .readback import *
+from .recorder import *
 from .renderbuffer import *
 from .scope import *
+from .stream_buffer import *
 from .texture import *
 from .texture_3d import *
 from .texture_array import *
@@ -1,4 +1,25 @@
-__all__ = ['Buffer']
+import struct
+from array import array
+from contextlib import contextmanager
+
+from .readback import Readback, readback
+
+__all__ = ['Buffer',
+           'MAP_READ', 'MAP_WRITE', 'MAP_PERSISTENT', 'MAP_COHERENT', 'DYNAMIC_STORAGE', 'CLIENT_STORAGE']
+
+
+MAP_READ = 0x0001
+MAP_WRITE = 0x0002
+MAP_PERSISTENT = 0x0040
+MAP_COHERENT = 0x0080
+DYNAMIC_STORAGE = 0x0100
+CLIENT_STORAGE = 0x0200
+
+_DTYPES = {
+    'f2': 'e', 'f4': 'f', 'f8': 'd',
+    'u1': 'B', 'u2': 'H', 'u4': 'I',
+    'i1': 'b', 'i2': 'h', 'i4': 'i',
+}
 
 
 class Buffer:
@@ -14,12 +35,14 @@ class Buffer:
         Copy buffer content using :py:meth:`Context.copy_buffer`.
     '''
 
-    __slots__ = ['mglo', '_size', '_dynamic', '_glo', 'ctx', 'extra']
+    __slots__ = ['mglo', '_size', '_dynamic', '_immutable', '_flags', '_glo', 'ctx', 'extra', '__weakref__']
 
     def __init__(self):
         self.mglo = None
         self._size = None
         self._dynamic = None
+        self._immutable = None
+        self._flags = None
         self._glo = None
         self.ctx = None
         self.extra = None  #: Any - Attribute for storing user defined objects
@@ -28,6 +51,10 @@ class Buffer:
     def __repr__(self):
         return '<Buffer: %d>' % self.glo
 
+    def __del__(self):
+        if getattr(self, 'ctx', None) is not None:
+            self.ctx._collect(self)
+
     def __eq__(self, other):
         return type(self) is type(other) and self.mglo is other.mglo
 
@@ -47,6 +74,24 @@ class Buffer:
 
         return self._dynamic
 
+    @property
+    def immutable(self) -> bool:
+        '''
+            bool: Is the buffer created with immutable storage?
+        '''
+
+        return self._immutable
+
+    @property
+    def flags(self) -> int:
+        '''
+            int: The storage flags of an immutable buffer.
+            A combination of :py:data:`MAP_READ`, :py:data:`MAP_WRITE`, :py:data:`MAP_PERSISTENT`,
+            :py:data:`MAP_COHERENT`, :py:data:`DYNAMIC_STORAGE` and :py:data:`CLIENT_STORAGE`.
+        '''
+
+        return self._flags
+
     @property
     def glo(self) -> int:
         '''
@@ -115,6 +160,32 @@ class Buffer:
 
         return self.mglo.read_into(buffer, size, offset, write_offset)
 
+    def read_async(self, size=-1, offset=0, *, buffer=None, write_offset=0) -> Readback:
+        '''
+            Start reading the content of the buffer without waiting for the GPU.
+
+            The content is copied into a staging buffer and a fence is inserted after the copy.
+
+            Args:
+                size (int): The size. Value ``-1`` means all.
+                offset (int): The offset.
+
+            Keyword Args:
+                buffer (Buffer): The staging buffer. A new buffer is created when ``None``.
+                write_offset (int): The write offset in the staging buffer.
+
+            Returns:
+                :py:class:`Readback` object
+        '''
+
+        if size < 0:
+            size = self.size - offset
+
+        def copy(staging, write_offset):
+            self.ctx.copy_buffer(staging, self, size, read_offset=offset, write_offset=write_offset)
+
+        return readback(self.ctx, size, buffer, write_offset, copy)
+
     def read_chunks(self, chunk_size, start, step, count) -> bytes:
         '''
             Read the content.
@@ -154,18 +225,78 @@ class Buffer:
 
         return self.mglo.read(buffer, chunk_size, start, step, count, write_offset)
 
-    def clear(self, size=-1, *, offset=0, chunk=None) -> None:
+    def write_ranges(self, data, offsets, sizes) -> None:
+        '''
+            Write the content into multiple ranges with a single mapping.
+
+            The data is split into consecutive pieces of the given sizes.
+            The offsets and sizes can be lists or arrays of 32 or 64 bit integers.
+
+            Args:
+                data (bytes): The concatenated content of the ranges.
+                offsets (array): The offsets of the ranges.
+                sizes (array): The sizes of the ranges.
+        '''
+
+        self.mglo.write_ranges(data, _int_array(offsets), _int_array(sizes))
+
+    def read_ranges(self, offsets, sizes) -> bytes:
+        '''
+            Read and concatenate multiple ranges with a single mapping.
+
+            The offsets and sizes can be lists or arrays of 32 or 64 bit integers.
+
+            Args:
+                offsets (array): The offsets of the ranges.
+                sizes (array): The sizes of the ranges.
+
+            Returns:
+                bytes
+        '''
+
+        return self.mglo.read_ranges_into(None, _int_array(offsets), _int_array(sizes), 0)
+
+    def read_ranges_into(self, buffer, offsets, sizes, *, write_offset=0) -> None:
+        '''
+            Read and concatenate multiple ranges into a buffer with a single mapping.
+
+            Args:
+                buffer (bytearray): The buffer that will receive the content.
+                offsets (array): The offsets of the ranges.
+                sizes (array): The sizes of the ranges.
+
+            Keyword Args:
+                write_offset (int): The write offset.
+        '''
+
+        self.mglo.read_ranges_into(buffer, _int_array(offsets), _int_array(sizes), write_offset)
+
+    def clear(self, size=-1, *, offset=0, chunk=None, value=None, dtype='f4') -> None:
         '''
             Clear the content.
 
+            The clear runs on the GPU with ``glClearBufferSubData`` when OpenGL 4.3
+            or ``GL_ARB_clear_buffer_object`` is supported, the chunk is 1, 2, 4, 8, 12 or 16 bytes long
+            and the offset is a multiple of it. The chunk must divide the size.
+            Otherwise the buffer is mapped and filled on the CPU.
+
             Args:
                 size (int): The size. Value ``-1`` means all.
 
             Keyword Args:
                 offset (int): The offset.
                 chunk (bytes): The chunk to use repeatedly.
+                value (tuple): The value to use repeatedly instead of the chunk.
+                               A single number or a tuple of up to 4 numbers.
+                dtype (str): The data type of the value.
         '''
 
+        if value is not None:
+            if chunk is not None:
+                raise ValueError('chunk and value cannot be used together')
+
+            chunk = _pack_value(value, dtype)
+
         self.mglo.clear(size, offset, chunk)
 
     def bind_to_uniform_block(self, binding=0, *, offset=0, size=-1) -> None:
@@ -196,6 +327,41 @@ class Buffer:
 
         self.mglo.bind_to_storage_buffer(binding, offset, size)
 
+    @contextmanager
+    def map(self, offset=0, size=-1, *, read=True, write=True, invalidate=False, unsynchronized=False):
+        '''
+            Map a range of the buffer and return a memoryview over the mapping.
+            The buffer is unmapped when the ``with`` block ends.
+
+            The memoryview can be wrapped with ``numpy.frombuffer`` to read or fill
+            the buffer without an intermediate copy. The views created from it point into
+            the mapped memory. When such views are still alive at the end of the ``with`` block
+            the buffer stays mapped until the last of them is released.
+            A mapped buffer must not be used by OpenGL, drop the views before rendering with the buffer.
+
+            Args:
+                offset (int): The offset.
+                size (int): The size. Value ``-1`` means all.
+
+            Keyword Args:
+                read (bool): The mapping is readable.
+                write (bool): The mapping is writable.
+                invalidate (bool): Discard the previous content of the range.
+                unsynchronized (bool): Do not wait for the pending draw calls using the buffer.
+        '''
+
+        view = self.mglo.map(offset, size, read, write, invalidate, unsynchronized)
+
+        try:
+            yield view
+        finally:
+            try:
+                view.release()
+            except BufferError:
+                # The views exported from the memoryview defer the unmap.
+                pass
+            self.mglo.unmap()
+
     def orphan(self) -> None:
         '''
             Orphan the buffer.
@@ -220,6 +386,7 @@ class Buffer:
             Release the ModernGL object.
         '''
 
+        self.ctx._untrack(self)
         self.mglo.release()
 
     def bind(self, *attribs, layout=None):
@@ -227,3 +394,24 @@ class Buffer:
 
     def assign(self, index):
         return (self, index)
+
+
+def _pack_value(value, dtype):
+    if dtype not in _DTYPES:
+        raise ValueError('invalid dtype %r' % dtype)
+
+    if not isinstance(value, (tuple, list)):
+        value = (value,)
+
+    if not 1 <= len(value) <= 4:
+        raise ValueError('the value must have 1 to 4 components')
+
+    return struct.pack('%d%s' % (len(value), _DTYPES[dtype]), *value)
+
+
+def _int_array(values):
+    try:
+        memoryview(values)
+        return values
+    except TypeError:
+        return array('q', values)
@@ -0,0 +1,330 @@
+import bisect
+
+from .buffer import Buffer
+from .error import Error
+
+__all__ = ['BufferArena', 'BufferBlock']
+
+
+class BufferBlock:
+    '''
+        A BufferBlock is a range of a :py:class:`Buffer` allocated from a :py:class:`BufferArena`.
+
+        BufferBlocks can be used in place of Buffers when creating a :py:class:`VertexArray`.
+        Both the vertex buffers and the index buffer can be blocks.
+
+        A BufferBlock object cannot be instantiated directly.
+        Use :py:meth:`BufferArena.alloc` to create one.
+    '''
+
+    __slots__ = ['_arena', '_page', '_offset', '_size', '_alignment', 'extra', '__weakref__']
+
+    def __init__(self):
+        self._arena = None
+        self._page = None
+        self._offset = None
+        self._size = None
+        self._alignment = None
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<BufferBlock: %d bytes at %d>' % (self._size, self._offset)
+
+    @property
+    def buffer(self) -> Buffer:
+        '''
+            Buffer: The buffer containing the block.
+        '''
+
+        return self._page.buffer
+
+    @property
+    def offset(self) -> int:
+        '''
+            int: The offset of the block in the buffer.
+            The offset changes when the arena is defragmented.
+        '''
+
+        return self._offset
+
+    @property
+    def size(self) -> int:
+        '''
+            int: The size of the block.
+        '''
+
+        return self._size
+
+    def write(self, data, *, offset=0) -> None:
+        '''
+            Write the content.
+
+            Args:
+                data (bytes): The data.
+
+            Keyword Args:
+                offset (int): The offset in the block.
+        '''
+
+        if offset < 0 or offset + memoryview(data).nbytes > self._size:
+            raise Error('out of range offset = %d or size = %d' % (offset, memoryview(data).nbytes))
+
+        self._page.buffer.write(data, offset=self._offset + offset)
+
+    def read(self, size=-1, *, offset=0) -> bytes:
+        '''
+            Read the content.
+
+            Args:
+                size (int): The size. Value ``-1`` means all.
+
+            Keyword Args:
+                offset (int): The offset in the block.
+
+            Returns:
+                bytes
+        '''
+
+        if size < 0:
+            size = self._size - offset
+
+        if offset < 0 or offset + size > self._size:
+            raise Error('out of range offset = %d or size = %d' % (offset, size))
+
+        return self._page.buffer.read(size, offset=self._offset + offset)
+
+    def bind(self, *attribs, layout=None):
+        return (self, layout, *attribs)
+
+    def free(self) -> None:
+        '''
+            Return the block to the arena.
+        '''
+
+        self._arena.free(self)
+
+
+class BufferArenaPage:
+    __slots__ = ['buffer', 'free', 'blocks']
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.free = [(0, buffer.size)]
+        self.blocks = set()
+
+
+class BufferArena:
+    '''
+        A BufferArena sub-allocates ranges from a few large :py:class:`Buffer` objects.
+
+        Creating a GL buffer for each small mesh has a significant driver overhead.
+        The arena allocates :py:class:`BufferBlock` objects with a first-fit free list,
+        freed ranges are merged with their free neighbours.
+        A new buffer of :py:attr:`BufferArena.page_size` bytes is created when no free range is large enough.
+
+        A BufferArena object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.buffer_arena` to create one.
+    '''
+
+    __slots__ = ['_pages', '_page_size', '_alignment', '_dynamic', '_used', '_high_water', 'ctx', 'extra']
+
+    def __init__(self):
+        self._pages = None
+        self._page_size = None
+        self._alignment = None
+        self._dynamic = None
+        self._used = None
+        self._high_water = None
+        self.ctx = None
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<BufferArena: %d pages>' % len(self._pages)
+
+    @property
+    def page_size(self) -> int:
+        '''
+            int: The size of the buffers.
+        '''
+
+        return self._page_size
+
+    @property
+    def buffers(self) -> tuple:
+        '''
+            tuple: The buffers of the arena.
+        '''
+
+        return tuple(page.buffer for page in self._pages)
+
+    @property
+    def stats(self) -> dict:
+        '''
+            dict: The allocation statistics.
+
+            ``size`` and ``used`` are the allocated and the used bytes.
+            ``high_water`` is the largest value of ``used`` so far.
+            ``fragmentation`` is ``1 - largest_free / free``, ``0.0`` means all the free space is contiguous.
+        '''
+
+        free = sum(size for page in self._pages for offset, size in page.free)
+        largest_free = max((size for page in self._pages for offset, size in page.free), default=0)
+
+        return {
+            'buffers': len(self._pages),
+            'blocks': sum(len(page.blocks) for page in self._pages),
+            'size': len(self._pages) * self._page_size,
+            'used': self._used,
+            'free': free,
+            'largest_free': largest_free,
+            'high_water': self._high_water,
+            'fragmentation': 1.0 - largest_free / free if free else 0.0,
+        }
+
+    def alloc(self, size, *, alignment=None) -> BufferBlock:
+        '''
+            Allocate a block.
+
+            Args:
+                size (int): The size of the block.
+
+            Keyword Args:
+                alignment (int): The alignment of the block offset.
+                                 The default is the alignment of the arena.
+
+            Returns:
+                :py:class:`BufferBlock` object
+        '''
+
+        if alignment is None:
+            alignment = self._alignment
+
+        if size <= 0 or size > self._page_size:
+            raise Error('cannot allocate %d bytes from pages of %d bytes' % (size, self._page_size))
+
+        for page in self._pages:
+            block = self._alloc_from(page, size, alignment)
+            if block is not None:
+                return block
+
+        buffer = self.ctx.buffer(reserve=self._page_size, dynamic=self._dynamic)
+        page = BufferArenaPage(buffer)
+        self._pages.append(page)
+        return self._alloc_from(page, size, alignment)
+
+    def free(self, block) -> None:
+        '''
+            Return a block to the arena.
+
+            Args:
+                block (BufferBlock): The block.
+        '''
+
+        page = block._page
+
+        if block not in page.blocks:
+            raise Error('the block is not allocated')
+
+        page.blocks.remove(block)
+        self._used -= block._size
+
+        start, end = block._offset, block._offset + block._size
+        index = bisect.bisect(page.free, (start, 0))
+
+        if index < len(page.free) and page.free[index][0] == end:
+            end += page.free[index][1]
+            del page.free[index]
+
+        if index and sum(page.free[index - 1]) == start:
+            start = page.free[index - 1][0]
+            del page.free[index - 1]
+            index -= 1
+
+        page.free.insert(index, (start, end - start))
+
+    def defragment(self) -> list:
+        '''
+            Move the blocks to the beginning of their buffers to merge the free ranges.
+            The content is moved on the GPU.
+
+            VertexArrays created from the moved blocks must be recreated.
+
+            Returns:
+                list: The moved blocks.
+        '''
+
+        moved = []
+
+        for page in self._pages:
+            blocks = sorted(page.blocks, key=lambda block: block._offset)
+            targets = []
+            cursor = 0
+
+            for block in blocks:
+                offset = (cursor + block._alignment - 1) // block._alignment * block._alignment
+                targets.append(offset)
+                cursor = offset + block._size
+
+            first = next((i for i, block in enumerate(blocks) if block._offset != targets[i]), None)
+
+            if first is not None:
+                base = targets[first]
+                scratch = self.ctx.buffer(reserve=cursor - base)
+
+                for block, offset in zip(blocks[first:], targets[first:]):
+                    self.ctx.copy_buffer(scratch, page.buffer, block._size,
+                                         read_offset=block._offset, write_offset=offset - base)
+
+                self.ctx.copy_buffer(page.buffer, scratch, cursor - base, write_offset=base)
+                scratch.release()
+
+                for block, offset in zip(blocks[first:], targets[first:]):
+                    if block._offset != offset:
+                        block._offset = offset
+                        moved.append(block)
+
+            page.free = [(cursor, self._page_size - cursor)] if cursor < self._page_size else []
+
+        return moved
+
+    def release(self) -> None:
+        '''
+            Release the buffers of the arena. The blocks become invalid.
+        '''
+
+        for page in self._pages:
+            page.buffer.release()
+
+        self._pages = []
+        self._used = 0
+
+    def _alloc_from(self, page, size, alignment):
+        for index, (offset, free) in enumerate(page.free):
+            start = (offset + alignment - 1) // alignment * alignment
+            end = start + size
+
+            if end > offset + free:
+                continue
+
+            del page.free[index]
+
+            if end < offset + free:
+                page.free.insert(index, (end, offset + free - end))
+
+            if start > offset:
+                page.free.insert(index, (offset, start - offset))
+
+            block = BufferBlock.__new__(BufferBlock)
+            block._arena = self
+            block._page = page
+            block._offset = start
+            block._size = size
+            block._alignment = alignment
+            block.extra = None
+
+            page.blocks.add(block)
+            self._used += size
+            self._high_water = max(self._high_water, self._used)
+            return block
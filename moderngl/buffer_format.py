@@ -0,0 +1,246 @@
+import re
+from typing import Tuple
+
+try:
+    import moderngl.mgl as mgl
+except ImportError:
+    pass
+
+__all__ = ['BufferFormat', 'buffer_format', 'dtype_format', 'format_dtype']
+
+
+class BufferFormat:
+    '''
+        A BufferFormat is a compiled buffer format.
+        The format is parsed once, its size, nodes and divisor are resolved when the object is created.
+
+        A BufferFormat can be used in place of a format string when creating a :py:class:`VertexArray`.
+        The vertex arrays built with the same BufferFormat do not parse the format again.
+
+        A BufferFormat object cannot be instantiated directly.
+        Use :py:func:`moderngl.buffer_format` to create one.
+    '''
+
+    __slots__ = ['mglo', '_format', '_names']
+
+    def __init__(self):
+        self.mglo = None
+        self._format = None
+        self._names = ()
+        raise TypeError()
+
+    def __repr__(self):
+        return '<BufferFormat: %s>' % self._format
+
+    @property
+    def format(self) -> str:
+        '''
+            str: The format string.
+        '''
+
+        return self._format
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        '''
+            tuple: The field names of the NumPy dtype the format was created from.
+            The names are used as the attribute names when a vertex array content item has no attributes.
+            Empty for the formats created from a string.
+        '''
+
+        return self._names
+
+    @property
+    def size(self) -> int:
+        '''
+            int: The size of a single vertex in bytes, including the padding.
+        '''
+
+        return self.mglo.size
+
+    @property
+    def nodes(self) -> int:
+        '''
+            int: The number of attributes in the format, the padding is not counted.
+        '''
+
+        return self.mglo.nodes
+
+    @property
+    def divisor(self) -> int:
+        '''
+            int: The divisor, 0 for per vertex, 1 for per instance and 0x7fffffff for per render attributes.
+        '''
+
+        return self.mglo.divisor
+
+
+_DTYPE_CODES = {
+    ('f', 2): 'f2',
+    ('f', 4): 'f4',
+    ('f', 8): 'f8',
+    ('i', 1): 'i1',
+    ('i', 2): 'i2',
+    ('i', 4): 'i4',
+    ('u', 1): 'u1',
+    ('u', 2): 'u2',
+    ('u', 4): 'u4',
+}
+
+_FORMAT_CODES = {
+    ('f', ''): 'f4',
+    ('f', '1'): 'u1',
+    ('f', '2'): 'f2',
+    ('f', '4'): 'f4',
+    ('f', '8'): 'f8',
+    ('i', ''): 'i4',
+    ('i', '1'): 'i1',
+    ('i', '2'): 'i2',
+    ('i', '4'): 'i4',
+    ('u', ''): 'u4',
+    ('u', '1'): 'u1',
+    ('u', '2'): 'u2',
+    ('u', '4'): 'u4',
+}
+
+_PACKED_CODES = {
+    ('i', '10'): 4,
+    ('u', '10'): 4,
+    ('f', '11'): 3,
+}
+
+_PADDING_SIZES = {'': 1, '1': 1, '2': 2, '4': 4, '8': 8}
+
+_formats = {}
+
+
+def dtype_format(dtype) -> Tuple[str, Tuple[str, ...]]:
+    '''
+        Convert a NumPy structured dtype to a buffer format.
+        The fields are ordered by their offset, the gaps and the trailing padding are skipped with ``x`` nodes.
+
+        Args:
+            dtype (numpy.dtype): A structured dtype.
+
+        Returns:
+            tuple: The format string and the field names.
+    '''
+
+    if getattr(dtype, 'names', None) is None:
+        raise ValueError('the dtype must be a structured dtype')
+
+    fields = sorted((dtype.fields[name][1], name, dtype.fields[name][0]) for name in dtype.names)
+
+    nodes = []
+    position = 0
+
+    for offset, name, field in fields:
+        base = field.base
+        code = _DTYPE_CODES.get((base.kind, base.itemsize))
+
+        if code is None or not base.isnative:
+            raise ValueError('the %r field has an unsupported type %s' % (name, base.str))
+
+        if offset < position:
+            raise ValueError('the %r field overlaps the previous field' % name)
+
+        if offset > position:
+            nodes.append('%dx' % (offset - position))
+
+        count = 1
+        for dim in field.shape:
+            count *= dim
+
+        nodes.append('%d%s' % (count, code))
+        position = offset + field.itemsize
+
+    if dtype.itemsize > position:
+        nodes.append('%dx' % (dtype.itemsize - position))
+
+    return ' '.join(nodes), tuple(name for offset, name, field in fields)
+
+
+def format_dtype(fmt, names=None):
+    '''
+        Convert a buffer format to a NumPy structured dtype.
+        The padding is not converted to fields, it is skipped with the offsets.
+        The packed types are converted to a single ``u4`` field. The usage is ignored.
+
+        Args:
+            fmt (str): The buffer format. See :ref:`buffer-format-label`.
+            names (list): The field names, defaults to ``f0``, ``f1``, ...
+
+        Returns:
+            numpy.dtype
+    '''
+
+    import numpy as np
+
+    fields = []
+    offset = 0
+
+    for node in fmt.split('/')[0].split():
+        match = re.match(r'^(\d*)(n?)([fiux])(\d*)$', node)
+        count = int(match.group(1) or 1) if match else 0
+
+        if not count or (match.group(2) and match.group(3) not in 'iu'):
+            raise ValueError('invalid format: %s' % fmt)
+
+        kind, size = match.group(3), match.group(4)
+
+        if kind == 'x' and size in _PADDING_SIZES:
+            offset += count * _PADDING_SIZES[size]
+        elif (kind, size) in _PACKED_CODES and count == _PACKED_CODES[kind, size]:
+            fields.append(('u4', (), offset))
+            offset += 4
+        elif (kind, size) in _FORMAT_CODES:
+            code = _FORMAT_CODES[kind, size]
+            fields.append((code, (count,) if count > 1 else (), offset))
+            offset += count * int(code[1])
+        else:
+            raise ValueError('invalid format: %s' % fmt)
+
+    if names is None:
+        names = ['f%d' % i for i in range(len(fields))]
+
+    if len(names) != len(fields):
+        raise ValueError('the format has %d attributes not %d' % (len(fields), len(names)))
+
+    return np.dtype({
+        'names': list(names),
+        'formats': [(code, shape) if shape else code for code, shape, offset in fields],
+        'offsets': [offset for code, shape, offset in fields],
+        'itemsize': offset,
+    })
+
+
+def buffer_format(fmt) -> BufferFormat:
+    '''
+        Compile a buffer format.
+        The compiled formats are cached, the same format string or dtype returns the same object.
+
+        Args:
+            fmt (str): A format string or a NumPy structured dtype. See :ref:`buffer-format-label`.
+
+        Returns:
+            :py:class:`BufferFormat` object
+    '''
+
+    if type(fmt) is BufferFormat:
+        return fmt
+
+    key = fmt if type(fmt) is str else ('dtype', fmt)
+    res = _formats.get(key)
+
+    if res is None:
+        names = ()
+        if type(fmt) is not str:
+            fmt, names = dtype_format(fmt)
+
+        res = BufferFormat.__new__(BufferFormat)
+        res.mglo = mgl.buffer_format(fmt)
+        res._format = fmt
+        res._names = names
+        _formats[key] = res
+
+    return res
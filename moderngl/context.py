@@ -1,17 +1,25 @@
 import os
 import warnings
+import weakref
 from typing import Dict, Tuple
 
-from .buffer import Buffer
+from .buffer import DYNAMIC_STORAGE, MAP_COHERENT, MAP_PERSISTENT, MAP_READ, MAP_WRITE, Buffer
+from .buffer_arena import BufferArena, BufferBlock
+from .buffer_format import buffer_format
 from .compute_shader import ComputeShader
 from .conditional_render import ConditionalRender
+from .draw_stats import DrawStats
 from .framebuffer import Framebuffer
+from .multi_buffer import MultiBuffer
+from .pipeline_state import PipelineState
 from .program import Program, detect_format
 from .program_members import (Attribute, Subroutine, Uniform, UniformBlock,
                               Varying)
 from .query import Query
+from .recorder import Recorder
 from .renderbuffer import Renderbuffer
 from .scope import Scope
+from .stream_buffer import StreamBuffer
 from .texture import Texture
 from .texture_3d import Texture3D
 from .texture_array import TextureArray
@@ -56,6 +64,16 @@ LAST_VERTEX_CONVENTION = 0x8E4E
 DEFAULT_BLENDING = (SRC_ALPHA, ONE_MINUS_SRC_ALPHA)
 PREMULTIPLIED_ALPHA = (SRC_ALPHA, ONE)
 
+_DTYPE_SIZES = {
+    'f1': 1, 'f2': 2, 'f4': 4,
+    'u1': 1, 'u2': 2, 'u4': 4,
+    'i1': 1, 'i2': 2, 'i4': 4,
+}
+
+_MEMORY_TYPES = ('Buffer', 'Texture', 'Texture3D', 'TextureArray', 'TextureCube', 'Renderbuffer')
+
+_COLLECTED_TYPES = (Buffer, Texture, Texture3D, TextureArray, TextureCube, Renderbuffer)
+
 
 class Context:
     '''
@@ -82,12 +100,18 @@ class Context:
     FIRST_VERTEX_CONVENTION = 0x8E4D
     LAST_VERTEX_CONVENTION = 0x8E4E
 
-    __slots__ = ['mglo', '_screen', '_info', 'version_code', 'fbo', 'extra']
+    __slots__ = ['mglo', '_screen', '_info', '_allocations', '_gc_mode', '_garbage', '_recorder', '_stats', '_vertex_arrays', 'version_code', 'fbo', 'extra']
 
     def __init__(self):
         self.mglo = None
         self._screen = None
         self._info = None
+        self._allocations = None
+        self._gc_mode = None
+        self._garbage = None
+        self._recorder = None
+        self._stats = None
+        self._vertex_arrays = None
         self.version_code = None  #: int: The OpenGL version code. Reports ``410`` for OpenGL 4.1
         self.fbo = None  #: Framebuffer: The active framebuffer. Set every time ``Framebuffer.use()`` is called.
         self.extra = None  #: Any - Attribute for storing user defined objects
@@ -317,6 +341,28 @@ class Context:
     def front_face(self, value):
         self.mglo.front_face = str(value)
 
+    @property
+    def cull_face(self) -> str:
+        '''
+            str: The faces to cull. Acceptable values are ``'back'`` (default), ``'front'`` or ``'front_and_back'``.
+
+            Face culling must be enabled for this to have any effect:
+            ``ctx.enable(moderngl.CULL_FACE)``.
+
+            .. code-block:: python
+
+                # Cull the triangles facing away from the camera
+                ctx.cull_face = 'back'
+                # Cull the triangles facing the camera
+                ctx.cull_face = 'front'
+        '''
+
+        return self.mglo.cull_face
+
+    @cull_face.setter
+    def cull_face(self, value):
+        self.mglo.cull_face = str(value)
+
     @property
     def patch_vertices(self) -> int:
         '''
@@ -340,6 +386,112 @@ class Context:
 
         return self.mglo.error
 
+    @property
+    def gc_mode(self) -> str:
+        '''
+            str: The handling of the objects dropped by Python without calling ``release``.
+
+            ``None`` keeps the OpenGL objects alive until the context is released. This is the default.
+            ``'context_gc'`` queues the objects, :py:meth:`Context.gc` deletes the queued objects in bulk.
+            ``'auto'`` deletes the objects when they are garbage collected,
+            the context must be current in the thread collecting them.
+
+            Only Buffers, Textures, Renderbuffers and VertexArrays are collected.
+        '''
+
+        return self._gc_mode
+
+    @gc_mode.setter
+    def gc_mode(self, value):
+        if value not in (None, 'context_gc', 'auto'):
+            raise ValueError('invalid gc_mode %r' % (value,))
+
+        self._gc_mode = value
+
+    @property
+    def state_cache(self) -> bool:
+        '''
+            bool: Skip the binding and render state changes that are already applied.
+
+            The cache is disabled by default. Enable it only when ModernGL owns the context.
+            Host frameworks sharing the context, such as Qt, pyglet or imgui, may bind their own programs,
+            framebuffers and textures between the ModernGL calls, the cache cannot see these changes.
+            Call :py:meth:`Context.invalidate_state` after such changes when the cache is enabled.
+            Enabling the cache reads the render state back from OpenGL.
+        '''
+
+        return self.mglo.state_cache
+
+    @state_cache.setter
+    def state_cache(self, value):
+        self.mglo.state_cache = bool(value)
+
+    @property
+    def state_stats(self) -> Dict[str, int]:
+        '''
+            dict: The number of issued and skipped binding and render state changes.
+
+            The context keeps a shadow copy of the bound program, vertex array, framebuffer,
+            the active texture unit and the textures and samplers bound to each unit.
+            It also keeps a shadow copy of the enable flags, blend func, depth func, face culling,
+            viewport and write masks.
+            Binding an object that is already bound or setting a value that is already set is skipped
+            when the :py:attr:`Context.state_cache` is enabled.
+            Use :py:meth:`Context.reset_state_stats` to count a single frame.
+
+            Example::
+
+                {'issued': 120, 'skipped': 2880}
+        '''
+
+        issued, skipped = self.mglo.state_changes
+        return {'issued': issued, 'skipped': skipped}
+
+    @property
+    def stats(self) -> DrawStats:
+        '''
+            DrawStats: The draw statistics of the context.
+
+            Example::
+
+                ctx.stats.enabled = True
+
+                while True:
+                    ctx.stats.reset()
+                    render_frame()
+                    print(ctx.stats.snapshot())
+        '''
+
+        if self._stats is None:
+            self._stats = DrawStats.__new__(DrawStats)
+            self._stats.ctx = self
+            self._stats.extra = None
+
+        return self._stats
+
+    @property
+    def recorder(self) -> Recorder:
+        '''
+            Recorder: The command recorder of the context.
+
+            .. code-block:: python
+
+                with ctx.recorder:
+                    ctx.clear()
+                    vao.render()
+
+                bytecode = ctx.recorder.dump()
+                ctx.replay(bytecode)
+        '''
+
+        if self._recorder is None:
+            self._recorder = Recorder.__new__(Recorder)
+            self._recorder._bytecode = None
+            self._recorder.ctx = self
+            self._recorder.extra = None
+
+        return self._recorder
+
     @property
     def info(self) -> Dict[str, object]:
         '''
@@ -562,6 +714,62 @@ class Context:
 
         self.mglo.copy_framebuffer(dst.mglo, src.mglo)
 
+    def memory_info(self, largest=10) -> dict:
+        '''
+            The GPU memory allocated by the Buffers, Textures and Renderbuffers of the context.
+
+            The sizes are computed from the size, components, data type and samples of the objects,
+            including the mipmaps created by ``build_mipmaps``.
+            The driver may allocate more for alignment and internal copies.
+
+            Example::
+
+                {
+                    'size': 23068672,
+                    'objects': 3,
+                    'types': {
+                        'Buffer': {'size': 4194304, 'objects': 1},
+                        'Texture': {'size': 18874368, 'objects': 2},
+                        ...
+                    },
+                    'largest': [
+                        {'type': 'Texture', 'glo': 2, 'size': 16777216},
+                        ...
+                    ],
+                }
+
+            Args:
+                largest (int): The number of largest allocations to list.
+
+            Returns:
+                dict
+        '''
+
+        types = {name: {'size': 0, 'objects': 0} for name in _MEMORY_TYPES}
+        allocations = []
+
+        for kind, glo, unit, dims, levels in self._allocations.values():
+            size = 0
+
+            for level in range(levels):
+                level_size = unit
+                for dim in dims:
+                    level_size *= max(dim >> level, 1)
+                size += level_size
+
+            types[kind]['size'] += size
+            types[kind]['objects'] += 1
+            allocations.append({'type': kind, 'glo': glo, 'size': size})
+
+        allocations.sort(key=lambda allocation: allocation['size'], reverse=True)
+
+        return {
+            'size': sum(allocation['size'] for allocation in allocations),
+            'objects': len(allocations),
+            'types': types,
+            'largest': allocations[:largest],
+        }
+
     def detect_framebuffer(self, glo=None) -> 'Framebuffer':
         '''
             Detect framebuffer.
@@ -581,16 +789,26 @@ class Context:
         res.extra = None
         return res
 
-    def buffer(self, data=None, *, reserve=0, dynamic=False) -> Buffer:
+    def buffer(self, data=None, *, reserve=0, dynamic=False, immutable=False, flags=0) -> Buffer:
         '''
             Create a :py:class:`Buffer` object.
 
+            Immutable buffers are allocated with ``glBufferStorage``, their size cannot change
+            and they cannot be orphaned. Drivers can place them more efficiently.
+            Requires OpenGL 4.4 or the ``GL_ARB_buffer_storage`` extension.
+            The content of an immutable buffer can only be written with the :py:data:`DYNAMIC_STORAGE` flag
+            or through a mapping created with the :py:data:`MAP_WRITE` flag.
+            With the :py:data:`MAP_PERSISTENT` flag the buffer stays mapped for its whole lifetime.
+            :py:meth:`Buffer.read` and :py:meth:`Buffer.write` still wait for the pending commands using the buffer.
+
             Args:
                 data (bytes): Content of the new buffer.
 
             Keyword Args:
                 reserve (int): The number of bytes to reserve.
                 dynamic (bool): Treat buffer as dynamic.
+                immutable (bool): Allocate immutable storage.
+                flags (int): The storage flags of an immutable buffer.
 
             Returns:
                 :py:class:`Buffer` object
@@ -599,9 +817,111 @@ class Context:
         if type(reserve) is str:
             reserve = mgl.strsize(reserve)
 
+        if flags and not immutable:
+            raise ValueError('storage flags require immutable=True')
+
         res = Buffer.__new__(Buffer)
-        res.mglo, res._size, res._glo = self.mglo.buffer(data, reserve, dynamic)
+        res.mglo, res._size, res._glo = self.mglo.buffer(data, reserve, dynamic, flags if immutable else -1)
+        self._track(res, res._size)
         res._dynamic = dynamic
+        res._immutable = immutable
+        res._flags = flags
+        res.ctx = self
+        res.extra = None
+        return res
+
+    def buffer_arena(self, page_size, *, alignment=16, dynamic=False) -> 'BufferArena':
+        '''
+            Create a :py:class:`BufferArena` object.
+
+            Args:
+                page_size (int): The size of the buffers allocated by the arena.
+
+            Keyword Args:
+                alignment (int): The default alignment of the blocks.
+                dynamic (bool): Treat the buffers as dynamic.
+
+            Returns:
+                :py:class:`BufferArena` object
+        '''
+
+        if type(page_size) is str:
+            page_size = mgl.strsize(page_size)
+
+        res = BufferArena.__new__(BufferArena)
+        res._pages = []
+        res._page_size = page_size
+        res._alignment = alignment
+        res._dynamic = dynamic
+        res._used = 0
+        res._high_water = 0
+        res.ctx = self
+        res.extra = None
+        return res
+
+    def multi_buffer(self, data=None, *, reserve=0, frames=3, dynamic=True) -> 'MultiBuffer':
+        '''
+            Create a :py:class:`MultiBuffer` object.
+
+            Args:
+                data (bytes): Content of each copy.
+
+            Keyword Args:
+                reserve (int): The number of bytes to reserve for each copy.
+                frames (int): The number of frames in flight.
+                dynamic (bool): Treat the buffers as dynamic.
+
+            Returns:
+                :py:class:`MultiBuffer` object
+        '''
+
+        if frames < 1:
+            raise ValueError('frames must be positive')
+
+        res = MultiBuffer.__new__(MultiBuffer)
+        res._buffers = tuple(self.buffer(data, reserve=reserve, dynamic=dynamic) for _ in range(frames))
+        res._frame = 0
+        res._fences = [None] * frames
+        res.ctx = self
+        res.extra = None
+        return res
+
+    def stream_buffer(self, reserve, *, frames=3, alignment=256) -> 'StreamBuffer':
+        '''
+            Create a :py:class:`StreamBuffer` object.
+
+            The buffer uses immutable storage with a persistent coherent mapping.
+            Requires OpenGL 4.4 or the ``GL_ARB_buffer_storage`` extension.
+
+            Args:
+                reserve (int): The number of bytes available for each frame.
+
+            Keyword Args:
+                frames (int): The number of frames in flight.
+                alignment (int): The alignment of the allocated sub-ranges.
+
+            Returns:
+                :py:class:`StreamBuffer` object
+        '''
+
+        if type(reserve) is str:
+            reserve = mgl.strsize(reserve)
+
+        if frames < 1 or alignment < 1:
+            raise ValueError('frames and alignment must be positive')
+
+        frame_size = (reserve + alignment - 1) // alignment * alignment
+
+        flags = MAP_READ | MAP_WRITE | MAP_PERSISTENT | MAP_COHERENT | DYNAMIC_STORAGE
+
+        res = StreamBuffer.__new__(StreamBuffer)
+        res._buffer = self.buffer(reserve=frame_size * frames, dynamic=True, immutable=True, flags=flags)
+        res._frames = frames
+        res._frame = 0
+        res._frame_size = frame_size
+        res._alignment = alignment
+        res._cursor = 0
+        res._fences = [None] * frames
         res.ctx = self
         res.extra = None
         return res
@@ -626,6 +946,7 @@ class Context:
 
         res = Texture.__new__(Texture)
         res.mglo, res._glo = self.mglo.texture(size, components, data, samples, alignment, dtype)
+        self._track(res, components * _DTYPE_SIZES[dtype] * max(samples, 1), size)
         res._size = size
         res._components = components
         res._samples = samples
@@ -655,6 +976,7 @@ class Context:
 
         res = TextureArray.__new__(TextureArray)
         res.mglo, res._glo = self.mglo.texture_array(size, components, data, alignment, dtype)
+        self._track(res, components * _DTYPE_SIZES[dtype] * size[2], size[:2])
         res._size = size
         res._components = components
         res._dtype = dtype
@@ -681,6 +1003,11 @@ class Context:
 
         res = Texture3D.__new__(Texture3D)
         res.mglo, res._glo = self.mglo.texture3d(size, components, data, alignment, dtype)
+        res._size = size
+        res._components = components
+        res._samples = 0
+        res._dtype = dtype
+        self._track(res, components * _DTYPE_SIZES[dtype], size)
         res.ctx = self
         res.extra = None
         return res
@@ -704,6 +1031,7 @@ class Context:
 
         res = TextureCube.__new__(TextureCube)
         res.mglo, res._glo = self.mglo.texture_cube(size, components, data, alignment, dtype)
+        self._track(res, components * _DTYPE_SIZES[dtype] * 6, size)
         res._size = size
         res._components = components
         res._dtype = dtype
@@ -729,6 +1057,7 @@ class Context:
 
         res = Texture.__new__(Texture)
         res.mglo, res._glo = self.mglo.depth_texture(size, data, samples, alignment)
+        self._track(res, 4 * max(samples, 1), size)
         res._size = size
         res._components = 1
         res._samples = samples
@@ -739,45 +1068,120 @@ class Context:
         return res
 
     def vertex_array(self, *args, **kwargs) -> 'VertexArray':
-        if len(args) > 2 and type(args[1]) is Buffer:
+        if len(args) > 2 and type(args[1]) in (Buffer, BufferBlock, MultiBuffer):
             return self.simple_vertex_array(*args, **kwargs)
         return self._vertex_array(*args, **kwargs)
 
     def _vertex_array(self, program, content,
-                     index_buffer=None, index_element_size=4, *, skip_errors=False) -> 'VertexArray':
+                     index_buffer=None, index_element_size=4, *, skip_errors=False, cache=False) -> 'VertexArray':
         '''
             Create a :py:class:`VertexArray` object.
 
+            With ``cache=True`` the VertexArray created for the same program, buffers, formats, attributes
+            and index buffer is returned instead of creating a new one. The cached VertexArray is shared,
+            it should not be modified or released by a single user. The cache only holds weak references,
+            an entry is dropped when its VertexArray is garbage collected. A released VertexArray, program
+            or buffer is never returned.
+
             Args:
                 program (Program): The program used when rendering.
                 content (list): A list of (buffer, format, attributes). See :ref:`buffer-format-label`.
-                index_buffer (Buffer): An index buffer.
+                                The buffers can be :py:class:`BufferBlock` or :py:class:`MultiBuffer` objects.
+                                The format can be a :py:class:`BufferFormat` or a NumPy structured dtype,
+                                the attributes default to the field names of the dtype.
+                index_buffer (Buffer): An index buffer, a :py:class:`BufferBlock` or a :py:class:`MultiBuffer`.
 
             Keyword Args:
                 index_element_size (int): byte size of each index element, 1, 2 or 4.
                 skip_errors (bool): Ignore skip_errors varyings.
+                cache (bool): Reuse the VertexArray created with the same arguments.
 
             Returns:
                 :py:class:`VertexArray` object
         '''
 
+        def compiled(buffer, fmt, *attributes):
+            fmt = buffer_format(fmt)
+            return (buffer, fmt) + (attributes or fmt.names)
+
+        content = [compiled(*item) for item in content]
+
+        if cache:
+            key = (
+                id(program),
+                tuple((id(item[0]),) + tuple(item[1:]) for item in content),
+                id(index_buffer),
+                index_element_size,
+                skip_errors,
+            )
+
+            entry = self._vertex_arrays.get(key)
+
+            if entry is not None:
+                res, refs = entry[0](), entry[1]
+                if res is not None and not _released(res) and not any(_released(ref()) for ref in refs):
+                    return res
+
+            res = self._vertex_array(program, content, index_buffer, index_element_size, skip_errors=skip_errors)
+            objects = [program, index_buffer] + [item[0] for item in content]
+
+            def drop(ref, key=key, cache=self._vertex_arrays):
+                if cache.get(key, (None,))[0] is ref:
+                    cache.pop(key)
+
+            # The VertexArray keeps the program and the buffers alive, the cache must not keep the VertexArray alive.
+            refs = tuple(weakref.ref(obj) for obj in objects if obj is not None)
+            self._vertex_arrays[key] = (weakref.ref(res, drop), refs)
+            return res
+
         members = program._members
-        index_buffer_mglo = None if index_buffer is None else index_buffer.mglo
-        content = tuple((a.mglo, b) + tuple(getattr(members.get(x), 'mglo', None) for x in c) for a, b, *c in content)
+
+        multi_buffers = {item[0] for item in content + [(index_buffer,)] if type(item[0]) is MultiBuffer}
+
+        if len(multi_buffers) > 1:
+            raise ValueError('a VertexArray cannot use more than one MultiBuffer')
+
+        multi_buffer = multi_buffers.pop() if multi_buffers else None
+
+        def frame_buffer(buffer, frame):
+            return buffer.buffers[frame] if type(buffer) is MultiBuffer else buffer
+
+        def content_item(frame, buffer, fmt, *attributes):
+            buffer = frame_buffer(buffer, frame)
+            if type(buffer) is BufferBlock:
+                item = (buffer.buffer.mglo, fmt.mglo, buffer.offset, buffer.size)
+            else:
+                item = (buffer.mglo, fmt.mglo, 0, -1)
+            return item + tuple(getattr(members.get(x), 'mglo', None) for x in attributes)
+
+        def index_buffer_range(frame):
+            buffer = frame_buffer(index_buffer, frame)
+            if type(buffer) is BufferBlock:
+                return (buffer.buffer.mglo, buffer.offset, buffer.size)
+            return (None if buffer is None else buffer.mglo, 0, -1)
+
+        frames = [
+            self.mglo.vertex_array(program.mglo, tuple(content_item(frame, *item) for item in content),
+                                   *index_buffer_range(frame), index_element_size, skip_errors)
+            for frame in range(multi_buffer.frames if multi_buffer is not None else 1)
+        ]
 
         res = VertexArray.__new__(VertexArray)
-        res.mglo, res._glo = self.mglo.vertex_array(program.mglo, content, index_buffer_mglo,
-                                                    index_element_size, skip_errors)
+        res.mglo, res._glo = frames[0]
+        res._frames = tuple(mglo for mglo, glo in frames)
+        res._multi_buffer = multi_buffer
         res._program = program
         res._index_buffer = index_buffer
         res._index_element_size = index_element_size
+        # The buffers are kept alive as long as the VertexArray uses them, gc_mode would delete them otherwise.
+        res._buffers = tuple(item[0] for item in content)
         res.ctx = self
         res.extra = None
         res.scope = None
         return res
 
     def simple_vertex_array(self, program, buffer, *attributes,
-                            index_buffer=None, index_element_size=4) -> 'VertexArray':
+                            index_buffer=None, index_element_size=4, cache=False) -> 'VertexArray':
         '''
             Create a :py:class:`VertexArray` object.
 
@@ -789,6 +1193,7 @@ class Context:
             Keyword Args:
                 index_element_size (int): byte size of each index element, 1, 2 or 4.
                 index_buffer (Buffer): An index buffer.
+                cache (bool): Reuse the VertexArray created with the same arguments.
 
             Returns:
                 :py:class:`VertexArray` object
@@ -798,7 +1203,7 @@ class Context:
             raise SyntaxError('Change simple_vertex_array to vertex_array')
 
         content = [(buffer, detect_format(program, attributes)) + attributes]
-        return self.vertex_array(program, content, index_buffer, index_element_size)
+        return self.vertex_array(program, content, index_buffer, index_element_size, cache=cache)
 
     def program(self, *, vertex_shader, fragment_shader=None, geometry_shader=None,
                 tess_control_shader=None, tess_evaluation_shader=None, varyings=()) -> 'Program':
@@ -857,6 +1262,7 @@ class Context:
             members[obj.name] = obj
 
         res._members = members
+        res._formats = {}
         res.ctx = self
         res.extra = None
         return res
@@ -884,10 +1290,15 @@ class Context:
         res.extra = None
         return res
 
-    def scope(self, framebuffer=None, enable_only=None, *, textures=(), uniform_buffers=(), storage_buffers=(), samplers=(), enable=None) -> 'Scope':
+    def scope(self, framebuffer=None, enable_only=None, *, textures=(), uniform_buffers=(), storage_buffers=(),
+              samplers=(), enable=None, blend_func=None, depth_func=None, cull_face=None, viewport=None,
+              color_mask=None, depth_mask=None, primitive_restart=None, restart_index=-1) -> 'Scope':
         '''
             Create a :py:class:`Scope` object.
 
+            Entering and exiting the scope only applies the state that differs from the current state.
+            The render state arguments left as None keep their current value.
+
             Args:
                 framebuffer (Framebuffer): The framebuffer to use when entering.
                 enable_only (int): The enable_only flags to set when entering.
@@ -896,6 +1307,16 @@ class Context:
                 textures (list): List of (texture, binding) tuples.
                 uniform_buffers (list): List of (buffer, binding) tuples.
                 storage_buffers (list): List of (buffer, binding) tuples.
+                samplers (list): List of (sampler, binding) tuples.
+                blend_func (tuple): The blend func to set when entering.
+                depth_func (str): The depth func to set when entering.
+                cull_face (str): The faces to cull when entering.
+                viewport (tuple): The viewport to set when entering.
+                color_mask (tuple): The color mask to set for every draw buffer when entering.
+                depth_mask (bool): The depth mask to set when entering.
+                primitive_restart (bool): Enable or disable the primitive restart when entering.
+                restart_index (int): The primitive restart index to set with the primitive restart.
+                    The default -1 is the largest index of 4 byte index buffers.
         '''
 
         if enable is not None:
@@ -904,12 +1325,66 @@ class Context:
         if framebuffer is None:
             framebuffer = self.screen
 
+        samplers = tuple(samplers)
+        textures = tuple(textures)
+        uniform_buffers = tuple(uniform_buffers)
+        storage_buffers = tuple(storage_buffers)
+
+        # The objects are kept alive as long as the Scope uses them, gc_mode would delete them otherwise.
+        refs = (framebuffer, textures, uniform_buffers, storage_buffers, samplers)
+
         textures = tuple((tex.mglo, idx) for tex, idx in textures)
+        textures += tuple((smp.texture.mglo, idx) for smp, idx in samplers if smp.texture is not None)
+        samplers = tuple((smp.mglo, idx) for smp, idx in samplers)
         uniform_buffers = tuple((buf.mglo, idx) for buf, idx in uniform_buffers)
         storage_buffers = tuple((buf.mglo, idx) for buf, idx in storage_buffers)
 
+        if blend_func is not None:
+            blend_func = tuple(blend_func)
+
+        if viewport is not None:
+            viewport = tuple(viewport)
+
+        if color_mask is not None:
+            color_mask = tuple(color_mask)
+
         res = Scope.__new__(Scope)
-        res.mglo = self.mglo.scope(framebuffer.mglo, enable_only, textures, uniform_buffers, storage_buffers, samplers)
+        res.mglo = self.mglo.scope(
+            framebuffer.mglo, enable_only, textures, uniform_buffers, storage_buffers, samplers,
+            blend_func, depth_func, cull_face, viewport, color_mask, depth_mask,
+            primitive_restart, restart_index & 0xFFFFFFFF,
+        )
+        res._refs = refs
+        res.ctx = self
+        res.extra = None
+        return res
+
+    def pipeline_state(self, *, enable=None, blend_func=None, depth_func=None, cull_face=None, front_face=None,
+                       wireframe=None, multisample=None) -> 'PipelineState':
+        '''
+            Create a :py:class:`PipelineState` object.
+
+            The arguments left as None keep their current value when the pipeline state is used.
+
+            Keyword Args:
+                enable (int): The enable_only flags to set.
+                blend_func (tuple): The source and destination blend factors to set,
+                                    for example ``(moderngl.SRC_ALPHA, moderngl.ONE)``.
+                depth_func (str): The depth func to set.
+                cull_face (str): The faces to cull.
+                front_face (str): The front face.
+                wireframe (bool): The wireframe mode.
+                multisample (bool): The multisample mode.
+
+            Returns:
+                :py:class:`PipelineState` object
+        '''
+
+        if blend_func is not None:
+            blend_func = tuple(blend_func)
+
+        res = PipelineState.__new__(PipelineState)
+        res.mglo = self.mglo.pipeline_state(enable, blend_func, depth_func, cull_face, front_face, wireframe, multisample)
         res.ctx = self
         res.extra = None
         return res
@@ -982,6 +1457,7 @@ class Context:
 
         res = Renderbuffer.__new__(Renderbuffer)
         res.mglo, res._glo = self.mglo.renderbuffer(size, components, samples, dtype)
+        self._track(res, components * _DTYPE_SIZES[dtype] * max(samples, 1), size)
         res._size = size
         res._components = components
         res._samples = samples
@@ -1008,6 +1484,7 @@ class Context:
 
         res = Renderbuffer.__new__(Renderbuffer)
         res.mglo, res._glo = self.mglo.depth_renderbuffer(size, samples)
+        self._track(res, 4 * max(samples, 1), size)
         res._size = size
         res._components = 1
         res._samples = samples
@@ -1109,6 +1586,23 @@ class Context:
         '''
         self.mglo.clear_samplers(start, end)
 
+    def invalidate_state(self) -> None:
+        '''
+            Forget the bindings cached by the context and read the render state back from OpenGL.
+            The next bindings are issued even if the objects are already bound.
+
+            Call it after changing the bindings or the render state with OpenGL calls made outside of ModernGL.
+        '''
+
+        self.mglo.invalidate_state()
+
+    def reset_state_stats(self) -> None:
+        '''
+            Reset the counters of :py:attr:`Context.state_stats`.
+        '''
+
+        self.mglo.reset_state_changes()
+
     def core_profile_check(self) -> None:
         '''
             Core profile check.
@@ -1128,6 +1622,58 @@ class Context:
         if version_code < 330:
             warnings.warn('The window should support OpenGL 3.3+ (version_code=%d)' % version_code)
 
+    def release_many(self, objects) -> None:
+        '''
+            Release many objects at once.
+
+            Buffers, Textures, Renderbuffers and VertexArrays are deleted
+            with a single OpenGL call for each kind of object.
+            The other objects are released one by one.
+
+            Args:
+                objects (list): The objects to release.
+        '''
+
+        mglos = []
+
+        for obj in objects:
+            if type(obj) is VertexArray:
+                mglos.extend(obj._frames)
+            elif type(obj) in _COLLECTED_TYPES:
+                self._untrack(obj)
+                mglos.append(obj.mglo)
+            else:
+                obj.release()
+
+        self.mglo.release_many(tuple(mglos))
+
+    def gc(self) -> int:
+        '''
+            Delete the objects queued when :py:attr:`Context.gc_mode` is ``'context_gc'``.
+            Call it at a safe point, for example at the end of the frame.
+
+            Returns:
+                int: The number of deleted objects.
+        '''
+
+        garbage, self._garbage = self._garbage, []
+        self.mglo.release_many(tuple(garbage))
+        return len(garbage)
+
+    def replay(self, bytecode) -> None:
+        '''
+            Execute the commands captured by :py:attr:`Context.recorder`.
+
+            The commands are executed in C without calling back into Python.
+            The state cached by ModernGL, for example :py:attr:`Context.fbo`, is not updated,
+            replay the bytecode from the state the recording was started in.
+
+            Args:
+                bytecode (bytes): The bytecode returned by :py:meth:`Recorder.dump`.
+        '''
+
+        self.mglo.replay(bytecode)
+
     def release(self) -> None:
         '''
             Release the ModernGL object.
@@ -1135,6 +1681,32 @@ class Context:
 
         self.mglo.release()
 
+    def _collect(self, obj) -> None:
+        if self._gc_mode is None or type(obj.mglo) is mgl.InvalidObject or type(self.mglo) is mgl.InvalidObject:
+            return
+
+        self._untrack(obj)
+        mglos = obj._frames if type(obj) is VertexArray else (obj.mglo,)
+
+        if self._gc_mode == 'auto':
+            self.mglo.release_many(tuple(mglos))
+        else:
+            self._garbage.extend(mglos)
+
+    def _track(self, obj, unit, dims=()) -> None:
+        self._allocations[obj.mglo] = (type(obj).__name__, obj.glo, unit, tuple(dims), 1)
+
+    def _track_mipmaps(self, obj, max_level) -> None:
+        allocation = self._allocations.get(obj.mglo)
+
+        if allocation is not None:
+            kind, glo, unit, dims, levels = allocation
+            levels = min(max_level, max(dims).bit_length() - 1) + 1
+            self._allocations[obj.mglo] = (kind, glo, unit, dims, levels)
+
+    def _untrack(self, obj) -> None:
+        self._allocations.pop(obj.mglo, None)
+
 
 def create_context(require=None, standalone=False, **settings) -> Context:
     '''
@@ -1165,6 +1737,12 @@ def create_context(require=None, standalone=False, **settings) -> Context:
     ctx = Context.__new__(Context)
     ctx.mglo, ctx.version_code = mgl.create_context()
     ctx._info = None
+    ctx._allocations = {}
+    ctx._gc_mode = None
+    ctx._garbage = []
+    ctx._recorder = None
+    ctx._stats = None
+    ctx._vertex_arrays = {}
     ctx.extra = None
 
     if require is not None and ctx.version_code < require:
@@ -1206,6 +1784,12 @@ def create_standalone_context(require=None, **settings) -> 'Context':
     ctx._screen = None
     ctx.fbo = None
     ctx._info = None
+    ctx._allocations = {}
+    ctx._gc_mode = None
+    ctx._garbage = []
+    ctx._recorder = None
+    ctx._stats = None
+    ctx._vertex_arrays = {}
     ctx.extra = None
 
     if require is not None and ctx.version_code < require:
@@ -1213,3 +1797,16 @@ def create_standalone_context(require=None, **settings) -> 'Context':
             require, ctx.version_code))
 
     return ctx
+
+
+def _released(obj) -> bool:
+    if type(obj) is BufferBlock:
+        obj = obj.buffer
+
+    if type(obj) is MultiBuffer:
+        return any(type(buffer.mglo) is mgl.InvalidObject for buffer in obj.buffers)
+
+    if type(obj) is VertexArray:
+        return any(type(mglo) is mgl.InvalidObject for mglo in obj._frames)
+
+    return type(obj.mglo) is mgl.InvalidObject
@@ -0,0 +1,67 @@
+__all__ = ['DrawStats']
+
+STATS_KEYS = ('draw_calls', 'vertices', 'instances', 'indirect_commands', 'transform_calls', 'state_binds')
+
+
+class DrawStats:
+    '''
+        DrawStats count the draw calls issued by the VertexArrays of a context.
+
+        The counters are ``draw_calls``, ``vertices``, ``instances``, ``indirect_commands``,
+        ``transform_calls`` and ``state_binds``. The ``vertices`` include every instance,
+        the indirect draws only count their commands as the vertices are stored on the GPU.
+        The ``indirect_commands`` of :py:meth:`VertexArray.render_indirect_count` are an upper bound,
+        the ``max_count`` is counted as the number of draws is only known on the GPU.
+        The ``state_binds`` are the binding and render state changes issued by the draw calls.
+
+        The counters are disabled by default, a disabled counter costs a single branch per draw call.
+        Use :py:meth:`DrawStats.reset` at the beginning of each frame to count a single frame.
+        :py:attr:`VertexArray.stats` contains the counters of a single VertexArray since the last reset.
+
+        A DrawStats object cannot be instantiated directly, it requires a context.
+        Use :py:attr:`Context.stats` to get one.
+    '''
+
+    __slots__ = ['ctx', 'extra']
+
+    def __init__(self):
+        self.ctx = None
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<DrawStats: %s>' % ('enabled' if self.enabled else 'disabled')
+
+    @property
+    def enabled(self) -> bool:
+        '''
+            bool: Enable or disable the counters.
+        '''
+
+        return self.ctx.mglo.collect_stats
+
+    @enabled.setter
+    def enabled(self, value):
+        self.ctx.mglo.collect_stats = bool(value)
+
+    def reset(self) -> None:
+        '''
+            Reset the counters of the context and every VertexArray.
+        '''
+
+        self.ctx.mglo.reset_stats()
+
+    def snapshot(self) -> dict:
+        '''
+            The counters of the context since the last reset.
+
+            Returns:
+                dict
+
+            Example::
+
+                {'draw_calls': 120, 'vertices': 360000, 'instances': 120,
+                 'indirect_commands': 0, 'transform_calls': 0, 'state_binds': 240}
+        '''
+
+        return dict(zip(STATS_KEYS, self.ctx.mglo.stats))
@@ -1,6 +1,7 @@
 from typing import Dict, Tuple, Union
 
 from .buffer import Buffer
+from .readback import Readback, readback
 from .renderbuffer import Renderbuffer
 from .texture import Texture
 
@@ -215,6 +216,40 @@ class Framebuffer:
 
         return self.mglo.read_into(buffer, viewport, components, attachment, alignment, dtype, write_offset)
 
+    def read_async(self, viewport=None, components=3, *,
+                   attachment=0, alignment=1, dtype='f1', buffer=None, write_offset=0) -> Readback:
+        '''
+            Start reading the content of the framebuffer without waiting for the GPU.
+
+            The pixels are read into a pixel pack buffer and a fence is inserted after the read.
+
+            Args:
+                viewport (tuple): The viewport.
+                components (int): The number of components to read.
+
+            Keyword Args:
+                attachment (int): The color attachment.
+                alignment (int): The byte alignment of the pixels.
+                dtype (str): Data type.
+                buffer (Buffer): The pixel pack buffer. A new buffer is created when ``None``.
+                write_offset (int): The write offset in the pixel pack buffer.
+
+            Returns:
+                :py:class:`Readback` object
+        '''
+
+        width, height = self.size if viewport is None else viewport[-2:]
+
+        if attachment == -1:
+            components = 1
+
+        row = (width * components * int(dtype[1:]) + alignment - 1) // alignment * alignment
+
+        def copy(staging, write_offset):
+            self.mglo.read_into(staging.mglo, viewport, components, attachment, alignment, dtype, write_offset)
+
+        return readback(self.ctx, row * height, buffer, write_offset, copy)
+
     def release(self) -> None:
         '''
             Release the ModernGL object.
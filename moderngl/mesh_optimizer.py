@@ -0,0 +1,495 @@
+'''
+    NumPy mesh optimizers for indexed triangle lists.
+
+    The optimizers reorder the triangles for the post-transform vertex cache and for less overdraw,
+    and reorder the vertices for the vertex fetch. The results are ready for :py:meth:`Context.buffer`
+    and :py:meth:`Context.vertex_array`. The unindexed meshes are indexed by welding their identical vertices.
+    The triangle lists can be converted to triangle strips separated by the primitive restart index.
+'''
+
+import numpy as np
+
+from .buffer_format import format_dtype
+
+__all__ = ['optimize_vertex_cache', 'optimize_overdraw', 'optimize_vertex_fetch', 'optimize_mesh',
+           'cache_miss_ratio', 'index_element_size', 'pack_indices', 'triangle_strips', 'weld_vertices', 'weld_mesh']
+
+
+def _triangles(indices):
+    indices = np.asarray(indices).ravel()
+
+    if len(indices) % 3:
+        raise ValueError('the indices must be a triangle list')
+
+    if len(indices) and indices.min() < 0:
+        raise ValueError('the indices must not be negative')
+
+    return indices.astype('i8')
+
+
+def _vertex_count(indices, vertex_count):
+    if vertex_count is None:
+        return int(indices.max()) + 1 if len(indices) else 0
+
+    if len(indices) and indices.max() >= vertex_count:
+        raise ValueError('the indices must be less than the vertex_count')
+
+    return vertex_count
+
+
+def cache_miss_ratio(indices, cache_size=16) -> float:
+    '''
+        Simulate a FIFO post-transform vertex cache.
+
+        Args:
+            indices (array): The triangle list.
+
+        Keyword Args:
+            cache_size (int): The number of vertices in the cache.
+
+        Returns:
+            float: The average number of cache misses per triangle. (ACMR)
+    '''
+
+    indices = _triangles(indices)
+
+    stamps = {}
+    misses = 0
+
+    for vertex in indices.tolist():
+        if misses - stamps.get(vertex, -cache_size - 1) > cache_size:
+            stamps[vertex] = misses
+            misses += 1
+
+    return misses / max(len(indices) // 3, 1)
+
+
+def optimize_vertex_cache(indices, vertex_count=None, cache_size=16) -> np.ndarray:
+    '''
+        Reorder the triangles for the post-transform vertex cache.
+        Implements the Tipsify algorithm from "Fast Triangle Reordering for Vertex Locality and Reduced Overdraw".
+
+        Args:
+            indices (array): The triangle list.
+            vertex_count (int): The number of vertices, defaults to the largest index + 1.
+
+        Keyword Args:
+            cache_size (int): The number of vertices in the cache.
+
+        Returns:
+            array: The reordered triangle list.
+    '''
+
+    indices = _triangles(indices)
+    vertex_count = _vertex_count(indices, vertex_count)
+
+    # The triangles around each vertex.
+    adjacency = (np.argsort(indices, kind='stable') // 3).tolist()
+    live = np.bincount(indices, minlength=vertex_count)
+    offsets = np.concatenate([[0], np.cumsum(live)]).tolist()
+    live = live.tolist()
+
+    triangles = indices.tolist()
+    emitted = [False] * (len(triangles) // 3)
+    stamps = [0] * vertex_count
+    dead_end = []
+
+    result = []
+    time = cache_size + 1
+    cursor = 0
+    fanning = 0
+
+    while True:
+        if fanning < 0 or fanning >= vertex_count or not live[fanning]:
+            # The dead-end stack and the input order give the next vertex with live triangles.
+            fanning = -1
+
+            while dead_end:
+                vertex = dead_end.pop()
+                if live[vertex]:
+                    fanning = vertex
+                    break
+
+            while fanning < 0 and cursor < vertex_count:
+                if live[cursor]:
+                    fanning = cursor
+                cursor += 1
+
+            if fanning < 0:
+                break
+
+        candidates = []
+
+        for triangle in adjacency[offsets[fanning]:offsets[fanning + 1]]:
+            if emitted[triangle]:
+                continue
+
+            emitted[triangle] = True
+
+            for vertex in triangles[triangle * 3:triangle * 3 + 3]:
+                result.append(vertex)
+                dead_end.append(vertex)
+                candidates.append(vertex)
+                live[vertex] -= 1
+
+                if time - stamps[vertex] > cache_size:
+                    stamps[vertex] = time
+                    time += 1
+
+        # The candidate that stays in the cache while its live triangles are emitted.
+        fanning = -1
+        priority = -1
+
+        for vertex in candidates:
+            if live[vertex]:
+                age = time - stamps[vertex]
+                value = age if age + 2 * live[vertex] <= cache_size else 0
+                if value > priority:
+                    fanning = vertex
+                    priority = value
+
+    return np.array(result, dtype='i8')
+
+
+def optimize_overdraw(indices, positions, cache_size=16, threshold=1.05) -> np.ndarray:
+    '''
+        Reorder clusters of triangles to reduce the overdraw.
+        The triangles should be optimized for the vertex cache first, the clusters keep the cache efficiency
+        within ``threshold`` times the original cache miss ratio.
+        The clusters facing outwards from the center of the mesh are rendered first.
+
+        Args:
+            indices (array): The triangle list.
+            positions (array): The vertex positions of shape (n, 3).
+
+        Keyword Args:
+            cache_size (int): The number of vertices in the cache.
+            threshold (float): The allowed increase of the cache miss ratio.
+
+        Returns:
+            array: The reordered triangle list.
+    '''
+
+    indices = _triangles(indices)
+    positions = np.asarray(positions, dtype='f8')
+
+    if positions.ndim != 2 or positions.shape[1] != 3:
+        raise ValueError('the positions must be an array of shape (n, 3)')
+
+    _vertex_count(indices, len(positions))
+
+    num_triangles = len(indices) // 3
+
+    if num_triangles < 2:
+        return indices
+
+    limit = cache_miss_ratio(indices, cache_size) * threshold
+
+    # The clusters start at the triangles missing the cache with all of their vertices
+    # and where the cache miss ratio of the cluster is already below the limit.
+    starts = [0]
+    stamps = {}
+    misses = 0
+    cluster_misses = 0
+    cluster_triangles = 0
+
+    for triangle, (a, b, c) in enumerate(indices.reshape(-1, 3).tolist()):
+        hits = 0
+        for vertex in (a, b, c):
+            if misses - stamps.get(vertex, -cache_size - 1) > cache_size:
+                stamps[vertex] = misses
+                misses += 1
+            else:
+                hits += 1
+
+        if triangle and (not hits or cluster_misses <= limit * cluster_triangles):
+            starts.append(triangle)
+            cluster_misses = 0
+            cluster_triangles = 0
+
+        cluster_misses += 3 - hits
+        cluster_triangles += 1
+
+    corners = positions[indices].reshape(-1, 3, 3)
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    areas = np.linalg.norm(normals, axis=1)
+    centers = corners.mean(axis=1)
+
+    mesh_center = (centers * areas[:, None]).sum(axis=0) / max(areas.sum(), 1e-30)
+
+    cluster_normals = np.add.reduceat(normals, starts)
+    cluster_areas = np.add.reduceat(areas, starts)
+    cluster_centers = np.add.reduceat(centers * areas[:, None], starts) / np.maximum(cluster_areas, 1e-30)[:, None]
+
+    lengths = np.linalg.norm(cluster_normals, axis=1)
+    lengths[lengths == 0.0] = 1.0
+    sort_keys = ((cluster_centers - mesh_center) * cluster_normals).sum(axis=1) / lengths
+
+    order = np.argsort(-sort_keys, kind='stable')
+    bounds = np.append(starts, num_triangles)
+    triangles = np.concatenate([np.arange(bounds[i], bounds[i + 1]) for i in order])
+
+    return indices.reshape(-1, 3)[triangles].ravel()
+
+
+def optimize_vertex_fetch(indices, vertices) -> tuple:
+    '''
+        Reorder the vertices in the order of their first use.
+        The vertices not used by the indices are removed.
+
+        Args:
+            indices (array): The indices.
+            vertices (array): The vertices, one row or structured element per vertex.
+
+        Returns:
+            tuple: The remapped indices and the reordered vertices.
+    '''
+
+    indices = np.asarray(indices).ravel()
+    vertices = np.asarray(vertices)
+
+    _vertex_count(indices.astype('i8'), len(vertices))
+
+    used, first = np.unique(indices, return_index=True)
+    order = used[np.argsort(first, kind='stable')]
+
+    remap = np.zeros(len(vertices), dtype='i8')
+    remap[order] = np.arange(len(order))
+
+    return remap[indices].astype(indices.dtype), vertices[order]
+
+
+def index_element_size(vertex_count) -> int:
+    '''
+        The smallest index element size for the given number of vertices.
+
+        Args:
+            vertex_count (int): The number of vertices.
+
+        Returns:
+            int: 1, 2 or 4
+    '''
+
+    if vertex_count <= 0x100:
+        return 1
+
+    if vertex_count <= 0x10000:
+        return 2
+
+    return 4
+
+
+def pack_indices(indices, vertex_count=None) -> tuple:
+    '''
+        Convert the indices to the smallest index element size.
+
+        Args:
+            indices (array): The indices.
+            vertex_count (int): The number of vertices, defaults to the largest index + 1.
+
+        Returns:
+            tuple: The indices as an ``u1``, ``u2`` or ``u4`` array and the ``index_element_size``.
+    '''
+
+    indices = np.asarray(indices).ravel()
+
+    if len(indices) and indices.min() < 0:
+        raise ValueError('the indices must not be negative')
+
+    element_size = index_element_size(_vertex_count(indices.astype('i8'), vertex_count))
+    return indices.astype('u%d' % element_size), element_size
+
+
+def optimize_mesh(vertices, indices, positions=None, cache_size=16) -> tuple:
+    '''
+        Optimize an indexed triangle mesh for the vertex cache, the overdraw and the vertex fetch,
+        and pack the indices to the smallest index element size.
+
+        Args:
+            vertices (array): The vertices, one row or structured element per vertex.
+            indices (array): The triangle list.
+            positions (array): The vertex positions of shape (n, 3), the overdraw is not optimized when omitted.
+
+        Keyword Args:
+            cache_size (int): The number of vertices in the cache.
+
+        Returns:
+            tuple: The vertices, the indices and the ``index_element_size``.
+    '''
+
+    vertices = np.asarray(vertices)
+    indices = optimize_vertex_cache(indices, len(vertices), cache_size)
+
+    if positions is not None:
+        indices = optimize_overdraw(indices, positions, cache_size)
+
+    indices, vertices = optimize_vertex_fetch(indices, vertices)
+    indices, element_size = pack_indices(indices, len(vertices))
+    return vertices, indices, element_size
+
+
+def triangle_strips(indices, vertex_count=None) -> tuple:
+    '''
+        Convert a triangle list to triangle strips separated by the primitive restart index.
+        The strips are built greedily in the order of the triangles, the winding of the triangles is preserved
+        and the degenerate triangles are dropped. Optimize the triangle list for the vertex cache first.
+
+        The restart index is the largest index of the returned ``index_element_size``,
+        the element size leaves room for it. It is the default :py:attr:`VertexArray.restart_index`,
+        enable the :py:attr:`VertexArray.primitive_restart` to render the strips with ``TRIANGLE_STRIP``.
+
+        Args:
+            indices (array): The triangle list.
+            vertex_count (int): The number of vertices, defaults to the largest index + 1.
+
+        Returns:
+            tuple: The strips as an ``u1``, ``u2`` or ``u4`` array and the ``index_element_size``.
+    '''
+
+    indices = _triangles(indices)
+    vertex_count = _vertex_count(indices, vertex_count)
+    element_size = index_element_size(vertex_count + 1)
+    restart_index = (1 << (8 * element_size)) - 1
+
+    triangles = [tuple(t) for t in indices.reshape(-1, 3).tolist() if len(set(t)) == 3]
+    visited = [False] * len(triangles)
+
+    # The directed edges of the triangles, each edge maps to the triangles and their third vertex.
+    edges = {}
+    for index, (a, b, c) in enumerate(triangles):
+        edges.setdefault((a, b), []).append((index, c))
+        edges.setdefault((b, c), []).append((index, a))
+        edges.setdefault((c, a), []).append((index, b))
+
+    def neighbor(strip):
+        # The even triangles of a strip are (v0, v1, v2), the odd ones are (v1, v0, v2).
+        edge = (strip[-1], strip[-2]) if len(strip) % 2 else (strip[-2], strip[-1])
+        for index, vertex in edges.get(edge, ()):
+            if not visited[index]:
+                return index, vertex
+        return None
+
+    def extend(strip, mark):
+        added = []
+        while True:
+            found = neighbor(strip)
+            if found is None:
+                break
+            visited[found[0]] = True
+            added.append(found[0])
+            strip.append(found[1])
+        if not mark:
+            for index in added:
+                visited[index] = False
+        return strip
+
+    res = []
+
+    for index, (a, b, c) in enumerate(triangles):
+        if visited[index]:
+            continue
+
+        visited[index] = True
+        rotations = [[a, b, c], [b, c, a], [c, a, b]]
+        best = max(range(3), key=lambda i: len(extend(list(rotations[i]), False)))
+
+        if res:
+            res.append(restart_index)
+
+        res.extend(extend(rotations[best], True))
+
+    return np.array(res, dtype='u%d' % element_size), element_size
+
+
+def weld_vertices(data, fmt, tolerance=0.0, position=0) -> tuple:
+    '''
+        Merge the identical vertices of unindexed vertex data.
+        The vertices keep the order of their first occurrence, the padding is not compared.
+
+        With a positive ``tolerance`` the positions are snapped to a grid of the given cell size
+        before they are compared, the welded vertex keeps the first of the positions.
+        The other attributes must still be identical.
+
+        Args:
+            data (bytes): The interleaved vertex data, bytes or a NumPy array.
+            fmt (str): The buffer format of a single vertex or a NumPy structured dtype.
+
+        Keyword Args:
+            tolerance (float): The distance within the float positions are welded.
+            position (int): The index of the position attribute in the format.
+
+        Returns:
+            tuple: The vertices as a NumPy structured array and the indices.
+    '''
+
+    dtype = format_dtype(fmt) if isinstance(fmt, str) else np.dtype(fmt)
+    data = data.tobytes() if hasattr(data, 'tobytes') else bytes(data)
+
+    if not dtype.names:
+        raise ValueError('the format must have attributes')
+
+    if len(data) % dtype.itemsize:
+        raise ValueError('the data size is not a multiple of the vertex size %d' % dtype.itemsize)
+
+    vertices = np.frombuffer(data, dtype=dtype)
+    num_vertices = len(vertices)
+
+    keys = []
+
+    for index, name in enumerate(dtype.names):
+        field = np.ascontiguousarray(vertices[name]).reshape(num_vertices, -1)
+
+        if tolerance > 0.0 and index == position:
+            if field.dtype.kind != 'f':
+                raise ValueError('the %r attribute must be a float attribute to weld with tolerance' % name)
+            field = np.round(field.astype('f8') / tolerance).astype('i8')
+
+        keys.append(field.view('u1').reshape(num_vertices, -1))
+
+    # Each vertex is compared as a single opaque value.
+    keys = np.ascontiguousarray(np.hstack(keys))
+    keys = keys.view('V%d' % keys.shape[1]).ravel()
+
+    unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind='stable')
+
+    rank = np.empty(len(order), dtype='i8')
+    rank[order] = np.arange(len(order))
+
+    return vertices[first[order]], rank[inverse.ravel()]
+
+
+def weld_mesh(ctx, program, data, fmt, *attributes, tolerance=0.0, position=0, optimize=True) -> tuple:
+    '''
+        Create an indexed :py:class:`VertexArray` from unindexed vertex data.
+        The identical vertices are merged with :py:func:`weld_vertices`,
+        the triangles are optimized for the vertex cache and the vertex fetch.
+
+        Args:
+            ctx (Context): The context.
+            program (Program): The program used when rendering.
+            data (bytes): The interleaved vertex data of a triangle list, bytes or a NumPy array.
+            fmt (str): The buffer format of a single vertex or a NumPy structured dtype.
+            attributes (list): A list of attribute names, defaults to the field names of the dtype.
+
+        Keyword Args:
+            tolerance (float): The distance within the float positions are welded.
+            position (int): The index of the position attribute in the format.
+            optimize (bool): Optimize the triangles for the vertex cache and the vertex fetch.
+
+        Returns:
+            tuple: The vertex buffer, the index buffer and the VertexArray.
+    '''
+
+    vertices, indices = weld_vertices(data, fmt, tolerance, position)
+
+    if optimize:
+        indices = optimize_vertex_cache(indices, len(vertices))
+        indices, vertices = optimize_vertex_fetch(indices, vertices)
+
+    indices, element_size = pack_indices(indices, len(vertices))
+
+    vbo = ctx.buffer(vertices.tobytes())
+    ibo = ctx.buffer(indices.tobytes())
+    vao = ctx.vertex_array(program, [(vbo, fmt) + attributes], ibo, index_element_size=element_size)
+    return vbo, ibo, vao
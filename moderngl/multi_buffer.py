@@ -0,0 +1,191 @@
+from .buffer import Buffer
+from .readback import TIMEOUT_IGNORED
+
+__all__ = ['MultiBuffer']
+
+
+class MultiBuffer:
+    '''
+        A MultiBuffer keeps a copy of a dynamic :py:class:`Buffer` for each frame in flight.
+
+        Writing a buffer that is still used by a previous draw call makes the driver wait for the GPU.
+        The MultiBuffer writes the copy of the current frame only.
+        :py:meth:`MultiBuffer.next_frame` fences the current copy and moves to the next one.
+        It only waits when the GPU is still using the next copy.
+
+        A MultiBuffer can be used in place of a Buffer when creating a :py:class:`VertexArray`,
+        the VertexArray always renders from the copy of the current frame.
+
+        A MultiBuffer object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.multi_buffer` to create one.
+    '''
+
+    __slots__ = ['_buffers', '_frame', '_fences', 'ctx', 'extra', '__weakref__']
+
+    def __init__(self):
+        self._buffers = None
+        self._frame = None
+        self._fences = None
+        self.ctx = None
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<MultiBuffer: %d frames>' % len(self._buffers)
+
+    @property
+    def buffer(self) -> Buffer:
+        '''
+            Buffer: The copy of the current frame.
+        '''
+
+        return self._buffers[self._frame]
+
+    @property
+    def buffers(self) -> tuple:
+        '''
+            tuple: The copies of all the frames.
+        '''
+
+        return self._buffers
+
+    @property
+    def frames(self) -> int:
+        '''
+            int: The number of frames in flight.
+        '''
+
+        return len(self._buffers)
+
+    @property
+    def frame(self) -> int:
+        '''
+            int: The index of the copy used by the current frame.
+        '''
+
+        return self._frame
+
+    @property
+    def size(self) -> int:
+        '''
+            int: The size of each copy.
+        '''
+
+        return self._buffers[0].size
+
+    def write(self, data, *, offset=0) -> None:
+        '''
+            Write the content of the current frame.
+
+            Args:
+                data (bytes): The data.
+
+            Keyword Args:
+                offset (int): The offset.
+        '''
+
+        self._buffers[self._frame].write(data, offset=offset)
+
+    def read(self, size=-1, *, offset=0) -> bytes:
+        '''
+            Read the content of the current frame.
+
+            Args:
+                size (int): The size. Value ``-1`` means all.
+
+            Keyword Args:
+                offset (int): The offset.
+
+            Returns:
+                bytes
+        '''
+
+        return self._buffers[self._frame].read(size, offset=offset)
+
+    def clear(self, size=-1, *, offset=0, chunk=None, value=None, dtype='f4') -> None:
+        '''
+            Clear the content of the current frame.
+
+            Args:
+                size (int): The size. Value ``-1`` means all.
+
+            Keyword Args:
+                offset (int): The offset.
+                chunk (bytes): The chunk to use repeatedly.
+                value (tuple): The value to use repeatedly instead of the chunk.
+                dtype (str): The data type of the value.
+        '''
+
+        self._buffers[self._frame].clear(size, offset=offset, chunk=chunk, value=value, dtype=dtype)
+
+    def bind_to_uniform_block(self, binding=0, *, offset=0, size=-1) -> None:
+        '''
+            Bind the copy of the current frame to a uniform block.
+
+            Args:
+                binding (int): The uniform block binding.
+
+            Keyword Args:
+                offset (int): The offset.
+                size (int): The size. Value ``-1`` means all.
+        '''
+
+        self._buffers[self._frame].bind_to_uniform_block(binding, offset=offset, size=size)
+
+    def bind_to_storage_buffer(self, binding=0, *, offset=0, size=-1) -> None:
+        '''
+            Bind the copy of the current frame to a shader storage buffer.
+
+            Args:
+                binding (int): The shader storage binding.
+
+            Keyword Args:
+                offset (int): The offset.
+                size (int): The size. Value ``-1`` means all.
+        '''
+
+        self._buffers[self._frame].bind_to_storage_buffer(binding, offset=offset, size=size)
+
+    def bind(self, *attribs, layout=None):
+        return (self, layout, *attribs)
+
+    def next_frame(self, *, copy=False) -> None:
+        '''
+            Finish the current frame and start the next one.
+
+            Call it after the draw calls reading the current frame's copy were issued.
+            The new copy still holds the content written ``frames`` frames ago.
+
+            Keyword Args:
+                copy (bool): Copy the content of the finished frame into the new one on the GPU.
+                             Use it when only parts of the buffer are written each frame.
+        '''
+
+        previous = self._buffers[self._frame]
+
+        self._fences[self._frame] = self.ctx.mglo.fence()
+        self._frame = (self._frame + 1) % len(self._buffers)
+
+        fence = self._fences[self._frame]
+
+        if fence is not None:
+            self.ctx.mglo.wait_fence(fence, TIMEOUT_IGNORED)
+            self.ctx.mglo.delete_fence(fence)
+            self._fences[self._frame] = None
+
+        if copy and previous is not self._buffers[self._frame]:
+            self.ctx.copy_buffer(self._buffers[self._frame], previous)
+
+    def release(self) -> None:
+        '''
+            Release the ModernGL objects.
+        '''
+
+        for fence in self._fences:
+            if fence is not None:
+                self.ctx.mglo.delete_fence(fence)
+
+        self._fences = [None] * len(self._buffers)
+
+        for buffer in self._buffers:
+            buffer.release()
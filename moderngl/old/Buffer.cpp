@@ -4,19 +4,51 @@ PyObject * MGLContext_buffer(MGLContext * self, PyObject * args) {
 	PyObject * data;
 	int reserve;
 	int dynamic;
+	int flags;
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"OIp",
+		"OIpi",
 		&data,
 		&reserve,
-		&dynamic
+		&dynamic,
+		&flags
 	);
 
 	if (!args_ok) {
 		return 0;
 	}
 
+	const GLMethods & gl = self->gl;
+
+	// Negative flags request a mutable buffer (glBufferData)
+	bool immutable = flags >= 0;
+
+	const int map_flags = GL_MAP_READ_BIT | GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT;
+	const int storage_flags = map_flags | GL_DYNAMIC_STORAGE_BIT | GL_CLIENT_STORAGE_BIT;
+
+	if (immutable) {
+		if (!self->buffer_storage) {
+			MGLError_Set("immutable buffers are not supported");
+			return 0;
+		}
+
+		if (flags & ~storage_flags) {
+			MGLError_Set("invalid storage flags 0x%x", flags);
+			return 0;
+		}
+
+		if ((flags & GL_MAP_PERSISTENT_BIT) && !(flags & (GL_MAP_READ_BIT | GL_MAP_WRITE_BIT))) {
+			MGLError_Set("persistent mapping requires MAP_READ or MAP_WRITE");
+			return 0;
+		}
+
+		if ((flags & GL_MAP_COHERENT_BIT) && !(flags & GL_MAP_PERSISTENT_BIT)) {
+			MGLError_Set("coherent mapping requires MAP_PERSISTENT");
+			return 0;
+		}
+	}
+
 	if (data == Py_None && !reserve) {
 		MGLError_Set("missing data or reserve");
 		return 0;
@@ -52,8 +84,8 @@ PyObject * MGLContext_buffer(MGLContext * self, PyObject * args) {
 
 	buffer->size = (int)buffer_view.len;
 	buffer->dynamic = dynamic ? true : false;
-
-	const GLMethods & gl = self->gl;
+	buffer->immutable = immutable;
+	buffer->flags = immutable ? flags : 0;
 
 	buffer->buffer_obj = 0;
 	gl.GenBuffers(1, (GLuint *)&buffer->buffer_obj);
@@ -65,7 +97,33 @@ PyObject * MGLContext_buffer(MGLContext * self, PyObject * args) {
 	}
 
 	gl.BindBuffer(GL_ARRAY_BUFFER, buffer->buffer_obj);
-	gl.BufferData(GL_ARRAY_BUFFER, buffer->size, buffer_view.buf, dynamic ? GL_DYNAMIC_DRAW : GL_STATIC_DRAW);
+	Py_BEGIN_ALLOW_THREADS
+	if (immutable) {
+		gl.BufferStorage(GL_ARRAY_BUFFER, buffer->size, buffer_view.buf, flags);
+	} else {
+		gl.BufferData(GL_ARRAY_BUFFER, buffer->size, buffer_view.buf, dynamic ? GL_DYNAMIC_DRAW : GL_STATIC_DRAW);
+	}
+	Py_END_ALLOW_THREADS
+
+	if (immutable && (flags & GL_MAP_PERSISTENT_BIT)) {
+		// The writes to a mapping without MAP_COHERENT are only visible after an explicit flush.
+		int access = flags & map_flags;
+		if ((access & GL_MAP_WRITE_BIT) && !(access & GL_MAP_COHERENT_BIT)) {
+			access |= GL_MAP_FLUSH_EXPLICIT_BIT;
+		}
+
+		buffer->mapping = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, 0, buffer->size, access);
+
+		if (!buffer->mapping) {
+			MGLError_Set("cannot map the buffer");
+			gl.DeleteBuffers(1, (GLuint *)&buffer->buffer_obj);
+			if (data != Py_None) {
+				PyBuffer_Release(&buffer_view);
+			}
+			Py_DECREF(buffer);
+			return 0;
+		}
+	}
 
 	Py_INCREF(self);
 	buffer->context = self;
@@ -83,6 +141,63 @@ PyObject * MGLContext_buffer(MGLContext * self, PyObject * args) {
 	return result;
 }
 
+// Persistently mapped buffers keep their mapping for their whole lifetime.
+// The mapping is reused instead of calling glMapBufferRange again (which would fail).
+// glMapBufferRange waits for the pending commands using the buffer, the reused mapping waits for a fence instead.
+
+inline char * MGLBuffer_MapRange(MGLBuffer * self, Py_ssize_t offset, Py_ssize_t size, int access) {
+	const GLMethods & gl = self->context->gl;
+
+	if (self->mapping) {
+		if (access & (GL_MAP_READ_BIT | GL_MAP_WRITE_BIT) & ~self->flags) {
+			return 0;
+		}
+
+		if (!(access & GL_MAP_UNSYNCHRONIZED_BIT)) {
+			if ((access & GL_MAP_READ_BIT) && !(self->flags & GL_MAP_COHERENT_BIT)) {
+				gl.MemoryBarrier(GL_CLIENT_MAPPED_BUFFER_BARRIER_BIT);
+			}
+
+			GLsync sync = gl.FenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0);
+			Py_BEGIN_ALLOW_THREADS
+			gl.ClientWaitSync(sync, GL_SYNC_FLUSH_COMMANDS_BIT, GL_TIMEOUT_IGNORED);
+			Py_END_ALLOW_THREADS
+			gl.DeleteSync(sync);
+		}
+
+		self->mapped_offset = offset;
+		self->mapped_size = size;
+		self->mapped_access = access;
+		return self->mapping + offset;
+	}
+
+	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+
+	// Mapping waits for the pending draw calls using the buffer
+	char * map;
+	Py_BEGIN_ALLOW_THREADS
+	map = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, offset, size, access);
+	Py_END_ALLOW_THREADS
+	return map;
+}
+
+inline void MGLBuffer_UnmapRange(MGLBuffer * self) {
+	const GLMethods & gl = self->context->gl;
+
+	if (self->mapping) {
+		if ((self->mapped_access & GL_MAP_WRITE_BIT) && !(self->flags & GL_MAP_COHERENT_BIT)) {
+			gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+			gl.FlushMappedBufferRange(GL_ARRAY_BUFFER, (GLintptr)self->mapped_offset, (GLsizeiptr)self->mapped_size);
+		}
+
+		self->mapped_access = 0;
+		return;
+	}
+
+	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+	gl.UnmapBuffer(GL_ARRAY_BUFFER);
+}
+
 PyObject * MGLBuffer_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
 	MGLBuffer * self = (MGLBuffer *)type->tp_alloc(type, 0);
 
@@ -99,12 +214,14 @@ void MGLBuffer_tp_dealloc(MGLBuffer * self) {
 PyObject * MGLBuffer_write(MGLBuffer * self, PyObject * args) {
 	PyObject * data;
 	Py_ssize_t offset;
+	int unsynchronized = false;
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"On",
+		"On|p",
 		&data,
-		&offset
+		&offset,
+		&unsynchronized
 	);
 
 	if (!args_ok) {
@@ -125,9 +242,36 @@ PyObject * MGLBuffer_write(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
+	// The unsynchronized writes and the buffers without DYNAMIC_STORAGE are written through a mapping.
+	if (buffer_view.len && (unsynchronized || (self->mapping && !(self->flags & GL_DYNAMIC_STORAGE_BIT)))) {
+		int access = GL_MAP_WRITE_BIT | (unsynchronized ? GL_MAP_UNSYNCHRONIZED_BIT : 0);
+		char * map = MGLBuffer_MapRange(self, offset, buffer_view.len, access);
+
+		if (!map) {
+			MGLError_Set("cannot map the buffer");
+			PyBuffer_Release(&buffer_view);
+			return 0;
+		}
+
+		Py_BEGIN_ALLOW_THREADS
+		memcpy(map, buffer_view.buf, buffer_view.len);
+		Py_END_ALLOW_THREADS
+		MGLBuffer_UnmapRange(self);
+		PyBuffer_Release(&buffer_view);
+		Py_RETURN_NONE;
+	}
+
+	if (self->immutable && !(self->flags & GL_DYNAMIC_STORAGE_BIT)) {
+		MGLError_Set("the buffer was created without DYNAMIC_STORAGE");
+		PyBuffer_Release(&buffer_view);
+		return 0;
+	}
+
 	const GLMethods & gl = self->context->gl;
 	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+	Py_BEGIN_ALLOW_THREADS
 	gl.BufferSubData(GL_ARRAY_BUFFER, (GLintptr)offset, buffer_view.len, buffer_view.buf);
+	Py_END_ALLOW_THREADS
 	PyBuffer_Release(&buffer_view);
 	Py_RETURN_NONE;
 }
@@ -156,19 +300,21 @@ PyObject * MGLBuffer_read(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-
-	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
-	void * map = gl.MapBufferRange(GL_ARRAY_BUFFER, offset, size, GL_MAP_READ_BIT);
+	char * map = MGLBuffer_MapRange(self, offset, size, GL_MAP_READ_BIT);
 
 	if (!map) {
 		MGLError_Set("cannot map the buffer");
 		return 0;
 	}
 
-	PyObject * data = PyBytes_FromStringAndSize((const char *)map, size);
+	PyObject * data = PyBytes_FromStringAndSize(0, size);
+	char * ptr = PyBytes_AS_STRING(data);
 
-	gl.UnmapBuffer(GL_ARRAY_BUFFER);
+	Py_BEGIN_ALLOW_THREADS
+	memcpy(ptr, map, size);
+	Py_END_ALLOW_THREADS
+
+	MGLBuffer_UnmapRange(self);
 
 	return data;
 }
@@ -215,15 +361,21 @@ PyObject * MGLBuffer_read_into(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
+	char * map = MGLBuffer_MapRange(self, offset, size, GL_MAP_READ_BIT);
 
-	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
-	void * map = gl.MapBufferRange(GL_ARRAY_BUFFER, offset, size, GL_MAP_READ_BIT);
+	if (!map) {
+		MGLError_Set("cannot map the buffer");
+		PyBuffer_Release(&buffer_view);
+		return 0;
+	}
 
 	char * ptr = (char *)buffer_view.buf + write_offset;
+
+	Py_BEGIN_ALLOW_THREADS
 	memcpy(ptr, map, size);
+	Py_END_ALLOW_THREADS
 
-	gl.UnmapBuffer(GL_ARRAY_BUFFER);
+	MGLBuffer_UnmapRange(self);
 
 	PyBuffer_Release(&buffer_view);
 	Py_RETURN_NONE;
@@ -258,9 +410,6 @@ PyObject * MGLBuffer_write_chunks(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
-
 	Py_ssize_t chunk_size = buffer_view.len / count;
 
 	if (buffer_view.len != chunk_size * count) {
@@ -279,7 +428,7 @@ PyObject * MGLBuffer_write_chunks(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
-	char * write_ptr = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, 0, self->size, GL_MAP_WRITE_BIT);
+	char * write_ptr = MGLBuffer_MapRange(self, 0, self->size, GL_MAP_WRITE_BIT);
 	char * read_ptr = (char *)buffer_view.buf;
 
 	if (!write_ptr) {
@@ -289,13 +438,16 @@ PyObject * MGLBuffer_write_chunks(MGLBuffer * self, PyObject * args) {
 	}
 
 	write_ptr += start;
+
+	Py_BEGIN_ALLOW_THREADS
 	for (Py_ssize_t i = 0; i < count; ++i) {
 		memcpy(write_ptr, read_ptr, chunk_size);
 		read_ptr += chunk_size;
 		write_ptr += step;
 	}
+	Py_END_ALLOW_THREADS
 
-	gl.UnmapBuffer(GL_ARRAY_BUFFER);
+	MGLBuffer_UnmapRange(self);
 	PyBuffer_Release(&buffer_view);
 	Py_RETURN_NONE;
 }
@@ -330,11 +482,7 @@ PyObject * MGLBuffer_read_chunks(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-
-	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
-
-	char * read_ptr = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, 0, self->size, GL_MAP_READ_BIT);
+	char * read_ptr = MGLBuffer_MapRange(self, 0, self->size, GL_MAP_READ_BIT);
 
 	if (!read_ptr) {
 		MGLError_Set("cannot map the buffer");
@@ -345,13 +493,16 @@ PyObject * MGLBuffer_read_chunks(MGLBuffer * self, PyObject * args) {
 	char * write_ptr = PyBytes_AS_STRING(data);
 
 	read_ptr += start;
+
+	Py_BEGIN_ALLOW_THREADS
 	for (Py_ssize_t i = 0; i < count; ++i) {
 		memcpy(write_ptr, read_ptr, chunk_size);
 		write_ptr += chunk_size;
 		read_ptr += step;
 	}
+	Py_END_ALLOW_THREADS
 
-	gl.UnmapBuffer(GL_ARRAY_BUFFER);
+	MGLBuffer_UnmapRange(self);
 	return data;
 }
 
@@ -386,26 +537,253 @@ PyObject * MGLBuffer_read_chunks_into(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-
-	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
-
-	char * read_ptr = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, 0, self->size, GL_MAP_READ_BIT);
+	char * read_ptr = MGLBuffer_MapRange(self, 0, self->size, GL_MAP_READ_BIT);
 	char * write_ptr = (char *)buffer_view.buf + write_offset;
 
 	if (!read_ptr) {
 		MGLError_Set("cannot map the buffer");
+		PyBuffer_Release(&buffer_view);
 		return 0;
 	}
 
 	read_ptr += start;
+
+	Py_BEGIN_ALLOW_THREADS
 	for (Py_ssize_t i = 0; i < count; ++i) {
 		memcpy(write_ptr, read_ptr, chunk_size);
 		write_ptr += chunk_size;
 		read_ptr += step;
 	}
+	Py_END_ALLOW_THREADS
+
+	MGLBuffer_UnmapRange(self);
+	PyBuffer_Release(&buffer_view);
+	Py_RETURN_NONE;
+}
+
+// Ranges are given as two arrays of 32 or 64 bit integers (offsets and sizes).
+// On success the ranges are stored as [offset, size] pairs and must be freed with delete[].
+
+Py_ssize_t * MGLBuffer_ParseRanges(MGLBuffer * self, PyObject * offsets, PyObject * sizes, Py_ssize_t * count, Py_ssize_t * total, Py_ssize_t * start, Py_ssize_t * end) {
+	PyObject * arrays[2] = {offsets, sizes};
+	Py_buffer views[2];
+
+	for (int i = 0; i < 2; ++i) {
+		int get_buffer = PyObject_GetBuffer(arrays[i], &views[i], PyBUF_C_CONTIGUOUS | PyBUF_FORMAT);
+		if (get_buffer < 0) {
+			MGLError_Set("the %s (%s) does not support buffer interface", i ? "sizes" : "offsets", Py_TYPE(arrays[i])->tp_name);
+			if (i) {
+				PyBuffer_Release(&views[0]);
+			}
+			return 0;
+		}
+	}
+
+	bool valid = true;
+
+	for (int i = 0; i < 2; ++i) {
+		const char * format = views[i].format ? views[i].format : "B";
+		char code = format[strlen(format) - 1];
+		if ((views[i].itemsize != 4 && views[i].itemsize != 8) || !strchr("ilqILQ", code)) {
+			MGLError_Set("the %s must be an array of 32 or 64 bit integers", i ? "sizes" : "offsets");
+			valid = false;
+			break;
+		}
+	}
+
+	if (valid && views[0].len / views[0].itemsize != views[1].len / views[1].itemsize) {
+		MGLError_Set("the offsets and sizes must have the same length");
+		valid = false;
+	}
+
+	Py_ssize_t * ranges = 0;
+
+	if (valid) {
+		*count = views[0].len / views[0].itemsize;
+		*total = 0;
+		*start = self->size;
+		*end = 0;
+
+		ranges = new Py_ssize_t[*count * 2 + 1];
+
+		for (Py_ssize_t i = 0; i < *count * 2; ++i) {
+			Py_buffer & view = views[i % 2];
+			Py_ssize_t index = i / 2;
+			ranges[i] = (view.itemsize == 8) ? (Py_ssize_t)((long long *)view.buf)[index] : (Py_ssize_t)((int *)view.buf)[index];
+		}
+
+		for (Py_ssize_t i = 0; i < *count; ++i) {
+			Py_ssize_t offset = ranges[i * 2];
+			Py_ssize_t size = ranges[i * 2 + 1];
+
+			if (offset < 0 || size < 0 || offset + size > self->size) {
+				MGLError_Set("out of range offset = %d or size = %d at index %d", offset, size, i);
+				delete[] ranges;
+				ranges = 0;
+				break;
+			}
+
+			*total += size;
+			*start = offset < *start ? offset : *start;
+			*end = offset + size > *end ? offset + size : *end;
+		}
+	}
+
+	PyBuffer_Release(&views[0]);
+	PyBuffer_Release(&views[1]);
+	return ranges;
+}
+
+PyObject * MGLBuffer_write_ranges(MGLBuffer * self, PyObject * args) {
+	PyObject * data;
+	PyObject * offsets;
+	PyObject * sizes;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"OOO",
+		&data,
+		&offsets,
+		&sizes
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	Py_ssize_t count, total, start, end;
+	Py_ssize_t * ranges = MGLBuffer_ParseRanges(self, offsets, sizes, &count, &total, &start, &end);
+
+	if (!ranges) {
+		return 0;
+	}
+
+	Py_buffer buffer_view;
+
+	int get_buffer = PyObject_GetBuffer(data, &buffer_view, PyBUF_SIMPLE);
+	if (get_buffer < 0) {
+		MGLError_Set("data (%s) does not support buffer interface", Py_TYPE(data)->tp_name);
+		delete[] ranges;
+		return 0;
+	}
+
+	if (buffer_view.len != total) {
+		MGLError_Set("data (%d bytes) does not match the total size of the ranges (%d bytes)", buffer_view.len, total);
+		PyBuffer_Release(&buffer_view);
+		delete[] ranges;
+		return 0;
+	}
+
+	if (!total) {
+		PyBuffer_Release(&buffer_view);
+		delete[] ranges;
+		Py_RETURN_NONE;
+	}
+
+	char * map = MGLBuffer_MapRange(self, start, end - start, GL_MAP_WRITE_BIT);
+
+	if (!map) {
+		MGLError_Set("cannot map the buffer");
+		PyBuffer_Release(&buffer_view);
+		delete[] ranges;
+		return 0;
+	}
+
+	Py_BEGIN_ALLOW_THREADS
+	char * read_ptr = (char *)buffer_view.buf;
+	for (Py_ssize_t i = 0; i < count; ++i) {
+		memcpy(map + ranges[i * 2] - start, read_ptr, ranges[i * 2 + 1]);
+		read_ptr += ranges[i * 2 + 1];
+	}
+	Py_END_ALLOW_THREADS
+
+	MGLBuffer_UnmapRange(self);
+	PyBuffer_Release(&buffer_view);
+	delete[] ranges;
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLBuffer_read_ranges_into(MGLBuffer * self, PyObject * args) {
+	PyObject * data;
+	PyObject * offsets;
+	PyObject * sizes;
+	Py_ssize_t write_offset;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"OOOn",
+		&data,
+		&offsets,
+		&sizes,
+		&write_offset
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	Py_ssize_t count, total, start, end;
+	Py_ssize_t * ranges = MGLBuffer_ParseRanges(self, offsets, sizes, &count, &total, &start, &end);
+
+	if (!ranges) {
+		return 0;
+	}
+
+	PyObject * result = 0;
+	Py_buffer buffer_view;
+
+	if (data == Py_None) {
+		result = PyBytes_FromStringAndSize(0, total);
+		buffer_view.buf = PyBytes_AS_STRING(result);
+		buffer_view.len = total;
+		write_offset = 0;
+	} else {
+		int get_buffer = PyObject_GetBuffer(data, &buffer_view, PyBUF_WRITABLE);
+		if (get_buffer < 0) {
+			MGLError_Set("the buffer (%s) does not support buffer interface", Py_TYPE(data)->tp_name);
+			delete[] ranges;
+			return 0;
+		}
+
+		if (write_offset < 0 || buffer_view.len < write_offset + total) {
+			MGLError_Set("the buffer is too small");
+			PyBuffer_Release(&buffer_view);
+			delete[] ranges;
+			return 0;
+		}
+	}
+
+	char * map = total ? MGLBuffer_MapRange(self, start, end - start, GL_MAP_READ_BIT) : 0;
+
+	if (total && !map) {
+		MGLError_Set("cannot map the buffer");
+		if (data == Py_None) {
+			Py_DECREF(result);
+		} else {
+			PyBuffer_Release(&buffer_view);
+		}
+		delete[] ranges;
+		return 0;
+	}
+
+	if (total) {
+		Py_BEGIN_ALLOW_THREADS
+		char * write_ptr = (char *)buffer_view.buf + write_offset;
+		for (Py_ssize_t i = 0; i < count; ++i) {
+			memcpy(write_ptr, map + ranges[i * 2] - start, ranges[i * 2 + 1]);
+			write_ptr += ranges[i * 2 + 1];
+		}
+		Py_END_ALLOW_THREADS
+
+		MGLBuffer_UnmapRange(self);
+	}
+
+	delete[] ranges;
+
+	if (data == Py_None) {
+		return result;
+	}
 
-	gl.UnmapBuffer(GL_ARRAY_BUFFER);
 	PyBuffer_Release(&buffer_view);
 	Py_RETURN_NONE;
 }
@@ -431,6 +809,11 @@ PyObject * MGLBuffer_clear(MGLBuffer * self, PyObject * args) {
 		size = self->size - offset;
 	}
 
+	if (offset < 0 || size < 0 || offset + size > self->size) {
+		MGLError_Set("out of range offset = %d or size = %d", offset, size);
+		return 0;
+	}
+
 	Py_buffer buffer_view;
 
 	if (chunk != Py_None) {
@@ -440,7 +823,7 @@ PyObject * MGLBuffer_clear(MGLBuffer * self, PyObject * args) {
 			return 0;
 		}
 
-		if (size % buffer_view.len != 0) {
+		if (!buffer_view.len || size % buffer_view.len != 0) {
 			MGLError_Set("the chunk does not fit the size");
 			PyBuffer_Release(&buffer_view);
 			return 0;
@@ -451,15 +834,50 @@ PyObject * MGLBuffer_clear(MGLBuffer * self, PyObject * args) {
 	}
 
 	const GLMethods & gl = self->context->gl;
-	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
 
-	char * map = (char *)gl.MapBufferRange(GL_ARRAY_BUFFER, offset, size, GL_MAP_WRITE_BIT);
+	if (self->context->clear_buffer_object) {
+		// The chunk is passed as unsigned integers so the bits are copied without conversion.
+		// A null chunk clears the range with zeros.
+
+		int internal_format = 0;
+		int format = 0;
+		int type = 0;
+
+		switch (buffer_view.len) {
+			case 0:
+			case 1: internal_format = GL_R8UI; format = GL_RED_INTEGER; type = GL_UNSIGNED_BYTE; break;
+			case 2: internal_format = GL_R16UI; format = GL_RED_INTEGER; type = GL_UNSIGNED_SHORT; break;
+			case 4: internal_format = GL_R32UI; format = GL_RED_INTEGER; type = GL_UNSIGNED_INT; break;
+			case 8: internal_format = GL_RG32UI; format = GL_RG_INTEGER; type = GL_UNSIGNED_INT; break;
+			case 12: internal_format = GL_RGB32UI; format = GL_RGB_INTEGER; type = GL_UNSIGNED_INT; break;
+			case 16: internal_format = GL_RGBA32UI; format = GL_RGBA_INTEGER; type = GL_UNSIGNED_INT; break;
+		}
+
+		Py_ssize_t element_size = buffer_view.len ? buffer_view.len : 1;
+
+		if (internal_format && offset % element_size == 0) {
+			gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
+			gl.ClearBufferSubData(GL_ARRAY_BUFFER, internal_format, offset, size, format, type, buffer_view.buf);
+
+			if (chunk != Py_None) {
+				PyBuffer_Release(&buffer_view);
+			}
+
+			Py_RETURN_NONE;
+		}
+	}
+
+	char * map = MGLBuffer_MapRange(self, offset, size, GL_MAP_WRITE_BIT);
 
 	if (!map) {
 		MGLError_Set("cannot map the buffer");
+		if (chunk != Py_None) {
+			PyBuffer_Release(&buffer_view);
+		}
 		return 0;
 	}
 
+	Py_BEGIN_ALLOW_THREADS
 	if (buffer_view.len) {
 		char * src = (char *)buffer_view.buf;
 		Py_ssize_t divisor = buffer_view.len;
@@ -468,10 +886,11 @@ PyObject * MGLBuffer_clear(MGLBuffer * self, PyObject * args) {
 			map[i] = src[i % divisor];
 		}
 	} else {
-		memset(map + offset, 0, size);
+		memset(map, 0, size);
 	}
+	Py_END_ALLOW_THREADS
 
-	gl.UnmapBuffer(GL_ARRAY_BUFFER);
+	MGLBuffer_UnmapRange(self);
 
 	if (chunk != Py_None) {
 		PyBuffer_Release(&buffer_view);
@@ -480,7 +899,211 @@ PyObject * MGLBuffer_clear(MGLBuffer * self, PyObject * args) {
 	Py_RETURN_NONE;
 }
 
+PyObject * MGLBuffer_map(MGLBuffer * self, PyObject * args) {
+	Py_ssize_t offset;
+	Py_ssize_t size;
+	int read;
+	int write;
+	int invalidate;
+	int unsynchronized;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"nnpppp",
+		&offset,
+		&size,
+		&read,
+		&write,
+		&invalidate,
+		&unsynchronized
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (size < 0) {
+		size = self->size - offset;
+	}
+
+	if (offset < 0 || size <= 0 || offset + size > self->size) {
+		MGLError_Set("out of range offset = %d or size = %d", offset, size);
+		return 0;
+	}
+
+	if (!read && !write) {
+		MGLError_Set("the mapping must be readable or writable");
+		return 0;
+	}
+
+	if (read && invalidate) {
+		MGLError_Set("invalidated mappings cannot be read");
+		return 0;
+	}
+
+	int access = 0;
+
+	if (read) {
+		access |= GL_MAP_READ_BIT;
+	}
+
+	if (write) {
+		access |= GL_MAP_WRITE_BIT;
+	}
+
+	if (invalidate) {
+		access |= GL_MAP_INVALIDATE_RANGE_BIT;
+	}
+
+	if (unsynchronized) {
+		access |= GL_MAP_UNSYNCHRONIZED_BIT;
+	}
+
+	if (self->map_view) {
+		MGLError_Set("the buffer is already mapped");
+		return 0;
+	}
+
+	char * map = MGLBuffer_MapRange(self, offset, size, access);
+
+	if (!map) {
+		MGLError_Set("cannot map the buffer");
+		return 0;
+	}
+
+	// The memoryview exports the mapping through a BufferMap object.
+	// The views derived from the memoryview keep the BufferMap exported until they are released.
+
+	MGLBufferMap * map_view = (MGLBufferMap *)MGLBufferMap_Type.tp_alloc(&MGLBufferMap_Type, 0);
+	Py_INCREF(self);
+	map_view->buffer = self;
+	map_view->ptr = map;
+	map_view->size = size;
+	map_view->readonly = !write;
+	map_view->exports = 0;
+
+	PyObject * res = PyMemoryView_FromObject((PyObject *)map_view);
+
+	if (!res) {
+		Py_DECREF(map_view);
+		MGLBuffer_UnmapRange(self);
+		return 0;
+	}
+
+	self->map_view = map_view;
+	return res;
+}
+
+void MGLBufferMap_Unmap(MGLBufferMap * self) {
+	MGLBuffer * buffer = self->buffer;
+
+	self->ptr = 0;
+
+	// A released buffer was unmapped when it was deleted.
+	if (Py_TYPE(buffer) == &MGLBuffer_Type) {
+		MGLBuffer_UnmapRange(buffer);
+	}
+
+	Py_CLEAR(buffer->map_view);
+}
+
+PyObject * MGLBuffer_unmap(MGLBuffer * self) {
+	if (!self->map_view) {
+		MGLBuffer_UnmapRange(self);
+		Py_RETURN_NONE;
+	}
+
+	// The views still using the mapped memory defer the unmap until the last one is released.
+	if (self->map_view->exports) {
+		self->map_view->unmap_pending = true;
+		Py_RETURN_NONE;
+	}
+
+	MGLBufferMap_Unmap(self->map_view);
+	Py_RETURN_NONE;
+}
+
+int MGLBufferMap_tp_as_buffer_get_view(MGLBufferMap * self, Py_buffer * view, int flags) {
+	if (!self->ptr) {
+		PyErr_Format(PyExc_BufferError, "the buffer is not mapped");
+		view->obj = 0;
+		return -1;
+	}
+
+	if (PyBuffer_FillInfo(view, (PyObject *)self, self->ptr, self->size, self->readonly, flags) < 0) {
+		return -1;
+	}
+
+	self->exports += 1;
+	return 0;
+}
+
+void MGLBufferMap_tp_as_buffer_release_view(MGLBufferMap * self, Py_buffer * view) {
+	self->exports -= 1;
+
+	// The released view holds a reference to the BufferMap, it is not deallocated here.
+	if (!self->exports && self->unmap_pending) {
+		MGLBufferMap_Unmap(self);
+	}
+}
+
+void MGLBufferMap_tp_dealloc(MGLBufferMap * self) {
+	Py_XDECREF(self->buffer);
+	MGLBufferMap_Type.tp_free((PyObject *)self);
+}
+
+PyBufferProcs MGLBufferMap_tp_as_buffer = {
+	(getbufferproc)MGLBufferMap_tp_as_buffer_get_view,               // getbufferproc bf_getbuffer
+	(releasebufferproc)MGLBufferMap_tp_as_buffer_release_view,       // releasebufferproc bf_releasebuffer
+};
+
+PyTypeObject MGLBufferMap_Type = {
+	PyVarObject_HEAD_INIT(0, 0)
+	"mgl.BufferMap",                                        // tp_name
+	sizeof(MGLBufferMap),                                   // tp_basicsize
+	0,                                                      // tp_itemsize
+	(destructor)MGLBufferMap_tp_dealloc,                    // tp_dealloc
+	0,                                                      // tp_print
+	0,                                                      // tp_getattr
+	0,                                                      // tp_setattr
+	0,                                                      // tp_reserved
+	0,                                                      // tp_repr
+	0,                                                      // tp_as_number
+	0,                                                      // tp_as_sequence
+	0,                                                      // tp_as_mapping
+	0,                                                      // tp_hash
+	0,                                                      // tp_call
+	0,                                                      // tp_str
+	0,                                                      // tp_getattro
+	0,                                                      // tp_setattro
+	&MGLBufferMap_tp_as_buffer,                             // tp_as_buffer
+	Py_TPFLAGS_DEFAULT,                                     // tp_flags
+	0,                                                      // tp_doc
+	0,                                                      // tp_traverse
+	0,                                                      // tp_clear
+	0,                                                      // tp_richcompare
+	0,                                                      // tp_weaklistoffset
+	0,                                                      // tp_iter
+	0,                                                      // tp_iternext
+	0,                                                      // tp_methods
+	0,                                                      // tp_members
+	0,                                                      // tp_getset
+	0,                                                      // tp_base
+	0,                                                      // tp_dict
+	0,                                                      // tp_descr_get
+	0,                                                      // tp_descr_set
+	0,                                                      // tp_dictoffset
+	0,                                                      // tp_init
+	0,                                                      // tp_alloc
+	0,                                                      // tp_new
+};
+
 PyObject * MGLBuffer_orphan(MGLBuffer * self) {
+	if (self->immutable) {
+		MGLError_Set("immutable buffers cannot be orphaned");
+		return 0;
+	}
+
 	const GLMethods & gl = self->context->gl;
 	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
 	gl.BufferData(GL_ARRAY_BUFFER, self->size, 0, self->dynamic ? GL_DYNAMIC_DRAW : GL_STATIC_DRAW);
@@ -551,7 +1174,11 @@ PyMethodDef MGLBuffer_tp_methods[] = {
 	{"write_chunks", (PyCFunction)MGLBuffer_write_chunks, METH_VARARGS, 0},
 	{"read_chunks", (PyCFunction)MGLBuffer_read_chunks, METH_VARARGS, 0},
 	{"read_chunks_into", (PyCFunction)MGLBuffer_read_chunks_into, METH_VARARGS, 0},
+	{"write_ranges", (PyCFunction)MGLBuffer_write_ranges, METH_VARARGS, 0},
+	{"read_ranges_into", (PyCFunction)MGLBuffer_read_ranges_into, METH_VARARGS, 0},
 	{"clear", (PyCFunction)MGLBuffer_clear, METH_VARARGS, 0},
+	{"map", (PyCFunction)MGLBuffer_map, METH_VARARGS, 0},
+	{"unmap", (PyCFunction)MGLBuffer_unmap, METH_NOARGS, 0},
 	{"orphan", (PyCFunction)MGLBuffer_orphan, METH_NOARGS, 0},
 	{"bind_to_uniform_block", (PyCFunction)MGLBuffer_bind_to_uniform_block, METH_VARARGS, 0},
 	{"bind_to_storage_buffer", (PyCFunction)MGLBuffer_bind_to_storage_buffer, METH_VARARGS, 0},
@@ -562,9 +1189,7 @@ PyMethodDef MGLBuffer_tp_methods[] = {
 int MGLBuffer_tp_as_buffer_get_view(MGLBuffer * self, Py_buffer * view, int flags) {
 	int access = (flags == PyBUF_SIMPLE) ? GL_MAP_READ_BIT : (GL_MAP_READ_BIT | GL_MAP_WRITE_BIT);
 
-	const GLMethods & gl = self->context->gl;
-	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
-	void * map = gl.MapBufferRange(GL_ARRAY_BUFFER, 0, self->size, access);
+	char * map = MGLBuffer_MapRange(self, 0, self->size, access);
 
 	if (!map) {
 		PyErr_Format(PyExc_BufferError, "Cannot map buffer");
@@ -588,8 +1213,7 @@ int MGLBuffer_tp_as_buffer_get_view(MGLBuffer * self, Py_buffer * view, int flag
 }
 
 void MGLBuffer_tp_as_buffer_release_view(MGLBuffer * self, Py_buffer * view) {
-	const GLMethods & gl = self->context->gl;
-	gl.UnmapBuffer(GL_ARRAY_BUFFER);
+	MGLBuffer_UnmapRange(self);
 }
 
 PyBufferProcs MGLBuffer_tp_as_buffer = {
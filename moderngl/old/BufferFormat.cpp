@@ -1,6 +1,6 @@
 #include "BufferFormat.hpp"
 
-#include "OpenGL.hpp"
+#include "Types.hpp"
 
 FormatNode * InvalidFormat = (FormatNode *)(-1);
 
@@ -56,6 +56,7 @@ FormatInfo FormatIterator::info() {
 
 FormatNode * FormatIterator::next() {
 	node.count = 0;
+	bool normalize = false;
 	while (true) {
 		char chr = *ptr++;
 		switch (chr) {
@@ -78,6 +79,16 @@ FormatNode * FormatIterator::next() {
 				}
 				switch (*ptr++) {
 					case '1':
+						if (*ptr == '1') {
+							++ptr;
+							if (node.count != 3 || (*ptr && *ptr != ' ' && *ptr != '/')) {
+								return InvalidFormat;
+							}
+							node.size = 4;
+							node.type = GL_UNSIGNED_INT_10F_11F_11F_REV;
+							node.normalize = false;
+							break;
+						}
 						if (*ptr && *ptr != ' ' && *ptr != '/') {
 							return InvalidFormat;
 						}
@@ -126,9 +137,18 @@ FormatNode * FormatIterator::next() {
 				if (node.count == 0) {
 					node.count = 1;
 				}
-				node.normalize = false;
+				node.normalize = normalize;
 				switch (*ptr++) {
 					case '1':
+						if (*ptr == '0') {
+							++ptr;
+							if (node.count != 4 || (*ptr && *ptr != ' ' && *ptr != '/')) {
+								return InvalidFormat;
+							}
+							node.size = 4;
+							node.type = GL_INT_2_10_10_10_REV;
+							break;
+						}
 						if (*ptr && *ptr != ' ' && *ptr != '/') {
 							return InvalidFormat;
 						}
@@ -165,9 +185,18 @@ FormatNode * FormatIterator::next() {
 				if (node.count == 0) {
 					node.count = 1;
 				}
-				node.normalize = false;
+				node.normalize = normalize;
 				switch (*ptr++) {
 					case '1':
+						if (*ptr == '0') {
+							++ptr;
+							if (node.count != 4 || (*ptr && *ptr != ' ' && *ptr != '/')) {
+								return InvalidFormat;
+							}
+							node.size = 4;
+							node.type = GL_UNSIGNED_INT_2_10_10_10_REV;
+							break;
+						}
 						if (*ptr && *ptr != ' ' && *ptr != '/') {
 							return InvalidFormat;
 						}
@@ -242,6 +271,14 @@ FormatNode * FormatIterator::next() {
 				}
 				return &node;
 
+			case 'n':
+				// The normalized integers, the next character must be the type.
+				if (*ptr != 'i' && *ptr != 'u') {
+					return InvalidFormat;
+				}
+				normalize = true;
+				break;
+
 			case ' ':
 				break;
 
@@ -255,3 +292,120 @@ FormatNode * FormatIterator::next() {
 		}
 	}
 }
+
+MGLBufferFormat * MGLBufferFormat_FromObject(PyObject * format) {
+	// Returns a new reference or 0 without an error set for the invalid formats.
+
+	if (Py_TYPE(format) == &MGLBufferFormat_Type) {
+		Py_INCREF(format);
+		return (MGLBufferFormat *)format;
+	}
+
+	if (Py_TYPE(format) != &PyUnicode_Type) {
+		return 0;
+	}
+
+	const char * str = PyUnicode_AsUTF8(format);
+
+	FormatIterator it = FormatIterator(str);
+	FormatInfo format_info = it.info();
+
+	if (!format_info.valid) {
+		return 0;
+	}
+
+	int num_nodes = 0;
+	while (it.next()) {
+		++num_nodes;
+	}
+
+	MGLBufferFormat * result = (MGLBufferFormat *)MGLBufferFormat_Type.tp_alloc(&MGLBufferFormat_Type, 0);
+
+	result->nodes = new FormatNode[num_nodes];
+	result->num_nodes = num_nodes;
+	result->info = format_info;
+
+	it = FormatIterator(str);
+	for (int i = 0; i < num_nodes; ++i) {
+		result->nodes[i] = *it.next();
+	}
+
+	return result;
+}
+
+PyObject * MGLBufferFormat_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
+	MGLBufferFormat * self = (MGLBufferFormat *)type->tp_alloc(type, 0);
+
+	if (self) {
+		self->nodes = 0;
+		self->num_nodes = 0;
+		self->info = FormatInfo::invalid();
+	}
+
+	return (PyObject *)self;
+}
+
+void MGLBufferFormat_tp_dealloc(MGLBufferFormat * self) {
+	delete[] self->nodes;
+	MGLBufferFormat_Type.tp_free((PyObject *)self);
+}
+
+PyObject * MGLBufferFormat_get_size(MGLBufferFormat * self) {
+	return PyLong_FromLong(self->info.size);
+}
+
+PyObject * MGLBufferFormat_get_nodes(MGLBufferFormat * self) {
+	return PyLong_FromLong(self->info.nodes);
+}
+
+PyObject * MGLBufferFormat_get_divisor(MGLBufferFormat * self) {
+	return PyLong_FromLong(self->info.divisor);
+}
+
+PyGetSetDef MGLBufferFormat_tp_getseters[] = {
+	{(char *)"size", (getter)MGLBufferFormat_get_size, 0, 0, 0},
+	{(char *)"nodes", (getter)MGLBufferFormat_get_nodes, 0, 0, 0},
+	{(char *)"divisor", (getter)MGLBufferFormat_get_divisor, 0, 0, 0},
+	{0},
+};
+
+PyTypeObject MGLBufferFormat_Type = {
+	PyVarObject_HEAD_INIT(0, 0)
+	"mgl.BufferFormat",                                     // tp_name
+	sizeof(MGLBufferFormat),                                // tp_basicsize
+	0,                                                      // tp_itemsize
+	(destructor)MGLBufferFormat_tp_dealloc,                 // tp_dealloc
+	0,                                                      // tp_print
+	0,                                                      // tp_getattr
+	0,                                                      // tp_setattr
+	0,                                                      // tp_reserved
+	0,                                                      // tp_repr
+	0,                                                      // tp_as_number
+	0,                                                      // tp_as_sequence
+	0,                                                      // tp_as_mapping
+	0,                                                      // tp_hash
+	0,                                                      // tp_call
+	0,                                                      // tp_str
+	0,                                                      // tp_getattro
+	0,                                                      // tp_setattro
+	0,                                                      // tp_as_buffer
+	Py_TPFLAGS_DEFAULT,                                     // tp_flags
+	0,                                                      // tp_doc
+	0,                                                      // tp_traverse
+	0,                                                      // tp_clear
+	0,                                                      // tp_richcompare
+	0,                                                      // tp_weaklistoffset
+	0,                                                      // tp_iter
+	0,                                                      // tp_iternext
+	0,                                                      // tp_methods
+	0,                                                      // tp_members
+	MGLBufferFormat_tp_getseters,                           // tp_getset
+	0,                                                      // tp_base
+	0,                                                      // tp_dict
+	0,                                                      // tp_descr_get
+	0,                                                      // tp_descr_set
+	0,                                                      // tp_dictoffset
+	0,                                                      // tp_init
+	0,                                                      // tp_alloc
+	MGLBufferFormat_tp_new,                                 // tp_new
+};
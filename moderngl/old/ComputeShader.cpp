@@ -264,7 +264,7 @@ PyObject * MGLComputeShader_run(MGLComputeShader * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.UseProgram(self->program_obj);
+	MGLContext_use_program(self->context, self->program_obj);
 	gl.DispatchCompute(x, y, z);
 
 	Py_RETURN_NONE;
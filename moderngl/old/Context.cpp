@@ -29,36 +29,30 @@ PyObject * MGLContext_enable_only(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	self->enable_flags = flags;
+	MGLContext_apply_enable_flags(self, flags);
 
-	if (flags & MGL_BLEND) {
-		self->gl.Enable(GL_BLEND);
-	} else {
-		self->gl.Disable(GL_BLEND);
-	}
+	Py_RETURN_NONE;
+}
 
-	if (flags & MGL_DEPTH_TEST) {
-		self->gl.Enable(GL_DEPTH_TEST);
-	} else {
-		self->gl.Disable(GL_DEPTH_TEST);
-	}
+PyObject * MGLContext_enable(MGLContext * self, PyObject * args) {
+	int flags;
 
-	if (flags & MGL_CULL_FACE) {
-		self->gl.Enable(GL_CULL_FACE);
-	} else {
-		self->gl.Disable(GL_CULL_FACE);
-	}
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"i",
+		&flags
+	);
 
-	if (flags & MGL_RASTERIZER_DISCARD) {
-		self->gl.Enable(GL_RASTERIZER_DISCARD);
-	} else {
-		self->gl.Disable(GL_RASTERIZER_DISCARD);
+	if (!args_ok) {
+		return 0;
 	}
 
+	MGLContext_apply_enable_flags(self, self->enable_flags | flags);
+
 	Py_RETURN_NONE;
 }
 
-PyObject * MGLContext_enable(MGLContext * self, PyObject * args) {
+PyObject * MGLContext_disable(MGLContext * self, PyObject * args) {
 	int flags;
 
 	int args_ok = PyArg_ParseTuple(
@@ -71,63 +65,190 @@ PyObject * MGLContext_enable(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	self->enable_flags |= flags;
+	MGLContext_apply_enable_flags(self, self->enable_flags & ~flags);
+
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLContext_finish(MGLContext * self) {
+	Py_BEGIN_ALLOW_THREADS
+	self->gl.Finish();
+	Py_END_ALLOW_THREADS
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLContext_fence(MGLContext * self) {
+	GLsync sync = self->gl.FenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0);
 
-	if (flags & MGL_BLEND) {
-		self->gl.Enable(GL_BLEND);
+	if (!sync) {
+		MGLError_Set("cannot create fence");
+		return 0;
 	}
 
-	if (flags & MGL_DEPTH_TEST) {
-		self->gl.Enable(GL_DEPTH_TEST);
+	return PyLong_FromVoidPtr(sync);
+}
+
+PyObject * MGLContext_wait_fence(MGLContext * self, PyObject * args) {
+	PyObject * handle;
+	unsigned long long timeout;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"OK",
+		&handle,
+		&timeout
+	);
+
+	if (!args_ok) {
+		return 0;
 	}
 
-	if (flags & MGL_CULL_FACE) {
-		self->gl.Enable(GL_CULL_FACE);
+	GLsync sync = (GLsync)PyLong_AsVoidPtr(handle);
+
+	if (!sync) {
+		MGLError_Set("invalid fence");
+		return 0;
+	}
+
+	GLenum status;
+	Py_BEGIN_ALLOW_THREADS
+	status = self->gl.ClientWaitSync(sync, GL_SYNC_FLUSH_COMMANDS_BIT, timeout);
+	Py_END_ALLOW_THREADS
+
+	if (status == GL_WAIT_FAILED) {
+		MGLError_Set("cannot wait for the fence");
+		return 0;
+	}
+
+	return PyBool_FromLong(status != GL_TIMEOUT_EXPIRED);
+}
+
+PyObject * MGLContext_delete_fence(MGLContext * self, PyObject * args) {
+	PyObject * handle;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"O",
+		&handle
+	);
+
+	if (!args_ok) {
+		return 0;
 	}
 
-	if (flags & MGL_RASTERIZER_DISCARD) {
-		self->gl.Enable(GL_RASTERIZER_DISCARD);
+	GLsync sync = (GLsync)PyLong_AsVoidPtr(handle);
+
+	if (sync) {
+		self->gl.DeleteSync(sync);
 	}
 
 	Py_RETURN_NONE;
 }
 
-PyObject * MGLContext_disable(MGLContext * self, PyObject * args) {
-	int flags;
+PyObject * MGLContext_release_many(MGLContext * self, PyObject * args) {
+	PyObject * objects;
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"i",
-		&flags
+		"O!",
+		&PyTuple_Type,
+		&objects
 	);
 
 	if (!args_ok) {
 		return 0;
 	}
 
-	self->enable_flags &= ~flags;
+	int num_objects = (int)PyTuple_GET_SIZE(objects);
+
+	int * buffers = new int[num_objects];
+	int * textures = new int[num_objects];
+	int * renderbuffers = new int[num_objects];
+	int * vertex_arrays = new int[num_objects];
+
+	int num_buffers = 0;
+	int num_textures = 0;
+	int num_renderbuffers = 0;
+	int num_vertex_arrays = 0;
+
+	for (int i = 0; i < num_objects; ++i) {
+		PyObject * obj = PyTuple_GET_ITEM(objects, i);
+		PyTypeObject * type = Py_TYPE(obj);
+
+		if (type == &MGLBuffer_Type) {
+			buffers[num_buffers++] = ((MGLBuffer *)obj)->buffer_obj;
+		} else if (type == &MGLTexture_Type) {
+			textures[num_textures++] = ((MGLTexture *)obj)->texture_obj;
+		} else if (type == &MGLTexture3D_Type) {
+			textures[num_textures++] = ((MGLTexture3D *)obj)->texture_obj;
+		} else if (type == &MGLTextureArray_Type) {
+			textures[num_textures++] = ((MGLTextureArray *)obj)->texture_obj;
+		} else if (type == &MGLTextureCube_Type) {
+			textures[num_textures++] = ((MGLTextureCube *)obj)->texture_obj;
+		} else if (type == &MGLRenderbuffer_Type) {
+			renderbuffers[num_renderbuffers++] = ((MGLRenderbuffer *)obj)->renderbuffer_obj;
+		} else if (type == &MGLVertexArray_Type) {
+			vertex_arrays[num_vertex_arrays++] = ((MGLVertexArray *)obj)->vertex_array_obj;
+		}
+	}
+
+	const GLMethods & gl = self->gl;
 
-	if (flags & MGL_BLEND) {
-		self->gl.Disable(GL_BLEND);
+	if (num_buffers) {
+		gl.DeleteBuffers(num_buffers, (GLuint *)buffers);
 	}
 
-	if (flags & MGL_DEPTH_TEST) {
-		self->gl.Disable(GL_DEPTH_TEST);
+	if (num_textures) {
+		gl.DeleteTextures(num_textures, (GLuint *)textures);
+		MGLContext_InvalidateTextures(self);
 	}
 
-	if (flags & MGL_CULL_FACE) {
-		self->gl.Disable(GL_CULL_FACE);
+	if (num_renderbuffers) {
+		gl.DeleteRenderbuffers(num_renderbuffers, (GLuint *)renderbuffers);
 	}
 
-	if (flags & MGL_RASTERIZER_DISCARD) {
-		self->gl.Disable(GL_RASTERIZER_DISCARD);
+	if (num_vertex_arrays) {
+		gl.DeleteVertexArrays(num_vertex_arrays, (GLuint *)vertex_arrays);
+		self->cached_vertex_array = -1;
 	}
 
-	Py_RETURN_NONE;
-}
+	delete[] buffers;
+	delete[] textures;
+	delete[] renderbuffers;
+	delete[] vertex_arrays;
+
+	// The same steps as the Invalidate functions without the per object delete calls.
+
+	for (int i = 0; i < num_objects; ++i) {
+		PyObject * obj = PyTuple_GET_ITEM(objects, i);
+		PyTypeObject * type = Py_TYPE(obj);
+
+		if (type == &MGLInvalidObject_Type) {
+			continue;
+		}
+
+		if (type == &MGLTexture_Type) {
+			Py_DECREF(((MGLTexture *)obj)->context);
+		} else if (type == &MGLTexture3D_Type) {
+			Py_DECREF(((MGLTexture3D *)obj)->context);
+		} else if (type == &MGLTextureArray_Type) {
+			Py_DECREF(((MGLTextureArray *)obj)->context);
+		} else if (type != &MGLBuffer_Type && type != &MGLTextureCube_Type &&
+				type != &MGLRenderbuffer_Type && type != &MGLVertexArray_Type) {
+			PyObject * res = PyObject_CallMethod(obj, "release", 0);
+
+			if (!res) {
+				return 0;
+			}
+
+			Py_DECREF(res);
+			continue;
+		}
+
+		Py_TYPE(obj) = &MGLInvalidObject_Type;
+		Py_DECREF(obj);
+	}
 
-PyObject * MGLContext_finish(MGLContext * self) {
-	self->gl.Finish();
 	Py_RETURN_NONE;
 }
 
@@ -223,13 +344,14 @@ PyObject * MGLContext_copy_framebuffer(MGLContext * self, PyObject * args) {
 
 		gl.BindFramebuffer(GL_READ_FRAMEBUFFER, src->framebuffer_obj);
 		gl.BindFramebuffer(GL_DRAW_FRAMEBUFFER, dst_framebuffer->framebuffer_obj);
+		self->cached_framebuffer = -1;
 		gl.BlitFramebuffer(
 			0, 0, width, height,
 			0, 0, width, height,
 			GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT,
 			GL_NEAREST
 		);
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->bound_framebuffer->framebuffer_obj);
+		MGLContext_bind_framebuffer(self, self->bound_framebuffer->framebuffer_obj);
 
 	} else if (Py_TYPE(dst) == &MGLTexture_Type) {
 
@@ -261,8 +383,9 @@ PyObject * MGLContext_copy_framebuffer(MGLContext * self, PyObject * args) {
 		int format = formats[dst_texture->components];
 
 		gl.BindFramebuffer(GL_READ_FRAMEBUFFER, src->framebuffer_obj);
+		self->cached_framebuffer = -1;
 		gl.CopyTexImage2D(texture_target, 0, format, 0, 0, width, height, 0);
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->bound_framebuffer->framebuffer_obj);
+		MGLContext_bind_framebuffer(self, self->bound_framebuffer->framebuffer_obj);
 
 	} else {
 
@@ -291,6 +414,7 @@ PyObject * MGLContext_detect_framebuffer(MGLContext * self, PyObject * args) {
 
 	int bound_framebuffer = 0;
 	gl.GetIntegerv(GL_DRAW_FRAMEBUFFER_BINDING, &bound_framebuffer);
+	self->cached_framebuffer = -1;
 
 	int framebuffer_obj = bound_framebuffer;
 	if (glo != Py_None) {
@@ -315,7 +439,7 @@ PyObject * MGLContext_detect_framebuffer(MGLContext * self, PyObject * args) {
 		return result;
 	}
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, framebuffer_obj);
+	MGLContext_bind_framebuffer(self, framebuffer_obj);
 
 	int num_color_attachments = self->max_color_attachments;
 
@@ -346,8 +470,8 @@ PyObject * MGLContext_detect_framebuffer(MGLContext * self, PyObject * args) {
 			break;
 		}
 		case GL_TEXTURE: {
-			gl.ActiveTexture(GL_TEXTURE0 + self->default_texture_unit);
-			gl.BindTexture(GL_TEXTURE_2D, color_attachment_name);
+			MGLContext_active_texture(self, GL_TEXTURE0 + self->default_texture_unit);
+			MGLContext_bind_texture(self, GL_TEXTURE_2D, color_attachment_name);
 			gl.GetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_WIDTH, &width);
 			gl.GetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_HEIGHT, &height);
 			break;
@@ -382,7 +506,7 @@ PyObject * MGLContext_detect_framebuffer(MGLContext * self, PyObject * args) {
 	framebuffer->width = width;
 	framebuffer->height = height;
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, bound_framebuffer);
+	MGLContext_bind_framebuffer(self, bound_framebuffer);
 
 	Py_INCREF(framebuffer);
 
@@ -421,15 +545,31 @@ PyObject * MGLContext_clear_samplers(MGLContext * self, PyObject * args) {
 		end = min(end, self->max_texture_units);
 	}
 
-	const GLMethods & gl = self->gl;
-
 	for(int i = start; i < end; i++) {
-		gl.BindSampler(i, 0);
+		MGLContext_bind_sampler(self, i, 0);
 	}
 
 	Py_RETURN_NONE;
 }
 
+PyObject * MGLContext_invalidate_state(MGLContext * self) {
+	MGLContext_InvalidateState(self);
+	MGLContext_QueryState(self);
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLContext_reset_state_changes(MGLContext * self) {
+	self->issued_state_changes = 0;
+	self->skipped_state_changes = 0;
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLContext_reset_stats(MGLContext * self) {
+	self->stats_generation += 1;
+	self->stats = MGLDrawStats();
+	Py_RETURN_NONE;
+}
+
 PyObject * MGLContext_buffer(MGLContext * self, PyObject * args);
 PyObject * MGLContext_texture(MGLContext * self, PyObject * args);
 PyObject * MGLContext_texture3d(MGLContext * self, PyObject * args);
@@ -444,7 +584,11 @@ PyObject * MGLContext_depth_renderbuffer(MGLContext * self, PyObject * args);
 PyObject * MGLContext_compute_shader(MGLContext * self, PyObject * args);
 PyObject * MGLContext_query(MGLContext * self, PyObject * args);
 PyObject * MGLContext_scope(MGLContext * self, PyObject * args);
+PyObject * MGLContext_pipeline_state(MGLContext * self, PyObject * args);
 PyObject * MGLContext_sampler(MGLContext * self, PyObject * args);
+PyObject * MGLContext_begin_recording(MGLContext * self);
+PyObject * MGLContext_end_recording(MGLContext * self);
+PyObject * MGLContext_replay(MGLContext * self, PyObject * args);
 
 PyObject * MGLContext_release(MGLContext * self) {
 	// TODO:
@@ -457,10 +601,20 @@ PyMethodDef MGLContext_tp_methods[] = {
 	{"enable", (PyCFunction)MGLContext_enable, METH_VARARGS, 0},
 	{"disable", (PyCFunction)MGLContext_disable, METH_VARARGS, 0},
 	{"finish", (PyCFunction)MGLContext_finish, METH_NOARGS, 0},
+	{"fence", (PyCFunction)MGLContext_fence, METH_NOARGS, 0},
+	{"wait_fence", (PyCFunction)MGLContext_wait_fence, METH_VARARGS, 0},
+	{"delete_fence", (PyCFunction)MGLContext_delete_fence, METH_VARARGS, 0},
+	{"release_many", (PyCFunction)MGLContext_release_many, METH_VARARGS, 0},
 	{"copy_buffer", (PyCFunction)MGLContext_copy_buffer, METH_VARARGS, 0},
 	{"copy_framebuffer", (PyCFunction)MGLContext_copy_framebuffer, METH_VARARGS, 0},
 	{"detect_framebuffer", (PyCFunction)MGLContext_detect_framebuffer, METH_VARARGS, 0},
 	{"clear_samplers", (PyCFunction)MGLContext_clear_samplers, METH_VARARGS, 0},
+	{"invalidate_state", (PyCFunction)MGLContext_invalidate_state, METH_NOARGS, 0},
+	{"reset_state_changes", (PyCFunction)MGLContext_reset_state_changes, METH_NOARGS, 0},
+	{"reset_stats", (PyCFunction)MGLContext_reset_stats, METH_NOARGS, 0},
+	{"begin_recording", (PyCFunction)MGLContext_begin_recording, METH_NOARGS, 0},
+	{"end_recording", (PyCFunction)MGLContext_end_recording, METH_NOARGS, 0},
+	{"replay", (PyCFunction)MGLContext_replay, METH_VARARGS, 0},
 
 	{"buffer", (PyCFunction)MGLContext_buffer, METH_VARARGS, 0},
 	{"texture", (PyCFunction)MGLContext_texture, METH_VARARGS, 0},
@@ -477,6 +631,7 @@ PyMethodDef MGLContext_tp_methods[] = {
 	{"compute_shader", (PyCFunction)MGLContext_compute_shader, METH_VARARGS, 0},
 	{"query", (PyCFunction)MGLContext_query, METH_VARARGS, 0},
 	{"scope", (PyCFunction)MGLContext_scope, METH_VARARGS, 0},
+	{"pipeline_state", (PyCFunction)MGLContext_pipeline_state, METH_VARARGS, 0},
 	{"sampler", (PyCFunction)MGLContext_sampler, METH_VARARGS, 0},
 
 	{"release", (PyCFunction)MGLContext_release, METH_NOARGS, 0},
@@ -543,7 +698,7 @@ int MGLContext_set_blend_func(MGLContext * self, PyObject * value) {
 		return -1;
 	}
 
-	self->gl.BlendFunc(sfact, dfact);
+	MGLContext_apply_blend_func(self, sfact, dfact);
 
 	return 0;
 }
@@ -565,8 +720,7 @@ int MGLContext_set_depth_func(MGLContext * self, PyObject * value) {
 		return -1;
 	}
 
-	self->depth_func = depth_func;
-	self->gl.DepthFunc(self->depth_func);
+	MGLContext_apply_depth_func(self, depth_func);
 
 	return 0;
 }
@@ -577,12 +731,10 @@ PyObject * MGLContext_get_multisample(MGLContext * self) {
 
 int MGLContext_set_multisample(MGLContext * self, PyObject * value) {
 	if (value == Py_True) {
-		self->gl.Enable(GL_MULTISAMPLE);
-		self->multisample = true;
+		MGLContext_apply_multisample(self, true);
 		return 0;
 	} else if (value == Py_False) {
-		self->gl.Disable(GL_MULTISAMPLE);
-		self->multisample = false;
+		MGLContext_apply_multisample(self, false);
 		return 0;
 	}
 	return -1;
@@ -657,11 +809,9 @@ PyObject * MGLContext_get_wireframe(MGLContext * self) {
 
 int MGLContext_set_wireframe(MGLContext * self, PyObject * value) {
 	if (value == Py_True) {
-		self->gl.PolygonMode(GL_FRONT_AND_BACK, GL_LINE);
-		self->wireframe = true;
+		MGLContext_apply_wireframe(self, true);
 	} else if (value == Py_False) {
-		self->gl.PolygonMode(GL_FRONT_AND_BACK, GL_FILL);
-		self->wireframe = false;
+		MGLContext_apply_wireframe(self, false);
 	} else {
 		MGLError_Set("invalid value for wireframe");
 		return -1;
@@ -684,15 +834,36 @@ int MGLContext_set_front_face(MGLContext * self, PyObject * value) {
 	const char * str = PyUnicode_AsUTF8(value);
 
 	if (!strcmp(str, "cw")) {
-		self->front_face = GL_CW;
+		MGLContext_apply_front_face(self, GL_CW);
 	} else if (!strcmp(str, "ccw")) {
-		self->front_face = GL_CCW;
+		MGLContext_apply_front_face(self, GL_CCW);
 	} else {
 		MGLError_Set("invalid front_face");
 		return -1;
 	}
 
-	self->gl.FrontFace(self->front_face);
+	return 0;
+}
+
+PyObject * MGLContext_get_cull_face(MGLContext * self) {
+	return cull_face_to_string(self->cull_face);
+}
+
+int MGLContext_set_cull_face(MGLContext * self, PyObject * value) {
+	const char * str = PyUnicode_AsUTF8(value);
+
+	if (PyErr_Occurred()) {
+		return -1;
+	}
+
+	int cull_face = cull_face_from_string(str);
+
+	if (!cull_face) {
+		MGLError_Set("invalid cull_face");
+		return -1;
+	}
+
+	MGLContext_apply_cull_face(self, cull_face);
 	return 0;
 }
 
@@ -742,6 +913,52 @@ PyObject * MGLContext_get_error(MGLContext * self, void * closure) {
 	return PyUnicode_FromFormat("GL_UNKNOWN_ERROR");
 }
 
+PyObject * MGLContext_get_state_changes(MGLContext * self, void * closure) {
+	return Py_BuildValue("(LL)", self->issued_state_changes, self->skipped_state_changes);
+}
+
+PyObject * MGLDrawStats_Tuple(const MGLDrawStats & stats) {
+	return Py_BuildValue(
+		"(LLLLLL)",
+		stats.draw_calls,
+		stats.vertices,
+		stats.instances,
+		stats.indirect_commands,
+		stats.transform_calls,
+		stats.state_binds
+	);
+}
+
+PyObject * MGLContext_get_state_cache(MGLContext * self, void * closure) {
+	return PyBool_FromLong(self->state_cache);
+}
+
+int MGLContext_set_state_cache(MGLContext * self, PyObject * value, void * closure) {
+	bool state_cache = PyObject_IsTrue(value) == 1;
+
+	// The state may have been changed outside of ModernGL while the cache was disabled.
+	if (state_cache && !self->state_cache) {
+		MGLContext_InvalidateState(self);
+		MGLContext_QueryState(self);
+	}
+
+	self->state_cache = state_cache;
+	return 0;
+}
+
+PyObject * MGLContext_get_stats(MGLContext * self, void * closure) {
+	return MGLDrawStats_Tuple(self->stats);
+}
+
+PyObject * MGLContext_get_collect_stats(MGLContext * self, void * closure) {
+	return PyBool_FromLong(self->collect_stats);
+}
+
+int MGLContext_set_collect_stats(MGLContext * self, PyObject * value, void * closure) {
+	self->collect_stats = PyObject_IsTrue(value) == 1;
+	return 0;
+}
+
 PyObject * MGLContext_get_version_code(MGLContext * self, void * closure) {
 	return PyLong_FromLong(self->version_code);
 }
@@ -1267,8 +1484,8 @@ PyGetSetDef MGLContext_tp_getseters[] = {
 	{(char *)"line_width", (getter)MGLContext_get_line_width, (setter)MGLContext_set_line_width, 0, 0},
 	{(char *)"point_size", (getter)MGLContext_get_point_size, (setter)MGLContext_set_point_size, 0, 0},
 
-	{(char *)"depth_func", (getter)MGLContext_get_blend_func, (setter)MGLContext_set_depth_func, 0, 0},
-	{(char *)"blend_func", (getter)MGLContext_get_depth_func, (setter)MGLContext_set_blend_func, 0, 0},
+	{(char *)"depth_func", (getter)MGLContext_get_depth_func, (setter)MGLContext_set_depth_func, 0, 0},
+	{(char *)"blend_func", (getter)MGLContext_get_blend_func, (setter)MGLContext_set_blend_func, 0, 0},
 	{(char *)"multisample", (getter)MGLContext_get_multisample, (setter)MGLContext_set_multisample, 0, 0},
 
 	{(char *)"provoking_vertex", (getter)MGLContext_get_provoking_vertex, (setter)MGLContext_set_provoking_vertex, 0, 0},
@@ -1283,11 +1500,16 @@ PyGetSetDef MGLContext_tp_getseters[] = {
 
 	{(char *)"wireframe", (getter)MGLContext_get_wireframe, (setter)MGLContext_set_wireframe, 0, 0},
 	{(char *)"front_face", (getter)MGLContext_get_front_face, (setter)MGLContext_set_front_face, 0, 0},
+	{(char *)"cull_face", (getter)MGLContext_get_cull_face, (setter)MGLContext_set_cull_face, 0, 0},
 
 	{(char *)"patch_vertices", (getter)MGLContext_get_patch_vertices, (setter)MGLContext_set_patch_vertices, 0, 0},
 
 	{(char *)"info", (getter)MGLContext_get_info, 0, 0, 0},
 	{(char *)"error", (getter)MGLContext_get_error, 0, 0, 0},
+	{(char *)"state_changes", (getter)MGLContext_get_state_changes, 0, 0, 0},
+	{(char *)"state_cache", (getter)MGLContext_get_state_cache, (setter)MGLContext_set_state_cache, 0, 0},
+	{(char *)"stats", (getter)MGLContext_get_stats, 0, 0, 0},
+	{(char *)"collect_stats", (getter)MGLContext_get_collect_stats, (setter)MGLContext_set_collect_stats, 0, 0},
 	{0},
 };
 
@@ -1343,6 +1565,73 @@ void MGLContext_Invalidate(MGLContext * context) {
 	Py_DECREF(context);
 }
 
+void MGLContext_QueryState(MGLContext * self) {
+	const GLMethods & gl = self->gl;
+
+	self->enable_flags = 0;
+
+	if (gl.IsEnabled(GL_BLEND)) {
+		self->enable_flags |= MGL_BLEND;
+	}
+
+	if (gl.IsEnabled(GL_DEPTH_TEST)) {
+		self->enable_flags |= MGL_DEPTH_TEST;
+	}
+
+	if (gl.IsEnabled(GL_CULL_FACE)) {
+		self->enable_flags |= MGL_CULL_FACE;
+	}
+
+	if (gl.IsEnabled(GL_RASTERIZER_DISCARD)) {
+		self->enable_flags |= MGL_RASTERIZER_DISCARD;
+	}
+
+	self->multisample = gl.IsEnabled(GL_MULTISAMPLE) ? true : false;
+
+	int primitive_restart_index = -1;
+	gl.GetIntegerv(GL_PRIMITIVE_RESTART_INDEX, &primitive_restart_index);
+	self->primitive_restart = gl.IsEnabled(GL_PRIMITIVE_RESTART) ? true : false;
+	self->primitive_restart_index = (unsigned)primitive_restart_index;
+
+	int polygon_mode[2] = {GL_FILL, GL_FILL};
+	gl.GetIntegerv(GL_POLYGON_MODE, polygon_mode);
+	self->wireframe = polygon_mode[0] == GL_LINE;
+
+	gl.GetIntegerv(GL_FRONT_FACE, &self->front_face);
+	gl.GetIntegerv(GL_CULL_FACE_MODE, &self->cull_face);
+	gl.GetIntegerv(GL_DEPTH_FUNC, &self->depth_func);
+	gl.GetIntegerv(GL_BLEND_SRC_RGB, &self->blend_func_src);
+	gl.GetIntegerv(GL_BLEND_DST_RGB, &self->blend_func_dst);
+	gl.GetIntegerv(GL_VIEWPORT, self->viewport);
+
+	GLboolean depth_mask = 0;
+	GLboolean color_mask[4] = {};
+
+	gl.GetBooleanv(GL_DEPTH_WRITEMASK, &depth_mask);
+	gl.GetBooleanv(GL_COLOR_WRITEMASK, color_mask);
+
+	self->depth_mask = depth_mask ? 1 : 0;
+	self->color_mask = (color_mask[0] ? 1 : 0) | (color_mask[1] ? 2 : 0) | (color_mask[2] ? 4 : 0) | (color_mask[3] ? 8 : 0);
+	self->color_mask_buffers = 1;
+	self->unknown_state = 0;
+}
+
+bool MGLContext_HasExtension(MGLContext * self, const char * extension) {
+	const GLMethods & gl = self->gl;
+
+	int num_extensions = 0;
+	gl.GetIntegerv(GL_NUM_EXTENSIONS, &num_extensions);
+
+	for (int i = 0; i < num_extensions; ++i) {
+		const char * name = (const char *)gl.GetStringi(GL_EXTENSIONS, i);
+		if (name && !strcmp(name, extension)) {
+			return true;
+		}
+	}
+
+	return false;
+}
+
 void MGLContext_Initialize(MGLContext * self) {
 	GLMethods & gl = self->gl;
 
@@ -1350,6 +1639,8 @@ void MGLContext_Initialize(MGLContext * self) {
 		return;
 	}
 
+	MGLContext_InvalidateState(self);
+
 	int major = 0;
 	int minor = 0;
 
@@ -1358,6 +1649,11 @@ void MGLContext_Initialize(MGLContext * self) {
 
 	self->version_code = major * 100 + minor * 10;
 
+	self->clear_buffer_object = self->version_code >= 430 || MGLContext_HasExtension(self, "GL_ARB_clear_buffer_object");
+	self->buffer_storage = self->version_code >= 440 || MGLContext_HasExtension(self, "GL_ARB_buffer_storage");
+	self->multi_bind = self->version_code >= 440 || MGLContext_HasExtension(self, "GL_ARB_multi_bind");
+	self->indirect_parameters = self->version_code >= 460 || MGLContext_HasExtension(self, "GL_ARB_indirect_parameters");
+
 	gl.BlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA);
 
 	gl.Enable(GL_TEXTURE_CUBE_MAP_SEAMLESS);
@@ -1405,9 +1701,9 @@ void MGLContext_Initialize(MGLContext * self) {
 		// framebuffer->draw_buffers[0] = GL_COLOR_ATTACHMENT0;
 		// framebuffer->draw_buffers[0] = GL_BACK_LEFT;
 
-		gl.BindFramebuffer(GL_FRAMEBUFFER, 0);
+		MGLContext_bind_framebuffer(self, 0);
 		gl.GetIntegerv(GL_DRAW_BUFFER, (int *)&framebuffer->draw_buffers[0]);
-		gl.BindFramebuffer(GL_FRAMEBUFFER, bound_framebuffer);
+		MGLContext_bind_framebuffer(self, bound_framebuffer);
 
 		framebuffer->color_mask = new bool[4];
 		framebuffer->color_mask[0] = true;
@@ -1437,15 +1733,8 @@ void MGLContext_Initialize(MGLContext * self) {
 	Py_INCREF(self->default_framebuffer);
 	self->bound_framebuffer = self->default_framebuffer;
 
-	self->enable_flags = 0;
-	self->front_face = GL_CCW;
-
-	self->depth_func = GL_LEQUAL;
-	self->blend_func_src = GL_SRC_ALPHA;
-	self->blend_func_dst = GL_ONE_MINUS_SRC_ALPHA;
-
-	self->wireframe = false;
-	self->multisample = true;
+	self->recording = false;
+	MGLContext_QueryState(self);
 
 	self->provoking_vertex = GL_LAST_VERTEX_CONVENTION;
 	gl.GetError(); // clear errors
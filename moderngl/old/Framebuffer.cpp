@@ -146,7 +146,7 @@ PyObject * MGLContext_framebuffer(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, framebuffer->framebuffer_obj);
+	MGLContext_bind_framebuffer(self, framebuffer->framebuffer_obj);
 
 	for (int i = 0; i < color_attachments_len; ++i) {
 		PyObject * item = PyTuple_GET_ITEM(color_attachments, i);
@@ -200,7 +200,7 @@ PyObject * MGLContext_framebuffer(MGLContext * self, PyObject * args) {
 
 	int status = gl.CheckFramebufferStatus(GL_FRAMEBUFFER);
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->bound_framebuffer->framebuffer_obj);
+	MGLContext_bind_framebuffer(self, self->bound_framebuffer->framebuffer_obj);
 
 	if (status != GL_FRAMEBUFFER_COMPLETE) {
 		const char * message = "the framebuffer is not complete";
@@ -374,7 +374,7 @@ PyObject * MGLFramebuffer_clear(MGLFramebuffer * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
+	MGLContext_bind_framebuffer(self->context, self->framebuffer_obj);
 
 	if (self->framebuffer_obj) {
 		gl.DrawBuffers(self->draw_buffers_len, self->draw_buffers);
@@ -383,17 +383,8 @@ PyObject * MGLFramebuffer_clear(MGLFramebuffer * self, PyObject * args) {
 	gl.ClearColor(r, g, b, a);
 	gl.ClearDepth(depth);
 
-	for (int i = 0; i < self->draw_buffers_len; ++i) {
-		gl.ColorMaski(
-			i,
-			self->color_mask[i * 4 + 0],
-			self->color_mask[i * 4 + 1],
-			self->color_mask[i * 4 + 2],
-			self->color_mask[i * 4 + 3]
-		);
-	}
-
-	gl.DepthMask(self->depth_mask);
+	MGLContext_apply_color_mask(self->context, self->color_mask, self->draw_buffers_len);
+	MGLContext_apply_depth_mask(self->context, self->depth_mask);
 
 	if (viewport != Py_None) {
 		gl.Enable(GL_SCISSOR_TEST);
@@ -404,7 +395,7 @@ PyObject * MGLFramebuffer_clear(MGLFramebuffer * self, PyObject * args) {
 		gl.Clear(GL_DEPTH_BUFFER_BIT | GL_COLOR_BUFFER_BIT);
 	}
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->context->bound_framebuffer->framebuffer_obj);
+	MGLContext_bind_framebuffer(self->context, self->context->bound_framebuffer->framebuffer_obj);
 
 	Py_RETURN_NONE;
 }
@@ -412,14 +403,20 @@ PyObject * MGLFramebuffer_clear(MGLFramebuffer * self, PyObject * args) {
 PyObject * MGLFramebuffer_use(MGLFramebuffer * self) {
 	const GLMethods & gl = self->context->gl;
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
+	// The draw buffers are stored in the framebuffer object, they are only set when it gets bound.
+	if (!self->context->state_cache || self->context->cached_framebuffer != self->framebuffer_obj) {
+		MGLContext_bind_framebuffer(self->context, self->framebuffer_obj);
 
-	if (self->framebuffer_obj) {
-		gl.DrawBuffers(self->draw_buffers_len, self->draw_buffers);
+		if (self->framebuffer_obj) {
+			gl.DrawBuffers(self->draw_buffers_len, self->draw_buffers);
+		}
+	} else {
+		self->context->skipped_state_changes += 1;
 	}
 
 	if (self->viewport_width && self->viewport_height) {
-		gl.Viewport(
+		MGLContext_apply_viewport(
+			self->context,
 			self->viewport_x,
 			self->viewport_y,
 			self->viewport_width,
@@ -427,17 +424,8 @@ PyObject * MGLFramebuffer_use(MGLFramebuffer * self) {
 		);
 	}
 
-	for (int i = 0; i < self->draw_buffers_len; ++i) {
-		gl.ColorMaski(
-			i,
-			self->color_mask[i * 4 + 0],
-			self->color_mask[i * 4 + 1],
-			self->color_mask[i * 4 + 2],
-			self->color_mask[i * 4 + 3]
-		);
-	}
-
-	gl.DepthMask(self->depth_mask);
+	MGLContext_apply_color_mask(self->context, self->color_mask, self->draw_buffers_len);
+	MGLContext_apply_depth_mask(self->context, self->depth_mask);
 
 	Py_INCREF(self);
 	Py_DECREF(self->context->bound_framebuffer);
@@ -543,7 +531,7 @@ PyObject * MGLFramebuffer_read(MGLFramebuffer * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
+	MGLContext_bind_framebuffer(self->context, self->framebuffer_obj);
 	// if (self->framebuffer_obj) {
 	gl.ReadBuffer(read_depth ? GL_NONE : (GL_COLOR_ATTACHMENT0 + attachment));
 	// } else {
@@ -552,8 +540,10 @@ PyObject * MGLFramebuffer_read(MGLFramebuffer * self, PyObject * args) {
 	// }
 	gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 	gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+	Py_BEGIN_ALLOW_THREADS
 	gl.ReadPixels(x, y, width, height, base_format, pixel_type, data);
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->context->bound_framebuffer->framebuffer_obj);
+	Py_END_ALLOW_THREADS
+	MGLContext_bind_framebuffer(self->context, self->context->bound_framebuffer->framebuffer_obj);
 
 	return result;
 }
@@ -660,12 +650,12 @@ PyObject * MGLFramebuffer_read_into(MGLFramebuffer * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_PACK_BUFFER, buffer->buffer_obj);
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
+		MGLContext_bind_framebuffer(self->context, self->framebuffer_obj);
 		gl.ReadBuffer(read_depth ? GL_NONE : (GL_COLOR_ATTACHMENT0 + attachment));
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.ReadPixels(x, y, width, height, base_format, pixel_type, (void *)write_offset);
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->context->bound_framebuffer->framebuffer_obj);
+		MGLContext_bind_framebuffer(self->context, self->context->bound_framebuffer->framebuffer_obj);
 		gl.BindBuffer(GL_PIXEL_PACK_BUFFER, 0);
 
 	} else {
@@ -688,12 +678,14 @@ PyObject * MGLFramebuffer_read_into(MGLFramebuffer * self, PyObject * args) {
 
 		const GLMethods & gl = self->context->gl;
 
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
+		MGLContext_bind_framebuffer(self->context, self->framebuffer_obj);
 		gl.ReadBuffer(read_depth ? GL_NONE : (GL_COLOR_ATTACHMENT0 + attachment));
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+		Py_BEGIN_ALLOW_THREADS
 		gl.ReadPixels(x, y, width, height, base_format, pixel_type, ptr);
-		gl.BindFramebuffer(GL_FRAMEBUFFER, self->context->bound_framebuffer->framebuffer_obj);
+		Py_END_ALLOW_THREADS
+		MGLContext_bind_framebuffer(self->context, self->context->bound_framebuffer->framebuffer_obj);
 
 		PyBuffer_Release(&buffer_view);
 	}
@@ -740,9 +732,8 @@ int MGLFramebuffer_set_viewport(MGLFramebuffer * self, PyObject * value, void *
 	self->viewport_height = viewport_height;
 
 	if (self->framebuffer_obj == self->context->bound_framebuffer->framebuffer_obj) {
-		const GLMethods & gl = self->context->gl;
-
-		gl.Viewport(
+		MGLContext_apply_viewport(
+			self->context,
 			self->viewport_x,
 			self->viewport_y,
 			self->viewport_width,
@@ -877,17 +868,7 @@ int MGLFramebuffer_set_color_mask(MGLFramebuffer * self, PyObject * value, void
 	}
 
 	if (self->framebuffer_obj == self->context->bound_framebuffer->framebuffer_obj) {
-		const GLMethods & gl = self->context->gl;
-
-		for (int i = 0; i < self->draw_buffers_len; ++i) {
-			gl.ColorMaski(
-				i,
-				self->color_mask[i * 4 + 0],
-				self->color_mask[i * 4 + 1],
-				self->color_mask[i * 4 + 2],
-				self->color_mask[i * 4 + 3]
-			);
-		}
+		MGLContext_apply_color_mask(self->context, self->color_mask, self->draw_buffers_len);
 	}
 
 	return 0;
@@ -908,8 +889,7 @@ int MGLFramebuffer_set_depth_mask(MGLFramebuffer * self, PyObject * value, void
 	}
 
 	if (self->framebuffer_obj == self->context->bound_framebuffer->framebuffer_obj) {
-		const GLMethods & gl = self->context->gl;
-		gl.DepthMask(self->depth_mask);
+		MGLContext_apply_depth_mask(self->context, self->depth_mask);
 	}
 
 	return 0;
@@ -930,14 +910,14 @@ PyObject * MGLFramebuffer_get_bits(MGLFramebuffer * self, void * closure) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->framebuffer_obj);
+	MGLContext_bind_framebuffer(self->context, self->framebuffer_obj);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_BACK_LEFT, GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE, &red_bits);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_BACK_LEFT, GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE, &green_bits);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_BACK_LEFT, GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE, &blue_bits);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_BACK_LEFT, GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE, &alpha_bits);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_DEPTH, GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE, &depth_bits);
 	gl.GetFramebufferAttachmentParameteriv(GL_FRAMEBUFFER, GL_STENCIL, GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE, &stencil_bits);
-	gl.BindFramebuffer(GL_FRAMEBUFFER, self->context->bound_framebuffer->framebuffer_obj);
+	MGLContext_bind_framebuffer(self->context, self->context->bound_framebuffer->framebuffer_obj);
 
 	PyObject * red_obj = PyLong_FromLong(red_bits);
 	PyObject * green_obj = PyLong_FromLong(green_bits);
@@ -1024,6 +1004,9 @@ void MGLFramebuffer_Invalidate(MGLFramebuffer * framebuffer) {
 
 	if (framebuffer->framebuffer_obj) {
 		framebuffer->context->gl.DeleteFramebuffers(1, (GLuint *)&framebuffer->framebuffer_obj);
+		if (framebuffer->context->cached_framebuffer == framebuffer->framebuffer_obj) {
+			framebuffer->context->cached_framebuffer = -1;
+		}
 		Py_DECREF(framebuffer->context);
 	}
 
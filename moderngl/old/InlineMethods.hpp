@@ -162,6 +162,72 @@ inline PyObject * compare_func_to_string(int func) {
 	}
 }
 
+inline int cull_face_from_string(const char * str) {
+	if (!strcmp(str, "back")) {
+		return GL_BACK;
+	}
+
+	if (!strcmp(str, "front")) {
+		return GL_FRONT;
+	}
+
+	if (!strcmp(str, "front_and_back")) {
+		return GL_FRONT_AND_BACK;
+	}
+
+	return 0;
+}
+
+inline PyObject * cull_face_to_string(int mode) {
+	switch (mode) {
+		case GL_FRONT: {
+			static PyObject * res_front = PyUnicode_FromString("front");
+			Py_INCREF(res_front);
+			return res_front;
+		}
+
+		case GL_FRONT_AND_BACK: {
+			static PyObject * res_front_and_back = PyUnicode_FromString("front_and_back");
+			Py_INCREF(res_front_and_back);
+			return res_front_and_back;
+		}
+
+		default: {
+			static PyObject * res_back = PyUnicode_FromString("back");
+			Py_INCREF(res_back);
+			return res_back;
+		}
+	}
+}
+
+inline bool blend_factor_valid(int factor) {
+	switch (factor) {
+		case GL_ZERO:
+		case GL_ONE:
+		case GL_SRC_COLOR:
+		case GL_ONE_MINUS_SRC_COLOR:
+		case GL_DST_COLOR:
+		case GL_ONE_MINUS_DST_COLOR:
+		case GL_SRC_ALPHA:
+		case GL_ONE_MINUS_SRC_ALPHA:
+		case GL_DST_ALPHA:
+		case GL_ONE_MINUS_DST_ALPHA:
+		case GL_CONSTANT_COLOR:
+		case GL_ONE_MINUS_CONSTANT_COLOR:
+		case GL_CONSTANT_ALPHA:
+		case GL_ONE_MINUS_CONSTANT_ALPHA:
+		case GL_SRC_ALPHA_SATURATE:
+		case GL_SRC1_COLOR:
+		case GL_ONE_MINUS_SRC1_COLOR:
+		case GL_SRC1_ALPHA:
+		case GL_ONE_MINUS_SRC1_ALPHA:
+			return true;
+
+		default:
+			return false;
+	}
+}
+
 inline PyObject * tuple2(PyObject * a, PyObject * b) {
 	PyObject * res = PyTuple_New(2);
 	PyTuple_SET_ITEM(res, 0, a);
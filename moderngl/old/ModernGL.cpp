@@ -98,6 +98,30 @@ PyObject * fmtdebug(PyObject * self, PyObject * args) {
 	return res;
 }
 
+PyObject * buffer_format(PyObject * self, PyObject * args) {
+	PyObject * format;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"O!",
+		&PyUnicode_Type,
+		&format
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	MGLBufferFormat * result = MGLBufferFormat_FromObject(format);
+
+	if (!result) {
+		MGLError_Set("invalid format: %s", PyUnicode_AsUTF8(format));
+		return 0;
+	}
+
+	return (PyObject *)result;
+}
+
 PyObject * create_standalone_context(PyObject * self, PyObject * args) {
 	PyObject * settings;
 
@@ -167,6 +191,7 @@ PyMethodDef MGL_module_methods[] = {
 	{"create_standalone_context", (PyCFunction)create_standalone_context, METH_VARARGS, 0},
 	{"create_context", (PyCFunction)create_context, METH_NOARGS, 0},
 	{"fmtdebug", (PyCFunction)fmtdebug, METH_VARARGS, 0},
+	{"buffer_format", (PyCFunction)buffer_format, METH_VARARGS, 0},
 	{0},
 };
 
@@ -193,6 +218,28 @@ bool MGL_InitializeModule(PyObject * module) {
 		PyModule_AddObject(module, "Buffer", (PyObject *)&MGLBuffer_Type);
 	}
 
+	{
+		if (PyType_Ready(&MGLBufferMap_Type) < 0) {
+			PyErr_Format(PyExc_ImportError, "Cannot register BufferMap in %s (%s:%d)", __FUNCTION__, __FILE__, __LINE__);
+			return false;
+		}
+
+		Py_INCREF(&MGLBufferMap_Type);
+
+		PyModule_AddObject(module, "BufferMap", (PyObject *)&MGLBufferMap_Type);
+	}
+
+	{
+		if (PyType_Ready(&MGLBufferFormat_Type) < 0) {
+			PyErr_Format(PyExc_ImportError, "Cannot register BufferFormat in %s (%s:%d)", __FUNCTION__, __FILE__, __LINE__);
+			return false;
+		}
+
+		Py_INCREF(&MGLBufferFormat_Type);
+
+		PyModule_AddObject(module, "BufferFormat", (PyObject *)&MGLBufferFormat_Type);
+	}
+
 	{
 		if (PyType_Ready(&MGLComputeShader_Type) < 0) {
 			PyErr_Format(PyExc_ImportError, "Cannot register ComputeShader in %s (%s:%d)", __FUNCTION__, __FILE__, __LINE__);
@@ -248,6 +295,17 @@ bool MGL_InitializeModule(PyObject * module) {
 		PyModule_AddObject(module, "Program", (PyObject *)&MGLProgram_Type);
 	}
 
+	{
+		if (PyType_Ready(&MGLPipelineState_Type) < 0) {
+			PyErr_Format(PyExc_ImportError, "Cannot register PipelineState in %s (%s:%d)", __FUNCTION__, __FILE__, __LINE__);
+			return false;
+		}
+
+		Py_INCREF(&MGLPipelineState_Type);
+
+		PyModule_AddObject(module, "PipelineState", (PyObject *)&MGLPipelineState_Type);
+	}
+
 	{
 		if (PyType_Ready(&MGLQuery_Type) < 0) {
 			PyErr_Format(PyExc_ImportError, "Cannot register Query in %s (%s:%d)", __FUNCTION__, __FILE__, __LINE__);
@@ -0,0 +1,212 @@
+#include "Types.hpp"
+
+#include "InlineMethods.hpp"
+
+PyObject * MGLContext_pipeline_state(MGLContext * self, PyObject * args) {
+	PyObject * enable_flags;
+	PyObject * blend_func;
+	PyObject * depth_func;
+	PyObject * cull_face;
+	PyObject * front_face;
+	PyObject * wireframe;
+	PyObject * multisample;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"OOOOOOO",
+		&enable_flags,
+		&blend_func,
+		&depth_func,
+		&cull_face,
+		&front_face,
+		&wireframe,
+		&multisample
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	int flags = -1;
+	if (enable_flags != Py_None) {
+		flags = PyLong_AsLong(enable_flags);
+		if (PyErr_Occurred() || flags < 0) {
+			MGLError_Set("invalid enable_flags");
+			return 0;
+		}
+	}
+
+	int blend_func_src = -1;
+	int blend_func_dst = -1;
+	if (blend_func != Py_None) {
+		if (!PyTuple_Check(blend_func) || PyTuple_GET_SIZE(blend_func) != 2) {
+			MGLError_Set("the blend_func must be a 2-tuple");
+			return 0;
+		}
+		blend_func_src = PyLong_AsLong(PyTuple_GET_ITEM(blend_func, 0));
+		blend_func_dst = PyLong_AsLong(PyTuple_GET_ITEM(blend_func, 1));
+		if (PyErr_Occurred() || !blend_factor_valid(blend_func_src) || !blend_factor_valid(blend_func_dst)) {
+			PyErr_Clear();
+			MGLError_Set("invalid blend_func");
+			return 0;
+		}
+	}
+
+	int depth_func_value = -1;
+	if (depth_func != Py_None) {
+		const char * func = PyUnicode_AsUTF8(depth_func);
+		depth_func_value = func ? compare_func_from_string(func) : 0;
+		if (!depth_func_value) {
+			PyErr_Clear();
+			MGLError_Set("invalid depth_func");
+			return 0;
+		}
+	}
+
+	int cull_face_value = -1;
+	if (cull_face != Py_None) {
+		const char * mode = PyUnicode_AsUTF8(cull_face);
+		cull_face_value = mode ? cull_face_from_string(mode) : 0;
+		if (!cull_face_value) {
+			PyErr_Clear();
+			MGLError_Set("invalid cull_face");
+			return 0;
+		}
+	}
+
+	int front_face_value = -1;
+	if (front_face != Py_None) {
+		const char * mode = PyUnicode_AsUTF8(front_face);
+		if (mode && !strcmp(mode, "cw")) {
+			front_face_value = GL_CW;
+		} else if (mode && !strcmp(mode, "ccw")) {
+			front_face_value = GL_CCW;
+		} else {
+			PyErr_Clear();
+			MGLError_Set("invalid front_face");
+			return 0;
+		}
+	}
+
+	int wireframe_value = -1;
+	if (wireframe != Py_None) {
+		wireframe_value = PyObject_IsTrue(wireframe) == 1;
+	}
+
+	int multisample_value = -1;
+	if (multisample != Py_None) {
+		multisample_value = PyObject_IsTrue(multisample) == 1;
+	}
+
+	MGLPipelineState * state = (MGLPipelineState *)MGLPipelineState_Type.tp_alloc(&MGLPipelineState_Type, 0);
+
+	Py_INCREF(self);
+	state->context = self;
+
+	state->enable_flags = flags;
+	state->blend_func_src = blend_func_src;
+	state->blend_func_dst = blend_func_dst;
+	state->depth_func = depth_func_value;
+	state->cull_face = cull_face_value;
+	state->front_face = front_face_value;
+	state->wireframe = wireframe_value;
+	state->multisample = multisample_value;
+
+	return (PyObject *)state;
+}
+
+PyObject * MGLPipelineState_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
+	MGLPipelineState * self = (MGLPipelineState *)type->tp_alloc(type, 0);
+
+	if (self) {
+		self->context = 0;
+	}
+
+	return (PyObject *)self;
+}
+
+void MGLPipelineState_tp_dealloc(MGLPipelineState * self) {
+	Py_XDECREF(self->context);
+	MGLPipelineState_Type.tp_free((PyObject *)self);
+}
+
+PyObject * MGLPipelineState_use(MGLPipelineState * self) {
+	MGLContext * context = self->context;
+
+	// Only the difference from the current state is applied.
+	if (self->enable_flags >= 0) {
+		MGLContext_apply_enable_flags(context, self->enable_flags);
+	}
+
+	if (self->blend_func_src >= 0) {
+		MGLContext_apply_blend_func(context, self->blend_func_src, self->blend_func_dst);
+	}
+
+	if (self->depth_func >= 0) {
+		MGLContext_apply_depth_func(context, self->depth_func);
+	}
+
+	if (self->cull_face >= 0) {
+		MGLContext_apply_cull_face(context, self->cull_face);
+	}
+
+	if (self->front_face >= 0) {
+		MGLContext_apply_front_face(context, self->front_face);
+	}
+
+	if (self->wireframe >= 0) {
+		MGLContext_apply_wireframe(context, self->wireframe);
+	}
+
+	if (self->multisample >= 0) {
+		MGLContext_apply_multisample(context, self->multisample);
+	}
+
+	Py_RETURN_NONE;
+}
+
+PyMethodDef MGLPipelineState_tp_methods[] = {
+	{"use", (PyCFunction)MGLPipelineState_use, METH_NOARGS, 0},
+	{0},
+};
+
+PyTypeObject MGLPipelineState_Type = {
+	PyVarObject_HEAD_INIT(0, 0)
+	"mgl.PipelineState",                                    // tp_name
+	sizeof(MGLPipelineState),                               // tp_basicsize
+	0,                                                      // tp_itemsize
+	(destructor)MGLPipelineState_tp_dealloc,                // tp_dealloc
+	0,                                                      // tp_print
+	0,                                                      // tp_getattr
+	0,                                                      // tp_setattr
+	0,                                                      // tp_reserved
+	0,                                                      // tp_repr
+	0,                                                      // tp_as_number
+	0,                                                      // tp_as_sequence
+	0,                                                      // tp_as_mapping
+	0,                                                      // tp_hash
+	0,                                                      // tp_call
+	0,                                                      // tp_str
+	0,                                                      // tp_getattro
+	0,                                                      // tp_setattro
+	0,                                                      // tp_as_buffer
+	Py_TPFLAGS_DEFAULT,                                     // tp_flags
+	0,                                                      // tp_doc
+	0,                                                      // tp_traverse
+	0,                                                      // tp_clear
+	0,                                                      // tp_richcompare
+	0,                                                      // tp_weaklistoffset
+	0,                                                      // tp_iter
+	0,                                                      // tp_iternext
+	MGLPipelineState_tp_methods,                            // tp_methods
+	0,                                                      // tp_members
+	0,                                                      // tp_getset
+	0,                                                      // tp_base
+	0,                                                      // tp_dict
+	0,                                                      // tp_descr_get
+	0,                                                      // tp_descr_set
+	0,                                                      // tp_dictoffset
+	0,                                                      // tp_init
+	0,                                                      // tp_alloc
+	MGLPipelineState_tp_new,                                // tp_new
+};
@@ -677,6 +677,10 @@ void MGLProgram_Invalidate(MGLProgram * program) {
 	const GLMethods & gl = program->context->gl;
 	gl.DeleteProgram(program->program_obj);
 
+	if (program->context->cached_program == program->program_obj) {
+		program->context->cached_program = -1;
+	}
+
 	Py_TYPE(program) = &MGLInvalidObject_Type;
 	Py_DECREF(program);
 }
@@ -0,0 +1,1015 @@
+#include "Types.hpp"
+
+#include "UniformGetSetters.hpp"
+
+// The recorder replaces the entries of the context's GLMethods with tracers.
+// Each tracer appends the call to the bytecode and then calls the original method.
+// The bytecode is a sequence of 32 bit words: the magic, then an opcode followed by its arguments for each call.
+// Pointers and doubles take two words, arrays are stored as their length followed by the elements.
+
+enum MGLCommand {
+	MGL_CMD_USE_PROGRAM = 1,
+	MGL_CMD_BIND_VERTEX_ARRAY,
+	MGL_CMD_UNIFORM_SUBROUTINES,
+	MGL_CMD_UNIFORM,
+	MGL_CMD_UNIFORM_BLOCK_BINDING,
+	MGL_CMD_DRAW_ARRAYS_INSTANCED,
+	MGL_CMD_DRAW_ELEMENTS_INSTANCED,
+	MGL_CMD_MULTI_DRAW_ARRAYS,
+	MGL_CMD_MULTI_DRAW_ELEMENTS,
+	MGL_CMD_MULTI_DRAW_ELEMENTS_BASE_VERTEX,
+	MGL_CMD_MULTI_DRAW_ARRAYS_INDIRECT,
+	MGL_CMD_MULTI_DRAW_ELEMENTS_INDIRECT,
+	MGL_CMD_MULTI_DRAW_ARRAYS_INDIRECT_COUNT,
+	MGL_CMD_MULTI_DRAW_ELEMENTS_INDIRECT_COUNT,
+	MGL_CMD_BEGIN_TRANSFORM_FEEDBACK,
+	MGL_CMD_END_TRANSFORM_FEEDBACK,
+	MGL_CMD_FLUSH,
+	MGL_CMD_BIND_BUFFER,
+	MGL_CMD_BIND_BUFFER_BASE,
+	MGL_CMD_BIND_BUFFER_RANGE,
+	MGL_CMD_BIND_FRAMEBUFFER,
+	MGL_CMD_DRAW_BUFFERS,
+	MGL_CMD_VIEWPORT,
+	MGL_CMD_SCISSOR,
+	MGL_CMD_COLOR_MASKI,
+	MGL_CMD_DEPTH_MASK,
+	MGL_CMD_CLEAR_COLOR,
+	MGL_CMD_CLEAR_DEPTH,
+	MGL_CMD_CLEAR,
+	MGL_CMD_ENABLE,
+	MGL_CMD_DISABLE,
+	MGL_CMD_ACTIVE_TEXTURE,
+	MGL_CMD_BIND_TEXTURE,
+	MGL_CMD_BIND_SAMPLER,
+	MGL_CMD_BLEND_FUNC,
+	MGL_CMD_DEPTH_FUNC,
+	MGL_CMD_FRONT_FACE,
+	MGL_CMD_LINE_WIDTH,
+	MGL_CMD_POINT_SIZE,
+	MGL_CMD_POLYGON_MODE,
+	MGL_CMD_PROVOKING_VERTEX,
+	MGL_CMD_PATCH_PARAMETERI,
+	MGL_CMD_PRIMITIVE_RESTART_INDEX,
+	MGL_CMD_CULL_FACE,
+};
+
+const unsigned MGL_RECORDER_MAGIC = 0x524c474d;
+const int MGL_NUM_UNIFORM_WRITERS = 34;
+const int MGL_FIRST_MATRIX_WRITER = 16;
+
+// The number of words each command reads before its variable length data.
+const int MGLCommand_arguments[] = {
+	0, 1, 1, 2, 6, 3, 4, 6, 2, 3, 3, 5, 6, 7, 8, 1, 0, 0, 2, 3, 7, 2, 1, 4, 4,
+	2, 1, 4, 2, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1, 1, 2, 1, 2, 1, 1,
+};
+
+// The size of a single element for each uniform writer.
+const int MGLUniform_writer_element_size[] = {
+	4, 8, 12, 16, 4, 8, 12, 16, 4, 8, 12, 16, 8, 16, 24, 32,
+	16, 24, 32, 24, 36, 48, 32, 48, 64, 32, 48, 64, 48, 72, 96, 64, 96, 128,
+};
+
+struct MGLRecording {
+	MGLContext * context;
+	MGLUniform * uniform;
+	MGLProc uniform_writer_proc;
+	GLMethods gl;
+
+	unsigned * words;
+	int size;
+	int capacity;
+};
+
+MGLRecording recording;
+
+bool MGLRecorder_recording;
+
+MGLProc MGLRecorder_uniform_writer(const GLMethods & gl, int kind) {
+	switch (kind) {
+		case 0: return (MGLProc)gl.ProgramUniform1iv;
+		case 1: return (MGLProc)gl.ProgramUniform2iv;
+		case 2: return (MGLProc)gl.ProgramUniform3iv;
+		case 3: return (MGLProc)gl.ProgramUniform4iv;
+		case 4: return (MGLProc)gl.ProgramUniform1uiv;
+		case 5: return (MGLProc)gl.ProgramUniform2uiv;
+		case 6: return (MGLProc)gl.ProgramUniform3uiv;
+		case 7: return (MGLProc)gl.ProgramUniform4uiv;
+		case 8: return (MGLProc)gl.ProgramUniform1fv;
+		case 9: return (MGLProc)gl.ProgramUniform2fv;
+		case 10: return (MGLProc)gl.ProgramUniform3fv;
+		case 11: return (MGLProc)gl.ProgramUniform4fv;
+		case 12: return (MGLProc)gl.ProgramUniform1dv;
+		case 13: return (MGLProc)gl.ProgramUniform2dv;
+		case 14: return (MGLProc)gl.ProgramUniform3dv;
+		case 15: return (MGLProc)gl.ProgramUniform4dv;
+		case 16: return (MGLProc)gl.ProgramUniformMatrix2fv;
+		case 17: return (MGLProc)gl.ProgramUniformMatrix2x3fv;
+		case 18: return (MGLProc)gl.ProgramUniformMatrix2x4fv;
+		case 19: return (MGLProc)gl.ProgramUniformMatrix3x2fv;
+		case 20: return (MGLProc)gl.ProgramUniformMatrix3fv;
+		case 21: return (MGLProc)gl.ProgramUniformMatrix3x4fv;
+		case 22: return (MGLProc)gl.ProgramUniformMatrix4x2fv;
+		case 23: return (MGLProc)gl.ProgramUniformMatrix4x3fv;
+		case 24: return (MGLProc)gl.ProgramUniformMatrix4fv;
+		case 25: return (MGLProc)gl.ProgramUniformMatrix2dv;
+		case 26: return (MGLProc)gl.ProgramUniformMatrix2x3dv;
+		case 27: return (MGLProc)gl.ProgramUniformMatrix2x4dv;
+		case 28: return (MGLProc)gl.ProgramUniformMatrix3x2dv;
+		case 29: return (MGLProc)gl.ProgramUniformMatrix3dv;
+		case 30: return (MGLProc)gl.ProgramUniformMatrix3x4dv;
+		case 31: return (MGLProc)gl.ProgramUniformMatrix4x2dv;
+		case 32: return (MGLProc)gl.ProgramUniformMatrix4x3dv;
+		case 33: return (MGLProc)gl.ProgramUniformMatrix4dv;
+	}
+	return 0;
+}
+
+unsigned * MGLRecorder_reserve(int count) {
+	if (recording.size + count > recording.capacity) {
+		int capacity = recording.capacity * 2 + count;
+		unsigned * words = new unsigned[capacity];
+		if (recording.size) {
+			memcpy(words, recording.words, recording.size * sizeof(unsigned));
+		}
+		delete[] recording.words;
+		recording.words = words;
+		recording.capacity = capacity;
+	}
+
+	unsigned * result = recording.words + recording.size;
+	recording.size += count;
+	return result;
+}
+
+inline void MGLRecorder_word(unsigned value) {
+	*MGLRecorder_reserve(1) = value;
+}
+
+inline void MGLRecorder_float(float value) {
+	memcpy(MGLRecorder_reserve(1), &value, 4);
+}
+
+inline void MGLRecorder_double(double value) {
+	memcpy(MGLRecorder_reserve(2), &value, 8);
+}
+
+inline void MGLRecorder_pointer(const void * value) {
+	unsigned long long offset = (unsigned long long)(size_t)value;
+	MGLRecorder_word((unsigned)offset);
+	MGLRecorder_word((unsigned)(offset >> 32));
+}
+
+void MGLRecorder_data(const void * data, int size) {
+	MGLRecorder_word(size);
+	unsigned * words = MGLRecorder_reserve((size + 3) / 4);
+	if (size % 4) {
+		words[size / 4] = 0;
+	}
+	memcpy(words, data, size);
+}
+
+void MGLRecorder_pointers(const void * const * pointers, int count) {
+	MGLRecorder_word(count);
+	for (int i = 0; i < count; ++i) {
+		MGLRecorder_pointer(pointers[i]);
+	}
+}
+
+void GLAPI MGLTrace_UseProgram(GLuint program) {
+	MGLRecorder_word(MGL_CMD_USE_PROGRAM);
+	MGLRecorder_word(program);
+	recording.gl.UseProgram(program);
+}
+
+void GLAPI MGLTrace_BindVertexArray(GLuint array) {
+	MGLRecorder_word(MGL_CMD_BIND_VERTEX_ARRAY);
+	MGLRecorder_word(array);
+	recording.gl.BindVertexArray(array);
+}
+
+void GLAPI MGLTrace_UniformSubroutinesuiv(GLenum shadertype, GLsizei count, const GLuint * indices) {
+	MGLRecorder_word(MGL_CMD_UNIFORM_SUBROUTINES);
+	MGLRecorder_word(shadertype);
+	MGLRecorder_data(indices, count * 4);
+	recording.gl.UniformSubroutinesuiv(shadertype, count, indices);
+}
+
+void MGLRecorder_uniform(GLuint program, GLint location, GLsizei count, GLboolean transpose, const void * value) {
+	for (int kind = 0; kind < MGL_NUM_UNIFORM_WRITERS; ++kind) {
+		if (MGLRecorder_uniform_writer(recording.gl, kind) == recording.uniform_writer_proc) {
+			MGLRecorder_word(MGL_CMD_UNIFORM);
+			MGLRecorder_word(kind);
+			MGLRecorder_word(program);
+			MGLRecorder_word(location);
+			MGLRecorder_word(count);
+			MGLRecorder_word(transpose);
+			MGLRecorder_data(value, count * recording.uniform->element_size);
+			break;
+		}
+	}
+}
+
+void GLAPI MGLTrace_uniform_vector(GLuint program, GLint location, GLsizei count, const void * value) {
+	MGLRecorder_uniform(program, location, count, false, value);
+	((gl_uniform_vector_writer_proc)recording.uniform_writer_proc)(program, location, count, value);
+}
+
+void GLAPI MGLTrace_uniform_matrix(GLuint program, GLint location, GLsizei count, GLboolean transpose, const void * value) {
+	MGLRecorder_uniform(program, location, count, transpose, value);
+	((gl_uniform_matrix_writer_proc)recording.uniform_writer_proc)(program, location, count, transpose, value);
+}
+
+void GLAPI MGLTrace_UniformBlockBinding(GLuint program, GLuint index, GLuint binding) {
+	MGLRecorder_word(MGL_CMD_UNIFORM_BLOCK_BINDING);
+	MGLRecorder_word(program);
+	MGLRecorder_word(index);
+	MGLRecorder_word(binding);
+	recording.gl.UniformBlockBinding(program, index, binding);
+}
+
+void GLAPI MGLTrace_DrawArraysInstanced(GLenum mode, GLint first, GLsizei count, GLsizei instances) {
+	MGLRecorder_word(MGL_CMD_DRAW_ARRAYS_INSTANCED);
+	MGLRecorder_word(mode);
+	MGLRecorder_word(first);
+	MGLRecorder_word(count);
+	MGLRecorder_word(instances);
+	recording.gl.DrawArraysInstanced(mode, first, count, instances);
+}
+
+void GLAPI MGLTrace_DrawElementsInstanced(GLenum mode, GLsizei count, GLenum type, const void * indices, GLsizei instances) {
+	MGLRecorder_word(MGL_CMD_DRAW_ELEMENTS_INSTANCED);
+	MGLRecorder_word(mode);
+	MGLRecorder_word(count);
+	MGLRecorder_word(type);
+	MGLRecorder_pointer(indices);
+	MGLRecorder_word(instances);
+	recording.gl.DrawElementsInstanced(mode, count, type, indices, instances);
+}
+
+void GLAPI MGLTrace_MultiDrawArrays(GLenum mode, const GLint * first, const GLsizei * count, GLsizei drawcount) {
+	MGLRecorder_word(MGL_CMD_MULTI_DRAW_ARRAYS);
+	MGLRecorder_word(mode);
+	MGLRecorder_data(first, drawcount * 4);
+	MGLRecorder_data(count, drawcount * 4);
+	recording.gl.MultiDrawArrays(mode, first, count, drawcount);
+}
+
+void GLAPI MGLTrace_MultiDrawElements(GLenum mode, const GLsizei * count, GLenum type, const void * const * indices, GLsizei drawcount) {
+	MGLRecorder_word(MGL_CMD_MULTI_DRAW_ELEMENTS);
+	MGLRecorder_word(mode);
+	MGLRecorder_word(type);
+	MGLRecorder_data(count, drawcount * 4);
+	MGLRecorder_pointers(indices, drawcount);
+	recording.gl.MultiDrawElements(mode, count, type, indices, drawcount);
+}
+
+void GLAPI MGLTrace_MultiDrawElementsBaseVertex(GLenum mode, const GLsizei * count, GLenum type, const void * const * indices, GLsizei drawcount, const GLint * basevertex) {
+	MGLRecorder_word(MGL_CMD_MULTI_DRAW_ELEMENTS_BASE_VERTEX);
+	MGLRecorder_word(mode);
+	MGLRecorder_word(type);
+	MGLRecorder_data(count, drawcount * 4);
+	MGLRecorder_pointers(indices, drawcount);
+	MGLRecorder_data(basevertex, drawcount * 4);
+	recording.gl.MultiDrawElementsBaseVertex(mode, count, type, indices, drawcount, basevertex);
+}
+
+void GLAPI MGLTrace_MultiDrawArraysIndirect(GLenum mode, const void * indirect, GLsizei drawcount, GLsizei stride) {
+	MGLRecorder_word(MGL_CMD_MULTI_DRAW_ARRAYS_INDIRECT);
+	MGLRecorder_word(mode);
+	MGLRecorder_pointer(indirect);
+	MGLRecorder_word(drawcount);
+	MGLRecorder_word(stride);
+	recording.gl.MultiDrawArraysIndirect(mode, indirect, drawcount, stride);
+}
+
+void GLAPI MGLTrace_MultiDrawElementsIndirect(GLenum mode, GLenum type, const void * indirect, GLsizei drawcount, GLsizei stride) {
+	MGLRecorder_word(MGL_CMD_MULTI_DRAW_ELEMENTS_INDIRECT);
+	MGLRecorder_word(mode);
+	MGLRecorder_word(type);
+	MGLRecorder_pointer(indirect);
+	MGLRecorder_word(drawcount);
+	MGLRecorder_word(stride);
+	recording.gl.MultiDrawElementsIndirect(mode, type, indirect, drawcount, stride);
+}
+
+void GLAPI MGLTrace_MultiDrawArraysIndirectCount(GLenum mode, const void * indirect, GLintptr drawcount, GLsizei maxdrawcount, GLsizei stride) {
+	MGLRecorder_word(MGL_CMD_MULTI_DRAW_ARRAYS_INDIRECT_COUNT);
+	MGLRecorder_word(mode);
+	MGLRecorder_pointer(indirect);
+	MGLRecorder_pointer((const void *)drawcount);
+	MGLRecorder_word(maxdrawcount);
+	MGLRecorder_word(stride);
+	recording.gl.MultiDrawArraysIndirectCount(mode, indirect, drawcount, maxdrawcount, stride);
+}
+
+void GLAPI MGLTrace_MultiDrawElementsIndirectCount(GLenum mode, GLenum type, const void * indirect, GLintptr drawcount, GLsizei maxdrawcount, GLsizei stride) {
+	MGLRecorder_word(MGL_CMD_MULTI_DRAW_ELEMENTS_INDIRECT_COUNT);
+	MGLRecorder_word(mode);
+	MGLRecorder_word(type);
+	MGLRecorder_pointer(indirect);
+	MGLRecorder_pointer((const void *)drawcount);
+	MGLRecorder_word(maxdrawcount);
+	MGLRecorder_word(stride);
+	recording.gl.MultiDrawElementsIndirectCount(mode, type, indirect, drawcount, maxdrawcount, stride);
+}
+
+void GLAPI MGLTrace_BeginTransformFeedback(GLenum mode) {
+	MGLRecorder_word(MGL_CMD_BEGIN_TRANSFORM_FEEDBACK);
+	MGLRecorder_word(mode);
+	recording.gl.BeginTransformFeedback(mode);
+}
+
+void GLAPI MGLTrace_EndTransformFeedback() {
+	MGLRecorder_word(MGL_CMD_END_TRANSFORM_FEEDBACK);
+	recording.gl.EndTransformFeedback();
+}
+
+void GLAPI MGLTrace_Flush() {
+	MGLRecorder_word(MGL_CMD_FLUSH);
+	recording.gl.Flush();
+}
+
+void GLAPI MGLTrace_BindBuffer(GLenum target, GLuint buffer) {
+	MGLRecorder_word(MGL_CMD_BIND_BUFFER);
+	MGLRecorder_word(target);
+	MGLRecorder_word(buffer);
+	recording.gl.BindBuffer(target, buffer);
+}
+
+void GLAPI MGLTrace_BindBufferBase(GLenum target, GLuint index, GLuint buffer) {
+	MGLRecorder_word(MGL_CMD_BIND_BUFFER_BASE);
+	MGLRecorder_word(target);
+	MGLRecorder_word(index);
+	MGLRecorder_word(buffer);
+	recording.gl.BindBufferBase(target, index, buffer);
+}
+
+void GLAPI MGLTrace_BindBufferRange(GLenum target, GLuint index, GLuint buffer, GLintptr offset, GLsizeiptr size) {
+	MGLRecorder_word(MGL_CMD_BIND_BUFFER_RANGE);
+	MGLRecorder_word(target);
+	MGLRecorder_word(index);
+	MGLRecorder_word(buffer);
+	MGLRecorder_pointer((const void *)offset);
+	MGLRecorder_pointer((const void *)size);
+	recording.gl.BindBufferRange(target, index, buffer, offset, size);
+}
+
+void GLAPI MGLTrace_BindFramebuffer(GLenum target, GLuint framebuffer) {
+	MGLRecorder_word(MGL_CMD_BIND_FRAMEBUFFER);
+	MGLRecorder_word(target);
+	MGLRecorder_word(framebuffer);
+	recording.gl.BindFramebuffer(target, framebuffer);
+}
+
+void GLAPI MGLTrace_DrawBuffers(GLsizei n, const GLenum * bufs) {
+	MGLRecorder_word(MGL_CMD_DRAW_BUFFERS);
+	MGLRecorder_data(bufs, n * 4);
+	recording.gl.DrawBuffers(n, bufs);
+}
+
+void GLAPI MGLTrace_Viewport(GLint x, GLint y, GLsizei width, GLsizei height) {
+	MGLRecorder_word(MGL_CMD_VIEWPORT);
+	MGLRecorder_word(x);
+	MGLRecorder_word(y);
+	MGLRecorder_word(width);
+	MGLRecorder_word(height);
+	recording.gl.Viewport(x, y, width, height);
+}
+
+void GLAPI MGLTrace_Scissor(GLint x, GLint y, GLsizei width, GLsizei height) {
+	MGLRecorder_word(MGL_CMD_SCISSOR);
+	MGLRecorder_word(x);
+	MGLRecorder_word(y);
+	MGLRecorder_word(width);
+	MGLRecorder_word(height);
+	recording.gl.Scissor(x, y, width, height);
+}
+
+void GLAPI MGLTrace_ColorMaski(GLuint index, GLboolean r, GLboolean g, GLboolean b, GLboolean a) {
+	MGLRecorder_word(MGL_CMD_COLOR_MASKI);
+	MGLRecorder_word(index);
+	MGLRecorder_word(r | g << 1 | b << 2 | a << 3);
+	recording.gl.ColorMaski(index, r, g, b, a);
+}
+
+void GLAPI MGLTrace_DepthMask(GLboolean flag) {
+	MGLRecorder_word(MGL_CMD_DEPTH_MASK);
+	MGLRecorder_word(flag);
+	recording.gl.DepthMask(flag);
+}
+
+void GLAPI MGLTrace_ClearColor(GLfloat r, GLfloat g, GLfloat b, GLfloat a) {
+	MGLRecorder_word(MGL_CMD_CLEAR_COLOR);
+	MGLRecorder_float(r);
+	MGLRecorder_float(g);
+	MGLRecorder_float(b);
+	MGLRecorder_float(a);
+	recording.gl.ClearColor(r, g, b, a);
+}
+
+void GLAPI MGLTrace_ClearDepth(GLdouble depth) {
+	MGLRecorder_word(MGL_CMD_CLEAR_DEPTH);
+	MGLRecorder_double(depth);
+	recording.gl.ClearDepth(depth);
+}
+
+void GLAPI MGLTrace_Clear(GLbitfield mask) {
+	MGLRecorder_word(MGL_CMD_CLEAR);
+	MGLRecorder_word(mask);
+	recording.gl.Clear(mask);
+}
+
+void GLAPI MGLTrace_Enable(GLenum cap) {
+	MGLRecorder_word(MGL_CMD_ENABLE);
+	MGLRecorder_word(cap);
+	recording.gl.Enable(cap);
+}
+
+void GLAPI MGLTrace_Disable(GLenum cap) {
+	MGLRecorder_word(MGL_CMD_DISABLE);
+	MGLRecorder_word(cap);
+	recording.gl.Disable(cap);
+}
+
+void GLAPI MGLTrace_ActiveTexture(GLenum texture) {
+	MGLRecorder_word(MGL_CMD_ACTIVE_TEXTURE);
+	MGLRecorder_word(texture);
+	recording.gl.ActiveTexture(texture);
+}
+
+void GLAPI MGLTrace_BindTexture(GLenum target, GLuint texture) {
+	MGLRecorder_word(MGL_CMD_BIND_TEXTURE);
+	MGLRecorder_word(target);
+	MGLRecorder_word(texture);
+	recording.gl.BindTexture(target, texture);
+}
+
+void GLAPI MGLTrace_BindSampler(GLuint unit, GLuint sampler) {
+	MGLRecorder_word(MGL_CMD_BIND_SAMPLER);
+	MGLRecorder_word(unit);
+	MGLRecorder_word(sampler);
+	recording.gl.BindSampler(unit, sampler);
+}
+
+void GLAPI MGLTrace_BlendFunc(GLenum sfactor, GLenum dfactor) {
+	MGLRecorder_word(MGL_CMD_BLEND_FUNC);
+	MGLRecorder_word(sfactor);
+	MGLRecorder_word(dfactor);
+	recording.gl.BlendFunc(sfactor, dfactor);
+}
+
+void GLAPI MGLTrace_DepthFunc(GLenum func) {
+	MGLRecorder_word(MGL_CMD_DEPTH_FUNC);
+	MGLRecorder_word(func);
+	recording.gl.DepthFunc(func);
+}
+
+void GLAPI MGLTrace_FrontFace(GLenum mode) {
+	MGLRecorder_word(MGL_CMD_FRONT_FACE);
+	MGLRecorder_word(mode);
+	recording.gl.FrontFace(mode);
+}
+
+void GLAPI MGLTrace_LineWidth(GLfloat width) {
+	MGLRecorder_word(MGL_CMD_LINE_WIDTH);
+	MGLRecorder_float(width);
+	recording.gl.LineWidth(width);
+}
+
+void GLAPI MGLTrace_PointSize(GLfloat size) {
+	MGLRecorder_word(MGL_CMD_POINT_SIZE);
+	MGLRecorder_float(size);
+	recording.gl.PointSize(size);
+}
+
+void GLAPI MGLTrace_PolygonMode(GLenum face, GLenum mode) {
+	MGLRecorder_word(MGL_CMD_POLYGON_MODE);
+	MGLRecorder_word(face);
+	MGLRecorder_word(mode);
+	recording.gl.PolygonMode(face, mode);
+}
+
+void GLAPI MGLTrace_ProvokingVertex(GLenum mode) {
+	MGLRecorder_word(MGL_CMD_PROVOKING_VERTEX);
+	MGLRecorder_word(mode);
+	recording.gl.ProvokingVertex(mode);
+}
+
+void GLAPI MGLTrace_PatchParameteri(GLenum pname, GLint value) {
+	MGLRecorder_word(MGL_CMD_PATCH_PARAMETERI);
+	MGLRecorder_word(pname);
+	MGLRecorder_word(value);
+	recording.gl.PatchParameteri(pname, value);
+}
+
+void GLAPI MGLTrace_PrimitiveRestartIndex(GLuint index) {
+	MGLRecorder_word(MGL_CMD_PRIMITIVE_RESTART_INDEX);
+	MGLRecorder_word(index);
+	recording.gl.PrimitiveRestartIndex(index);
+}
+
+void GLAPI MGLTrace_CullFace(GLenum mode) {
+	MGLRecorder_word(MGL_CMD_CULL_FACE);
+	MGLRecorder_word(mode);
+	recording.gl.CullFace(mode);
+}
+
+MGLProc MGLRecorder_trace_uniform(MGLUniform * uniform) {
+	MGLProc proc = uniform->gl_value_writer_proc;
+	recording.uniform = uniform;
+	recording.uniform_writer_proc = proc;
+	uniform->gl_value_writer_proc = uniform->matrix ? (MGLProc)MGLTrace_uniform_matrix : (MGLProc)MGLTrace_uniform_vector;
+	return proc;
+}
+
+PyObject * MGLContext_begin_recording(MGLContext * self) {
+	if (MGLRecorder_recording) {
+		MGLError_Set("a recording is already in progress");
+		return 0;
+	}
+
+	Py_INCREF(self);
+	recording.context = self;
+	recording.gl = self->gl;
+	recording.size = 0;
+	MGLRecorder_recording = true;
+
+	MGLRecorder_word(MGL_RECORDER_MAGIC);
+
+	// The bytecode may be replayed from any state, the first bindings must not be skipped.
+	MGLContext_InvalidateState(self);
+	self->recording = true;
+
+	GLMethods & gl = self->gl;
+
+	gl.UseProgram = MGLTrace_UseProgram;
+	gl.BindVertexArray = MGLTrace_BindVertexArray;
+	gl.UniformSubroutinesuiv = MGLTrace_UniformSubroutinesuiv;
+	gl.UniformBlockBinding = MGLTrace_UniformBlockBinding;
+	gl.DrawArraysInstanced = MGLTrace_DrawArraysInstanced;
+	gl.DrawElementsInstanced = MGLTrace_DrawElementsInstanced;
+	gl.MultiDrawArrays = MGLTrace_MultiDrawArrays;
+	gl.MultiDrawElements = MGLTrace_MultiDrawElements;
+	gl.MultiDrawElementsBaseVertex = MGLTrace_MultiDrawElementsBaseVertex;
+	gl.MultiDrawArraysIndirect = MGLTrace_MultiDrawArraysIndirect;
+	gl.MultiDrawElementsIndirect = MGLTrace_MultiDrawElementsIndirect;
+	gl.MultiDrawArraysIndirectCount = MGLTrace_MultiDrawArraysIndirectCount;
+	gl.MultiDrawElementsIndirectCount = MGLTrace_MultiDrawElementsIndirectCount;
+	gl.BeginTransformFeedback = MGLTrace_BeginTransformFeedback;
+	gl.EndTransformFeedback = MGLTrace_EndTransformFeedback;
+	gl.Flush = MGLTrace_Flush;
+	gl.BindBuffer = MGLTrace_BindBuffer;
+	gl.BindBufferBase = MGLTrace_BindBufferBase;
+	gl.BindBufferRange = MGLTrace_BindBufferRange;
+	gl.BindFramebuffer = MGLTrace_BindFramebuffer;
+	gl.DrawBuffers = MGLTrace_DrawBuffers;
+	gl.Viewport = MGLTrace_Viewport;
+	gl.Scissor = MGLTrace_Scissor;
+	gl.ColorMaski = MGLTrace_ColorMaski;
+	gl.DepthMask = MGLTrace_DepthMask;
+	gl.ClearColor = MGLTrace_ClearColor;
+	gl.ClearDepth = MGLTrace_ClearDepth;
+	gl.Clear = MGLTrace_Clear;
+	gl.Enable = MGLTrace_Enable;
+	gl.Disable = MGLTrace_Disable;
+	gl.ActiveTexture = MGLTrace_ActiveTexture;
+	gl.BindTexture = MGLTrace_BindTexture;
+	gl.BindSampler = MGLTrace_BindSampler;
+	gl.BlendFunc = MGLTrace_BlendFunc;
+	gl.DepthFunc = MGLTrace_DepthFunc;
+	gl.FrontFace = MGLTrace_FrontFace;
+	gl.LineWidth = MGLTrace_LineWidth;
+	gl.PointSize = MGLTrace_PointSize;
+	gl.PolygonMode = MGLTrace_PolygonMode;
+	gl.ProvokingVertex = MGLTrace_ProvokingVertex;
+	gl.PatchParameteri = MGLTrace_PatchParameteri;
+	gl.PrimitiveRestartIndex = MGLTrace_PrimitiveRestartIndex;
+	gl.CullFace = MGLTrace_CullFace;
+
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLContext_end_recording(MGLContext * self) {
+	if (!MGLRecorder_recording || recording.context != self) {
+		MGLError_Set("the context is not recording");
+		return 0;
+	}
+
+	self->gl = recording.gl;
+	self->recording = false;
+	MGLRecorder_recording = false;
+	recording.context = 0;
+	recording.uniform = 0;
+	Py_DECREF(self);
+
+	return PyBytes_FromStringAndSize((const char *)recording.words, recording.size * sizeof(unsigned));
+}
+
+struct MGLReader {
+	const unsigned * words;
+	int size;
+	int position;
+	bool ok;
+
+	unsigned word() {
+		if (position >= size) {
+			ok = false;
+			return 0;
+		}
+		return words[position++];
+	}
+
+	float real() {
+		unsigned value = word();
+		float result;
+		memcpy(&result, &value, 4);
+		return result;
+	}
+
+	double real64() {
+		unsigned value[2] = {word(), word()};
+		double result;
+		memcpy(&result, value, 8);
+		return result;
+	}
+
+	const void * pointer() {
+		unsigned long long lo = word();
+		unsigned long long hi = word();
+		return (const void *)(size_t)(lo | hi << 32);
+	}
+
+	const void * data(int * count, int element_size) {
+		int bytes = (int)word();
+		int length = (bytes + 3) / 4;
+		if (!ok || bytes < 0 || length > size - position) {
+			ok = false;
+			*count = 0;
+			return 0;
+		}
+		const void * result = words + position;
+		position += length;
+		*count = bytes / element_size;
+		return result;
+	}
+
+	const void ** pointers(int count) {
+		if (word() != (unsigned)count || count * 2 > size - position) {
+			ok = false;
+			return 0;
+		}
+		const void ** result = new const void * [count + 1];
+		for (int i = 0; i < count; ++i) {
+			result[i] = pointer();
+		}
+		return result;
+	}
+};
+
+PyObject * MGLContext_replay(MGLContext * self, PyObject * args) {
+	Py_buffer buffer_view;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"y*",
+		&buffer_view
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	MGLReader reader = {(const unsigned *)buffer_view.buf, (int)(buffer_view.len / 4), 0, true};
+
+	if (buffer_view.len % 4 || reader.word() != MGL_RECORDER_MAGIC) {
+		MGLError_Set("invalid bytecode");
+		PyBuffer_Release(&buffer_view);
+		return 0;
+	}
+
+	const GLMethods & gl = self->gl;
+
+	while (reader.ok && reader.position < reader.size) {
+		int command_start = reader.position;
+		unsigned command = reader.word();
+
+		if (command == 0 || command > MGL_CMD_CULL_FACE || MGLCommand_arguments[command] > reader.size - reader.position) {
+			command = 0;
+		}
+
+		switch (command) {
+			case MGL_CMD_USE_PROGRAM: {
+				gl.UseProgram(reader.word());
+				break;
+			}
+			case MGL_CMD_BIND_VERTEX_ARRAY: {
+				gl.BindVertexArray(reader.word());
+				break;
+			}
+			case MGL_CMD_UNIFORM_SUBROUTINES: {
+				int count = 0;
+				GLenum shadertype = reader.word();
+				const void * indices = reader.data(&count, 4);
+				if (reader.ok) {
+					gl.UniformSubroutinesuiv(shadertype, count, (const GLuint *)indices);
+				}
+				break;
+			}
+			case MGL_CMD_UNIFORM: {
+				int kind = reader.word();
+				int program = reader.word();
+				int location = reader.word();
+				int count = reader.word();
+				int transpose = reader.word();
+				int size = 0;
+				const void * value = reader.data(&size, 1);
+				MGLProc proc = MGLRecorder_uniform_writer(gl, kind);
+				if (!proc || count < 0 || size < count * MGLUniform_writer_element_size[kind]) {
+					reader.ok = false;
+				}
+				if (!reader.ok) {
+					break;
+				}
+				if (kind >= MGL_FIRST_MATRIX_WRITER) {
+					((gl_uniform_matrix_writer_proc)proc)(program, location, count, transpose, value);
+				} else {
+					((gl_uniform_vector_writer_proc)proc)(program, location, count, value);
+				}
+				break;
+			}
+			case MGL_CMD_UNIFORM_BLOCK_BINDING: {
+				int program = reader.word();
+				int index = reader.word();
+				int binding = reader.word();
+				gl.UniformBlockBinding(program, index, binding);
+				break;
+			}
+			case MGL_CMD_DRAW_ARRAYS_INSTANCED: {
+				int mode = reader.word();
+				int first = reader.word();
+				int count = reader.word();
+				int instances = reader.word();
+				gl.DrawArraysInstanced(mode, first, count, instances);
+				break;
+			}
+			case MGL_CMD_DRAW_ELEMENTS_INSTANCED: {
+				int mode = reader.word();
+				int count = reader.word();
+				int type = reader.word();
+				const void * indices = reader.pointer();
+				int instances = reader.word();
+				gl.DrawElementsInstanced(mode, count, type, indices, instances);
+				break;
+			}
+			case MGL_CMD_MULTI_DRAW_ARRAYS: {
+				int num_firsts = 0;
+				int num_counts = 0;
+				int mode = reader.word();
+				const void * firsts = reader.data(&num_firsts, 4);
+				const void * counts = reader.data(&num_counts, 4);
+				if (reader.ok && num_firsts == num_counts) {
+					gl.MultiDrawArrays(mode, (const GLint *)firsts, (const GLsizei *)counts, num_counts);
+				}
+				break;
+			}
+			case MGL_CMD_MULTI_DRAW_ELEMENTS:
+			case MGL_CMD_MULTI_DRAW_ELEMENTS_BASE_VERTEX: {
+				int num_counts = 0;
+				int num_base_vertices = 0;
+				int mode = reader.word();
+				int type = reader.word();
+				const void * counts = reader.data(&num_counts, 4);
+				const void ** indices = reader.pointers(num_counts);
+				const void * base_vertices = 0;
+				if (command == MGL_CMD_MULTI_DRAW_ELEMENTS_BASE_VERTEX) {
+					base_vertices = reader.data(&num_base_vertices, 4);
+					if (num_base_vertices != num_counts) {
+						reader.ok = false;
+					}
+				}
+				if (reader.ok) {
+					if (base_vertices) {
+						gl.MultiDrawElementsBaseVertex(mode, (const GLsizei *)counts, type, indices, num_counts, (const GLint *)base_vertices);
+					} else {
+						gl.MultiDrawElements(mode, (const GLsizei *)counts, type, indices, num_counts);
+					}
+				}
+				delete[] indices;
+				break;
+			}
+			case MGL_CMD_MULTI_DRAW_ARRAYS_INDIRECT: {
+				int mode = reader.word();
+				const void * indirect = reader.pointer();
+				int drawcount = reader.word();
+				int stride = reader.word();
+				gl.MultiDrawArraysIndirect(mode, indirect, drawcount, stride);
+				break;
+			}
+			case MGL_CMD_MULTI_DRAW_ELEMENTS_INDIRECT: {
+				int mode = reader.word();
+				int type = reader.word();
+				const void * indirect = reader.pointer();
+				int drawcount = reader.word();
+				int stride = reader.word();
+				gl.MultiDrawElementsIndirect(mode, type, indirect, drawcount, stride);
+				break;
+			}
+			case MGL_CMD_MULTI_DRAW_ARRAYS_INDIRECT_COUNT: {
+				int mode = reader.word();
+				const void * indirect = reader.pointer();
+				GLintptr drawcount = (GLintptr)reader.pointer();
+				int maxdrawcount = reader.word();
+				int stride = reader.word();
+				gl.MultiDrawArraysIndirectCount(mode, indirect, drawcount, maxdrawcount, stride);
+				break;
+			}
+			case MGL_CMD_MULTI_DRAW_ELEMENTS_INDIRECT_COUNT: {
+				int mode = reader.word();
+				int type = reader.word();
+				const void * indirect = reader.pointer();
+				GLintptr drawcount = (GLintptr)reader.pointer();
+				int maxdrawcount = reader.word();
+				int stride = reader.word();
+				gl.MultiDrawElementsIndirectCount(mode, type, indirect, drawcount, maxdrawcount, stride);
+				break;
+			}
+			case MGL_CMD_BEGIN_TRANSFORM_FEEDBACK: {
+				gl.BeginTransformFeedback(reader.word());
+				break;
+			}
+			case MGL_CMD_END_TRANSFORM_FEEDBACK: {
+				gl.EndTransformFeedback();
+				break;
+			}
+			case MGL_CMD_FLUSH: {
+				gl.Flush();
+				break;
+			}
+			case MGL_CMD_BIND_BUFFER: {
+				int target = reader.word();
+				int buffer = reader.word();
+				gl.BindBuffer(target, buffer);
+				break;
+			}
+			case MGL_CMD_BIND_BUFFER_BASE: {
+				int target = reader.word();
+				int index = reader.word();
+				int buffer = reader.word();
+				gl.BindBufferBase(target, index, buffer);
+				break;
+			}
+			case MGL_CMD_BIND_BUFFER_RANGE: {
+				int target = reader.word();
+				int index = reader.word();
+				int buffer = reader.word();
+				GLintptr offset = (GLintptr)reader.pointer();
+				GLsizeiptr size = (GLsizeiptr)reader.pointer();
+				gl.BindBufferRange(target, index, buffer, offset, size);
+				break;
+			}
+			case MGL_CMD_BIND_FRAMEBUFFER: {
+				int target = reader.word();
+				int framebuffer = reader.word();
+				gl.BindFramebuffer(target, framebuffer);
+				break;
+			}
+			case MGL_CMD_DRAW_BUFFERS: {
+				int count = 0;
+				const void * bufs = reader.data(&count, 4);
+				if (reader.ok) {
+					gl.DrawBuffers(count, (const GLenum *)bufs);
+				}
+				break;
+			}
+			case MGL_CMD_VIEWPORT:
+			case MGL_CMD_SCISSOR: {
+				int x = reader.word();
+				int y = reader.word();
+				int width = reader.word();
+				int height = reader.word();
+				if (command == MGL_CMD_VIEWPORT) {
+					gl.Viewport(x, y, width, height);
+				} else {
+					gl.Scissor(x, y, width, height);
+				}
+				break;
+			}
+			case MGL_CMD_COLOR_MASKI: {
+				int index = reader.word();
+				int mask = reader.word();
+				gl.ColorMaski(index, mask & 1, (mask >> 1) & 1, (mask >> 2) & 1, (mask >> 3) & 1);
+				break;
+			}
+			case MGL_CMD_DEPTH_MASK: {
+				gl.DepthMask(reader.word());
+				break;
+			}
+			case MGL_CMD_CLEAR_COLOR: {
+				float r = reader.real();
+				float g = reader.real();
+				float b = reader.real();
+				float a = reader.real();
+				gl.ClearColor(r, g, b, a);
+				break;
+			}
+			case MGL_CMD_CLEAR_DEPTH: {
+				gl.ClearDepth(reader.real64());
+				break;
+			}
+			case MGL_CMD_CLEAR: {
+				gl.Clear(reader.word());
+				break;
+			}
+			case MGL_CMD_ENABLE: {
+				gl.Enable(reader.word());
+				break;
+			}
+			case MGL_CMD_DISABLE: {
+				gl.Disable(reader.word());
+				break;
+			}
+			case MGL_CMD_ACTIVE_TEXTURE: {
+				gl.ActiveTexture(reader.word());
+				break;
+			}
+			case MGL_CMD_BIND_TEXTURE: {
+				int target = reader.word();
+				int texture = reader.word();
+				gl.BindTexture(target, texture);
+				break;
+			}
+			case MGL_CMD_BIND_SAMPLER: {
+				int unit = reader.word();
+				int sampler = reader.word();
+				gl.BindSampler(unit, sampler);
+				break;
+			}
+			case MGL_CMD_BLEND_FUNC: {
+				int sfactor = reader.word();
+				int dfactor = reader.word();
+				gl.BlendFunc(sfactor, dfactor);
+				break;
+			}
+			case MGL_CMD_DEPTH_FUNC: {
+				gl.DepthFunc(reader.word());
+				break;
+			}
+			case MGL_CMD_FRONT_FACE: {
+				gl.FrontFace(reader.word());
+				break;
+			}
+			case MGL_CMD_LINE_WIDTH: {
+				gl.LineWidth(reader.real());
+				break;
+			}
+			case MGL_CMD_POINT_SIZE: {
+				gl.PointSize(reader.real());
+				break;
+			}
+			case MGL_CMD_POLYGON_MODE: {
+				int face = reader.word();
+				int mode = reader.word();
+				gl.PolygonMode(face, mode);
+				break;
+			}
+			case MGL_CMD_PROVOKING_VERTEX: {
+				gl.ProvokingVertex(reader.word());
+				break;
+			}
+			case MGL_CMD_PATCH_PARAMETERI: {
+				int pname = reader.word();
+				int value = reader.word();
+				gl.PatchParameteri(pname, value);
+				break;
+			}
+			case MGL_CMD_PRIMITIVE_RESTART_INDEX: {
+				gl.PrimitiveRestartIndex(reader.word());
+				break;
+			}
+			case MGL_CMD_CULL_FACE: {
+				gl.CullFace(reader.word());
+				break;
+			}
+			default: {
+				reader.ok = false;
+				break;
+			}
+		}
+
+		if (!reader.ok) {
+			MGLContext_InvalidateState(self);
+			self->unknown_state = MGL_UNKNOWN_RENDER_STATE;
+			MGLError_Set("invalid bytecode at offset %d", command_start * 4);
+			PyBuffer_Release(&buffer_view);
+			return 0;
+		}
+	}
+
+	// The replayed commands change the state behind the shadow copy, querying it back would stall the pipeline.
+	MGLContext_InvalidateState(self);
+	self->unknown_state = MGL_UNKNOWN_RENDER_STATE;
+
+	PyBuffer_Release(&buffer_view);
+	Py_RETURN_NONE;
+}
@@ -68,8 +68,7 @@ PyObject * MGLSampler_use(MGLSampler * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-	gl.BindSampler(index, self->sampler_obj);
+	MGLContext_bind_sampler(self->context, index, self->sampler_obj);
 
 	Py_RETURN_NONE;
 }
@@ -87,8 +86,7 @@ PyObject * MGLSampler_clear(MGLSampler * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-	gl.BindSampler(index, 0);
+	MGLContext_bind_sampler(self->context, index, 0);
 
 	Py_RETURN_NONE;
 }
@@ -351,6 +349,7 @@ void MGLSampler_Invalidate(MGLSampler * sampler) {
 
 	const GLMethods & gl = sampler->context->gl;
 	gl.DeleteSamplers(1, (GLuint *)&sampler->sampler_obj);
+	MGLContext_InvalidateSamplers(sampler->context);
 
 	Py_TYPE(sampler) = &MGLInvalidObject_Type;
 	Py_DECREF(sampler);
@@ -2,6 +2,19 @@
 
 #include "InlineMethods.hpp"
 
+// Stable insertion sort of the (unit, ...) records, later records for the same unit are still bound last.
+void MGLScope_SortByUnit(int * records, int count, int stride) {
+	for (int i = 1; i < count; ++i) {
+		for (int j = i; j > 0 && records[(j - 1) * stride] > records[j * stride]; --j) {
+			for (int k = 0; k < stride; ++k) {
+				int temp = records[(j - 1) * stride + k];
+				records[(j - 1) * stride + k] = records[j * stride + k];
+				records[j * stride + k] = temp;
+			}
+		}
+	}
+}
+
 PyObject * MGLContext_scope(MGLContext * self, PyObject * args) {
 	MGLFramebuffer * framebuffer;
 	PyObject * enable_flags;
@@ -9,17 +22,33 @@ PyObject * MGLContext_scope(MGLContext * self, PyObject * args) {
 	PyObject * uniform_buffers;
 	PyObject * shader_storage_buffers;
 	PyObject * samplers;
+	PyObject * blend_func;
+	PyObject * depth_func;
+	PyObject * cull_face;
+	PyObject * viewport;
+	PyObject * color_mask;
+	PyObject * depth_mask;
+	PyObject * primitive_restart;
+	unsigned restart_index;
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"O!OOOOO",
+		"O!OOOOOOOOOOOOI",
 		&MGLFramebuffer_Type,
 		&framebuffer,
 		&enable_flags,
 		&textures,
 		&uniform_buffers,
 		&shader_storage_buffers,
-		&samplers
+		&samplers,
+		&blend_func,
+		&depth_func,
+		&cull_face,
+		&viewport,
+		&color_mask,
+		&depth_mask,
+		&primitive_restart,
+		&restart_index
 	);
 
 	if (!args_ok) {
@@ -35,6 +64,79 @@ PyObject * MGLContext_scope(MGLContext * self, PyObject * args) {
 		}
 	}
 
+	int blend_func_src = -1;
+	int blend_func_dst = -1;
+	if (blend_func != Py_None) {
+		if (!PyTuple_Check(blend_func) || PyTuple_GET_SIZE(blend_func) != 2) {
+			MGLError_Set("the blend_func must be a 2-tuple");
+			return 0;
+		}
+		blend_func_src = PyLong_AsLong(PyTuple_GET_ITEM(blend_func, 0));
+		blend_func_dst = PyLong_AsLong(PyTuple_GET_ITEM(blend_func, 1));
+		if (PyErr_Occurred()) {
+			MGLError_Set("invalid blend_func");
+			return 0;
+		}
+	}
+
+	int depth_func_value = -1;
+	if (depth_func != Py_None) {
+		const char * func = PyUnicode_AsUTF8(depth_func);
+		depth_func_value = func ? compare_func_from_string(func) : 0;
+		if (!depth_func_value) {
+			PyErr_Clear();
+			MGLError_Set("invalid depth_func");
+			return 0;
+		}
+	}
+
+	int cull_face_value = -1;
+	if (cull_face != Py_None) {
+		const char * mode = PyUnicode_AsUTF8(cull_face);
+		cull_face_value = mode ? cull_face_from_string(mode) : 0;
+		if (!cull_face_value) {
+			PyErr_Clear();
+			MGLError_Set("invalid cull_face");
+			return 0;
+		}
+	}
+
+	int viewport_value[4] = {};
+	if (viewport != Py_None) {
+		if (!PyTuple_Check(viewport) || PyTuple_GET_SIZE(viewport) != 4) {
+			MGLError_Set("the viewport must be a 4-tuple");
+			return 0;
+		}
+		for (int i = 0; i < 4; ++i) {
+			viewport_value[i] = PyLong_AsLong(PyTuple_GET_ITEM(viewport, i));
+		}
+		if (PyErr_Occurred()) {
+			MGLError_Set("invalid viewport");
+			return 0;
+		}
+	}
+
+	bool color_mask_value[4] = {};
+	if (color_mask != Py_None) {
+		if (!PyTuple_Check(color_mask) || PyTuple_GET_SIZE(color_mask) != 4) {
+			MGLError_Set("the color_mask must be a 4-tuple");
+			return 0;
+		}
+		for (int i = 0; i < 4; ++i) {
+			color_mask_value[i] = PyObject_IsTrue(PyTuple_GET_ITEM(color_mask, i)) == 1;
+		}
+	}
+
+	int depth_mask_value = -1;
+	if (depth_mask != Py_None) {
+		depth_mask_value = PyObject_IsTrue(depth_mask) == 1;
+	}
+
+	int primitive_restart_value = -1;
+	if (primitive_restart != Py_None) {
+		primitive_restart_value = PyObject_IsTrue(primitive_restart) == 1;
+	}
+
 	MGLScope * scope = (MGLScope *)MGLScope_Type.tp_alloc(&MGLScope_Type, 0);
 
 	Py_INCREF(self);
@@ -42,6 +144,27 @@ PyObject * MGLContext_scope(MGLContext * self, PyObject * args) {
 
 	scope->enable_flags = flags;
 
+	scope->blend_func_src = blend_func_src;
+	scope->blend_func_dst = blend_func_dst;
+	scope->depth_func = depth_func_value;
+	scope->cull_face = cull_face_value;
+	scope->depth_mask = depth_mask_value;
+	scope->primitive_restart = primitive_restart_value;
+	scope->restart_index = restart_index;
+
+	scope->has_viewport = viewport != Py_None;
+	for (int i = 0; i < 4; ++i) {
+		scope->viewport[i] = viewport_value[i];
+	}
+
+	scope->color_mask = 0;
+	if (color_mask != Py_None && framebuffer->draw_buffers_len) {
+		scope->color_mask = new bool[framebuffer->draw_buffers_len * 4];
+		for (int i = 0; i < framebuffer->draw_buffers_len * 4; ++i) {
+			scope->color_mask[i] = color_mask_value[i % 4];
+		}
+	}
+
 	Py_INCREF(framebuffer);
 	scope->framebuffer = framebuffer;
 
@@ -51,13 +174,16 @@ PyObject * MGLContext_scope(MGLContext * self, PyObject * args) {
 	int num_textures = (int)PyTuple_Size(textures);
 	int num_uniform_buffers = (int)PyTuple_Size(uniform_buffers);
 	int num_shader_storage_buffers = (int)PyTuple_Size(shader_storage_buffers);
+	int num_samplers = (int)PyTuple_Size(samplers);
 
 	scope->num_textures = num_textures;
 	scope->textures = new int[scope->num_textures * 3];
+	scope->texture_names = new unsigned[scope->num_textures];
 	scope->num_buffers = num_uniform_buffers + num_shader_storage_buffers;
 	scope->buffers = new int[scope->num_buffers * 3];
-
-	scope->samplers = PySequence_Fast(samplers, "not iterable");
+	scope->num_samplers = num_samplers;
+	scope->samplers = new int[scope->num_samplers * 2];
+	scope->sampler_names = new unsigned[scope->num_samplers];
 
 	for (int i = 0; i < num_textures; ++i) {
 		PyObject * tup = PyTuple_GET_ITEM(textures, i);
@@ -78,17 +204,49 @@ PyObject * MGLContext_scope(MGLContext * self, PyObject * args) {
 			MGLTextureCube * texture = (MGLTextureCube *)item;
 			texture_type = GL_TEXTURE_CUBE_MAP;
 			texture_obj = texture->texture_obj;
+		} else if (Py_TYPE(item) == &MGLTextureArray_Type) {
+			MGLTextureArray * texture = (MGLTextureArray *)item;
+			texture_type = GL_TEXTURE_2D_ARRAY;
+			texture_obj = texture->texture_obj;
 		} else {
 			MGLError_Set("invalid texture");
+			Py_DECREF(scope);
 			return 0;
 		}
 
 		int binding = PyLong_AsLong(PyTuple_GET_ITEM(tup, 1));
-		scope->textures[i * 3 + 0] = GL_TEXTURE0 + binding;
+		scope->textures[i * 3 + 0] = binding;
 		scope->textures[i * 3 + 1] = texture_type;
 		scope->textures[i * 3 + 2] = texture_obj;
 	}
 
+	MGLScope_SortByUnit(scope->textures, num_textures, 3);
+
+	for (int i = 0; i < num_textures; ++i) {
+		scope->texture_names[i] = scope->textures[i * 3 + 2];
+	}
+
+	for (int i = 0; i < num_samplers; ++i) {
+		PyObject * tup = PyTuple_GET_ITEM(samplers, i);
+		MGLSampler * sampler = (MGLSampler *)PyTuple_GET_ITEM(tup, 0);
+
+		if (Py_TYPE(sampler) != &MGLSampler_Type) {
+			MGLError_Set("invalid sampler");
+			Py_DECREF(scope);
+			return 0;
+		}
+
+		int binding = PyLong_AsLong(PyTuple_GET_ITEM(tup, 1));
+		scope->samplers[i * 2 + 0] = binding;
+		scope->samplers[i * 2 + 1] = sampler->sampler_obj;
+	}
+
+	MGLScope_SortByUnit(scope->samplers, num_samplers, 2);
+
+	for (int i = 0; i < num_samplers; ++i) {
+		scope->sampler_names[i] = scope->samplers[i * 2 + 1];
+	}
+
 	for (int i = 0; i < num_uniform_buffers; ++i) {
 		PyObject * tup = PyTuple_GET_ITEM(uniform_buffers, i);
 		MGLBuffer * buffer = (MGLBuffer *)PyTuple_GET_ITEM(tup, 0);
@@ -100,6 +258,7 @@ PyObject * MGLContext_scope(MGLContext * self, PyObject * args) {
 			scope->buffers[i * 3 + 2] = binding;
 		} else {
 			MGLError_Set("invalid buffer");
+			Py_DECREF(scope);
 			return 0;
 		}
 	}
@@ -117,6 +276,7 @@ PyObject * MGLContext_scope(MGLContext * self, PyObject * args) {
 			scope->buffers[base + i * 3 + 2] = binding;
 		} else {
 			MGLError_Set("invalid buffer");
+			Py_DECREF(scope);
 			return 0;
 		}
 	}
@@ -129,18 +289,127 @@ PyObject * MGLScope_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwar
 
 	if (self) {
 		self->textures = 0;
+		self->texture_names = 0;
 		self->buffers = 0;
+		self->samplers = 0;
+		self->sampler_names = 0;
+		self->color_mask = 0;
 	}
 
 	return (PyObject *)self;
 }
 
 void MGLScope_tp_dealloc(MGLScope * self) {
+	delete[] self->textures;
+	delete[] self->texture_names;
+	delete[] self->buffers;
+	delete[] self->samplers;
+	delete[] self->sampler_names;
+	delete[] self->color_mask;
+	Py_XDECREF(self->old_framebuffer);
+	Py_XDECREF(self->framebuffer);
+	Py_XDECREF(self->context);
 	MGLScope_Type.tp_free((PyObject *)self);
 }
 
 extern PyObject * MGLFramebuffer_use(MGLFramebuffer * self);
 
+// Consecutive texture units are bound with a single glBindTextures call with OpenGL 4.4 or ARB_multi_bind.
+// A run that is already bound according to the shadow copy in the context is skipped.
+// While recording the units are bound one by one, the recorder traces the single binds only.
+
+void MGLScope_BindTextures(MGLScope * self) {
+	MGLContext * context = self->context;
+	const GLMethods & gl = context->gl;
+
+	if (!context->multi_bind || context->recording) {
+		for (int i = 0; i < self->num_textures; ++i) {
+			MGLContext_active_texture(context, GL_TEXTURE0 + self->textures[i * 3]);
+			MGLContext_bind_texture(context, self->textures[i * 3 + 1], self->textures[i * 3 + 2]);
+		}
+		return;
+	}
+
+	int start = 0;
+	while (start < self->num_textures) {
+		int end = start + 1;
+		while (end < self->num_textures && self->textures[end * 3] == self->textures[(end - 1) * 3] + 1) {
+			end += 1;
+		}
+
+		bool bound = context->state_cache;
+		for (int i = start; i < end; ++i) {
+			int unit = self->textures[i * 3];
+			if (unit < 0 || unit >= MGL_CACHED_TEXTURE_UNITS || context->cached_texture_targets[unit] != self->textures[i * 3 + 1] || context->cached_textures[unit] != self->textures[i * 3 + 2]) {
+				bound = false;
+				break;
+			}
+		}
+
+		if (bound) {
+			context->skipped_state_changes += 1;
+		} else {
+			gl.BindTextures(self->textures[start * 3], end - start, self->texture_names + start);
+			context->issued_state_changes += 1;
+
+			for (int i = start; i < end; ++i) {
+				int unit = self->textures[i * 3];
+				if (unit >= 0 && unit < MGL_CACHED_TEXTURE_UNITS) {
+					context->cached_texture_targets[unit] = self->textures[i * 3 + 1];
+					context->cached_textures[unit] = self->textures[i * 3 + 2];
+				}
+			}
+		}
+
+		start = end;
+	}
+}
+
+void MGLScope_BindSamplers(MGLScope * self) {
+	MGLContext * context = self->context;
+	const GLMethods & gl = context->gl;
+
+	if (!context->multi_bind || context->recording) {
+		for (int i = 0; i < self->num_samplers; ++i) {
+			MGLContext_bind_sampler(context, self->samplers[i * 2], self->samplers[i * 2 + 1]);
+		}
+		return;
+	}
+
+	int start = 0;
+	while (start < self->num_samplers) {
+		int end = start + 1;
+		while (end < self->num_samplers && self->samplers[end * 2] == self->samplers[(end - 1) * 2] + 1) {
+			end += 1;
+		}
+
+		bool bound = context->state_cache;
+		for (int i = start; i < end; ++i) {
+			int unit = self->samplers[i * 2];
+			if (unit < 0 || unit >= MGL_CACHED_TEXTURE_UNITS || context->cached_samplers[unit] != self->samplers[i * 2 + 1]) {
+				bound = false;
+				break;
+			}
+		}
+
+		if (bound) {
+			context->skipped_state_changes += 1;
+		} else {
+			gl.BindSamplers(self->samplers[start * 2], end - start, self->sampler_names + start);
+			context->issued_state_changes += 1;
+
+			for (int i = start; i < end; ++i) {
+				int unit = self->samplers[i * 2];
+				if (unit >= 0 && unit < MGL_CACHED_TEXTURE_UNITS) {
+					context->cached_samplers[unit] = self->samplers[i * 2 + 1];
+				}
+			}
+		}
+
+		start = end;
+	}
+}
+
 PyObject * MGLScope_begin(MGLScope * self, PyObject * args) {
 	int args_ok = PyArg_ParseTuple(
 		args,
@@ -151,60 +420,58 @@ PyObject * MGLScope_begin(MGLScope * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-	const int & flags = self->enable_flags;
+	MGLContext * context = self->context;
+	const GLMethods & gl = context->gl;
 
-	self->old_enable_flags = self->context->enable_flags;
-	self->context->enable_flags = self->enable_flags;
+	self->old_enable_flags = context->enable_flags;
+	self->old_blend_func_src = context->blend_func_src;
+	self->old_blend_func_dst = context->blend_func_dst;
+	self->old_depth_func = context->depth_func;
+	self->old_cull_face = context->cull_face;
+	self->old_primitive_restart = context->primitive_restart;
+	self->old_restart_index = context->primitive_restart_index;
 
+	// Only the difference from the current state is applied.
 	MGLFramebuffer_use(self->framebuffer);
 
-	for (int i = 0; i < self->num_textures; ++i) {
-		gl.ActiveTexture(self->textures[i * 3]);
-		gl.BindTexture(self->textures[i * 3 + 1], self->textures[i * 3 + 2]);
+	if (self->has_viewport) {
+		MGLContext_apply_viewport(context, self->viewport[0], self->viewport[1], self->viewport[2], self->viewport[3]);
 	}
 
-	for (int i = 0; i < self->num_buffers; ++i) {
-		gl.BindBufferBase(self->buffers[i * 3], self->buffers[i * 3 + 2], self->buffers[i * 3 + 1]);
+	if (self->color_mask) {
+		MGLContext_apply_color_mask(context, self->color_mask, self->framebuffer->draw_buffers_len);
 	}
 
-	int num_samplers = (int)PySequence_Fast_GET_SIZE(self->samplers);
-	for (int i = 0; i < num_samplers; ++i) {
-		PyObject * pair = PySequence_Fast(PySequence_Fast_GET_ITEM(self->samplers, i), "not iterable");
-		if (PySequence_Fast_GET_SIZE(pair) != 2) {
-			return NULL;
-		}
-		PyObject * call = PyObject_CallMethod(PySequence_Fast_GET_ITEM(pair, 0), "use", "O", PySequence_Fast_GET_ITEM(pair, 1));
-		Py_XDECREF(call);
-		if (!call) {
-			return NULL;
-		}
+	if (self->depth_mask >= 0) {
+		MGLContext_apply_depth_mask(context, self->depth_mask);
 	}
 
-	if (flags & MGL_BLEND) {
-		gl.Enable(GL_BLEND);
-	} else {
-		gl.Disable(GL_BLEND);
+	MGLContext_apply_enable_flags(context, self->enable_flags);
+
+	if (self->blend_func_src >= 0) {
+		MGLContext_apply_blend_func(context, self->blend_func_src, self->blend_func_dst);
 	}
 
-	if (flags & MGL_DEPTH_TEST) {
-		gl.Enable(GL_DEPTH_TEST);
-	} else {
-		gl.Disable(GL_DEPTH_TEST);
+	if (self->depth_func >= 0) {
+		MGLContext_apply_depth_func(context, self->depth_func);
 	}
 
-	if (flags & MGL_CULL_FACE) {
-		gl.Enable(GL_CULL_FACE);
-	} else {
-		gl.Disable(GL_CULL_FACE);
+	if (self->cull_face >= 0) {
+		MGLContext_apply_cull_face(context, self->cull_face);
 	}
 
-	if (flags & MGL_RASTERIZER_DISCARD) {
-		gl.Enable(GL_RASTERIZER_DISCARD);
-	} else {
-		gl.Disable(GL_RASTERIZER_DISCARD);
+	if (self->primitive_restart >= 0) {
+		MGLContext_apply_primitive_restart(context, self->primitive_restart, self->restart_index);
 	}
 
+	MGLScope_BindTextures(self);
+
+	for (int i = 0; i < self->num_buffers; ++i) {
+		gl.BindBufferBase(self->buffers[i * 3], self->buffers[i * 3 + 2], self->buffers[i * 3 + 1]);
+	}
+
+	MGLScope_BindSamplers(self);
+
 	Py_RETURN_NONE;
 }
 
@@ -218,35 +485,27 @@ PyObject * MGLScope_end(MGLScope * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-	const int & flags = self->old_enable_flags;
-
-	self->context->enable_flags = self->old_enable_flags;
+	MGLContext * context = self->context;
 
+	// The old framebuffer restores its own viewport.
 	MGLFramebuffer_use(self->old_framebuffer);
 
-	if (flags & MGL_BLEND) {
-		gl.Enable(GL_BLEND);
-	} else {
-		gl.Disable(GL_BLEND);
+	MGLContext_apply_enable_flags(context, self->old_enable_flags);
+
+	if (self->blend_func_src >= 0) {
+		MGLContext_apply_blend_func(context, self->old_blend_func_src, self->old_blend_func_dst);
 	}
 
-	if (flags & MGL_DEPTH_TEST) {
-		gl.Enable(GL_DEPTH_TEST);
-	} else {
-		gl.Disable(GL_DEPTH_TEST);
+	if (self->depth_func >= 0) {
+		MGLContext_apply_depth_func(context, self->old_depth_func);
 	}
 
-	if (flags & MGL_CULL_FACE) {
-		gl.Enable(GL_CULL_FACE);
-	} else {
-		gl.Disable(GL_CULL_FACE);
+	if (self->cull_face >= 0) {
+		MGLContext_apply_cull_face(context, self->old_cull_face);
 	}
 
-	if (flags & MGL_RASTERIZER_DISCARD) {
-		gl.Enable(GL_RASTERIZER_DISCARD);
-	} else {
-		gl.Disable(GL_RASTERIZER_DISCARD);
+	if (self->primitive_restart >= 0) {
+		MGLContext_apply_primitive_restart(context, self->old_primitive_restart, self->old_restart_index);
 	}
 
 	Py_RETURN_NONE;
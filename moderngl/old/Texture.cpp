@@ -97,7 +97,7 @@ PyObject * MGLContext_texture(MGLContext * self, PyObject * args) {
 
 	const GLMethods & gl = self->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->default_texture_unit);
+	MGLContext_active_texture(self, GL_TEXTURE0 + self->default_texture_unit);
 
 	MGLTexture * texture = (MGLTexture *)MGLTexture_Type.tp_alloc(&MGLTexture_Type, 0);
 
@@ -110,7 +110,7 @@ PyObject * MGLContext_texture(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	gl.BindTexture(texture_target, texture->texture_obj);
+	MGLContext_bind_texture(self, texture_target, texture->texture_obj);
 
 	if (samples) {
 		gl.TexImage2DMultisample(texture_target, samples, internal_format, width, height, true);
@@ -217,7 +217,7 @@ PyObject * MGLContext_depth_texture(MGLContext * self, PyObject * args) {
 
 	const GLMethods & gl = self->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->default_texture_unit);
+	MGLContext_active_texture(self, GL_TEXTURE0 + self->default_texture_unit);
 
 	MGLTexture * texture = (MGLTexture *)MGLTexture_Type.tp_alloc(&MGLTexture_Type, 0);
 
@@ -230,7 +230,7 @@ PyObject * MGLContext_depth_texture(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	gl.BindTexture(texture_target, texture->texture_obj);
+	MGLContext_bind_texture(self, texture_target, texture->texture_obj);
 
 	gl.TexParameteri(texture_target, GL_TEXTURE_MIN_FILTER, GL_LINEAR);
 	gl.TexParameteri(texture_target, GL_TEXTURE_MAG_FILTER, GL_LINEAR);
@@ -338,8 +338,8 @@ PyObject * MGLTexture_read(MGLTexture * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_2D, self->texture_obj);
 
 	gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 	gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
@@ -364,7 +364,9 @@ PyObject * MGLTexture_read(MGLTexture * self, PyObject * args) {
 	// printf("level_width: %d\n", level_width);
 	// printf("level_height: %d\n", level_height);
 
+	Py_BEGIN_ALLOW_THREADS
 	gl.GetTexImage(GL_TEXTURE_2D, level, base_format, pixel_type, data);
+	Py_END_ALLOW_THREADS
 
 	return result;
 }
@@ -423,8 +425,8 @@ PyObject * MGLTexture_read_into(MGLTexture * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_PACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_2D, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_2D, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.GetTexImage(GL_TEXTURE_2D, level, base_format, pixel_type, (void *)write_offset);
@@ -450,11 +452,13 @@ PyObject * MGLTexture_read_into(MGLTexture * self, PyObject * args) {
 
 		const GLMethods & gl = self->context->gl;
 
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_2D, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_2D, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+		Py_BEGIN_ALLOW_THREADS
 		gl.GetTexImage(GL_TEXTURE_2D, level, base_format, pixel_type, ptr);
+		Py_END_ALLOW_THREADS
 
 		PyBuffer_Release(&buffer_view);
 
@@ -554,8 +558,8 @@ PyObject * MGLTexture_write(MGLTexture * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_UNPACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(texture_target, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, texture_target, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.TexSubImage2D(texture_target, level, x, y, width, height, format, pixel_type, 0);
@@ -579,11 +583,13 @@ PyObject * MGLTexture_write(MGLTexture * self, PyObject * args) {
 
 		const GLMethods & gl = self->context->gl;
 
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(texture_target, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, texture_target, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+		Py_BEGIN_ALLOW_THREADS
 		gl.TexSubImage2D(texture_target, level, x, y, width, height, format, pixel_type, buffer_view.buf);
+		Py_END_ALLOW_THREADS
 
 		PyBuffer_Release(&buffer_view);
 
@@ -607,9 +613,8 @@ PyObject * MGLTexture_use(MGLTexture * self, PyObject * args) {
 
 	int texture_target = self->samples ? GL_TEXTURE_2D_MULTISAMPLE : GL_TEXTURE_2D;
 
-	const GLMethods & gl = self->context->gl;
-	gl.ActiveTexture(GL_TEXTURE0 + index);
-	gl.BindTexture(texture_target, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + index);
+	MGLContext_bind_texture(self->context, texture_target, self->texture_obj);
 
 	Py_RETURN_NONE;
 }
@@ -638,8 +643,8 @@ PyObject * MGLTexture_build_mipmaps(MGLTexture * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(texture_target, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, texture_target, self->texture_obj);
 
 	gl.TexParameteri(texture_target, GL_TEXTURE_BASE_LEVEL, base);
 	gl.TexParameteri(texture_target, GL_TEXTURE_MAX_LEVEL, max);
@@ -680,8 +685,8 @@ int MGLTexture_set_repeat_x(MGLTexture * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(texture_target, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, texture_target, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(texture_target, GL_TEXTURE_WRAP_S, GL_REPEAT);
@@ -706,8 +711,8 @@ int MGLTexture_set_repeat_y(MGLTexture * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(texture_target, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, texture_target, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(texture_target, GL_TEXTURE_WRAP_T, GL_REPEAT);
@@ -743,8 +748,8 @@ int MGLTexture_set_filter(MGLTexture * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(texture_target, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, texture_target, self->texture_obj);
 	gl.TexParameteri(texture_target, GL_TEXTURE_MIN_FILTER, self->min_filter);
 	gl.TexParameteri(texture_target, GL_TEXTURE_MAG_FILTER, self->mag_filter);
 
@@ -762,8 +767,8 @@ PyObject * MGLTexture_get_swizzle(MGLTexture * self, void * closure) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(texture_target, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, texture_target, self->texture_obj);
 
 	int swizzle_r = 0;
 	int swizzle_g = 0;
@@ -819,8 +824,8 @@ int MGLTexture_set_swizzle(MGLTexture * self, PyObject * value, void * closure)
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(texture_target, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, texture_target, self->texture_obj);
 
 	gl.TexParameteri(texture_target, GL_TEXTURE_SWIZZLE_R, tex_swizzle[0]);
 	if (tex_swizzle[1] != -1) {
@@ -861,8 +866,8 @@ int MGLTexture_set_compare_func(MGLTexture * self, PyObject * value) {
 	self->compare_func = compare_func_from_string(func);
 
 	const GLMethods & gl = self->context->gl;
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(texture_target, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, texture_target, self->texture_obj);
 	if (self->compare_func == 0) {
 		gl.TexParameteri(texture_target, GL_TEXTURE_COMPARE_MODE, GL_NONE);
 	} else {
@@ -883,8 +888,8 @@ int MGLTexture_set_anisotropy(MGLTexture * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(texture_target, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, texture_target, self->texture_obj);
 	gl.TexParameterf(texture_target, GL_TEXTURE_MAX_ANISOTROPY, self->anisotropy);
 
 	return 0;
@@ -950,6 +955,7 @@ void MGLTexture_Invalidate(MGLTexture * texture) {
 
 	const GLMethods & gl = texture->context->gl;
 	gl.DeleteTextures(1, (GLuint *)&texture->texture_obj);
+	MGLContext_InvalidateTextures(texture->context);
 
 	Py_DECREF(texture->context);
 	Py_TYPE(texture) = &MGLInvalidObject_Type;
@@ -97,8 +97,8 @@ PyObject * MGLContext_texture3d(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, texture->texture_obj);
+	MGLContext_active_texture(self, GL_TEXTURE0 + self->default_texture_unit);
+	MGLContext_bind_texture(self, GL_TEXTURE_3D, texture->texture_obj);
 
 	gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 	gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
@@ -178,12 +178,14 @@ PyObject * MGLTexture3D_read(MGLTexture3D * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 
 	gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 	gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+	Py_BEGIN_ALLOW_THREADS
 	gl.GetTexImage(GL_TEXTURE_3D, 0, base_format, pixel_type, data);
+	Py_END_ALLOW_THREADS
 
 	return result;
 }
@@ -224,8 +226,8 @@ PyObject * MGLTexture3D_read_into(MGLTexture3D * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_PACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.GetTexImage(GL_TEXTURE_3D, 0, format, pixel_type, (void *)write_offset);
@@ -250,11 +252,13 @@ PyObject * MGLTexture3D_read_into(MGLTexture3D * self, PyObject * args) {
 		char * ptr = (char *)buffer_view.buf + write_offset;
 
 		const GLMethods & gl = self->context->gl;
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+		Py_BEGIN_ALLOW_THREADS
 		gl.GetTexImage(GL_TEXTURE_3D, 0, format, pixel_type, ptr);
+		Py_END_ALLOW_THREADS
 
 		PyBuffer_Release(&buffer_view);
 
@@ -343,8 +347,8 @@ PyObject * MGLTexture3D_write(MGLTexture3D * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_UNPACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.TexSubImage3D(GL_TEXTURE_3D, 0, x, y, z, width, height, depth, format, pixel_type, 0);
@@ -368,12 +372,14 @@ PyObject * MGLTexture3D_write(MGLTexture3D * self, PyObject * args) {
 
 		const GLMethods & gl = self->context->gl;
 
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+		Py_BEGIN_ALLOW_THREADS
 		gl.TexSubImage3D(GL_TEXTURE_3D, 0, x, y, z, width, height, depth, format, pixel_type, buffer_view.buf);
+		Py_END_ALLOW_THREADS
 
 		PyBuffer_Release(&buffer_view);
 
@@ -395,9 +401,8 @@ PyObject * MGLTexture3D_use(MGLTexture3D * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-	gl.ActiveTexture(GL_TEXTURE0 + index);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + index);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 
 	Py_RETURN_NONE;
 }
@@ -424,8 +429,8 @@ PyObject * MGLTexture3D_build_mipmaps(MGLTexture3D * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_BASE_LEVEL, base);
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_MAX_LEVEL, max);
@@ -465,8 +470,8 @@ int MGLTexture3D_set_repeat_x(MGLTexture3D * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_WRAP_S, GL_REPEAT);
@@ -490,8 +495,8 @@ int MGLTexture3D_set_repeat_y(MGLTexture3D * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_WRAP_T, GL_REPEAT);
@@ -515,8 +520,8 @@ int MGLTexture3D_set_repeat_z(MGLTexture3D * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_WRAP_R, GL_REPEAT);
@@ -550,8 +555,8 @@ int MGLTexture3D_set_filter(MGLTexture3D * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_MIN_FILTER, self->min_filter);
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_MAG_FILTER, self->mag_filter);
 
@@ -562,8 +567,8 @@ PyObject * MGLTexture3D_get_swizzle(MGLTexture3D * self, void * closure) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 
 	int swizzle_r = 0;
 	int swizzle_g = 0;
@@ -613,8 +618,8 @@ int MGLTexture3D_set_swizzle(MGLTexture3D * self, PyObject * value, void * closu
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_SWIZZLE_R, tex_swizzle[0]);
 	if (tex_swizzle[1] != -1) {
@@ -689,6 +694,7 @@ void MGLTexture3D_Invalidate(MGLTexture3D * texture) {
 
 	const GLMethods & gl = texture->context->gl;
 	gl.DeleteTextures(1, (GLuint *)&texture->texture_obj);
+	MGLContext_InvalidateTextures(texture->context);
 
 	Py_DECREF(texture->context);
 	Py_TYPE(texture) = &MGLInvalidObject_Type;
@@ -86,7 +86,7 @@ PyObject * MGLContext_texture_array(MGLContext * self, PyObject * args) {
 
 	const GLMethods & gl = self->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->default_texture_unit);
+	MGLContext_active_texture(self, GL_TEXTURE0 + self->default_texture_unit);
 
 	MGLTextureArray * texture = (MGLTextureArray *)MGLTextureArray_Type.tp_alloc(&MGLTextureArray_Type, 0);
 
@@ -99,7 +99,7 @@ PyObject * MGLContext_texture_array(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, texture->texture_obj);
+	MGLContext_bind_texture(self, GL_TEXTURE_2D_ARRAY, texture->texture_obj);
 
     gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
     gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
@@ -178,8 +178,8 @@ PyObject * MGLTextureArray_read(MGLTextureArray * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 
 	gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 	gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
@@ -204,7 +204,9 @@ PyObject * MGLTextureArray_read(MGLTextureArray * self, PyObject * args) {
 	// printf("level_width: %d\n", level_width);
 	// printf("level_height: %d\n", level_height);
 
+	Py_BEGIN_ALLOW_THREADS
 	gl.GetTexImage(GL_TEXTURE_2D_ARRAY, 0, base_format, pixel_type, data);
+	Py_END_ALLOW_THREADS
 
 	return result;
 }
@@ -245,8 +247,8 @@ PyObject * MGLTextureArray_read_into(MGLTextureArray * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_PACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.GetTexImage(GL_TEXTURE_2D_ARRAY, 0, format, pixel_type, (void *)write_offset);
@@ -272,11 +274,13 @@ PyObject * MGLTextureArray_read_into(MGLTextureArray * self, PyObject * args) {
 
 		const GLMethods & gl = self->context->gl;
 
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+		Py_BEGIN_ALLOW_THREADS
 		gl.GetTexImage(GL_TEXTURE_2D_ARRAY, 0, format, pixel_type, ptr);
+		Py_END_ALLOW_THREADS
 
 		PyBuffer_Release(&buffer_view);
 
@@ -365,8 +369,8 @@ PyObject * MGLTextureArray_write(MGLTextureArray * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_UNPACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.TexSubImage3D(GL_TEXTURE_2D_ARRAY, 0, x, y, z, width, height, layers, format, pixel_type, 0);
@@ -390,11 +394,13 @@ PyObject * MGLTextureArray_write(MGLTextureArray * self, PyObject * args) {
 
 		const GLMethods & gl = self->context->gl;
 
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+		Py_BEGIN_ALLOW_THREADS
 		gl.TexSubImage3D(GL_TEXTURE_2D_ARRAY, 0, x, y, z, width, height, layers, format, pixel_type, buffer_view.buf);
+		Py_END_ALLOW_THREADS
 
 		PyBuffer_Release(&buffer_view);
 
@@ -417,9 +423,8 @@ PyObject * MGLTextureArray_use(MGLTextureArray * self, PyObject * args) {
 	}
 
 
-	const GLMethods & gl = self->context->gl;
-	gl.ActiveTexture(GL_TEXTURE0 + index);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + index);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 
 	Py_RETURN_NONE;
 }
@@ -446,8 +451,8 @@ PyObject * MGLTextureArray_build_mipmaps(MGLTextureArray * self, PyObject * args
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_3D, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_3D, self->texture_obj);
 
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_BASE_LEVEL, base);
 	gl.TexParameteri(GL_TEXTURE_3D, GL_TEXTURE_MAX_LEVEL, max);
@@ -487,8 +492,8 @@ int MGLTextureArray_set_repeat_x(MGLTextureArray * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_S, GL_REPEAT);
@@ -512,8 +517,8 @@ int MGLTextureArray_set_repeat_y(MGLTextureArray * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 
 	if (value == Py_True) {
 		gl.TexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_T, GL_REPEAT);
@@ -548,8 +553,8 @@ int MGLTextureArray_set_filter(MGLTextureArray * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 	gl.TexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MIN_FILTER, self->min_filter);
 	gl.TexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAG_FILTER, self->mag_filter);
 
@@ -560,8 +565,8 @@ PyObject * MGLTextureArray_get_swizzle(MGLTextureArray * self, void * closure) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 
 	int swizzle_r = 0;
 	int swizzle_g = 0;
@@ -611,8 +616,8 @@ int MGLTextureArray_set_swizzle(MGLTextureArray * self, PyObject * value, void *
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 
 	gl.TexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_SWIZZLE_R, tex_swizzle[0]);
 	if (tex_swizzle[1] != -1) {
@@ -637,8 +642,8 @@ int MGLTextureArray_set_anisotropy(MGLTextureArray * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_2D_ARRAY, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_2D_ARRAY, self->texture_obj);
 	gl.TexParameterf(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAX_ANISOTROPY, self->anisotropy);
 
 	return 0;
@@ -703,6 +708,7 @@ void MGLTextureArray_Invalidate(MGLTextureArray * texture) {
 
 	const GLMethods & gl = texture->context->gl;
 	gl.DeleteTextures(1, (GLuint *)&texture->texture_obj);
+	MGLContext_InvalidateTextures(texture->context);
 
 	Py_DECREF(texture->context);
 	Py_TYPE(texture) = &MGLInvalidObject_Type;
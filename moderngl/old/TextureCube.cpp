@@ -95,8 +95,8 @@ PyObject * MGLContext_texture_cube(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_CUBE_MAP, texture->texture_obj);
+	MGLContext_active_texture(self, GL_TEXTURE0 + self->default_texture_unit);
+	MGLContext_bind_texture(self, GL_TEXTURE_CUBE_MAP, texture->texture_obj);
 
 	if (data == Py_None) {
 		expected_size = 0;
@@ -197,12 +197,14 @@ PyObject * MGLTextureCube_read(MGLTextureCube * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_CUBE_MAP, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_CUBE_MAP, self->texture_obj);
 
 	gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 	gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+	Py_BEGIN_ALLOW_THREADS
 	gl.GetTexImage(GL_TEXTURE_CUBE_MAP_POSITIVE_X + face, 0, format, pixel_type, data);
+	Py_END_ALLOW_THREADS
 
 	return result;
 }
@@ -250,8 +252,8 @@ PyObject * MGLTextureCube_read_into(MGLTextureCube * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_PACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_CUBE_MAP, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_CUBE_MAP, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.GetTexImage(GL_TEXTURE_CUBE_MAP_POSITIVE_X + face, 0, format, pixel_type, (char *)write_offset);
@@ -276,11 +278,13 @@ PyObject * MGLTextureCube_read_into(MGLTextureCube * self, PyObject * args) {
 		char * ptr = (char *)buffer_view.buf + write_offset;
 
 		const GLMethods & gl = self->context->gl;
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_CUBE_MAP, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_CUBE_MAP, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+		Py_BEGIN_ALLOW_THREADS
 		gl.GetTexImage(GL_TEXTURE_CUBE_MAP_POSITIVE_X + face, 0, format, pixel_type, ptr);
+		Py_END_ALLOW_THREADS
 
 		PyBuffer_Release(&buffer_view);
 
@@ -378,8 +382,8 @@ PyObject * MGLTextureCube_write(MGLTextureCube * self, PyObject * args) {
 		const GLMethods & gl = self->context->gl;
 
 		gl.BindBuffer(GL_PIXEL_UNPACK_BUFFER, buffer->buffer_obj);
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_CUBE_MAP, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_CUBE_MAP, self->texture_obj);
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
 		gl.TexSubImage2D(GL_TEXTURE_CUBE_MAP_POSITIVE_X + face, 0, x, y, width, height, format, pixel_type, 0);
@@ -401,12 +405,14 @@ PyObject * MGLTextureCube_write(MGLTextureCube * self, PyObject * args) {
 
 		const GLMethods & gl = self->context->gl;
 
-		gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-		gl.BindTexture(GL_TEXTURE_CUBE_MAP, self->texture_obj);
+		MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+		MGLContext_bind_texture(self->context, GL_TEXTURE_CUBE_MAP, self->texture_obj);
 
 		gl.PixelStorei(GL_PACK_ALIGNMENT, alignment);
 		gl.PixelStorei(GL_UNPACK_ALIGNMENT, alignment);
+		Py_BEGIN_ALLOW_THREADS
 		gl.TexSubImage2D(GL_TEXTURE_CUBE_MAP_POSITIVE_X + face, 0, x, y, width, height, format, pixel_type, buffer_view.buf);
+		Py_END_ALLOW_THREADS
 
 		PyBuffer_Release(&buffer_view);
 	}
@@ -427,9 +433,8 @@ PyObject * MGLTextureCube_use(MGLTextureCube * self, PyObject * args) {
 		return 0;
 	}
 
-	const GLMethods & gl = self->context->gl;
-	gl.ActiveTexture(GL_TEXTURE0 + index);
-	gl.BindTexture(GL_TEXTURE_CUBE_MAP, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + index);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_CUBE_MAP, self->texture_obj);
 
 	Py_RETURN_NONE;
 }
@@ -467,8 +472,8 @@ int MGLTextureCube_set_filter(MGLTextureCube * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_CUBE_MAP, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_CUBE_MAP, self->texture_obj);
 	gl.TexParameteri(GL_TEXTURE_CUBE_MAP, GL_TEXTURE_MIN_FILTER, self->min_filter);
 	gl.TexParameteri(GL_TEXTURE_CUBE_MAP, GL_TEXTURE_MAG_FILTER, self->mag_filter);
 
@@ -479,8 +484,8 @@ PyObject * MGLTextureCube_get_swizzle(MGLTextureCube * self, void * closure) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_CUBE_MAP, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_CUBE_MAP, self->texture_obj);
 
 	int swizzle_r = 0;
 	int swizzle_g = 0;
@@ -530,8 +535,8 @@ int MGLTextureCube_set_swizzle(MGLTextureCube * self, PyObject * value, void * c
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_CUBE_MAP, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_CUBE_MAP, self->texture_obj);
 
 	gl.TexParameteri(GL_TEXTURE_CUBE_MAP, GL_TEXTURE_SWIZZLE_R, tex_swizzle[0]);
 	if (tex_swizzle[1] != -1) {
@@ -556,8 +561,8 @@ int MGLTextureCube_set_anisotropy(MGLTextureCube * self, PyObject * value) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.ActiveTexture(GL_TEXTURE0 + self->context->default_texture_unit);
-	gl.BindTexture(GL_TEXTURE_CUBE_MAP, self->texture_obj);
+	MGLContext_active_texture(self->context, GL_TEXTURE0 + self->context->default_texture_unit);
+	MGLContext_bind_texture(self->context, GL_TEXTURE_CUBE_MAP, self->texture_obj);
 	gl.TexParameterf(GL_TEXTURE_CUBE_MAP, GL_TEXTURE_MAX_ANISOTROPY, self->anisotropy);
 
 	return 0;
@@ -620,6 +625,7 @@ void MGLTextureCube_Invalidate(MGLTextureCube * texture) {
 
 	const GLMethods & gl = texture->context->gl;
 	gl.DeleteTextures(1, (GLuint *)&texture->texture_obj);
+	MGLContext_InvalidateTextures(texture->context);
 
 	Py_TYPE(texture) = &MGLInvalidObject_Type;
 	Py_DECREF(texture);
@@ -4,6 +4,7 @@
 #include "gl_context.hpp"
 #include "gl_methods.hpp"
 #include "Error.hpp"
+#include "BufferFormat.hpp"
 
 typedef void (* MGLProc)();
 
@@ -16,6 +17,25 @@ enum MGLEnableFlag {
 	MGL_INVALID = 0x40000000,
 };
 
+// The render state in the shadow copy that is not known to match the GL state.
+enum MGLUnknownState {
+	MGL_UNKNOWN_ENABLE_FLAGS = 1,
+	MGL_UNKNOWN_BLEND_FUNC = 2,
+	MGL_UNKNOWN_DEPTH_FUNC = 4,
+	MGL_UNKNOWN_FRONT_FACE = 8,
+	MGL_UNKNOWN_CULL_FACE = 16,
+	MGL_UNKNOWN_VIEWPORT = 32,
+	MGL_UNKNOWN_COLOR_MASK = 64,
+	MGL_UNKNOWN_DEPTH_MASK = 128,
+	MGL_UNKNOWN_WIREFRAME = 256,
+	MGL_UNKNOWN_PRIMITIVE_RESTART = 512,
+	MGL_UNKNOWN_MULTISAMPLE = 1024,
+	MGL_UNKNOWN_RENDER_STATE = 2047,
+};
+
+// The number of texture units with a shadow copy of their bindings.
+const int MGL_CACHED_TEXTURE_UNITS = 64;
+
 enum SHADER_SLOT_ENUM {
 	VERTEX_SHADER_SLOT,
 	FRAGMENT_SHADER_SLOT,
@@ -35,10 +55,12 @@ static const int SHADER_TYPE[] = {
 
 struct MGLAttribute;
 struct MGLBuffer;
+struct MGLBufferFormat;
 struct MGLComputeShader;
 struct MGLContext;
 struct MGLFramebuffer;
 struct MGLInvalidObject;
+struct MGLPipelineState;
 struct MGLProgram;
 struct MGLRenderbuffer;
 struct MGLTexture;
@@ -50,6 +72,15 @@ struct MGLUniformBlock;
 struct MGLVertexArray;
 struct MGLSampler;
 
+struct MGLDrawStats {
+	long long draw_calls;
+	long long vertices;
+	long long instances;
+	long long indirect_commands;
+	long long transform_calls;
+	long long state_binds;
+};
+
 struct MGLDataType {
 	int * base_format;
 	int * internal_format;
@@ -89,6 +120,35 @@ struct MGLBuffer {
 
 	Py_ssize_t size;
 	bool dynamic;
+	bool immutable;
+	int flags;
+
+	char * mapping;
+
+	// The range of the persistent mapping used since the last MGLBuffer_MapRange, flushed when it was written.
+	Py_ssize_t mapped_offset;
+	Py_ssize_t mapped_size;
+	int mapped_access;
+
+	// The exporter of the range mapped with Buffer.map, null when the buffer is not mapped.
+	// The buffer stays mapped after the with block while views of the mapping are alive.
+	struct MGLBufferMap * map_view;
+};
+
+struct MGLBufferMap {
+	PyObject_HEAD
+
+	MGLBuffer * buffer;
+
+	char * ptr;
+	Py_ssize_t size;
+	bool readonly;
+
+	// The number of views using the mapped memory.
+	int exports;
+
+	// The with block has ended, the buffer is unmapped when the last view is released.
+	bool unmap_pending;
 };
 
 struct MGLComputeShader {
@@ -110,6 +170,13 @@ struct MGLContext {
 
 	int version_code;
 
+	// The optional features, detected from the version or the extensions.
+	// The function pointers cannot be used for the detection, they are loaded even when unsupported.
+	bool clear_buffer_object;
+	bool buffer_storage;
+	bool multi_bind;
+	bool indirect_parameters;
+
 	int max_samples;
 	int max_integer_samples;
 	int max_color_attachments;
@@ -120,6 +187,7 @@ struct MGLContext {
 
 	int enable_flags;
 	int front_face;
+	int cull_face;
 
 	int depth_func;
 	int blend_func_src;
@@ -128,8 +196,44 @@ struct MGLContext {
 	bool wireframe;
 	bool multisample;
 
+	bool primitive_restart;
+	unsigned primitive_restart_index;
+
 	int provoking_vertex;
 
+	// Shadow copy of the bindings, -1 means unknown.
+	int cached_program;
+	int cached_vertex_array;
+	int cached_framebuffer;
+	int cached_active_texture;
+	int cached_texture_targets[MGL_CACHED_TEXTURE_UNITS];
+	int cached_textures[MGL_CACHED_TEXTURE_UNITS];
+	int cached_samplers[MGL_CACHED_TEXTURE_UNITS];
+
+	// Shadow copy of the render state set by the framebuffers and the scopes.
+	int viewport[4];
+	int color_mask;
+	int color_mask_buffers;
+	int depth_mask;
+
+	// The redundant state changes are only skipped when the state cache is enabled.
+	// Host frameworks sharing the context may change the state behind the shadow copy.
+	bool state_cache;
+
+	// While recording the render state changes are never skipped.
+	bool recording;
+
+	// The MGLUnknownState flags of the render state changed behind the shadow copy, they are set again before being skipped.
+	int unknown_state;
+
+	long long issued_state_changes;
+	long long skipped_state_changes;
+
+	// The draw statistics are only counted when enabled, resetting them starts a new generation.
+	bool collect_stats;
+	int stats_generation;
+	MGLDrawStats stats;
+
 	GLMethods gl;
 };
 
@@ -196,6 +300,32 @@ struct MGLQuery {
 	int query_obj[4];
 };
 
+struct MGLBufferFormat {
+	PyObject_HEAD
+
+	// The parsed format, the padding nodes have a zero type.
+	FormatNode * nodes;
+	int num_nodes;
+
+	FormatInfo info;
+};
+
+struct MGLPipelineState {
+	PyObject_HEAD
+
+	MGLContext * context;
+
+	// The render state to set, -1 keeps the current value.
+	int enable_flags;
+	int blend_func_src;
+	int blend_func_dst;
+	int depth_func;
+	int cull_face;
+	int front_face;
+	int wireframe;
+	int multisample;
+};
+
 struct MGLRenderbuffer {
 	PyObject_HEAD
 
@@ -222,15 +352,42 @@ struct MGLScope {
 	MGLFramebuffer * framebuffer;
 	MGLFramebuffer * old_framebuffer;
 
+	// The textures (unit, target, name) and the samplers (unit, name) are sorted by unit.
+	// The names are also stored contiguously for the multi-bind calls.
 	int * textures;
+	unsigned * texture_names;
 	int * buffers;
-	PyObject * samplers;
+	int * samplers;
+	unsigned * sampler_names;
 
 	int num_textures;
 	int num_buffers;
+	int num_samplers;
 
 	int enable_flags;
 	int old_enable_flags;
+
+	// The render state to set when entering, -1 keeps the current value.
+	int blend_func_src;
+	int blend_func_dst;
+	int depth_func;
+	int cull_face;
+	int depth_mask;
+	int primitive_restart;
+	unsigned restart_index;
+
+	// The color mask for each draw buffer of the framebuffer, null keeps the current value.
+	bool * color_mask;
+
+	bool has_viewport;
+	int viewport[4];
+
+	int old_blend_func_src;
+	int old_blend_func_dst;
+	int old_depth_func;
+	int old_cull_face;
+	bool old_primitive_restart;
+	unsigned old_restart_index;
 };
 
 struct MGLTexture {
@@ -370,6 +527,7 @@ struct MGLVertexArray {
 
 	MGLProgram * program;
 	MGLBuffer * index_buffer;
+	Py_ssize_t index_buffer_offset;
 	int index_element_size;
 	int index_element_type;
 
@@ -379,6 +537,14 @@ struct MGLVertexArray {
 	int vertex_array_obj;
 	int num_vertices;
 	int num_instances;
+
+	// The primitive restart to set when rendering, -1 keeps the current value.
+	int primitive_restart;
+	unsigned restart_index;
+
+	// The draw statistics of an older generation are zero.
+	int stats_generation;
+	MGLDrawStats stats;
 };
 
 struct MGLSampler {
@@ -405,6 +571,10 @@ struct MGLSampler {
 
 MGLDataType * from_dtype(const char * dtype);
 
+PyObject * MGLDrawStats_Tuple(const MGLDrawStats & stats);
+
+bool MGLContext_HasExtension(MGLContext * self, const char * extension);
+
 void MGLAttribute_Invalidate(MGLAttribute * attribute);
 void MGLBuffer_Invalidate(MGLBuffer * buffer);
 void MGLComputeShader_Invalidate(MGLComputeShader * program);
@@ -427,13 +597,18 @@ void MGLVertexArray_Complete(MGLVertexArray * vertex_array);
 
 void MGLContext_Initialize(MGLContext * self);
 
+MGLBufferFormat * MGLBufferFormat_FromObject(PyObject * format);
+
 extern PyTypeObject MGLAttribute_Type;
 extern PyTypeObject MGLBuffer_Type;
+extern PyTypeObject MGLBufferMap_Type;
+extern PyTypeObject MGLBufferFormat_Type;
 extern PyTypeObject MGLComputeShader_Type;
 extern PyTypeObject MGLContext_Type;
 extern PyTypeObject MGLFramebuffer_Type;
 extern PyTypeObject MGLInvalidObject_Type;
 extern PyTypeObject MGLProgram_Type;
+extern PyTypeObject MGLPipelineState_Type;
 extern PyTypeObject MGLQuery_Type;
 extern PyTypeObject MGLRenderbuffer_Type;
 extern PyTypeObject MGLScope_Type;
@@ -445,3 +620,325 @@ extern PyTypeObject MGLUniformBlock_Type;
 extern PyTypeObject MGLUniform_Type;
 extern PyTypeObject MGLVertexArray_Type;
 extern PyTypeObject MGLSampler_Type;
+
+// The bindings below go through the shadow copy in the context.
+// Binding an object that is already bound is skipped.
+
+inline void MGLContext_InvalidateState(MGLContext * self) {
+	self->cached_program = -1;
+	self->cached_vertex_array = -1;
+	self->cached_framebuffer = -1;
+	self->cached_active_texture = -1;
+	for (int i = 0; i < MGL_CACHED_TEXTURE_UNITS; ++i) {
+		self->cached_texture_targets[i] = -1;
+		self->cached_textures[i] = -1;
+		self->cached_samplers[i] = -1;
+	}
+}
+
+inline void MGLContext_InvalidateTextures(MGLContext * self) {
+	for (int i = 0; i < MGL_CACHED_TEXTURE_UNITS; ++i) {
+		self->cached_textures[i] = -1;
+	}
+}
+
+inline void MGLContext_InvalidateSamplers(MGLContext * self) {
+	for (int i = 0; i < MGL_CACHED_TEXTURE_UNITS; ++i) {
+		self->cached_samplers[i] = -1;
+	}
+}
+
+inline bool MGLContext_skip_state(MGLContext * self, int state) {
+	return self->state_cache && !self->recording && !(self->unknown_state & state);
+}
+
+inline void MGLContext_use_program(MGLContext * self, int program_obj) {
+	if (self->state_cache && self->cached_program == program_obj) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	self->gl.UseProgram(program_obj);
+	self->cached_program = program_obj;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_bind_vertex_array(MGLContext * self, int vertex_array_obj) {
+	if (self->state_cache && self->cached_vertex_array == vertex_array_obj) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	self->gl.BindVertexArray(vertex_array_obj);
+	self->cached_vertex_array = vertex_array_obj;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_bind_framebuffer(MGLContext * self, int framebuffer_obj) {
+	if (self->state_cache && self->cached_framebuffer == framebuffer_obj) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	self->gl.BindFramebuffer(GL_FRAMEBUFFER, framebuffer_obj);
+	self->cached_framebuffer = framebuffer_obj;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_active_texture(MGLContext * self, int texture) {
+	if (self->state_cache && self->cached_active_texture == texture) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	self->gl.ActiveTexture(texture);
+	self->cached_active_texture = texture;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_bind_texture(MGLContext * self, int target, int texture_obj) {
+	int unit = self->cached_active_texture - GL_TEXTURE0;
+
+	if (self->cached_active_texture >= 0 && unit >= 0 && unit < MGL_CACHED_TEXTURE_UNITS) {
+		if (self->state_cache && self->cached_texture_targets[unit] == target && self->cached_textures[unit] == texture_obj) {
+			self->skipped_state_changes += 1;
+			return;
+		}
+
+		self->cached_texture_targets[unit] = target;
+		self->cached_textures[unit] = texture_obj;
+	}
+
+	self->gl.BindTexture(target, texture_obj);
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_bind_sampler(MGLContext * self, int unit, int sampler_obj) {
+	if (unit >= 0 && unit < MGL_CACHED_TEXTURE_UNITS) {
+		if (self->state_cache && self->cached_samplers[unit] == sampler_obj) {
+			self->skipped_state_changes += 1;
+			return;
+		}
+
+		self->cached_samplers[unit] = sampler_obj;
+	}
+
+	self->gl.BindSampler(unit, sampler_obj);
+	self->issued_state_changes += 1;
+}
+
+// The render state below is compared to the shadow copy in the context.
+// Setting a value that is already set is skipped.
+
+void MGLContext_QueryState(MGLContext * self);
+
+inline void MGLContext_apply_enable_flags(MGLContext * self, int flags) {
+	flags &= MGL_BLEND | MGL_DEPTH_TEST | MGL_CULL_FACE | MGL_RASTERIZER_DISCARD;
+
+	int changed = MGLContext_skip_state(self, MGL_UNKNOWN_ENABLE_FLAGS) ? self->enable_flags ^ flags : ~0;
+
+	if (!(changed & (MGL_BLEND | MGL_DEPTH_TEST | MGL_CULL_FACE | MGL_RASTERIZER_DISCARD))) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	if (changed & MGL_BLEND) {
+		if (flags & MGL_BLEND) {
+			self->gl.Enable(GL_BLEND);
+		} else {
+			self->gl.Disable(GL_BLEND);
+		}
+	}
+
+	if (changed & MGL_DEPTH_TEST) {
+		if (flags & MGL_DEPTH_TEST) {
+			self->gl.Enable(GL_DEPTH_TEST);
+		} else {
+			self->gl.Disable(GL_DEPTH_TEST);
+		}
+	}
+
+	if (changed & MGL_CULL_FACE) {
+		if (flags & MGL_CULL_FACE) {
+			self->gl.Enable(GL_CULL_FACE);
+		} else {
+			self->gl.Disable(GL_CULL_FACE);
+		}
+	}
+
+	if (changed & MGL_RASTERIZER_DISCARD) {
+		if (flags & MGL_RASTERIZER_DISCARD) {
+			self->gl.Enable(GL_RASTERIZER_DISCARD);
+		} else {
+			self->gl.Disable(GL_RASTERIZER_DISCARD);
+		}
+	}
+
+	self->enable_flags = flags;
+	self->unknown_state &= ~MGL_UNKNOWN_ENABLE_FLAGS;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_apply_blend_func(MGLContext * self, int src, int dst) {
+	if (MGLContext_skip_state(self, MGL_UNKNOWN_BLEND_FUNC) && self->blend_func_src == src && self->blend_func_dst == dst) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	self->gl.BlendFunc(src, dst);
+	self->blend_func_src = src;
+	self->blend_func_dst = dst;
+	self->unknown_state &= ~MGL_UNKNOWN_BLEND_FUNC;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_apply_depth_func(MGLContext * self, int func) {
+	if (MGLContext_skip_state(self, MGL_UNKNOWN_DEPTH_FUNC) && self->depth_func == func) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	self->gl.DepthFunc(func);
+	self->depth_func = func;
+	self->unknown_state &= ~MGL_UNKNOWN_DEPTH_FUNC;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_apply_front_face(MGLContext * self, int mode) {
+	if (MGLContext_skip_state(self, MGL_UNKNOWN_FRONT_FACE) && self->front_face == mode) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	self->gl.FrontFace(mode);
+	self->front_face = mode;
+	self->unknown_state &= ~MGL_UNKNOWN_FRONT_FACE;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_apply_cull_face(MGLContext * self, int mode) {
+	if (MGLContext_skip_state(self, MGL_UNKNOWN_CULL_FACE) && self->cull_face == mode) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	self->gl.CullFace(mode);
+	self->cull_face = mode;
+	self->unknown_state &= ~MGL_UNKNOWN_CULL_FACE;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_apply_viewport(MGLContext * self, int x, int y, int width, int height) {
+	int * viewport = self->viewport;
+
+	if (MGLContext_skip_state(self, MGL_UNKNOWN_VIEWPORT) && viewport[0] == x && viewport[1] == y && viewport[2] == width && viewport[3] == height) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	self->gl.Viewport(x, y, width, height);
+	viewport[0] = x;
+	viewport[1] = y;
+	viewport[2] = width;
+	viewport[3] = height;
+	self->unknown_state &= ~MGL_UNKNOWN_VIEWPORT;
+	self->issued_state_changes += 1;
+}
+
+// The color mask is tracked as a 4 bit value shared by the first color_mask_buffers draw buffers, -1 means mixed.
+
+inline void MGLContext_apply_color_mask(MGLContext * self, const bool * color_mask, int num_buffers) {
+	if (!num_buffers) {
+		return;
+	}
+
+	int mask = color_mask[0] | color_mask[1] << 1 | color_mask[2] << 2 | color_mask[3] << 3;
+
+	for (int i = 1; i < num_buffers; ++i) {
+		const bool * other = color_mask + i * 4;
+		if ((other[0] | other[1] << 1 | other[2] << 2 | other[3] << 3) != mask) {
+			mask = -1;
+			break;
+		}
+	}
+
+	if (MGLContext_skip_state(self, MGL_UNKNOWN_COLOR_MASK) && mask >= 0 && self->color_mask == mask && self->color_mask_buffers >= num_buffers) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	for (int i = 0; i < num_buffers; ++i) {
+		self->gl.ColorMaski(i, color_mask[i * 4 + 0], color_mask[i * 4 + 1], color_mask[i * 4 + 2], color_mask[i * 4 + 3]);
+	}
+
+	self->color_mask = mask;
+	self->color_mask_buffers = mask >= 0 ? num_buffers : 0;
+	self->unknown_state &= ~MGL_UNKNOWN_COLOR_MASK;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_apply_depth_mask(MGLContext * self, bool depth_mask) {
+	if (MGLContext_skip_state(self, MGL_UNKNOWN_DEPTH_MASK) && self->depth_mask == (int)depth_mask) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	self->gl.DepthMask(depth_mask);
+	self->depth_mask = depth_mask;
+	self->unknown_state &= ~MGL_UNKNOWN_DEPTH_MASK;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_apply_wireframe(MGLContext * self, bool wireframe) {
+	if (MGLContext_skip_state(self, MGL_UNKNOWN_WIREFRAME) && self->wireframe == wireframe) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	self->gl.PolygonMode(GL_FRONT_AND_BACK, wireframe ? GL_LINE : GL_FILL);
+	self->wireframe = wireframe;
+	self->unknown_state &= ~MGL_UNKNOWN_WIREFRAME;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_apply_primitive_restart(MGLContext * self, bool enabled, unsigned index) {
+	if (MGLContext_skip_state(self, MGL_UNKNOWN_PRIMITIVE_RESTART) && self->primitive_restart == enabled && (!enabled || self->primitive_restart_index == index)) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	if (!enabled) {
+		self->gl.Disable(GL_PRIMITIVE_RESTART);
+	} else {
+		if (!MGLContext_skip_state(self, MGL_UNKNOWN_PRIMITIVE_RESTART) || !self->primitive_restart) {
+			self->gl.Enable(GL_PRIMITIVE_RESTART);
+		}
+
+		if (!MGLContext_skip_state(self, MGL_UNKNOWN_PRIMITIVE_RESTART) || self->primitive_restart_index != index) {
+			self->gl.PrimitiveRestartIndex(index);
+		}
+
+		self->primitive_restart_index = index;
+	}
+
+	self->primitive_restart = enabled;
+	self->unknown_state &= ~MGL_UNKNOWN_PRIMITIVE_RESTART;
+	self->issued_state_changes += 1;
+}
+
+inline void MGLContext_apply_multisample(MGLContext * self, bool multisample) {
+	if (MGLContext_skip_state(self, MGL_UNKNOWN_MULTISAMPLE) && self->multisample == multisample) {
+		self->skipped_state_changes += 1;
+		return;
+	}
+
+	if (multisample) {
+		self->gl.Enable(GL_MULTISAMPLE);
+	} else {
+		self->gl.Disable(GL_MULTISAMPLE);
+	}
+
+	self->multisample = multisample;
+	self->unknown_state &= ~MGL_UNKNOWN_MULTISAMPLE;
+	self->issued_state_changes += 1;
+}
@@ -19,7 +19,17 @@ PyObject * MGLUniform_get_value(MGLUniform * self, void * closure) {
 	return ((MGLUniform_Getter)self->value_getter)(self);
 }
 
+extern bool MGLRecorder_recording;
+MGLProc MGLRecorder_trace_uniform(MGLUniform * uniform);
+
 int MGLUniform_set_value(MGLUniform * self, PyObject * value, void * closure) {
+	if (MGLRecorder_recording) {
+		MGLProc proc = MGLRecorder_trace_uniform(self);
+		int result = ((MGLUniform_Setter)self->value_setter)(self, value);
+		self->gl_value_writer_proc = proc;
+		return result;
+	}
+
 	return ((MGLUniform_Setter)self->value_setter)(self, value);
 }
 
@@ -45,12 +55,20 @@ int MGLUniform_set_data(MGLUniform * self, PyObject * value, void * closure) {
 		return -1;
 	}
 
+	MGLProc proc = self->gl_value_writer_proc;
+
+	if (MGLRecorder_recording) {
+		MGLRecorder_trace_uniform(self);
+	}
+
 	if (self->matrix) {
 		((gl_uniform_matrix_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, self->array_length, false, buffer_view.buf);
 	} else {
 		((gl_uniform_vector_writer_proc)self->gl_value_writer_proc)(self->program_obj, self->location, self->array_length, buffer_view.buf);
 	}
 
+	self->gl_value_writer_proc = proc;
+
 	PyBuffer_Release(&buffer_view);
 	return 0;
 }
@@ -5,20 +5,29 @@
 typedef void (GLAPI * gl_attribute_normal_ptr_proc)(GLuint index, GLint size, GLenum type, GLboolean normalized, GLsizei stride, const void * pointer);
 typedef void (GLAPI * gl_attribute_ptr_proc)(GLuint index, GLint size, GLenum type, GLsizei stride, const void * pointer);
 
+inline bool is_packed_type(int type) {
+	// The packed types can only be passed to float attributes.
+	return type == GL_INT_2_10_10_10_REV || type == GL_UNSIGNED_INT_2_10_10_10_REV || type == GL_UNSIGNED_INT_10F_11F_11F_REV;
+}
+
 PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 	MGLProgram * program;
 	PyObject * content;
 	MGLBuffer * index_buffer;
+	Py_ssize_t index_buffer_offset;
+	Py_ssize_t index_buffer_size;
 	int index_element_size;
 	int skip_errors;
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"O!OOIp",
+		"O!OOnnIp",
 		&MGLProgram_Type,
 		&program,
 		&content,
 		&index_buffer,
+		&index_buffer_offset,
+		&index_buffer_size,
 		&index_element_size,
 		&skip_errors
 	);
@@ -44,68 +53,97 @@ PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 		return 0;
 	}
 
+	// The formats are resolved once, the strings are compiled here.
+	PyObject * formats = PyTuple_New(content_len);
+
 	for (int i = 0; i < content_len; ++i) {
 		PyObject * tuple = PyTuple_GET_ITEM(content, i);
 		PyObject * buffer = PyTuple_GET_ITEM(tuple, 0);
 		PyObject * format = PyTuple_GET_ITEM(tuple, 1);
+		Py_ssize_t offset = PyLong_AsSsize_t(PyTuple_GET_ITEM(tuple, 2));
+		Py_ssize_t size = PyLong_AsSsize_t(PyTuple_GET_ITEM(tuple, 3));
 
 		if (Py_TYPE(buffer) != &MGLBuffer_Type) {
 			MGLError_Set("content[%d][0] must be a Buffer not %s", i, Py_TYPE(buffer)->tp_name);
+			Py_DECREF(formats);
 			return 0;
 		}
 
-		if (Py_TYPE(format) != &PyUnicode_Type) {
-			MGLError_Set("content[%d][1] must be a string not %s", i, Py_TYPE(format)->tp_name);
+		if (Py_TYPE(format) != &PyUnicode_Type && Py_TYPE(format) != &MGLBufferFormat_Type) {
+			MGLError_Set("content[%d][1] must be a string or a BufferFormat not %s", i, Py_TYPE(format)->tp_name);
+			Py_DECREF(formats);
 			return 0;
 		}
 
 		if (((MGLBuffer *)buffer)->context != self) {
 			MGLError_Set("content[%d][0] belongs to a different context", i);
+			Py_DECREF(formats);
+			return 0;
+		}
+
+		if (offset < 0 || offset + (size < 0 ? 0 : size) > ((MGLBuffer *)buffer)->size) {
+			MGLError_Set("content[%d][0] is out of range offset = %d or size = %d", i, offset, size);
+			Py_DECREF(formats);
 			return 0;
 		}
 
-		FormatIterator it = FormatIterator(PyUnicode_AsUTF8(format));
-		FormatInfo format_info = it.info();
+		MGLBufferFormat * buffer_format = MGLBufferFormat_FromObject(format);
 
-		if (!format_info.valid) {
+		if (!buffer_format) {
 			MGLError_Set("content[%d][1] is an invalid format", i);
+			Py_DECREF(formats);
 			return 0;
 		}
 
+		PyTuple_SET_ITEM(formats, i, (PyObject *)buffer_format);
+
+		FormatInfo format_info = buffer_format->info;
+
 		if (i == 0 && format_info.divisor) {
 			MGLError_Set("the first vertex attribute must not be a per instance attribute");
+			Py_DECREF(formats);
 			return 0;
 		}
 
-		int attributes_len = (int)PyTuple_GET_SIZE(tuple) - 2;
+		int attributes_len = (int)PyTuple_GET_SIZE(tuple) - 4;
 
 		if (!attributes_len) {
 			MGLError_Set("content[%d][2] must not be empty", i);
+			Py_DECREF(formats);
 			return 0;
 		}
 
 		if (attributes_len != format_info.nodes) {
 			MGLError_Set("content[%d][1] and content[%d][2] size mismatch %d != %d", i, i, format_info.nodes, attributes_len);
+			Py_DECREF(formats);
 			return 0;
 		}
 
-		for (int j = 0; j < attributes_len; ++j) {
-			FormatNode * node = it.next();
+		FormatNode * node = buffer_format->nodes;
 
+		for (int j = 0; j < attributes_len; ++j, ++node) {
 			while (!node->type) {
-				node = it.next();
+				++node;
 			}
 
-			MGLAttribute * attribute = (MGLAttribute *)PyTuple_GET_ITEM(tuple, j + 2);
+			MGLAttribute * attribute = (MGLAttribute *)PyTuple_GET_ITEM(tuple, j + 4);
 
 			if (!skip_errors) {
 				if (Py_TYPE(attribute) != &MGLAttribute_Type) {
 					MGLError_Set("content[%d][%d] must be an attribute not %s", i, j + 2, Py_TYPE(attribute)->tp_name);
+					Py_DECREF(formats);
 					return 0;
 				}
 
 				if (node->count % attribute->rows_length) {
 					MGLError_Set("invalid format");
+					Py_DECREF(formats);
+					return 0;
+				}
+
+				if (is_packed_type(node->type) && (!attribute->normalizable || attribute->rows_length != 1)) {
+					MGLError_Set("content[%d][%d] must be a float vector attribute for a packed format", i, j + 2);
+					Py_DECREF(formats);
 					return 0;
 				}
 			}
@@ -114,14 +152,28 @@ PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 
 	if (index_buffer != (MGLBuffer *)Py_None && Py_TYPE(index_buffer) != &MGLBuffer_Type) {
 		MGLError_Set("the index_buffer must be a Buffer not %s", Py_TYPE(index_buffer)->tp_name);
+		Py_DECREF(formats);
 		return 0;
 	}
 
 	if (index_element_size != 1 && index_element_size != 2 && index_element_size != 4) {
 		MGLError_Set("index_element_size must be 1, 2, or 4, not %d", index_element_size);
+		Py_DECREF(formats);
 		return 0;
 	}
 
+	if (index_buffer != (MGLBuffer *)Py_None) {
+		if (index_buffer_size < 0) {
+			index_buffer_size = index_buffer->size - index_buffer_offset;
+		}
+
+		if (index_buffer_offset < 0 || index_buffer_offset + index_buffer_size > index_buffer->size) {
+			MGLError_Set("the index_buffer is out of range offset = %d or size = %d", index_buffer_offset, index_buffer_size);
+			Py_DECREF(formats);
+			return 0;
+		}
+	}
+
 	const GLMethods & gl = self->gl;
 
 	MGLVertexArray * array = (MGLVertexArray *)MGLVertexArray_Type.tp_alloc(&MGLVertexArray_Type, 0);
@@ -129,6 +181,11 @@ PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 	array->num_vertices = 0;
 	array->num_instances = 1;
 
+	array->stats_generation = self->stats_generation;
+
+	array->primitive_restart = -1;
+	array->restart_index = (unsigned)(0xFFFFFFFFull >> (32 - index_element_size * 8));
+
 	Py_INCREF(program);
 	array->program = program;
 
@@ -137,21 +194,23 @@ PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 
 	if (!array->vertex_array_obj) {
 		MGLError_Set("cannot create vertex array");
+		Py_DECREF(formats);
 		Py_DECREF(array);
 		return 0;
 	}
 
-	gl.BindVertexArray(array->vertex_array_obj);
+	MGLContext_bind_vertex_array(self, array->vertex_array_obj);
 
 	Py_INCREF(index_buffer);
 	array->index_buffer = index_buffer;
+	array->index_buffer_offset = index_buffer_offset;
 	array->index_element_size = index_element_size;
 
 	const int element_types[5] = {0, GL_UNSIGNED_BYTE, GL_UNSIGNED_SHORT, 0, GL_UNSIGNED_INT};
 	array->index_element_type = element_types[index_element_size];
 
 	if (index_buffer != (MGLBuffer *)Py_None) {
-		array->num_vertices = (int)(index_buffer->size / index_element_size);
+		array->num_vertices = (int)(index_buffer_size / index_element_size);
 		gl.BindBuffer(GL_ELEMENT_ARRAY_BUFFER, index_buffer->buffer_obj);
 	} else {
 		array->num_vertices = -1;
@@ -161,12 +220,17 @@ PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 		PyObject * tuple = PyTuple_GET_ITEM(content, i);
 
 		MGLBuffer * buffer = (MGLBuffer *)PyTuple_GET_ITEM(tuple, 0);
-		const char * format = PyUnicode_AsUTF8(PyTuple_GET_ITEM(tuple, 1));
+		MGLBufferFormat * buffer_format = (MGLBufferFormat *)PyTuple_GET_ITEM(formats, i);
+		Py_ssize_t offset = PyLong_AsSsize_t(PyTuple_GET_ITEM(tuple, 2));
+		Py_ssize_t size = PyLong_AsSsize_t(PyTuple_GET_ITEM(tuple, 3));
+
+		if (size < 0) {
+			size = buffer->size - offset;
+		}
 
-		FormatIterator it = FormatIterator(format);
-		FormatInfo format_info = it.info();
+		FormatInfo format_info = buffer_format->info;
 
-		int buf_vertices = (int)(buffer->size / format_info.size);
+		int buf_vertices = (int)(size / format_info.size);
 
 		if (!format_info.divisor && array->index_buffer == (MGLBuffer *)Py_None && (!i || array->num_vertices > buf_vertices)) {
 			array->num_vertices = buf_vertices;
@@ -174,19 +238,19 @@ PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 
 		gl.BindBuffer(GL_ARRAY_BUFFER, buffer->buffer_obj);
 
-		char * ptr = 0;
+		char * ptr = (char *)offset;
 
-		int attributes_len = (int)PyTuple_GET_SIZE(tuple) - 2;
+		int attributes_len = (int)PyTuple_GET_SIZE(tuple) - 4;
 
-		for (int j = 0; j < attributes_len; ++j) {
-			FormatNode * node = it.next();
+		FormatNode * node = buffer_format->nodes;
 
+		for (int j = 0; j < attributes_len; ++j, ++node) {
 			while (!node->type) {
 				ptr += node->size;
-				node = it.next();
+				++node;
 			}
 
-			MGLAttribute * attribute = (MGLAttribute *)PyTuple_GET_ITEM(tuple, j + 2);
+			MGLAttribute * attribute = (MGLAttribute *)PyTuple_GET_ITEM(tuple, j + 4);
 
 			if (attribute == (MGLAttribute *)Py_None) {
 				ptr += node->size;
@@ -212,6 +276,8 @@ PyObject * MGLContext_vertex_array(MGLContext * self, PyObject * args) {
 		}
 	}
 
+	Py_DECREF(formats);
+
 	Py_INCREF(self);
 	array->context = self;
 
@@ -240,6 +306,50 @@ void MGLVertexArray_tp_dealloc(MGLVertexArray * self) {
 
 inline void MGLVertexArray_SET_SUBROUTINES(MGLVertexArray * self, const GLMethods & gl);
 
+void MGLVertexArray_CountDraw(MGLVertexArray * self, const MGLDrawStats & draw) {
+	MGLContext * context = self->context;
+
+	if (self->stats_generation != context->stats_generation) {
+		self->stats_generation = context->stats_generation;
+		self->stats = MGLDrawStats();
+	}
+
+	MGLDrawStats * targets[] = {&self->stats, &context->stats};
+
+	for (int i = 0; i < 2; ++i) {
+		targets[i]->draw_calls += draw.draw_calls;
+		targets[i]->vertices += draw.vertices;
+		targets[i]->instances += draw.instances;
+		targets[i]->indirect_commands += draw.indirect_commands;
+		targets[i]->transform_calls += draw.transform_calls;
+		targets[i]->state_binds += draw.state_binds;
+	}
+}
+
+// The primitive restart of a VertexArray only applies to its own draws.
+// The previous state is restored after the draw, the VertexArrays keeping the current state must not inherit it.
+
+struct MGLPrimitiveRestart {
+	bool enabled;
+	unsigned index;
+};
+
+MGLPrimitiveRestart MGLVertexArray_BeginPrimitiveRestart(MGLVertexArray * self) {
+	MGLPrimitiveRestart old = {self->context->primitive_restart, self->context->primitive_restart_index};
+
+	if (self->primitive_restart >= 0) {
+		MGLContext_apply_primitive_restart(self->context, self->primitive_restart, self->restart_index);
+	}
+
+	return old;
+}
+
+void MGLVertexArray_EndPrimitiveRestart(MGLVertexArray * self, const MGLPrimitiveRestart & old) {
+	if (self->primitive_restart >= 0) {
+		MGLContext_apply_primitive_restart(self->context, old.enabled, old.index);
+	}
+}
+
 PyObject * MGLVertexArray_render(MGLVertexArray * self, PyObject * args) {
 	int mode;
 	int vertices;
@@ -274,18 +384,145 @@ PyObject * MGLVertexArray_render(MGLVertexArray * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.UseProgram(self->program->program_obj);
-	gl.BindVertexArray(self->vertex_array_obj);
+	long long issued_state_changes = self->context->issued_state_changes;
+
+	MGLContext_use_program(self->context, self->program->program_obj);
+	MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
+
+	MGLPrimitiveRestart old_primitive_restart = MGLVertexArray_BeginPrimitiveRestart(self);
 
 	MGLVertexArray_SET_SUBROUTINES(self, gl);
 
 	if (self->index_buffer != (MGLBuffer *)Py_None) {
-		const void * ptr = (const void *)((GLintptr)first * self->index_element_size);
+		const void * ptr = (const void *)(self->index_buffer_offset + (GLintptr)first * self->index_element_size);
 		gl.DrawElementsInstanced(mode, vertices, self->index_element_type, ptr, instances);
 	} else {
 		gl.DrawArraysInstanced(mode, first, vertices, instances);
 	}
 
+	MGLVertexArray_EndPrimitiveRestart(self, old_primitive_restart);
+
+	if (self->context->collect_stats) {
+		long long state_binds = self->context->issued_state_changes - issued_state_changes;
+		MGLDrawStats draw = {1, (long long)vertices * instances, instances, 0, 0, state_binds};
+		MGLVertexArray_CountDraw(self, draw);
+	}
+
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLVertexArray_render_multi(MGLVertexArray * self, PyObject * args) {
+	int mode;
+	PyObject * firsts;
+	PyObject * counts;
+	PyObject * base_vertices;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"IOOO",
+		&mode,
+		&firsts,
+		&counts,
+		&base_vertices
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	Py_buffer firsts_view;
+	Py_buffer counts_view;
+	Py_buffer base_vertices_view = {};
+
+	if (PyObject_GetBuffer(firsts, &firsts_view, PyBUF_SIMPLE) < 0) {
+		return 0;
+	}
+
+	if (PyObject_GetBuffer(counts, &counts_view, PyBUF_SIMPLE) < 0) {
+		PyBuffer_Release(&firsts_view);
+		return 0;
+	}
+
+	if (base_vertices != Py_None && PyObject_GetBuffer(base_vertices, &base_vertices_view, PyBUF_SIMPLE) < 0) {
+		PyBuffer_Release(&firsts_view);
+		PyBuffer_Release(&counts_view);
+		return 0;
+	}
+
+	int draws = (int)(counts_view.len / 4);
+
+	bool valid = counts_view.len % 4 == 0 && firsts_view.len == counts_view.len;
+
+	if (base_vertices != Py_None) {
+		valid = valid && base_vertices_view.len == counts_view.len && self->index_buffer != (MGLBuffer *)Py_None;
+	}
+
+	if (!valid) {
+		MGLError_Set("firsts, counts and base_vertices must be int32 arrays of the same length");
+		PyBuffer_Release(&firsts_view);
+		PyBuffer_Release(&counts_view);
+		if (base_vertices != Py_None) {
+			PyBuffer_Release(&base_vertices_view);
+		}
+		return 0;
+	}
+
+	const GLMethods & gl = self->context->gl;
+
+	long long issued_state_changes = self->context->issued_state_changes;
+
+	MGLContext_use_program(self->context, self->program->program_obj);
+	MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
+
+	MGLPrimitiveRestart old_primitive_restart = MGLVertexArray_BeginPrimitiveRestart(self);
+
+	MGLVertexArray_SET_SUBROUTINES(self, gl);
+
+	if (self->index_buffer != (MGLBuffer *)Py_None) {
+		int * first = (int *)firsts_view.buf;
+		const void ** indices = new const void * [draws];
+
+		for (int i = 0; i < draws; ++i) {
+			indices[i] = (const void *)(self->index_buffer_offset + (GLintptr)first[i] * self->index_element_size);
+		}
+
+		if (base_vertices != Py_None) {
+			gl.MultiDrawElementsBaseVertex(
+				mode,
+				(const GLsizei *)counts_view.buf,
+				self->index_element_type,
+				indices,
+				draws,
+				(const GLint *)base_vertices_view.buf
+			);
+		} else {
+			gl.MultiDrawElements(mode, (const GLsizei *)counts_view.buf, self->index_element_type, indices, draws);
+		}
+
+		delete[] indices;
+	} else {
+		gl.MultiDrawArrays(mode, (const GLint *)firsts_view.buf, (const GLsizei *)counts_view.buf, draws);
+	}
+
+	MGLVertexArray_EndPrimitiveRestart(self, old_primitive_restart);
+
+	if (self->context->collect_stats) {
+		long long vertices = 0;
+		for (int i = 0; i < draws; ++i) {
+			vertices += ((int *)counts_view.buf)[i];
+		}
+		long long state_binds = self->context->issued_state_changes - issued_state_changes;
+		MGLDrawStats draw = {1, vertices, draws, 0, 0, state_binds};
+		MGLVertexArray_CountDraw(self, draw);
+	}
+
+	PyBuffer_Release(&firsts_view);
+	PyBuffer_Release(&counts_view);
+
+	if (base_vertices != Py_None) {
+		PyBuffer_Release(&base_vertices_view);
+	}
+
 	Py_RETURN_NONE;
 }
 
@@ -315,8 +552,13 @@ PyObject * MGLVertexArray_render_indirect(MGLVertexArray * self, PyObject * args
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.UseProgram(self->program->program_obj);
-	gl.BindVertexArray(self->vertex_array_obj);
+	long long issued_state_changes = self->context->issued_state_changes;
+
+	MGLContext_use_program(self->context, self->program->program_obj);
+	MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
+
+	MGLPrimitiveRestart old_primitive_restart = MGLVertexArray_BeginPrimitiveRestart(self);
+
 	gl.BindBuffer(GL_DRAW_INDIRECT_BUFFER, buffer->buffer_obj);
 
 	MGLVertexArray_SET_SUBROUTINES(self, gl);
@@ -329,6 +571,87 @@ PyObject * MGLVertexArray_render_indirect(MGLVertexArray * self, PyObject * args
 		gl.MultiDrawArraysIndirect(mode, ptr, count, 20);
 	}
 
+	MGLVertexArray_EndPrimitiveRestart(self, old_primitive_restart);
+
+	if (self->context->collect_stats) {
+		long long state_binds = self->context->issued_state_changes - issued_state_changes;
+		MGLDrawStats draw = {1, 0, 0, count, 0, state_binds};
+		MGLVertexArray_CountDraw(self, draw);
+	}
+
+	Py_RETURN_NONE;
+}
+
+PyObject * MGLVertexArray_render_indirect_count(MGLVertexArray * self, PyObject * args) {
+	MGLBuffer * buffer;
+	MGLBuffer * count_buffer;
+	int mode;
+	int max_count;
+	int first;
+	Py_ssize_t count_offset;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"O!O!IIIn",
+		&MGLBuffer_Type,
+		&buffer,
+		&MGLBuffer_Type,
+		&count_buffer,
+		&mode,
+		&max_count,
+		&first,
+		&count_offset
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	const GLMethods & gl = self->context->gl;
+
+	if (!self->context->indirect_parameters) {
+		MGLError_Set("the draw count from a buffer requires OpenGL 4.6 or GL_ARB_indirect_parameters");
+		return 0;
+	}
+
+	if (max_count < 0) {
+		max_count = (int)(buffer->size / 20 - first);
+	}
+
+	if (count_offset < 0 || count_offset % 4 != 0 || count_offset + 4 > count_buffer->size) {
+		MGLError_Set("invalid count_offset = %d", (int)count_offset);
+		return 0;
+	}
+
+	long long issued_state_changes = self->context->issued_state_changes;
+
+	MGLContext_use_program(self->context, self->program->program_obj);
+	MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
+
+	MGLPrimitiveRestart old_primitive_restart = MGLVertexArray_BeginPrimitiveRestart(self);
+
+	gl.BindBuffer(GL_DRAW_INDIRECT_BUFFER, buffer->buffer_obj);
+	gl.BindBuffer(GL_PARAMETER_BUFFER, count_buffer->buffer_obj);
+
+	MGLVertexArray_SET_SUBROUTINES(self, gl);
+
+	const void * ptr = (const void *)((GLintptr)first * 20);
+
+	if (self->index_buffer != (MGLBuffer *)Py_None) {
+		gl.MultiDrawElementsIndirectCount(mode, self->index_element_type, ptr, count_offset, max_count, 20);
+	} else {
+		gl.MultiDrawArraysIndirectCount(mode, ptr, count_offset, max_count, 20);
+	}
+
+	MGLVertexArray_EndPrimitiveRestart(self, old_primitive_restart);
+
+	if (self->context->collect_stats) {
+		long long state_binds = self->context->issued_state_changes - issued_state_changes;
+		// The number of draws is only known on the GPU, the max_count is an upper bound.
+		MGLDrawStats draw = {1, 0, 0, max_count, 0, state_binds};
+		MGLVertexArray_CountDraw(self, draw);
+	}
+
 	Py_RETURN_NONE;
 }
 
@@ -374,8 +697,12 @@ PyObject * MGLVertexArray_transform(MGLVertexArray * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.UseProgram(self->program->program_obj);
-	gl.BindVertexArray(self->vertex_array_obj);
+	long long issued_state_changes = self->context->issued_state_changes;
+
+	MGLContext_use_program(self->context, self->program->program_obj);
+	MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
+
+	MGLPrimitiveRestart old_primitive_restart = MGLVertexArray_BeginPrimitiveRestart(self);
 
 	gl.BindBufferBase(GL_TRANSFORM_FEEDBACK_BUFFER, 0, output->buffer_obj);
 
@@ -385,7 +712,7 @@ PyObject * MGLVertexArray_transform(MGLVertexArray * self, PyObject * args) {
 	MGLVertexArray_SET_SUBROUTINES(self, gl);
 
 	if (self->index_buffer != (MGLBuffer *)Py_None) {
-		const void * ptr = (const void *)((GLintptr)first * self->index_element_size);
+		const void * ptr = (const void *)(self->index_buffer_offset + (GLintptr)first * self->index_element_size);
 		gl.DrawElementsInstanced(mode, vertices, self->index_element_type, ptr, instances);
 	} else {
 		gl.DrawArraysInstanced(mode, first, vertices, instances);
@@ -397,6 +724,14 @@ PyObject * MGLVertexArray_transform(MGLVertexArray * self, PyObject * args) {
 	}
 	gl.Flush();
 
+	MGLVertexArray_EndPrimitiveRestart(self, old_primitive_restart);
+
+	if (self->context->collect_stats) {
+		long long state_binds = self->context->issued_state_changes - issued_state_changes;
+		MGLDrawStats draw = {0, (long long)vertices * instances, instances, 0, 1, state_binds};
+		MGLVertexArray_CountDraw(self, draw);
+	}
+
 	Py_RETURN_NONE;
 }
 
@@ -404,7 +739,7 @@ PyObject * MGLVertexArray_bind(MGLVertexArray * self, PyObject * args) {
 	int location;
 	const char * type;
 	MGLBuffer * buffer;
-	const char * format;
+	PyObject * format;
 	Py_ssize_t offset;
 	int stride;
 	int divisor;
@@ -412,7 +747,7 @@ PyObject * MGLVertexArray_bind(MGLVertexArray * self, PyObject * args) {
 
 	int args_ok = PyArg_ParseTuple(
 		args,
-		"IsO!snIIp",
+		"IsO!OnIIp",
 		&location,
 		&type,
 		&MGLBuffer_Type,
@@ -428,22 +763,25 @@ PyObject * MGLVertexArray_bind(MGLVertexArray * self, PyObject * args) {
 		return 0;
 	}
 
-	FormatIterator it = FormatIterator(format);
-	FormatInfo format_info = it.info();
-
 	if (type[0] == 'f' && normalize) {
 		MGLError_Set("invalid normalize");
 		return 0;
 	}
 
-	if (!format_info.valid || format_info.divisor || format_info.nodes != 1) {
+	MGLBufferFormat * buffer_format = MGLBufferFormat_FromObject(format);
+
+	if (!buffer_format) {
 		MGLError_Set("invalid format");
 		return 0;
 	}
 
-	FormatNode * node = it.next();
+	FormatInfo format_info = buffer_format->info;
+	bool valid = !format_info.divisor && format_info.nodes == 1 && buffer_format->nodes[0].type;
+	valid = valid && (type[0] == 'f' || !is_packed_type(buffer_format->nodes[0].type));
+	FormatNode node = valid ? buffer_format->nodes[0] : FormatNode();
+	Py_DECREF(buffer_format);
 
-	if (!node->type) {
+	if (!valid) {
 		MGLError_Set("invalid format");
 		return 0;
 	}
@@ -452,18 +790,18 @@ PyObject * MGLVertexArray_bind(MGLVertexArray * self, PyObject * args) {
 
 	const GLMethods & gl = self->context->gl;
 
-	gl.BindVertexArray(self->vertex_array_obj);
+	MGLContext_bind_vertex_array(self->context, self->vertex_array_obj);
 	gl.BindBuffer(GL_ARRAY_BUFFER, buffer->buffer_obj);
 
 	switch (type[0]) {
 		case 'f':
-			gl.VertexAttribPointer(location, node->count, node->type, normalize, stride, ptr);
+			gl.VertexAttribPointer(location, node.count, node.type, normalize, stride, ptr);
 			break;
 		case 'i':
-			gl.VertexAttribIPointer(location, node->count, node->type, stride, ptr);
+			gl.VertexAttribIPointer(location, node.count, node.type, stride, ptr);
 			break;
 		case 'd':
-			gl.VertexAttribLPointer(location, node->count, node->type, stride, ptr);
+			gl.VertexAttribLPointer(location, node.count, node.type, stride, ptr);
 			break;
 		default:
 			MGLError_Set("invalid type");
@@ -484,7 +822,9 @@ PyObject * MGLVertexArray_release(MGLVertexArray * self) {
 
 PyMethodDef MGLVertexArray_tp_methods[] = {
 	{"render", (PyCFunction)MGLVertexArray_render, METH_VARARGS, 0},
+	{"render_multi", (PyCFunction)MGLVertexArray_render_multi, METH_VARARGS, 0},
 	{"render_indirect", (PyCFunction)MGLVertexArray_render_indirect, METH_VARARGS, 0},
+	{"render_indirect_count", (PyCFunction)MGLVertexArray_render_indirect_count, METH_VARARGS, 0},
 	{"transform", (PyCFunction)MGLVertexArray_transform, METH_VARARGS, 0},
 	{"bind", (PyCFunction)MGLVertexArray_bind, METH_VARARGS, 0},
 	{"release", (PyCFunction)MGLVertexArray_release, METH_NOARGS, 0},
@@ -500,6 +840,7 @@ int MGLVertexArray_set_index_buffer(MGLVertexArray * self, PyObject * value, voi
 	Py_INCREF(value);
 	Py_DECREF(self->index_buffer);
 	self->index_buffer = (MGLBuffer *)value;
+	self->index_buffer_offset = 0;
 	self->num_vertices = (int)(self->index_buffer->size / 4);
 
 	return 0;
@@ -539,6 +880,44 @@ int MGLVertexArray_set_instances(MGLVertexArray * self, PyObject * value, void *
 	return 0;
 }
 
+PyObject * MGLVertexArray_get_stats(MGLVertexArray * self, void * closure) {
+	if (self->stats_generation != self->context->stats_generation) {
+		return MGLDrawStats_Tuple(MGLDrawStats());
+	}
+
+	return MGLDrawStats_Tuple(self->stats);
+}
+
+PyObject * MGLVertexArray_get_primitive_restart(MGLVertexArray * self, void * closure) {
+	if (self->primitive_restart < 0) {
+		Py_RETURN_NONE;
+	}
+
+	return PyBool_FromLong(self->primitive_restart);
+}
+
+int MGLVertexArray_set_primitive_restart(MGLVertexArray * self, PyObject * value, void * closure) {
+	self->primitive_restart = value == Py_None ? -1 : PyObject_IsTrue(value) == 1;
+	return 0;
+}
+
+PyObject * MGLVertexArray_get_restart_index(MGLVertexArray * self, void * closure) {
+	return PyLong_FromUnsignedLong(self->restart_index);
+}
+
+int MGLVertexArray_set_restart_index(MGLVertexArray * self, PyObject * value, void * closure) {
+	unsigned long restart_index = PyLong_AsUnsignedLong(value);
+
+	if (PyErr_Occurred() || restart_index > 0xFFFFFFFFul) {
+		MGLError_Set("invalid value for restart_index");
+		return -1;
+	}
+
+	self->restart_index = (unsigned)restart_index;
+
+	return 0;
+}
+
 int MGLVertexArray_set_subroutines(MGLVertexArray * self, PyObject * value, void * closure) {
 	if (PyTuple_GET_SIZE(value) != self->num_subroutines) {
 		MGLError_Set("the number of subroutines is %d not %d", self->num_subroutines, PyTuple_GET_SIZE(value));
@@ -573,6 +952,9 @@ PyGetSetDef MGLVertexArray_tp_getseters[] = {
 	{(char *)"vertices", (getter)MGLVertexArray_get_vertices, (setter)MGLVertexArray_set_vertices, 0, 0},
 	{(char *)"instances", (getter)MGLVertexArray_get_instances, (setter)MGLVertexArray_set_instances, 0, 0},
 	{(char *)"subroutines", 0, (setter)MGLVertexArray_set_subroutines, 0, 0},
+	{(char *)"primitive_restart", (getter)MGLVertexArray_get_primitive_restart, (setter)MGLVertexArray_set_primitive_restart, 0, 0},
+	{(char *)"restart_index", (getter)MGLVertexArray_get_restart_index, (setter)MGLVertexArray_set_restart_index, 0, 0},
+	{(char *)"stats", (getter)MGLVertexArray_get_stats, 0, 0, 0},
 	{0},
 };
 
@@ -627,6 +1009,10 @@ void MGLVertexArray_Invalidate(MGLVertexArray * array) {
 	const GLMethods & gl = array->context->gl;
 	gl.DeleteVertexArrays(1, (GLuint *)&array->vertex_array_obj);
 
+	if (array->context->cached_vertex_array == array->vertex_array_obj) {
+		array->context->cached_vertex_array = -1;
+	}
+
 	Py_TYPE(array) = &MGLInvalidObject_Type;
 	Py_DECREF(array);
 }
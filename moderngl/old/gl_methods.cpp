@@ -736,5 +736,10 @@ bool GLMethods::load() {
     this->MultiDrawElementsIndirectCount = (PFNGLMULTIDRAWELEMENTSINDIRECTCOUNTPROC)LoadMethod(PREFIX "glMultiDrawElementsIndirectCount");
     this->PolygonOffsetClamp = (PFNGLPOLYGONOFFSETCLAMPPROC)LoadMethod(PREFIX "glPolygonOffsetClamp");
 
+    if (!this->MultiDrawArraysIndirectCount) {
+        this->MultiDrawArraysIndirectCount = (PFNGLMULTIDRAWARRAYSINDIRECTCOUNTPROC)LoadMethod(PREFIX "glMultiDrawArraysIndirectCountARB");
+        this->MultiDrawElementsIndirectCount = (PFNGLMULTIDRAWELEMENTSINDIRECTCOUNTPROC)LoadMethod(PREFIX "glMultiDrawElementsIndirectCountARB");
+    }
+
     return true;
 }
@@ -0,0 +1,33 @@
+__all__ = ['PipelineState']
+
+
+class PipelineState:
+    '''
+        A PipelineState bundles the enable flags, blend func, depth func, face culling,
+        wireframe and multisample settings into a single immutable object.
+
+        The values are validated when the object is created.
+        Using it sets only the state that differs from the current state of the context, in a single call.
+        The values left as None keep their current value.
+
+        A PipelineState object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.pipeline_state` to create one.
+    '''
+
+    __slots__ = ['mglo', 'ctx', 'extra']
+
+    def __init__(self):
+        self.mglo = None
+        self.ctx = None
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<PipelineState>'
+
+    def use(self) -> None:
+        '''
+            Apply the pipeline state to the context.
+        '''
+
+        self.mglo.use()
@@ -21,12 +21,13 @@ class Program:
         Use :py:meth:`Context.program` to create one.
     '''
 
-    __slots__ = ['mglo', '_members', '_subroutines', '_geom', '_glo', 'ctx', 'extra']
+    __slots__ = ['mglo', '_members', '_subroutines', '_formats', '_geom', '_glo', 'ctx', 'extra', '__weakref__']
 
     def __init__(self):
         self.mglo = None
         self._members = {}
         self._subroutines = None
+        self._formats = {}
         self._geom = (None, None, None)
         self._glo = None
         self.ctx = None
@@ -135,4 +136,11 @@ def detect_format(program, attributes) -> str:
 
         return attr.array_length * attr.dimension, attr.shape
 
-    return ' '.join('%d%s' % fmt(program[a]) for a in attributes)
+    attributes = tuple(attributes)
+    res = program._formats.get(attributes)
+
+    if res is None:
+        res = ' '.join('%d%s' % fmt(program[a]) for a in attributes)
+        program._formats[attributes] = res
+
+    return res
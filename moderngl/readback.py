@@ -0,0 +1,154 @@
+from .error import Error
+
+__all__ = ['Readback']
+
+TIMEOUT_IGNORED = 0xFFFFFFFFFFFFFFFF
+
+
+class Readback:
+    '''
+        A Readback is a pending copy of GPU data into a staging :py:class:`Buffer`.
+        The copy is followed by a fence, so the data can be collected
+        later without waiting for the whole pipeline to finish.
+        A staging buffer created by the readback is released once the result was read.
+
+        A Readback object cannot be instantiated directly.
+        Use :py:meth:`Buffer.read_async`, :py:meth:`Texture.read_async`
+        or :py:meth:`Framebuffer.read_async` to create one.
+    '''
+
+    __slots__ = ['_buffer', '_offset', '_size', '_owned', '_fence', 'ctx', 'extra']
+
+    def __init__(self):
+        self._buffer = None
+        self._offset = None
+        self._size = None
+        self._owned = None
+        self._fence = None
+        self.ctx = None
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<Readback: %d bytes>' % self._size
+
+    @property
+    def buffer(self) -> 'Buffer':
+        '''
+            Buffer: The staging buffer receiving the data.
+        '''
+
+        return self._buffer
+
+    @property
+    def offset(self) -> int:
+        '''
+            int: The offset of the data in the staging buffer.
+        '''
+
+        return self._offset
+
+    @property
+    def size(self) -> int:
+        '''
+            int: The size of the data.
+        '''
+
+        return self._size
+
+    def ready(self) -> bool:
+        '''
+            Check whether the copy has finished without waiting.
+
+            Returns:
+                bool
+        '''
+
+        return self.wait(0.0)
+
+    def wait(self, timeout=None) -> bool:
+        '''
+            Wait for the copy to finish.
+
+            Args:
+                timeout (float): The timeout in seconds. Value ``None`` means no timeout.
+
+            Returns:
+                bool: ``True`` if the copy has finished.
+        '''
+
+        if self._fence is None:
+            return True
+
+        timeout = TIMEOUT_IGNORED if timeout is None else int(timeout * 1e9)
+
+        if not self.ctx.mglo.wait_fence(self._fence, timeout):
+            return False
+
+        self.ctx.mglo.delete_fence(self._fence)
+        self._fence = None
+        return True
+
+    def result(self) -> bytes:
+        '''
+            Wait for the copy to finish and read the data.
+
+            Returns:
+                bytes
+        '''
+
+        self.wait()
+        data = self._buffer.read(self._size, offset=self._offset)
+        self.release()
+        return data
+
+    def result_into(self, buffer, *, write_offset=0) -> None:
+        '''
+            Wait for the copy to finish and read the data into a buffer.
+
+            Args:
+                buffer (bytearray): The buffer that will receive the data.
+
+            Keyword Args:
+                write_offset (int): The write offset.
+        '''
+
+        self.wait()
+        self._buffer.read_into(buffer, self._size, offset=self._offset, write_offset=write_offset)
+        self.release()
+
+    def release(self) -> None:
+        '''
+            Release the fence and the staging buffer if it was created by the readback.
+        '''
+
+        if self._fence is not None:
+            self.ctx.mglo.delete_fence(self._fence)
+            self._fence = None
+
+        if self._owned:
+            self._buffer.release()
+            self._owned = False
+
+
+def readback(ctx, size, buffer, write_offset, copy) -> Readback:
+    owned = buffer is None
+
+    if owned:
+        buffer = ctx.buffer(reserve=size, dynamic=True)
+        write_offset = 0
+
+    elif write_offset < 0 or write_offset + size > buffer.size:
+        raise Error('the buffer is too small')
+
+    copy(buffer, write_offset)
+
+    res = Readback.__new__(Readback)
+    res._buffer = buffer
+    res._offset = write_offset
+    res._size = size
+    res._owned = owned
+    res._fence = ctx.mglo.fence()
+    res.ctx = ctx
+    res.extra = None
+    return res
@@ -0,0 +1,55 @@
+from .error import Error
+
+__all__ = ['Recorder']
+
+
+class Recorder:
+    '''
+        A Recorder captures the OpenGL commands issued by ModernGL into a compact bytecode.
+
+        The commands issued inside the ``with`` block are executed as usual and recorded at the same time.
+        The recorded commands are the clears, the scope begin and end, the uniform writes,
+        the texture, sampler and buffer bindings, the render state changes and the draw calls.
+        Uploads, downloads and object creation are executed but not recorded.
+
+        :py:meth:`Context.replay` executes the bytecode entirely in C,
+        without the per call Python overhead of the original calls.
+        The bytecode references the OpenGL objects by name,
+        it is only valid while the objects used in the recording are alive.
+
+        Only one recording can be in progress at a time.
+
+        A Recorder object cannot be instantiated directly, it requires a context.
+        Use :py:attr:`Context.recorder` to get one.
+    '''
+
+    __slots__ = ['_bytecode', 'ctx', 'extra']
+
+    def __init__(self):
+        self._bytecode = None
+        self.ctx = None
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<Recorder>'
+
+    def __enter__(self):
+        self.ctx.mglo.begin_recording()
+        return self
+
+    def __exit__(self, *args):
+        self._bytecode = self.ctx.mglo.end_recording()
+
+    def dump(self) -> bytes:
+        '''
+            The bytecode of the last recording.
+
+            Returns:
+                bytes
+        '''
+
+        if self._bytecode is None:
+            raise Error('nothing was recorded')
+
+        return self._bytecode
@@ -32,6 +32,10 @@ class Renderbuffer:
     def __repr__(self):
         return '<Renderbuffer: %d>' % self.glo
 
+    def __del__(self):
+        if getattr(self, 'ctx', None) is not None:
+            self.ctx._collect(self)
+
     def __eq__(self, other):
         return type(self) is type(other) and self.mglo is other.mglo
 
@@ -105,4 +109,5 @@ class Renderbuffer:
             Release the ModernGL object.
         '''
 
+        self.ctx._untrack(self)
         self.mglo.release()
@@ -9,20 +9,27 @@ class Scope:
 
         - Set the enable flags.
         - Bind the framebuffer.
+        - Set the optional blend func, depth func, cull face, viewport and masks.
         - Assigning textures to texture locations.
         - Assigning buffers to uniform buffers.
         - Assigning buffers to shader storage buffers.
+        - Assigning samplers to texture locations.
 
         Responsibilities on exit:
 
         - Restore the enable flags.
         - Restore the framebuffer.
+        - Restore the optional render state.
+
+        Only the state that differs from the current state is applied.
+        Textures and samplers on consecutive locations are bound with a single call when ARB_multi_bind is available.
     '''
 
-    __slots__ = ['mglo', 'ctx', 'extra']
+    __slots__ = ['mglo', '_refs', 'ctx', 'extra']
 
     def __init__(self):
         self.mglo = None
+        self._refs = None
         self.ctx = None
         self.extra = None  #: Any - Attribute for storing user defined objects
         raise TypeError()
@@ -0,0 +1,148 @@
+from .buffer import Buffer
+from .error import Error
+from .readback import TIMEOUT_IGNORED
+
+__all__ = ['StreamBuffer']
+
+
+class StreamBuffer:
+    '''
+        A StreamBuffer is a ring allocator for per-frame uploads.
+
+        The underlying :py:class:`Buffer` uses immutable storage and stays
+        persistently mapped for its whole lifetime, so writes are plain memory copies.
+        The buffer is split into one region per frame in flight.
+        Data for the current frame is allocated from the current region only.
+        :py:meth:`StreamBuffer.next_frame` fences the current region and moves to the next one.
+        It only waits when the GPU is still using the next region,
+        that is when the GPU is more than ``frames - 1`` frames behind.
+
+        A StreamBuffer object cannot be instantiated directly, it requires a context.
+        Use :py:meth:`Context.stream_buffer` to create one.
+    '''
+
+    __slots__ = ['_buffer', '_frames', '_frame', '_frame_size', '_alignment', '_cursor', '_fences', 'ctx', 'extra']
+
+    def __init__(self):
+        self._buffer = None
+        self._frames = None
+        self._frame = None
+        self._frame_size = None
+        self._alignment = None
+        self._cursor = None
+        self._fences = None
+        self.ctx = None
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self):
+        return '<StreamBuffer: %d>' % self._buffer.glo
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._buffer == other._buffer
+
+    @property
+    def buffer(self) -> Buffer:
+        '''
+            Buffer: The persistently mapped buffer.
+            Use it to create VertexArrays or to bind uniform blocks.
+        '''
+
+        return self._buffer
+
+    @property
+    def frames(self) -> int:
+        '''
+            int: The number of frames in flight.
+        '''
+
+        return self._frames
+
+    @property
+    def frame_size(self) -> int:
+        '''
+            int: The number of bytes available for each frame.
+        '''
+
+        return self._frame_size
+
+    @property
+    def frame(self) -> int:
+        '''
+            int: The index of the region used by the current frame.
+        '''
+
+        return self._frame
+
+    @property
+    def used(self) -> int:
+        '''
+            int: The number of bytes allocated in the current frame.
+        '''
+
+        return self._cursor
+
+    def allocate(self, size) -> int:
+        '''
+            Allocate a sub-range from the current frame's region.
+
+            Args:
+                size (int): The number of bytes to allocate.
+
+            Returns:
+                int: The offset of the sub-range in :py:attr:`StreamBuffer.buffer`.
+        '''
+
+        cursor = (self._cursor + self._alignment - 1) // self._alignment * self._alignment
+
+        if size < 0 or cursor + size > self._frame_size:
+            raise Error('the frame is full, %d of %d bytes are used' % (self._cursor, self._frame_size))
+
+        self._cursor = cursor + size
+        return self._frame * self._frame_size + cursor
+
+    def write(self, data) -> int:
+        '''
+            Allocate a sub-range from the current frame's region and write the data into it.
+
+            Args:
+                data (bytes): The data.
+
+            Returns:
+                int: The offset of the data in :py:attr:`StreamBuffer.buffer`.
+        '''
+
+        # The fences of next_frame keep the GPU off the current region, the write does not wait.
+        offset = self.allocate(memoryview(data).nbytes)
+        self._buffer.mglo.write(data, offset, True)
+        return offset
+
+    def next_frame(self) -> None:
+        '''
+            Finish the current frame and start the next one.
+
+            Call it after the draw calls reading the current frame's data were issued.
+        '''
+
+        self._fences[self._frame] = self.ctx.mglo.fence()
+        self._frame = (self._frame + 1) % self._frames
+        self._cursor = 0
+
+        fence = self._fences[self._frame]
+
+        if fence is not None:
+            self.ctx.mglo.wait_fence(fence, TIMEOUT_IGNORED)
+            self.ctx.mglo.delete_fence(fence)
+            self._fences[self._frame] = None
+
+    def release(self) -> None:
+        '''
+            Release the ModernGL object.
+        '''
+
+        for fence in self._fences:
+            if fence is not None:
+                self.ctx.mglo.delete_fence(fence)
+
+        self._fences = [None] * self._frames
+        self._buffer.release()
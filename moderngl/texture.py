@@ -1,6 +1,7 @@
 from typing import Tuple
 
 from .buffer import Buffer
+from .readback import Readback, readback
 
 __all__ = ['Texture',
            'NEAREST', 'LINEAR', 'NEAREST_MIPMAP_NEAREST', 'LINEAR_MIPMAP_NEAREST', 'NEAREST_MIPMAP_LINEAR',
@@ -44,6 +45,10 @@ class Texture:
     def __repr__(self):
         return '<Texture: %d>' % self.glo
 
+    def __del__(self):
+        if getattr(self, 'ctx', None) is not None:
+            self.ctx._collect(self)
+
     def __eq__(self, other):
         return type(self) is type(other) and self.mglo is other.mglo
 
@@ -299,6 +304,31 @@ class Texture:
 
         return self.mglo.read_into(buffer, level, alignment, write_offset)
 
+    def read_async(self, *, level=0, alignment=1, buffer=None, write_offset=0) -> Readback:
+        '''
+            Start reading the content of the texture without waiting for the GPU.
+
+            The pixels are read into a pixel pack buffer and a fence is inserted after the read.
+
+            Keyword Args:
+                level (int): The mipmap level.
+                alignment (int): The byte alignment of the pixels.
+                buffer (Buffer): The pixel pack buffer. A new buffer is created when ``None``.
+                write_offset (int): The write offset in the pixel pack buffer.
+
+            Returns:
+                :py:class:`Readback` object
+        '''
+
+        width = max(self.width >> level, 1)
+        height = max(self.height >> level, 1)
+        row = (width * self.components * int(self.dtype[1:]) + alignment - 1) // alignment * alignment
+
+        def copy(staging, write_offset):
+            self.mglo.read_into(staging.mglo, level, alignment, write_offset)
+
+        return readback(self.ctx, row * height, buffer, write_offset, copy)
+
     def write(self, data, viewport=None, *, level=0, alignment=1) -> None:
         '''
             Update the content of the texture.
@@ -330,6 +360,7 @@ class Texture:
         '''
 
         self.mglo.build_mipmaps(base, max_level)
+        self.ctx._track_mipmaps(self, max_level)
 
     def use(self, location=0) -> None:
         '''
@@ -349,4 +380,5 @@ class Texture:
             Release the ModernGL object.
         '''
 
+        self.ctx._untrack(self)
         self.mglo.release()
@@ -32,6 +32,10 @@ class Texture3D:
     def __repr__(self):
         return '<Texture3D: %d>' % self.glo
 
+    def __del__(self):
+        if getattr(self, 'ctx', None) is not None:
+            self.ctx._collect(self)
+
     def __eq__(self, other):
         return type(self) is type(other) and self.mglo is other.mglo
 
@@ -258,6 +262,7 @@ class Texture3D:
         '''
 
         self.mglo.build_mipmaps(base, max_level)
+        self.ctx._track_mipmaps(self, max_level)
 
     def use(self, location=0) -> None:
         '''
@@ -277,4 +282,5 @@ class Texture3D:
             Release the ModernGL object.
         '''
 
+        self.ctx._untrack(self)
         self.mglo.release()
@@ -32,6 +32,10 @@ class TextureArray:
     def __repr__(self):
         return '<Texture: %d>' % self.glo
 
+    def __del__(self):
+        if getattr(self, 'ctx', None) is not None:
+            self.ctx._collect(self)
+
     def __eq__(self, other):
         return type(self) is type(other) and self.mglo is other.mglo
 
@@ -267,6 +271,7 @@ class TextureArray:
         '''
 
         self.mglo.build_mipmaps(base, max_level)
+        self.ctx._track_mipmaps(self, max_level)
 
     def use(self, location=0) -> None:
         '''
@@ -286,4 +291,5 @@ class TextureArray:
             Release the ModernGL object.
         '''
 
+        self.ctx._untrack(self)
         self.mglo.release()
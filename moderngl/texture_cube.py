@@ -29,6 +29,10 @@ class TextureCube:
     def __repr__(self):
         return '<TextureCube: %d>' % self.glo
 
+    def __del__(self):
+        if getattr(self, 'ctx', None) is not None:
+            self.ctx._collect(self)
+
     def __eq__(self, other):
         return type(self) is type(other) and self.mglo is other.mglo
 
@@ -203,4 +207,5 @@ class TextureCube:
             Release the ModernGL object.
         '''
 
+        self.ctx._untrack(self)
         self.mglo.release()
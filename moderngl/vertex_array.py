@@ -1,6 +1,11 @@
-from typing import Tuple
+from array import array
+from typing import Dict, Tuple
 
-__all__ = ['VertexArray',
+from .buffer_format import buffer_format
+from .draw_stats import STATS_KEYS
+from .multi_buffer import MultiBuffer
+
+__all__ = ['VertexArray', 'indirect_commands',
            'POINTS', 'LINES', 'LINE_LOOP', 'LINE_STRIP', 'TRIANGLES', 'TRIANGLE_STRIP', 'TRIANGLE_FAN',
            'LINES_ADJACENCY', 'LINE_STRIP_ADJACENCY', 'TRIANGLES_ADJACENCY', 'TRIANGLE_STRIP_ADJACENCY', 'PATCHES']
 
@@ -33,13 +38,17 @@ class VertexArray:
         to create one.
     '''
 
-    __slots__ = ['mglo', '_program', '_index_buffer', '_index_element_size', '_glo', 'ctx', 'extra', 'scope']
+    __slots__ = ['mglo', '_frames', '_multi_buffer', '_program', '_index_buffer', '_index_element_size', '_buffers',
+                 '_glo', 'ctx', 'extra', 'scope', '__weakref__']
 
     def __init__(self):
         self.mglo = None
+        self._frames = None
+        self._multi_buffer = None
         self._program = None
         self._index_buffer = None
         self._index_element_size = None
+        self._buffers = None
         self._glo = None
         self.ctx = None
         self.extra = None  #: Any - Attribute for storing user defined objects
@@ -49,6 +58,10 @@ class VertexArray:
     def __repr__(self):
         return '<VertexArray: %d>' % self.glo
 
+    def __del__(self):
+        if getattr(self, 'ctx', None) is not None:
+            self.ctx._collect(self)
+
     def __eq__(self, other):
         return type(self) is type(other) and self.mglo is other.mglo
 
@@ -89,7 +102,8 @@ class VertexArray:
 
     @vertices.setter
     def vertices(self, value):
-        self.mglo.vertices = int(value)
+        for mglo in self._frames:
+            mglo.vertices = int(value)
 
     @property
     def instances(self) -> int:
@@ -97,7 +111,56 @@ class VertexArray:
 
     @instances.setter
     def instances(self, value):
-        self.mglo.instances = int(value)
+        for mglo in self._frames:
+            mglo.instances = int(value)
+
+    @property
+    def primitive_restart(self) -> bool:
+        '''
+            bool: Enable or disable the primitive restart when rendering.
+            The state is only changed for the draws of this VertexArray, the previous state is restored after each draw.
+            None (the default) keeps the current state, the context enables the primitive restart
+            with the largest index of 4 byte index buffers by default.
+        '''
+
+        return self.mglo.primitive_restart
+
+    @primitive_restart.setter
+    def primitive_restart(self, value):
+        for mglo in self._frames:
+            mglo.primitive_restart = None if value is None else bool(value)
+
+    @property
+    def restart_index(self) -> int:
+        '''
+            int: The primitive restart index used when the :py:attr:`primitive_restart` is enabled.
+            Defaults to the largest index of the :py:attr:`index_element_size`, 0xFF, 0xFFFF or 0xFFFFFFFF,
+            the same index as ``GL_PRIMITIVE_RESTART_FIXED_INDEX``. Setting it to -1 restores the default.
+        '''
+
+        return self.mglo.restart_index
+
+    @restart_index.setter
+    def restart_index(self, value):
+        limit = (1 << (8 * self._index_element_size)) - 1
+        value = limit if value == -1 else int(value)
+
+        if not 0 <= value <= limit:
+            raise ValueError('the restart_index must be -1 or between 0 and %d' % limit)
+
+        for mglo in self._frames:
+            mglo.restart_index = value
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        '''
+            dict: The draw statistics of the VertexArray since the last :py:meth:`DrawStats.reset`.
+            The statistics are only counted when :py:attr:`DrawStats.enabled` is set.
+            See :py:attr:`Context.stats` for the counters.
+        '''
+
+        totals = [sum(values) for values in zip(*(mglo.stats for mglo in self._frames))]
+        return dict(zip(STATS_KEYS, totals))
 
     @property
     def subroutines(self) -> Tuple[int, ...]:
@@ -110,7 +173,8 @@ class VertexArray:
 
     @subroutines.setter
     def subroutines(self, value):
-        self.mglo.subroutines = tuple(value)
+        for mglo in self._frames:
+            mglo.subroutines = tuple(value)
 
     @property
     def glo(self) -> int:
@@ -121,6 +185,15 @@ class VertexArray:
 
         return self._glo
 
+    @property
+    def multi_buffer(self) -> 'MultiBuffer':
+        '''
+            MultiBuffer: The MultiBuffer used by the VertexArray, otherwise ``None``.
+            The VertexArray renders from the copy of the MultiBuffer's current frame.
+        '''
+
+        return self._multi_buffer
+
     def render(self, mode=None, vertices=-1, *, first=0, instances=-1) -> None:
         '''
             The render primitive (mode) must be the same as
@@ -138,12 +211,53 @@ class VertexArray:
         if mode is None:
             mode = TRIANGLES
 
+        if self._multi_buffer is not None:
+            self.mglo = self._frames[self._multi_buffer.frame]
+
         if self.scope:
             with self.scope:
                 self.mglo.render(mode, vertices, first, instances)
         else:
             self.mglo.render(mode, vertices, first, instances)
 
+    def render_multi(self, firsts, counts, mode=None, *, base_vertices=None) -> None:
+        '''
+            Render many ranges of the VertexArray with a single
+            ``glMultiDrawArrays`` or ``glMultiDrawElements`` call.
+
+            The render primitive (mode) must be the same as
+            the input primitive of the GeometryShader.
+            The arrays are expected to be int32 arrays, for example NumPy arrays with ``dtype='i4'``.
+            Other sequences of integers are converted.
+
+            Args:
+                firsts (array): The index of the first vertex of each draw.
+                counts (array): The number of vertices of each draw.
+                mode (int): By default :py:data:`TRIANGLES` will be used.
+
+            Keyword Args:
+                base_vertices (array): The value added to the indices of each draw.
+                                       Requires an index buffer.
+        '''
+
+        if mode is None:
+            mode = TRIANGLES
+
+        firsts = _int32_array(firsts)
+        counts = _int32_array(counts)
+
+        if base_vertices is not None:
+            base_vertices = _int32_array(base_vertices)
+
+        if self._multi_buffer is not None:
+            self.mglo = self._frames[self._multi_buffer.frame]
+
+        if self.scope:
+            with self.scope:
+                self.mglo.render_multi(mode, firsts, counts, base_vertices)
+        else:
+            self.mglo.render_multi(mode, firsts, counts, base_vertices)
+
     def render_indirect(self, buffer, mode=None, count=-1, *, first=0) -> None:
         '''
             The render primitive (mode) must be the same as
@@ -163,12 +277,49 @@ class VertexArray:
         if mode is None:
             mode = TRIANGLES
 
+        if self._multi_buffer is not None:
+            self.mglo = self._frames[self._multi_buffer.frame]
+
         if self.scope:
             with self.scope:
                 self.mglo.render_indirect(buffer.mglo, mode, count, first)
         else:
             self.mglo.render_indirect(buffer.mglo, mode, count, first)
 
+    def render_indirect_count(self, buffer, count_buffer, mode=None, max_count=-1, *, first=0,
+                              count_offset=0) -> None:
+        '''
+            Render with the draw commands and the number of draws stored in buffers.
+            The number of draws is read on the GPU, it can be written by a compute shader.
+            Requires OpenGL 4.6 or the ``GL_ARB_indirect_parameters`` extension.
+
+            The draw commands are 5 integers: (count, instanceCount, firstIndex, baseVertex, baseInstance).
+            Use :py:func:`indirect_commands` to build them.
+
+            Args:
+                buffer (Buffer): Indirect drawing commands.
+                count_buffer (Buffer): The buffer containing the number of draws as a 32 bit integer.
+                mode (int): By default :py:data:`TRIANGLES` will be used.
+                max_count (int): The maximum number of draws.
+                                 The :py:class:`DrawStats` count it as the ``indirect_commands``.
+
+            Keyword Args:
+                first (int): The index of the first indirect draw command.
+                count_offset (int): The offset of the number of draws in the count_buffer.
+        '''
+
+        if mode is None:
+            mode = TRIANGLES
+
+        if self._multi_buffer is not None:
+            self.mglo = self._frames[self._multi_buffer.frame]
+
+        if self.scope:
+            with self.scope:
+                self.mglo.render_indirect_count(buffer.mglo, count_buffer.mglo, mode, max_count, first, count_offset)
+        else:
+            self.mglo.render_indirect_count(buffer.mglo, count_buffer.mglo, mode, max_count, first, count_offset)
+
     def transform(self, buffer, mode=None, vertices=-1, *, first=0, instances=-1) -> None:
         '''
             Transform vertices.
@@ -189,6 +340,9 @@ class VertexArray:
         if mode is None:
             mode = POINTS
 
+        if self._multi_buffer is not None:
+            self.mglo = self._frames[self._multi_buffer.frame]
+
         if self.scope:
             with self.scope:
                 self.mglo.transform(buffer.mglo, mode, vertices, first, instances)
@@ -203,7 +357,7 @@ class VertexArray:
                 location (int): The attribute location.
                 cls (str): The attribute class. Valid values are ``f``, ``i`` or ``d``.
                 buffer (Buffer): The buffer.
-                format (str): The buffer format.
+                format (str): The buffer format or a :py:class:`BufferFormat`.
 
             Keyword Args:
                 offset (int): The offset.
@@ -212,11 +366,82 @@ class VertexArray:
                 normalize (bool): The normalize parameter, if applicable.
         '''
 
-        self.mglo.bind(attribute, cls, buffer.mglo, fmt, offset, stride, divisor, normalize)
+        if type(buffer) is MultiBuffer:
+            if buffer is not self._multi_buffer:
+                raise ValueError('the MultiBuffer must be the one used to create the VertexArray')
+            buffers = buffer.buffers
+        else:
+            buffers = (buffer,) * len(self._frames)
+
+        fmt = buffer_format(fmt).mglo
+
+        for mglo, frame_buffer in zip(self._frames, buffers):
+            mglo.bind(attribute, cls, frame_buffer.mglo, fmt, offset, stride, divisor, normalize)
+
+        self._buffers += (buffer,)
 
     def release(self) -> None:
         '''
             Release the ModernGL object.
         '''
 
-        self.mglo.release()
+        for mglo in self._frames:
+            mglo.release()
+
+
+def indirect_commands(commands, *, indexed=True) -> bytes:
+    '''
+        Pack draw commands for :py:meth:`VertexArray.render_indirect`
+        and :py:meth:`VertexArray.render_indirect_count`.
+
+        The commands can be a NumPy structured array with the
+        ``count``, ``instances``, ``first``, ``base_vertex`` and ``base_instance`` fields
+        or a list of ``(count, instances, first, base_vertex, base_instance)`` tuples.
+        Missing fields default to ``1`` instance and ``0`` for the rest.
+        Without an index buffer the ``base_vertex`` is ignored
+        and the tuples are ``(count, instances, first, base_instance)``.
+
+        Args:
+            commands (array): The draw commands.
+
+        Keyword Args:
+            indexed (bool): The commands are for a VertexArray with an index buffer.
+
+        Returns:
+            bytes
+    '''
+
+    fields = ('count', 'instances', 'first', 'base_vertex' if indexed else 'base_instance',
+              'base_instance' if indexed else None)
+
+    names = getattr(getattr(commands, 'dtype', None), 'names', None)
+
+    if names:
+        import numpy as np
+
+        res = np.zeros((len(commands), 5), dtype='i4')
+        res[:, 1] = 1
+
+        for index, field in enumerate(fields):
+            if field in names:
+                res[:, index] = commands[field]
+
+        return res.tobytes()
+
+    res = array('i')
+
+    for command in commands:
+        res.extend((tuple(command) + (0, 1, 0, 0, 0)[len(command):])[:5])
+
+    return res.tobytes()
+
+
+def _int32_array(values):
+    try:
+        view = memoryview(values)
+        if view.itemsize == 4 and view.format[-1] in 'il':
+            return values
+    except TypeError:
+        pass
+
+    return array('i', values)
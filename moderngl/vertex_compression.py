@@ -0,0 +1,308 @@
+'''
+    NumPy encoders for compressed vertex attributes.
+
+    The encoders quantize the vertex attributes into the normalized integer and packed buffer formats.
+    Each encoder returns the encoded array and its buffer format, the positions and the uvs
+    also return the offset and the scale to restore the original range in the vertex shader.
+    The decoders restore the values on the CPU, :py:func:`compression_report` uses them to measure the error.
+'''
+
+import numpy as np
+
+__all__ = ['encode_positions', 'encode_normals', 'encode_tangents', 'encode_uvs', 'encode_colors',
+           'decode_positions', 'decode_normals', 'decode_tangents', 'decode_uvs', 'decode_colors',
+           'compression_report']
+
+
+def _vectors(values, size, name):
+    values = np.asarray(values, dtype='f8')
+
+    if values.ndim != 2 or values.shape[1] not in size:
+        raise ValueError('the %s must be an array of shape (n, %s)' % (name, ' or '.join(str(x) for x in size)))
+
+    return values
+
+
+def _bounds(values):
+    offset = values.min(axis=0) if len(values) else np.zeros(values.shape[1])
+    scale = (values.max(axis=0) if len(values) else np.zeros(values.shape[1])) - offset
+    scale[scale == 0.0] = 1.0
+    return offset.astype('f4'), scale.astype('f4')
+
+
+def _unorm16(values, offset, scale):
+    return np.round(np.clip((values - offset) / scale, 0.0, 1.0) * 65535.0).astype('u2')
+
+
+def _snorm(values, bits):
+    limit = (1 << (bits - 1)) - 1
+    return np.round(np.clip(values, -1.0, 1.0) * limit).astype('i4')
+
+
+def _normalize(values):
+    length = np.linalg.norm(values, axis=1, keepdims=True)
+    length[length == 0.0] = 1.0
+    return values / length
+
+
+def encode_positions(positions) -> tuple:
+    '''
+        Quantize positions into normalized unsigned shorts relative to their bounding box.
+        The positions are restored in the vertex shader with ``offset + in_vert * scale``.
+
+        Args:
+            positions (array): An array of shape (n, 3).
+
+        Returns:
+            tuple: The ``(n, 4)`` array of ``u2``, the ``'3nu2 2x'`` format, the offset and the scale.
+    '''
+
+    positions = _vectors(positions, (3,), 'positions')
+    offset, scale = _bounds(positions)
+
+    data = np.zeros((len(positions), 4), dtype='u2')
+    data[:, :3] = _unorm16(positions, offset, scale)
+    return data, '3nu2 2x', offset, scale
+
+
+def decode_positions(data, offset, scale) -> np.ndarray:
+    '''
+        Restore the positions encoded by :py:func:`encode_positions`.
+
+        Returns:
+            array: An array of shape (n, 3).
+    '''
+
+    return np.asarray(offset, dtype='f8') + np.asarray(data)[:, :3] / 65535.0 * np.asarray(scale, dtype='f8')
+
+
+def encode_normals(normals) -> tuple:
+    '''
+        Encode unit normals with the octahedral mapping into two normalized shorts.
+        The normals are restored in the vertex shader with::
+
+            vec3 n = vec3(in_norm, 1.0 - abs(in_norm.x) - abs(in_norm.y));
+            n.xy = n.z < 0.0 ? (1.0 - abs(n.yx)) * sign(n.xy) : n.xy;
+            n = normalize(n);
+
+        Args:
+            normals (array): An array of shape (n, 3).
+
+        Returns:
+            tuple: The ``(n, 2)`` array of ``i2`` and the ``'2ni2'`` format.
+    '''
+
+    normals = _vectors(normals, (3,), 'normals')
+
+    norm = np.abs(normals).sum(axis=1, keepdims=True)
+    norm[norm == 0.0] = 1.0
+    octahedral = normals[:, :2] / norm
+
+    lower = normals[:, 2] < 0.0
+    sign = np.where(octahedral[lower] >= 0.0, 1.0, -1.0)
+    octahedral[lower] = (1.0 - np.abs(octahedral[lower][:, ::-1])) * sign
+
+    return _snorm(octahedral, 16).astype('i2'), '2ni2'
+
+
+def decode_normals(data) -> np.ndarray:
+    '''
+        Restore the normals encoded by :py:func:`encode_normals`.
+
+        Returns:
+            array: An array of shape (n, 3).
+    '''
+
+    octahedral = np.maximum(np.asarray(data, dtype='f8') / 32767.0, -1.0)
+
+    normals = np.empty((len(octahedral), 3))
+    normals[:, :2] = octahedral
+    normals[:, 2] = 1.0 - np.abs(octahedral).sum(axis=1)
+
+    lower = normals[:, 2] < 0.0
+    sign = np.where(octahedral[lower] >= 0.0, 1.0, -1.0)
+    normals[lower, :2] = (1.0 - np.abs(octahedral[lower][:, ::-1])) * sign
+
+    return _normalize(normals)
+
+
+def encode_tangents(tangents) -> tuple:
+    '''
+        Encode tangents into a single ``GL_INT_2_10_10_10_REV`` value.
+        The direction is stored in the 10 bit components and the handedness in the 2 bit component.
+        The tangents without a handedness are encoded with a positive one.
+
+        Args:
+            tangents (array): An array of shape (n, 3) or (n, 4).
+
+        Returns:
+            tuple: The ``(n,)`` array of ``u4`` and the ``'4ni10'`` format.
+    '''
+
+    tangents = _vectors(tangents, (3, 4), 'tangents')
+
+    xyz = _snorm(_normalize(tangents[:, :3]), 10).astype('i8') & 0x3ff
+    w = np.where(tangents[:, 3] < 0.0, -1, 1) if tangents.shape[1] == 4 else np.ones(len(tangents), dtype='i4')
+
+    data = xyz[:, 0] | (xyz[:, 1] << 10) | (xyz[:, 2] << 20) | ((w & 0x3) << 30)
+    return data.astype('u4'), '4ni10'
+
+
+def decode_tangents(data) -> np.ndarray:
+    '''
+        Restore the tangents encoded by :py:func:`encode_tangents`.
+
+        Returns:
+            array: An array of shape (n, 4).
+    '''
+
+    data = np.asarray(data, dtype='u4').astype('i8')
+
+    def component(shift, bits):
+        value = (data >> shift) & ((1 << bits) - 1)
+        value = np.where(value >= 1 << (bits - 1), value - (1 << bits), value)
+        return np.maximum(value / ((1 << (bits - 1)) - 1), -1.0)
+
+    tangents = np.empty((len(data), 4))
+    tangents[:, 0] = component(0, 10)
+    tangents[:, 1] = component(10, 10)
+    tangents[:, 2] = component(20, 10)
+    tangents[:, 3] = component(30, 2)
+    tangents[:, :3] = _normalize(tangents[:, :3])
+    return tangents
+
+
+def encode_uvs(uvs) -> tuple:
+    '''
+        Quantize texture coordinates into normalized unsigned shorts relative to their bounds.
+        The texture coordinates are restored in the vertex shader with ``offset + in_text * scale``.
+
+        Args:
+            uvs (array): An array of shape (n, 2).
+
+        Returns:
+            tuple: The ``(n, 2)`` array of ``u2``, the ``'2nu2'`` format, the offset and the scale.
+    '''
+
+    uvs = _vectors(uvs, (2,), 'uvs')
+    offset, scale = _bounds(uvs)
+    return _unorm16(uvs, offset, scale), '2nu2', offset, scale
+
+
+def decode_uvs(data, offset, scale) -> np.ndarray:
+    '''
+        Restore the texture coordinates encoded by :py:func:`encode_uvs`.
+
+        Returns:
+            array: An array of shape (n, 2).
+    '''
+
+    return np.asarray(offset, dtype='f8') + np.asarray(data) / 65535.0 * np.asarray(scale, dtype='f8')
+
+
+def encode_colors(colors) -> tuple:
+    '''
+        Encode non-negative RGB values, such as HDR colors, into a single ``GL_UNSIGNED_INT_10F_11F_11F_REV`` value.
+        The negative values are clamped to zero.
+
+        Args:
+            colors (array): An array of shape (n, 3).
+
+        Returns:
+            tuple: The ``(n,)`` array of ``u4`` and the ``'3f11'`` format.
+    '''
+
+    colors = _vectors(colors, (3,), 'colors')
+
+    # The clip keeps the sign of -0.0, the sign bit is cleared to encode it as zero.
+    half = np.clip(colors, 0.0, 65000.0).astype('f2').view('u2').astype('u4') & 0x7fff
+
+    red = np.minimum((half[:, 0] + 0x8) >> 4, 0x7bf)
+    green = np.minimum((half[:, 1] + 0x8) >> 4, 0x7bf)
+    blue = np.minimum((half[:, 2] + 0x10) >> 5, 0x3df)
+
+    return (red | (green << 11) | (blue << 22)).astype('u4'), '3f11'
+
+
+def decode_colors(data) -> np.ndarray:
+    '''
+        Restore the colors encoded by :py:func:`encode_colors`.
+
+        Returns:
+            array: An array of shape (n, 3).
+    '''
+
+    data = np.asarray(data, dtype='u4')
+
+    half = np.empty((len(data), 3), dtype='u2')
+    half[:, 0] = (data & 0x7ff) << 4
+    half[:, 1] = ((data >> 11) & 0x7ff) << 4
+    half[:, 2] = ((data >> 22) & 0x3ff) << 5
+
+    return half.view('f2').astype('f8')
+
+
+def _angle(original, decoded):
+    cosine = (_normalize(original) * _normalize(decoded)).sum(axis=1)
+    return np.degrees(np.arccos(np.clip(cosine, -1.0, 1.0)))
+
+
+def compression_report(*, positions=None, normals=None, tangents=None, uvs=None, colors=None) -> dict:
+    '''
+        Encode the given attributes and measure the error the encoding introduces.
+
+        The positions, uvs and colors report the distance from the original values,
+        the normals and the tangents report the angle from the original direction in degrees.
+
+        Keyword Args:
+            positions (array): An array of shape (n, 3).
+            normals (array): An array of shape (n, 3).
+            tangents (array): An array of shape (n, 3) or (n, 4).
+            uvs (array): An array of shape (n, 2).
+            colors (array): An array of shape (n, 3).
+
+        Returns:
+            dict: The ``format``, ``size``, ``original_size``, ``max_error`` and ``mean_error`` for each attribute.
+            The sizes are in bytes per vertex.
+    '''
+
+    def report(original, encoded, fmt, error):
+        return {
+            'format': fmt,
+            'size': encoded.itemsize * (encoded.size // max(len(encoded), 1)),
+            'original_size': 4 * original.shape[1],
+            'max_error': float(error.max()) if len(error) else 0.0,
+            'mean_error': float(error.mean()) if len(error) else 0.0,
+        }
+
+    res = {}
+
+    if positions is not None:
+        positions = _vectors(positions, (3,), 'positions')
+        data, fmt, offset, scale = encode_positions(positions)
+        error = np.linalg.norm(decode_positions(data, offset, scale) - positions, axis=1)
+        res['positions'] = report(positions, data, fmt, error)
+
+    if normals is not None:
+        normals = _vectors(normals, (3,), 'normals')
+        data, fmt = encode_normals(normals)
+        res['normals'] = report(normals, data, fmt, _angle(normals, decode_normals(data)))
+
+    if tangents is not None:
+        tangents = _vectors(tangents, (3, 4), 'tangents')
+        data, fmt = encode_tangents(tangents)
+        res['tangents'] = report(tangents, data, fmt, _angle(tangents[:, :3], decode_tangents(data)[:, :3]))
+
+    if uvs is not None:
+        uvs = _vectors(uvs, (2,), 'uvs')
+        data, fmt, offset, scale = encode_uvs(uvs)
+        error = np.linalg.norm(decode_uvs(data, offset, scale) - uvs, axis=1)
+        res['uvs'] = report(uvs, data, fmt, error)
+
+    if colors is not None:
+        colors = _vectors(colors, (3,), 'colors')
+        data, fmt = encode_colors(colors)
+        error = np.abs(decode_colors(data) - np.maximum(colors, 0.0)).max(axis=1)
+        res['colors'] = report(colors, data, fmt, error)
+
+    return res
@@ -95,8 +95,10 @@ mgl = Extension(
         'moderngl/old/Framebuffer.cpp',
         'moderngl/old/InvalidObject.cpp',
         'moderngl/old/ModernGL.cpp',
+        'moderngl/old/PipelineState.cpp',
         'moderngl/old/Program.cpp',
         'moderngl/old/Query.cpp',
+        'moderngl/old/Recorder.cpp',
         'moderngl/old/Renderbuffer.cpp',
         'moderngl/old/Scope.cpp',
         'moderngl/old/Texture.cpp',
@@ -13,3 +13,22 @@ def get_context() -> moderngl.Context:
         _static['context'] = ctx
 
     return ctx
+
+
+def reset_state(ctx: moderngl.Context) -> None:
+    ctx.state_cache = False
+    ctx.enable_only(moderngl.NOTHING)
+    ctx.wireframe = False
+    ctx.clear_samplers()
+
+
+class StateCacheMixin:
+    '''
+        Enables the state cache of the shared context for each test.
+        The enable flags, the wireframe mode and the samplers are reset after the test.
+    '''
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(reset_state, self.ctx)
+        self.ctx.state_cache = True
@@ -1,6 +1,8 @@
+import array
 import unittest
 
 import moderngl
+import numpy as np
 
 from common import get_context
 
@@ -21,6 +23,15 @@ class TestBuffer(unittest.TestCase):
         buf.clear(offset=1, size=18, chunk=b'AB')
         self.assertEqual(buf.read(), b'\xAAABABABABABABABABAB\x55')
 
+    def test_buffer_clear_value(self):
+        buf = self.ctx.buffer(reserve=48)
+        buf.clear(value=(1.0, 2.0, 3.0, 4.0))
+        self.assertEqual(buf.read(), array.array('f', [1.0, 2.0, 3.0, 4.0] * 3).tobytes())
+        buf.clear(8, offset=4, value=7, dtype='u4')
+        self.assertEqual(buf.read(12), array.array('f', [1.0]).tobytes() + array.array('I', [7, 7]).tobytes())
+        with self.assertRaises(ValueError):
+            buf.clear(value=1.0, chunk=b'AB')
+
     def test_buffer_create(self):
         buf = self.ctx.buffer(data=b'\xAA\x55' * 10)
         self.assertEqual(buf.read(), b'\xAA\x55' * 10)
@@ -54,6 +65,113 @@ class TestBuffer(unittest.TestCase):
         buf = self.ctx.buffer(reserve=1024)
         buf.orphan()
 
+    def test_buffer_write_ranges(self):
+        buf = self.ctx.buffer(b'.' * 12)
+        buf.write_ranges(b'ABxyz', [10, 2], [2, 3])
+        self.assertEqual(buf.read(), b'..xyz.....AB')
+
+    def test_buffer_read_ranges(self):
+        buf = self.ctx.buffer(b'Hello World!')
+        offsets = array.array('i', [6, 0, 11])
+        sizes = array.array('i', [5, 5, 1])
+        self.assertEqual(buf.read_ranges(offsets, sizes), b'WorldHello!')
+        res = bytearray(13)
+        buf.read_ranges_into(res, offsets, sizes, write_offset=2)
+        self.assertEqual(bytes(res), b'\x00\x00WorldHello!')
+
+    def test_buffer_ranges_errors(self):
+        buf = self.ctx.buffer(reserve=8)
+        with self.assertRaises(moderngl.Error):
+            buf.write_ranges(b'abc', [6], [3])
+        with self.assertRaises(moderngl.Error):
+            buf.write_ranges(b'abc', [0, 4], [3])
+        with self.assertRaises(moderngl.Error):
+            buf.write_ranges(b'abc', [0], [2])
+
+    def test_buffer_immutable(self):
+        if self.ctx.version_code < 440:
+            self.skipTest('OpenGL 4.4 is not supported')
+
+        buf = self.ctx.buffer(b'abcd', immutable=True, flags=moderngl.MAP_READ)
+        self.assertTrue(buf.immutable)
+        self.assertEqual(buf.flags, moderngl.MAP_READ)
+        self.assertEqual(buf.read(), b'abcd')
+        with self.assertRaises(moderngl.Error):
+            buf.write(b'xyzw')
+        with self.assertRaises(moderngl.Error):
+            buf.orphan()
+
+    def test_buffer_immutable_persistent(self):
+        if self.ctx.version_code < 440:
+            self.skipTest('OpenGL 4.4 is not supported')
+
+        flags = moderngl.MAP_WRITE | moderngl.MAP_PERSISTENT | moderngl.MAP_COHERENT | moderngl.DYNAMIC_STORAGE
+        buf = self.ctx.buffer(reserve=4, immutable=True, flags=flags)
+        buf.write(b'abcd')
+        with self.assertRaises(moderngl.Error):
+            buf.read()
+        with self.assertRaises(moderngl.Error):
+            self.ctx.buffer(reserve=4, immutable=True, flags=moderngl.MAP_COHERENT)
+
+    def test_buffer_persistent_synchronized(self):
+        if self.ctx.version_code < 440:
+            self.skipTest('OpenGL 4.4 is not supported')
+
+        flags = moderngl.MAP_READ | moderngl.MAP_WRITE | moderngl.MAP_PERSISTENT
+        buf = self.ctx.buffer(reserve=4, immutable=True, flags=flags)
+        res = self.ctx.buffer(reserve=4)
+
+        buf.write(b'abcd')
+        self.ctx.copy_buffer(res, buf)
+        self.assertEqual(res.read(), b'abcd')
+
+        self.ctx.copy_buffer(buf, self.ctx.buffer(b'wxyz'))
+        self.assertEqual(buf.read(), b'wxyz')
+
+    def test_buffer_map_read(self):
+        buf = self.ctx.buffer(b'Hello World!')
+        with buf.map(6, 5, write=False) as view:
+            self.assertTrue(view.readonly)
+            self.assertEqual(bytes(view), b'World')
+
+    def test_buffer_map_write(self):
+        buf = self.ctx.buffer(b'Hello World!')
+        with buf.map(0, 5, read=False, invalidate=True) as view:
+            view[:] = b'HELLO'
+        self.assertEqual(buf.read(), b'HELLO World!')
+
+    def test_buffer_map_exported_views(self):
+        buf = self.ctx.buffer(b'Hello World!')
+        with buf.map() as view:
+            exported = np.frombuffer(view, dtype='u1')
+            exported[:5] = np.frombuffer(b'HELLO', dtype='u1')
+
+        self.assertEqual(exported.tobytes(), b'HELLO World!')
+
+        with self.assertRaises(moderngl.Error):
+            with buf.map():
+                pass
+
+        del exported
+        self.assertEqual(buf.read(), b'HELLO World!')
+
+        with self.assertRaises(ZeroDivisionError):
+            with buf.map() as view:
+                exported = np.frombuffer(view, dtype='u1')
+                1 / 0
+
+        del exported
+        self.assertEqual(buf.read(), b'HELLO World!')
+
+    def test_buffer_map_errors(self):
+        buf = self.ctx.buffer(reserve=16)
+        with self.assertRaises(moderngl.Error):
+            with buf.map(8, 16):
+                pass
+        with self.assertRaises(moderngl.Error):
+            with buf.map(invalidate=True):
+                pass
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,93 @@
+import struct
+import unittest
+
+import moderngl
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def test_alloc_free(self):
+        arena = self.ctx.buffer_arena(64, alignment=8)
+        a = arena.alloc(10)
+        b = arena.alloc(10)
+        self.assertEqual((a.offset, b.offset), (0, 16))
+        self.assertIs(a.buffer, b.buffer)
+        a.free()
+        c = arena.alloc(4)
+        self.assertEqual(c.offset, 0)
+        self.assertEqual(arena.stats['used'], 14)
+        self.assertEqual(arena.stats['high_water'], 20)
+        with self.assertRaises(moderngl.Error):
+            a.free()
+        arena.release()
+
+    def test_coalesce(self):
+        arena = self.ctx.buffer_arena(48, alignment=16)
+        blocks = [arena.alloc(16) for _ in range(3)]
+        blocks[0].free()
+        blocks[2].free()
+        self.assertAlmostEqual(arena.stats['fragmentation'], 0.5)
+        blocks[1].free()
+        self.assertEqual(arena.stats['largest_free'], 48)
+        self.assertEqual(arena.stats['fragmentation'], 0.0)
+        arena.release()
+
+    def test_new_page(self):
+        arena = self.ctx.buffer_arena(32)
+        a = arena.alloc(32)
+        b = arena.alloc(16)
+        self.assertIsNot(a.buffer, b.buffer)
+        self.assertEqual(arena.stats['buffers'], 2)
+        with self.assertRaises(moderngl.Error):
+            arena.alloc(33)
+        arena.release()
+
+    def test_defragment(self):
+        arena = self.ctx.buffer_arena(64, alignment=4)
+        a = arena.alloc(8)
+        b = arena.alloc(8)
+        c = arena.alloc(8)
+        b.write(b'bbbbbbbb')
+        c.write(b'cccccccc')
+        a.free()
+        self.assertEqual(arena.defragment(), [b, c])
+        self.assertEqual((b.offset, c.offset), (0, 8))
+        self.assertEqual(b.read() + c.read(), b'bbbbbbbbcccccccc')
+        self.assertEqual(arena.stats['largest_free'], 48)
+        arena.release()
+
+    def test_vertex_array(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                in float in_value;
+                out float out_value;
+                void main() {
+                    out_value = in_value * 2.0;
+                }
+            ''',
+            varyings=['out_value'],
+        )
+
+        arena = self.ctx.buffer_arena(256)
+        arena.alloc(20)
+        vbo = arena.alloc(12)
+        vbo.write(struct.pack('3f', 1.0, 2.0, 3.0))
+        ibo = arena.alloc(8, alignment=4)
+        ibo.write(struct.pack('2i', 2, 0))
+
+        res = self.ctx.buffer(reserve=8)
+        vao = self.ctx.vertex_array(prog, [(vbo, 'f', 'in_value')], ibo)
+        self.assertEqual(vao.vertices, 2)
+        vao.transform(res, moderngl.POINTS)
+        self.assertEqual(struct.unpack('2f', res.read()), (6.0, 2.0))
+        arena.release()
+
+
+if __name__ == '__main__':
+    unittest.main()
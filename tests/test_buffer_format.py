@@ -12,6 +12,9 @@ GL_UNSIGNED_INT = 0x1405
 GL_FLOAT = 0x1406
 GL_DOUBLE = 0x140A
 GL_HALF_FLOAT = 0x140B
+GL_UNSIGNED_INT_2_10_10_10_REV = 0x8368
+GL_UNSIGNED_INT_10F_11F_11F_REV = 0x8C3B
+GL_INT_2_10_10_10_REV = 0x8D9F
 
 
 class TestBuffer(unittest.TestCase):
@@ -104,6 +107,19 @@ class TestBuffer(unittest.TestCase):
         self.check('2f 2x4/i', (16, 1, 1, True, ((8, 2, GL_FLOAT, False), (8, 2, 0, False))))
         self.check('2f 2x4 /i', (16, 1, 1, True, ((8, 2, GL_FLOAT, False), (8, 2, 0, False))))
 
+    def test_format_8(self):
+        self.check('2ni2', (4, 1, 0, True, ((4, 2, GL_SHORT, True),)))
+        self.check('4nu1 3nu2 2x', (12, 2, 0, True, ((4, 4, GL_UNSIGNED_BYTE, True), (6, 3, GL_UNSIGNED_SHORT, True), (2, 2, 0, False))))
+        self.check('2nf2', (0, 0, 0, False, ()))
+        self.check('2n', (0, 0, 0, False, ()))
+
+    def test_format_9(self):
+        self.check('4ni10', (4, 1, 0, True, ((4, 4, GL_INT_2_10_10_10_REV, True),)))
+        self.check('4u10/i', (4, 1, 1, True, ((4, 4, GL_UNSIGNED_INT_2_10_10_10_REV, False),)))
+        self.check('3f 3f11', (16, 2, 0, True, ((12, 3, GL_FLOAT, False), (4, 3, GL_UNSIGNED_INT_10F_11F_11F_REV, False))))
+        self.check('3i10', (0, 0, 0, False, ()))
+        self.check('4f11', (0, 0, 0, False, ()))
+
 
 if __name__ == '__main__':
     unittest.main()
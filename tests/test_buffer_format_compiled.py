@@ -0,0 +1,73 @@
+import struct
+import unittest
+
+import moderngl
+import numpy as np
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+        cls.prog = cls.ctx.program(
+            vertex_shader='''
+                #version 330
+                in vec2 in_pos;
+                in float in_scale;
+                out vec2 out_pos;
+                void main() {
+                    out_pos = in_pos * in_scale;
+                }
+            ''',
+            varyings=['out_pos'],
+        )
+
+    def test_buffer_format(self):
+        fmt = moderngl.buffer_format('2f 4x 1f /i')
+        self.assertIs(moderngl.buffer_format('2f 4x 1f /i'), fmt)
+        self.assertIs(moderngl.buffer_format(fmt), fmt)
+        self.assertEqual((fmt.size, fmt.nodes, fmt.divisor), (16, 2, 1))
+        self.assertEqual(fmt.names, ())
+
+        with self.assertRaises(moderngl.Error):
+            moderngl.buffer_format('2f 3')
+
+        with self.assertRaises(TypeError):
+            moderngl.BufferFormat()
+
+    def test_dtype_format(self):
+        vertex = np.dtype({'names': ['in_scale', 'in_pos'], 'formats': ['f4', ('f4', 2)], 'offsets': [12, 0], 'itemsize': 20})
+        self.assertEqual(moderngl.dtype_format(vertex), ('2f4 4x 1f4 4x', ('in_pos', 'in_scale')))
+
+        fmt = moderngl.buffer_format(vertex)
+        self.assertIs(moderngl.buffer_format(vertex), fmt)
+        self.assertEqual((fmt.size, fmt.nodes), (20, 2))
+
+        with self.assertRaises(ValueError):
+            moderngl.dtype_format(np.dtype('f4'))
+
+        with self.assertRaises(ValueError):
+            moderngl.dtype_format(np.dtype([('in_pos', 'f4', 2), ('in_id', 'i8')]))
+
+    def test_vertex_array_with_dtype(self):
+        vertex = np.dtype([('in_pos', 'f4', 2), ('in_scale', 'f4')])
+        vertices = np.array([((1.0, 2.0), 2.0), ((3.0, 4.0), 0.5)], dtype=vertex)
+
+        vbo = self.ctx.buffer(vertices.tobytes())
+        res = self.ctx.buffer(reserve=16)
+
+        vao = self.ctx.vertex_array(self.prog, [(vbo, vertices.dtype)])
+        vao.transform(res, moderngl.POINTS)
+        self.assertEqual(struct.unpack('4f', res.read()), (2.0, 4.0, 1.5, 2.0))
+
+        fmt = moderngl.buffer_format('2f 1f')
+        vao = self.ctx.vertex_array(self.prog, [(vbo, fmt, 'in_pos', 'in_scale')])
+        vao.transform(res, moderngl.POINTS)
+        self.assertEqual(struct.unpack('4f', res.read()), (2.0, 4.0, 1.5, 2.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -43,6 +43,21 @@ class TestCase(unittest.TestCase):
     def test_buffer_docs(self):
         self.validate('buffer.rst', 'Buffer', ['release', 'mglo', 'glo', 'ctx'])
 
+    def test_buffer_arena_docs(self):
+        self.validate('buffer_arena.rst', 'BufferArena', ['ctx'])
+
+    def test_buffer_block_docs(self):
+        self.validate('buffer_arena.rst', 'BufferBlock', [])
+
+    def test_buffer_format_docs(self):
+        self.validate('buffer_format.rst', 'BufferFormat', ['mglo'])
+
+    def test_multi_buffer_docs(self):
+        self.validate('multi_buffer.rst', 'MultiBuffer', ['release', 'bind', 'ctx'])
+
+    def test_stream_buffer_docs(self):
+        self.validate('stream_buffer.rst', 'StreamBuffer', ['release', 'ctx'])
+
     def test_texture_docs(self):
         self.validate('texture.rst', 'Texture', ['release', 'mglo', 'glo', 'ctx'])
 
@@ -64,9 +79,21 @@ class TestCase(unittest.TestCase):
     def test_query_docs(self):
         self.validate('query.rst', 'Query', ['mglo', 'ctx'])
 
+    def test_readback_docs(self):
+        self.validate('readback.rst', 'Readback', ['ctx'])
+
+    def test_recorder_docs(self):
+        self.validate('recorder.rst', 'Recorder', ['ctx'])
+
+    def test_draw_stats_docs(self):
+        self.validate('draw_stats.rst', 'DrawStats', ['ctx'])
+
     def test_scope_docs(self):
         self.validate('scope.rst', 'Scope', ['mglo', 'ctx'])
 
+    def test_pipeline_state_docs(self):
+        self.validate('pipeline_state.rst', 'PipelineState', ['mglo', 'ctx'])
+
     def test_compute_shader_docs(self):
         self.validate('compute_shader.rst', 'ComputeShader', ['release', 'mglo', 'glo', 'ctx'])
 
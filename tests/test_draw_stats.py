@@ -0,0 +1,75 @@
+import struct
+import unittest
+
+import moderngl
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+        cls.prog = cls.ctx.program(
+            vertex_shader='''
+                #version 330
+                in vec2 in_vert;
+                out vec2 out_vert;
+                void main() {
+                    out_vert = in_vert;
+                }
+            ''',
+            varyings=['out_vert'],
+        )
+        cls.vbo = cls.ctx.buffer(struct.pack('6f', 0.0, 0.0, 1.0, 0.0, 0.0, 1.0))
+
+    def tearDown(self):
+        self.ctx.stats.enabled = False
+
+    def test_disabled(self):
+        vao = self.ctx.simple_vertex_array(self.prog, self.vbo, 'in_vert')
+        self.ctx.stats.reset()
+        vao.render(moderngl.TRIANGLES)
+        self.assertFalse(self.ctx.stats.enabled)
+        self.assertEqual(self.ctx.stats.snapshot()['draw_calls'], 0)
+        self.assertEqual(vao.stats['draw_calls'], 0)
+
+    def test_counters(self):
+        vao1 = self.ctx.simple_vertex_array(self.prog, self.vbo, 'in_vert')
+        vao2 = self.ctx.simple_vertex_array(self.prog, self.vbo, 'in_vert')
+        res = self.ctx.buffer(reserve=24)
+
+        self.ctx.stats.enabled = True
+        self.ctx.stats.reset()
+
+        vao1.render(moderngl.TRIANGLES, instances=4)
+        vao1.render(moderngl.TRIANGLES)
+        vao2.transform(res, moderngl.POINTS)
+
+        stats = self.ctx.stats.snapshot()
+        self.assertEqual(stats['draw_calls'], 2)
+        self.assertEqual(stats['vertices'], 18)
+        self.assertEqual(stats['instances'], 6)
+        self.assertEqual(stats['transform_calls'], 1)
+        self.assertGreater(stats['state_binds'], 0)
+
+        self.assertEqual(vao1.stats['draw_calls'], 2)
+        self.assertEqual(vao1.stats['vertices'], 15)
+        self.assertEqual(vao2.stats['transform_calls'], 1)
+
+        self.ctx.stats.reset()
+        self.assertEqual(set(self.ctx.stats.snapshot().values()), {0})
+        self.assertEqual(set(vao1.stats.values()), {0})
+
+        vao2.render(moderngl.TRIANGLES)
+        self.assertEqual(vao2.stats['draw_calls'], 1)
+        self.assertEqual(vao1.stats['draw_calls'], 0)
+
+    def test_create(self):
+        with self.assertRaises(TypeError):
+            moderngl.DrawStats()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def test_memory_info(self):
+        before = self.ctx.memory_info()
+
+        buf = self.ctx.buffer(reserve=1000)
+        tex = self.ctx.texture((16, 16), 4)
+        rbo = self.ctx.renderbuffer((8, 8), 4, dtype='f4')
+
+        info = self.ctx.memory_info(largest=1)
+        self.assertEqual(info['size'] - before['size'], 1000 + 1024 + 1024)
+        self.assertEqual(info['objects'] - before['objects'], 3)
+        self.assertEqual(info['types']['Buffer']['size'] - before['types']['Buffer']['size'], 1000)
+        self.assertEqual(len(info['largest']), 1)
+
+        tex.build_mipmaps()
+        info = self.ctx.memory_info()
+        self.assertEqual(info['types']['Texture']['size'] - before['types']['Texture']['size'],
+                         4 * (256 + 64 + 16 + 4 + 1))
+
+        buf.release()
+        tex.release()
+        rbo.release()
+        self.assertEqual(self.ctx.memory_info()['size'], before['size'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import struct
+import unittest
+
+import moderngl
+import numpy as np
+
+from moderngl import mesh_optimizer
+
+
+def grid(size):
+    y, x = np.mgrid[0:size, 0:size]
+    v = (y * (size + 1) + x).ravel()
+    triangles = np.stack([v, v + 1, v + size + 1, v + 1, v + size + 2, v + size + 1], axis=1).reshape(-1, 3)
+    positions = np.c_[np.mgrid[0:size + 1, 0:size + 1].reshape(2, -1).T, np.zeros((size + 1) ** 2)]
+    return triangles, positions
+
+
+def sorted_triangles(indices):
+    triangles = np.asarray(indices).reshape(-1, 3)
+    rotation = np.argmin(triangles, axis=1)
+    rotated = np.stack([np.roll(triangle, -r) for triangle, r in zip(triangles, rotation)])
+    return sorted(map(tuple, rotated.tolist()))
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        triangles, self.positions = grid(32)
+        rng = np.random.RandomState(0)
+        self.triangles = triangles
+        self.indices = triangles[rng.permutation(len(triangles))].ravel()
+
+    def test_vertex_cache(self):
+        optimized = mesh_optimizer.optimize_vertex_cache(self.indices)
+        self.assertEqual(sorted_triangles(optimized), sorted_triangles(self.indices))
+        self.assertGreater(mesh_optimizer.cache_miss_ratio(self.indices), 2.5)
+        self.assertLess(mesh_optimizer.cache_miss_ratio(optimized), 0.8)
+
+        with self.assertRaises(ValueError):
+            mesh_optimizer.optimize_vertex_cache([0, 1])
+
+    def test_overdraw(self):
+        optimized = mesh_optimizer.optimize_vertex_cache(self.indices)
+        reordered = mesh_optimizer.optimize_overdraw(optimized, self.positions, threshold=1.05)
+        self.assertEqual(sorted_triangles(reordered), sorted_triangles(self.indices))
+        self.assertLessEqual(mesh_optimizer.cache_miss_ratio(reordered), mesh_optimizer.cache_miss_ratio(optimized) * 1.2)
+
+    def test_vertex_fetch(self):
+        vertices = np.arange(8, dtype='f4').reshape(4, 2)
+        indices, reordered = mesh_optimizer.optimize_vertex_fetch([2, 0, 3, 3, 0, 2], vertices)
+        np.testing.assert_equal(indices, [0, 1, 2, 2, 1, 0])
+        np.testing.assert_equal(reordered, vertices[[2, 0, 3]])
+
+    def test_pack_indices(self):
+        self.assertEqual(mesh_optimizer.index_element_size(256), 1)
+        self.assertEqual(mesh_optimizer.index_element_size(257), 2)
+        self.assertEqual(mesh_optimizer.index_element_size(65537), 4)
+
+        indices, element_size = mesh_optimizer.pack_indices([0, 1, 300])
+        self.assertEqual((indices.dtype, element_size), (np.dtype('u2'), 2))
+
+        with self.assertRaises(ValueError):
+            mesh_optimizer.pack_indices([0, 1, 2], vertex_count=2)
+
+    def test_triangle_strips(self):
+        strips, element_size = mesh_optimizer.triangle_strips(self.triangles)
+        self.assertEqual((strips.dtype, element_size), (np.dtype('u2'), 2))
+        self.assertLess(len(strips), len(self.triangles) * 3 // 2)
+
+        triangles = []
+        for strip in np.split(strips.astype('i8'), np.where(strips == 0xFFFF)[0]):
+            strip = strip[strip != 0xFFFF]
+            for i in range(len(strip) - 2):
+                a, b, c = strip[i:i + 3]
+                triangles.extend((a, b, c) if i % 2 == 0 else (b, a, c))
+
+        self.assertEqual(sorted_triangles(triangles), sorted_triangles(self.triangles))
+
+        strips, element_size = mesh_optimizer.triangle_strips([0, 1, 2, 2, 2, 3], vertex_count=256)
+        np.testing.assert_equal(strips, [0, 1, 2])
+        self.assertEqual(element_size, 2)
+
+    def test_optimize_mesh(self):
+        vertex = np.dtype([('in_vert', 'f4', 3), ('in_id', 'i4')])
+        vertices = np.zeros(len(self.positions), dtype=vertex)
+        vertices['in_vert'] = self.positions
+        vertices['in_id'] = np.arange(len(vertices))
+
+        result, indices, element_size = mesh_optimizer.optimize_mesh(vertices, self.indices, self.positions)
+        self.assertEqual((indices.dtype, element_size), (np.dtype('u2'), 2))
+        self.assertLess(mesh_optimizer.cache_miss_ratio(indices), 0.8)
+        self.assertEqual(sorted_triangles(result['in_id'][indices]), sorted_triangles(self.indices))
+
+    def test_weld_vertices(self):
+        quad = [(0, 0, 0, 0, 0), (1, 0, 0, 1, 0), (1, 1, 0, 1, 1), (1e-6, 0, 0, 0, 0), (1, 1, 0, 1, 1), (0, 1, 0, 0, 1)]
+        data = b''.join(struct.pack('3f2f', *vertex) for vertex in quad)
+
+        vertices, indices = mesh_optimizer.weld_vertices(data, '3f 2f')
+        self.assertEqual(len(vertices), 5)
+        np.testing.assert_equal(indices, [0, 1, 2, 3, 2, 4])
+
+        vertices, indices = mesh_optimizer.weld_vertices(data, '3f 2f', tolerance=1e-4)
+        self.assertEqual(len(vertices), 4)
+        np.testing.assert_equal(indices, [0, 1, 2, 0, 2, 3])
+        np.testing.assert_equal(vertices['f1'][indices], np.array(quad, dtype='f4')[:, 3:])
+
+        with self.assertRaises(ValueError):
+            mesh_optimizer.weld_vertices(data[:-4], '3f 2f')
+
+        with self.assertRaises(ValueError):
+            mesh_optimizer.weld_vertices(data, '3i 2f', tolerance=1e-4)
+
+    def test_weld_ignores_padding(self):
+        data = struct.pack('2f4B2f4B', 1.0, 2.0, 1, 2, 3, 4, 1.0, 2.0, 5, 6, 7, 8)
+        vertices, indices = mesh_optimizer.weld_vertices(data, '2f 4x')
+        self.assertEqual(len(vertices), 1)
+        self.assertEqual(vertices.dtype, moderngl.format_dtype('2f 4x'))
+
+
+if __name__ == '__main__':
+    unittest.main()
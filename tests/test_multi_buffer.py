@@ -0,0 +1,109 @@
+import struct
+import unittest
+
+import moderngl
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def test_rotate(self):
+        multi = self.ctx.multi_buffer(b'abcd', frames=2)
+        self.assertEqual(multi.frames, 2)
+        self.assertEqual(multi.size, 4)
+        multi.write(b'xy')
+        self.assertEqual(multi.read(), b'xycd')
+        multi.next_frame()
+        self.assertEqual(multi.frame, 1)
+        self.assertEqual(multi.read(), b'abcd')
+        multi.write(b'zw', offset=2)
+        multi.next_frame(copy=True)
+        self.assertEqual(multi.frame, 0)
+        self.assertEqual(multi.buffer.read(), b'abzw')
+        multi.release()
+
+    def test_vertex_array(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                in float in_value;
+                out float out_value;
+                void main() {
+                    out_value = in_value * 2.0;
+                }
+            ''',
+            varyings=['out_value'],
+        )
+
+        multi = self.ctx.multi_buffer(reserve=8, frames=3)
+        res = self.ctx.buffer(reserve=8)
+        vao = self.ctx.vertex_array(prog, [(multi, 'f', 'in_value')])
+        self.assertIs(vao.multi_buffer, multi)
+
+        for i in range(5):
+            multi.write(struct.pack('2f', i, i + 1))
+            vao.transform(res, moderngl.POINTS)
+            self.assertEqual(struct.unpack('2f', res.read()), (i * 2.0, i * 2.0 + 2.0))
+            multi.next_frame()
+
+        multi.release()
+
+    def test_write_while_draw_pending(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                uniform int loops;
+                in float in_value;
+                out float out_value;
+                void main() {
+                    // Keeps the draw busy so that it is still pending when the data is overwritten.
+                    float value = in_value;
+                    for (int i = 0; i < loops; ++i) {
+                        value = sqrt(value * value);
+                    }
+                    out_value = value * 2.0;
+                }
+            ''',
+            varyings=['out_value'],
+        )
+        prog['loops'].value = 64
+
+        values = [float(i % 1024) for i in range(1 << 16)]
+        fmt = '%df' % len(values)
+
+        multi = self.ctx.multi_buffer(struct.pack(fmt, *values), frames=2)
+        res = self.ctx.buffer(reserve=len(values) * 4)
+        vao = self.ctx.vertex_array(prog, [(multi, 'f', 'in_value')])
+
+        vao.transform(res, moderngl.POINTS)
+        multi.write(bytes(len(values) * 4))
+        self.assertEqual(struct.unpack(fmt, res.read()), tuple(x * 2.0 for x in values))
+        multi.release()
+
+    def test_single_multi_buffer(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                in float a;
+                in float b;
+                out float c;
+                void main() {
+                    c = a + b;
+                }
+            ''',
+            varyings=['c'],
+        )
+
+        a = self.ctx.multi_buffer(reserve=8)
+        b = self.ctx.multi_buffer(reserve=8)
+
+        with self.assertRaises(ValueError):
+            self.ctx.vertex_array(prog, [(a, 'f', 'a'), (b, 'f', 'b')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import moderngl
+from common import StateCacheMixin, get_context
+
+
+class TestCase(StateCacheMixin, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def test_pipeline_state_use(self):
+        opaque = self.ctx.pipeline_state(enable=moderngl.DEPTH_TEST | moderngl.CULL_FACE, depth_func='<', cull_face='back')
+        transparent = self.ctx.pipeline_state(
+            enable=moderngl.DEPTH_TEST | moderngl.BLEND,
+            blend_func=(moderngl.SRC_ALPHA, moderngl.ONE),
+            depth_func='<=',
+            wireframe=True,
+        )
+
+        transparent.use()
+        self.assertEqual(self.ctx.mglo.depth_func, '<=')
+        self.assertEqual(self.ctx.mglo.blend_func, (moderngl.SRC_ALPHA, moderngl.ONE))
+        self.assertTrue(self.ctx.wireframe)
+
+        opaque.use()
+        self.assertEqual(self.ctx.mglo.depth_func, '<')
+        self.assertTrue(self.ctx.wireframe)
+
+        self.ctx.reset_state_stats()
+        opaque.use()
+        self.assertEqual(self.ctx.state_stats['issued'], 0)
+
+    def test_pipeline_state_errors(self):
+        with self.assertRaises(moderngl.Error):
+            self.ctx.pipeline_state(depth_func='=>')
+
+        with self.assertRaises(moderngl.Error):
+            self.ctx.pipeline_state(cull_face='left')
+
+        with self.assertRaises(moderngl.Error):
+            self.ctx.pipeline_state(front_face='left')
+
+        with self.assertRaises(moderngl.Error):
+            self.ctx.pipeline_state(blend_func=(moderngl.SRC_ALPHA, moderngl.DEPTH_TEST))
+
+        with self.assertRaises(moderngl.Error):
+            self.ctx.pipeline_state(blend_func=(-1, moderngl.ONE))
+
+        with self.assertRaises(TypeError):
+            moderngl.PipelineState()
+
+
+if __name__ == '__main__':
+    unittest.main()
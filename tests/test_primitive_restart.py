@@ -0,0 +1,80 @@
+import struct
+import unittest
+
+import moderngl
+import numpy as np
+
+from common import StateCacheMixin, get_context
+
+
+class TestCase(StateCacheMixin, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+        cls.prog = cls.ctx.program(
+            vertex_shader='''
+                #version 330
+                in float in_value;
+                out float out_value;
+                void main() {
+                    out_value = in_value;
+                }
+            ''',
+            varyings=['out_value'],
+        )
+        cls.vbo = cls.ctx.buffer(np.array([1.0, 2.0, 3.0], dtype='f4').tobytes())
+        cls.ibo = cls.ctx.buffer(np.array([0, 1, 0xFF, 2], dtype='u1').tobytes())
+        cls.fbo = cls.ctx.simple_framebuffer((4, 4))
+
+    def transform(self, vao):
+        res = self.ctx.buffer(struct.pack('4f', -1.0, -1.0, -1.0, -1.0))
+        vao.transform(res, moderngl.POINTS)
+        return struct.unpack('4f', res.read())
+
+    def test_restart_index(self):
+        vao = self.ctx.vertex_array(self.prog, [(self.vbo, '1f', 'in_value')], self.ibo, index_element_size=1)
+        self.assertIsNone(vao.primitive_restart)
+        self.assertEqual(vao.restart_index, 0xFF)
+
+        vao.restart_index = 0
+        self.assertEqual(vao.restart_index, 0)
+
+        vao.restart_index = -1
+        self.assertEqual(vao.restart_index, 0xFF)
+
+        with self.assertRaises(ValueError):
+            vao.restart_index = 0x100
+
+    def test_vertex_array_primitive_restart(self):
+        vao = self.ctx.vertex_array(self.prog, [(self.vbo, '1f', 'in_value')], self.ibo, index_element_size=1)
+        vao.primitive_restart = True
+        self.assertEqual(self.transform(vao), (1.0, 2.0, 3.0, -1.0))
+
+    def test_vertex_array_restores_primitive_restart(self):
+        vao = self.ctx.vertex_array(self.prog, [(self.vbo, '1f', 'in_value')], self.ibo, index_element_size=1)
+        vao.primitive_restart = True
+        self.transform(vao)
+
+        vbo = self.ctx.buffer(np.arange(256, dtype='f4').tobytes())
+        ibo = self.ctx.buffer(np.array([0, 0xFF, 2], dtype='u4').tobytes())
+        other = self.ctx.vertex_array(self.prog, [(vbo, '1f', 'in_value')], ibo, index_element_size=4)
+        self.assertEqual(self.transform(other), (0.0, 255.0, 2.0, -1.0))
+
+    def test_scope_primitive_restart(self):
+        vao = self.ctx.vertex_array(self.prog, [(self.vbo, '1f', 'in_value')], self.ibo, index_element_size=1)
+
+        with self.ctx.scope(self.fbo, primitive_restart=True, restart_index=0xFF):
+            self.assertEqual(self.transform(vao), (1.0, 2.0, 3.0, -1.0))
+
+        scope = self.ctx.scope(self.fbo, primitive_restart=True)
+        self.ctx.reset_state_stats()
+
+        with scope:
+            pass
+
+        self.assertEqual(self.ctx.state_stats['issued'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
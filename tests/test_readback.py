@@ -0,0 +1,45 @@
+import unittest
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def test_buffer_read_async(self):
+        buf = self.ctx.buffer(b'Hello World!')
+        readback = buf.read_async(5, 6)
+        self.assertTrue(readback.wait())
+        self.assertTrue(readback.ready())
+        self.assertEqual(readback.result(), b'World')
+
+    def test_buffer_read_async_staging(self):
+        buf = self.ctx.buffer(b'Hello World!')
+        staging = self.ctx.buffer(reserve=16)
+        readback = buf.read_async(5, buffer=staging, write_offset=4)
+        res = bytearray(7)
+        readback.result_into(res, write_offset=2)
+        self.assertEqual(bytes(res), b'\x00\x00Hello')
+        self.assertEqual(staging.read(5, offset=4), b'Hello')
+
+    def test_framebuffer_read_async(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+        fbo.use()
+        fbo.clear(1.0, 0.0, 0.0, 1.0)
+        readback = fbo.read_async(components=4)
+        self.assertEqual(readback.size, 64)
+        self.assertEqual(readback.result(), b'\xff\x00\x00\xff' * 16)
+        self.assertEqual(fbo.read(components=4), b'\xff\x00\x00\xff' * 16)
+
+    def test_texture_read_async(self):
+        tex = self.ctx.texture((3, 2), 3, b'123456789abcdefghi')
+        readback = tex.read_async()
+        self.assertEqual(readback.size, 18)
+        self.assertEqual(readback.result(), b'123456789abcdefghi')
+
+
+if __name__ == '__main__':
+    unittest.main()
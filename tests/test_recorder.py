@@ -0,0 +1,67 @@
+import struct
+import unittest
+
+import moderngl
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def test_replay_clear(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+        fbo.use()
+
+        with self.ctx.recorder:
+            fbo.clear(1.0, 0.0, 0.0, 1.0)
+
+        bytecode = self.ctx.recorder.dump()
+        fbo.clear(0.0, 0.0, 0.0, 0.0)
+        self.ctx.replay(bytecode)
+        self.assertEqual(fbo.read(components=4), b'\xff\x00\x00\xff' * 16)
+
+    def test_replay_uniform_and_transform(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                uniform float scale;
+                in float in_value;
+                out float out_value;
+                void main() {
+                    out_value = in_value * scale;
+                }
+            ''',
+            varyings=['out_value'],
+        )
+
+        vbo = self.ctx.buffer(struct.pack('3f', 1.0, 2.0, 3.0))
+        res = self.ctx.buffer(reserve=12)
+        vao = self.ctx.simple_vertex_array(prog, vbo, 'in_value')
+
+        with self.ctx.recorder:
+            prog['scale'].value = 2.0
+            vao.transform(res, moderngl.POINTS)
+
+        bytecode = self.ctx.recorder.dump()
+        self.assertEqual(struct.unpack('3f', res.read()), (2.0, 4.0, 6.0))
+
+        prog['scale'].value = 3.0
+        res.clear()
+        self.ctx.replay(bytecode)
+        self.assertEqual(struct.unpack('3f', res.read()), (2.0, 4.0, 6.0))
+        self.assertEqual(prog['scale'].value, 2.0)
+
+    def test_errors(self):
+        with self.assertRaises(moderngl.Error):
+            self.ctx.replay(b'1234')
+
+        with self.ctx.recorder:
+            with self.assertRaises(moderngl.Error):
+                self.ctx.mglo.begin_recording()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import gc
+import unittest
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def tearDown(self):
+        self.ctx.gc_mode = None
+        self.ctx.gc()
+
+    def test_release_many(self):
+        before = self.ctx.memory_info()['objects']
+        buf = self.ctx.buffer(reserve=16)
+        tex = self.ctx.texture((4, 4), 4)
+        rbo = self.ctx.renderbuffer((4, 4))
+        sampler = self.ctx.sampler()
+        self.ctx.release_many([buf, tex, rbo, sampler, buf])
+        self.assertEqual(self.ctx.memory_info()['objects'], before)
+        with self.assertRaises(AttributeError):
+            buf.read()
+
+    def test_context_gc(self):
+        self.ctx.gc_mode = 'context_gc'
+        gc.collect()
+        self.ctx.gc()
+        before = self.ctx.memory_info()['objects']
+        for _ in range(10):
+            self.ctx.buffer(reserve=16)
+        gc.collect()
+        self.assertEqual(self.ctx.memory_info()['objects'], before)
+        self.assertEqual(self.ctx.gc(), 10)
+        self.assertEqual(self.ctx.gc(), 0)
+
+    def test_released_objects_are_not_collected(self):
+        self.ctx.gc_mode = 'context_gc'
+        buf = self.ctx.buffer(reserve=16)
+        buf.release()
+        del buf
+        self.assertEqual(self.ctx.gc(), 0)
+
+    def test_vertex_array_keeps_buffers(self):
+        self.ctx.gc_mode = 'context_gc'
+        gc.collect()
+        self.ctx.gc()
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                in vec2 in_vert;
+                out vec2 out_vert;
+                void main() {
+                    out_vert = in_vert;
+                }
+            ''',
+            varyings=['out_vert'],
+        )
+        vao = self.ctx.simple_vertex_array(prog, self.ctx.buffer(reserve=16), 'in_vert')
+        gc.collect()
+        self.assertEqual(self.ctx.gc(), 0)
+
+        del vao
+        gc.collect()
+        self.assertGreaterEqual(self.ctx.gc(), 2)
+
+    def test_scope_keeps_objects(self):
+        self.ctx.gc_mode = 'context_gc'
+        gc.collect()
+        self.ctx.gc()
+        scope = self.ctx.scope(
+            self.ctx.simple_framebuffer((4, 4)),
+            textures=[(self.ctx.texture((4, 4), 4), 0)],
+            uniform_buffers=[(self.ctx.buffer(reserve=16), 0)],
+            samplers=[(self.ctx.sampler(), 1)],
+        )
+        gc.collect()
+        self.assertEqual(self.ctx.gc(), 0)
+
+        del scope
+        gc.collect()
+        self.assertGreaterEqual(self.ctx.gc(), 4)
+
+    def test_invalid_gc_mode(self):
+        with self.assertRaises(ValueError):
+            self.ctx.gc_mode = 'manual'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+import moderngl
+import numpy as np
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+        cls.prog = cls.ctx.program(
+            vertex_shader='''
+                #version 330
+                in float in_x;
+                void main() {
+                    gl_Position = vec4(in_x, 0.0, 0.0, 1.0);
+                }
+            ''',
+            fragment_shader='''
+                #version 330
+                out vec4 color;
+                void main() {
+                    color = vec4(1.0, 1.0, 1.0, 1.0);
+                }
+            ''',
+        )
+        cls.vbo = cls.ctx.buffer(np.array([-0.75, -0.25, 0.25, 0.75], dtype='f4').tobytes())
+        cls.fbo = cls.ctx.simple_framebuffer((4, 1), components=1)
+
+    def render(self, vao, *args, **kwargs):
+        self.fbo.use()
+        self.fbo.clear()
+        vao.render_multi(*args, **kwargs)
+        return self.fbo.read(components=1)
+
+    def test_render_multi(self):
+        vao = self.ctx.vertex_array(self.prog, [(self.vbo, 'f', 'in_x')])
+        firsts = np.array([0, 2], dtype='i4')
+        counts = np.array([1, 2], dtype='i4')
+        self.assertEqual(self.render(vao, firsts, counts, moderngl.POINTS), b'\xff\x00\xff\xff')
+        self.assertEqual(self.render(vao, [1], [1], moderngl.POINTS), b'\x00\xff\x00\x00')
+
+    def test_render_multi_indexed(self):
+        ibo = self.ctx.buffer(np.array([3, 0, 1, 0], dtype='i4').tobytes())
+        vao = self.ctx.vertex_array(self.prog, [(self.vbo, 'f', 'in_x')], ibo)
+        self.assertEqual(self.render(vao, [0, 2], [1, 1], moderngl.POINTS), b'\x00\xff\x00\xff')
+        self.assertEqual(self.render(vao, [1], [1], moderngl.POINTS, base_vertices=[2]), b'\x00\x00\xff\x00')
+
+    def test_render_multi_errors(self):
+        vao = self.ctx.vertex_array(self.prog, [(self.vbo, 'f', 'in_x')])
+        with self.assertRaises(moderngl.Error):
+            vao.render_multi([0, 1], [1], moderngl.POINTS)
+        with self.assertRaises(moderngl.Error):
+            vao.render_multi([0], [1], moderngl.POINTS, base_vertices=[1])
+
+    def test_render_indirect_count(self):
+        if self.ctx.version_code < 460:
+            self.skipTest('OpenGL 4.6 is not supported')
+
+        vao = self.ctx.vertex_array(self.prog, [(self.vbo, 'f', 'in_x')])
+        commands = self.ctx.buffer(moderngl.indirect_commands([(1, 1, 3), (1, 1, 0), (1, 1, 1)], indexed=False))
+        count = self.ctx.buffer(np.array([0, 2], dtype='i4').tobytes())
+        self.fbo.use()
+        self.fbo.clear()
+        vao.render_indirect_count(commands, count, moderngl.POINTS, count_offset=4)
+        self.assertEqual(self.fbo.read(components=1), b'\xff\x00\x00\xff')
+
+    def test_indirect_commands(self):
+        commands = np.zeros(2, dtype=[('count', 'u4'), ('first', 'u4'), ('base_vertex', 'i4')])
+        commands['count'] = [3, 6]
+        commands['first'] = [0, 3]
+        commands['base_vertex'] = [0, 10]
+        expected = np.array([[3, 1, 0, 0, 0], [6, 1, 3, 10, 0]], dtype='u4').tobytes()
+        self.assertEqual(moderngl.indirect_commands(commands), expected)
+        self.assertEqual(moderngl.indirect_commands([(3,), (6, 1, 3, 10)]), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import sys
+import unittest
+
+import moderngl
+from common import StateCacheMixin, get_context
+
+
+class TestCase(StateCacheMixin, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def test_scope_applies_only_the_difference(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+        fbo.use()
+        self.ctx.enable_only(moderngl.DEPTH_TEST)
+
+        scope = self.ctx.scope(fbo, moderngl.DEPTH_TEST)
+
+        self.ctx.reset_state_stats()
+        with scope:
+            pass
+
+        self.assertEqual(self.ctx.state_stats['issued'], 0)
+
+        scope = self.ctx.scope(fbo, moderngl.BLEND)
+
+        self.ctx.reset_state_stats()
+        with scope:
+            pass
+
+        self.assertEqual(self.ctx.state_stats['issued'], 2)
+
+    def test_scope_render_state(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+        fbo.use()
+        self.ctx.cull_face = 'back'
+        self.ctx.depth_func = '<'
+
+        scope = self.ctx.scope(
+            fbo,
+            moderngl.DEPTH_TEST | moderngl.CULL_FACE,
+            blend_func=(moderngl.ONE, moderngl.ONE),
+            depth_func='>=',
+            cull_face='front',
+            viewport=(0, 0, 2, 2),
+            color_mask=(True, False, False, True),
+            depth_mask=False,
+        )
+
+        with scope:
+            self.assertEqual(self.ctx.cull_face, 'front')
+            self.assertEqual(self.ctx.mglo.depth_func, '>=')
+            self.assertEqual(self.ctx.mglo.blend_func, (moderngl.ONE, moderngl.ONE))
+
+        self.assertEqual(self.ctx.cull_face, 'back')
+        self.assertEqual(self.ctx.mglo.depth_func, '<')
+        self.assertEqual(fbo.viewport, (0, 0, 4, 4))
+
+        fbo.clear(1.0, 0.0, 0.0, 1.0)
+        self.assertEqual(fbo.read(components=4), b'\xff\x00\x00\xff' * 16)
+
+    def test_scope_textures_and_samplers(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+        textures = [self.ctx.texture((1, 1), 4, bytes([i] * 4)) for i in range(4)]
+        sampler = self.ctx.sampler(texture=textures[0])
+        fbo.use()
+
+        scope = self.ctx.scope(
+            fbo,
+            moderngl.NOTHING,
+            textures=[(tex, unit) for unit, tex in enumerate(textures) if unit],
+            samplers=[(sampler, 0)],
+        )
+
+        self.ctx.enable_only(moderngl.NOTHING)
+
+        with scope:
+            pass
+
+        self.ctx.reset_state_stats()
+        with scope:
+            pass
+
+        self.assertEqual(self.ctx.state_stats['issued'], 0)
+
+        refcount = sys.getrefcount(fbo.mglo)
+        with self.assertRaises(moderngl.Error):
+            self.ctx.mglo.scope(fbo.mglo, None, (), (), (), ((textures[0].mglo, 0),), None, None, None, None, None, None, None, 0xFFFFFFFF)
+
+        self.assertEqual(sys.getrefcount(fbo.mglo), refcount)
+
+    def test_scope_invalid_state(self):
+        fbo = self.ctx.simple_framebuffer((4, 4))
+
+        with self.assertRaises(moderngl.Error):
+            self.ctx.scope(fbo, cull_face='left')
+
+        with self.assertRaises(moderngl.Error):
+            self.ctx.scope(fbo, depth_func='<>')
+
+        with self.assertRaises(moderngl.Error):
+            self.ctx.cull_face = 'left'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import struct
+import unittest
+
+import moderngl
+from common import StateCacheMixin, get_context
+
+
+class TestCase(StateCacheMixin, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+        cls.prog = cls.ctx.program(
+            vertex_shader='''
+                #version 330
+                in float in_value;
+                out float out_value;
+                void main() {
+                    out_value = in_value + 1.0;
+                }
+            ''',
+            varyings=['out_value'],
+        )
+
+    def test_skip_bound_program_and_vertex_array(self):
+        vbo = self.ctx.buffer(struct.pack('2f', 1.0, 2.0))
+        res = self.ctx.buffer(reserve=8)
+        vao = self.ctx.simple_vertex_array(self.prog, vbo, 'in_value')
+
+        vao.transform(res, moderngl.POINTS)
+        self.ctx.reset_state_stats()
+        vao.transform(res, moderngl.POINTS)
+        self.assertEqual(self.ctx.state_stats['issued'], 0)
+        self.assertEqual(self.ctx.state_stats['skipped'], 2)
+
+        self.ctx.invalidate_state()
+        self.ctx.reset_state_stats()
+        vao.transform(res, moderngl.POINTS)
+        self.assertEqual(self.ctx.state_stats['issued'], 2)
+        self.assertEqual(struct.unpack('2f', res.read()), (2.0, 3.0))
+
+    def test_disabled_cache(self):
+        vbo = self.ctx.buffer(struct.pack('2f', 1.0, 2.0))
+        res = self.ctx.buffer(reserve=8)
+        vao = self.ctx.simple_vertex_array(self.prog, vbo, 'in_value')
+
+        self.ctx.state_cache = False
+        vao.transform(res, moderngl.POINTS)
+        self.ctx.reset_state_stats()
+        vao.transform(res, moderngl.POINTS)
+        self.assertEqual(self.ctx.state_stats, {'issued': 2, 'skipped': 0})
+
+    def test_texture_bindings(self):
+        tex1 = self.ctx.texture((1, 1), 4, b'\x01\x02\x03\x04')
+        tex2 = self.ctx.texture((1, 1), 4, b'\x05\x06\x07\x08')
+
+        tex1.use(0)
+        self.ctx.reset_state_stats()
+        tex1.use(0)
+        self.assertEqual(self.ctx.state_stats, {'issued': 0, 'skipped': 2})
+
+        tex2.use(0)
+        self.assertEqual(self.ctx.state_stats['issued'], 1)
+
+        tex1.release()
+        tex3 = self.ctx.texture((1, 1), 4, b'\x09\x0a\x0b\x0c')
+        self.assertEqual(tex3.read(), b'\x09\x0a\x0b\x0c')
+
+    def test_replay_forgets_render_state(self):
+        self.ctx.depth_func = '<'
+
+        with self.ctx.recorder:
+            self.ctx.depth_func = '>'
+
+        bytecode = self.ctx.recorder.dump()
+        self.ctx.depth_func = '<'
+        self.ctx.replay(bytecode)
+
+        self.ctx.reset_state_stats()
+        self.ctx.depth_func = '<'
+        self.assertEqual(self.ctx.state_stats, {'issued': 1, 'skipped': 0})
+
+        self.ctx.depth_func = '<'
+        self.assertEqual(self.ctx.state_stats, {'issued': 1, 'skipped': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
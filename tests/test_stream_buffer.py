@@ -0,0 +1,91 @@
+import struct
+import unittest
+
+import moderngl
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def setUp(self):
+        if self.ctx.version_code < 440:
+            self.skipTest('OpenGL 4.4 is not supported')
+
+    def test_write(self):
+        stream = self.ctx.stream_buffer(16, frames=2, alignment=4)
+        self.assertEqual(stream.buffer.size, 32)
+        self.assertEqual(stream.write(b'abc'), 0)
+        self.assertEqual(stream.write(b'xyz'), 4)
+        self.assertEqual(stream.buffer.read(3, offset=4), b'xyz')
+        stream.release()
+
+    def test_next_frame(self):
+        stream = self.ctx.stream_buffer(16, frames=2, alignment=4)
+        offsets = []
+        for _ in range(5):
+            offsets.append(stream.write(b'1234'))
+            stream.next_frame()
+        self.assertEqual(offsets, [0, 16, 0, 16, 0])
+        self.assertEqual(stream.frame, 1)
+        self.assertEqual(stream.used, 0)
+        stream.release()
+
+    def test_frame_full(self):
+        stream = self.ctx.stream_buffer(8, frames=2, alignment=4)
+        stream.write(b'12345')
+        with self.assertRaises(moderngl.Error):
+            stream.write(b'1234')
+        stream.release()
+
+    def test_write_while_draw_pending(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                uniform int loops;
+                in float in_value;
+                out float out_value;
+                void main() {
+                    // Keeps the draw busy so that it is still pending when the data is overwritten.
+                    float value = in_value;
+                    for (int i = 0; i < loops; ++i) {
+                        value = sqrt(value * value);
+                    }
+                    out_value = value * 2.0;
+                }
+            ''',
+            varyings=['out_value'],
+        )
+        prog['loops'].value = 64
+
+        values = [float(i % 1024) for i in range(1 << 16)]
+        fmt = '%df' % len(values)
+        size = len(values) * 4
+
+        stream = self.ctx.stream_buffer(size, frames=2, alignment=4)
+        res = self.ctx.buffer(reserve=size)
+        vao = self.ctx.vertex_array(prog, [(stream.buffer, 'f', 'in_value')])
+
+        offset = stream.write(struct.pack(fmt, *values))
+        vao.transform(res, moderngl.POINTS, len(values), first=offset // 4)
+
+        # The second frame does not overlap the pending draw, the third one waits for its fence.
+        for _ in range(2):
+            stream.next_frame()
+            stream.write(bytes(size))
+
+        self.assertEqual(struct.unpack(fmt, res.read()), tuple(x * 2.0 for x in values))
+        stream.release()
+
+    def test_orphan(self):
+        stream = self.ctx.stream_buffer(8)
+        with self.assertRaises(moderngl.Error):
+            stream.buffer.orphan()
+        stream.release()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import gc
+import struct
+import unittest
+import weakref
+
+import moderngl
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+        cls.prog = cls.ctx.program(
+            vertex_shader='''
+                #version 330
+                in vec2 in_vert;
+                in float in_value;
+                out float out_value;
+                void main() {
+                    out_value = in_vert.x + in_value;
+                }
+            ''',
+            varyings=['out_value'],
+        )
+
+    def test_detect_format(self):
+        fmt = moderngl.detect_format(self.prog, ['in_vert', 'in_value'])
+        self.assertEqual(fmt, '2f 1f')
+        self.assertIs(moderngl.detect_format(self.prog, ('in_vert', 'in_value')), fmt)
+
+    def test_cached_vertex_array(self):
+        vbo = self.ctx.buffer(struct.pack('3f', 1.0, 2.0, 3.0))
+        vao1 = self.ctx.vertex_array(self.prog, [(vbo, '2f 1f', 'in_vert', 'in_value')], cache=True)
+        vao2 = self.ctx.vertex_array(self.prog, [(vbo, '2f 1f', 'in_vert', 'in_value')], cache=True)
+        vao3 = self.ctx.vertex_array(self.prog, [(vbo, '2f 1f', 'in_vert', 'in_value')])
+        self.assertIs(vao1, vao2)
+        self.assertIsNot(vao1, vao3)
+
+        vao4 = self.ctx.simple_vertex_array(self.prog, vbo, 'in_vert', 'in_value', cache=True)
+        self.assertIs(vao1, vao4)
+
+        vao1.release()
+        vao5 = self.ctx.vertex_array(self.prog, [(vbo, '2f 1f', 'in_vert', 'in_value')], cache=True)
+        self.assertIsNot(vao1, vao5)
+
+    def test_cache_drops_released_buffers(self):
+        vbo = self.ctx.buffer(struct.pack('3f', 1.0, 2.0, 3.0))
+        vao = self.ctx.vertex_array(self.prog, [(vbo, '2f 1f', 'in_vert', 'in_value')], cache=True)
+        count = len(self.ctx._vertex_arrays)
+
+        del vao, vbo
+        gc.collect()
+        self.assertEqual(len(self.ctx._vertex_arrays), count - 1)
+
+    def test_cache_does_not_keep_vertex_array(self):
+        vbo = self.ctx.buffer(struct.pack('3f', 1.0, 2.0, 3.0))
+        vao = self.ctx.vertex_array(self.prog, [(vbo, '2f 1f', 'in_vert', 'in_value')], cache=True)
+        count = len(self.ctx._vertex_arrays)
+        ref = weakref.ref(vao)
+
+        del vao
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(len(self.ctx._vertex_arrays), count - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from moderngl import vertex_compression
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.positions = rng.uniform(-10.0, 10.0, (256, 3))
+        self.normals = rng.normal(size=(256, 3))
+        self.normals /= np.linalg.norm(self.normals, axis=1, keepdims=True)
+        self.tangents = np.c_[rng.normal(size=(256, 3)), np.where(rng.uniform(size=256) < 0.5, -1.0, 1.0)]
+        self.uvs = rng.uniform(0.0, 4.0, (256, 2))
+
+    def test_positions(self):
+        data, fmt, offset, scale = vertex_compression.encode_positions(self.positions)
+        self.assertEqual((data.dtype, data.shape, fmt), (np.dtype('u2'), (256, 4), '3nu2 2x'))
+        decoded = vertex_compression.decode_positions(data, offset, scale)
+        self.assertLess(np.abs(decoded - self.positions).max(), 20.0 / 65535.0)
+
+    def test_normals(self):
+        data, fmt = vertex_compression.encode_normals(self.normals)
+        self.assertEqual((data.dtype, data.shape, fmt), (np.dtype('i2'), (256, 2), '2ni2'))
+        decoded = vertex_compression.decode_normals(data)
+        self.assertLess(np.abs(decoded - self.normals).max(), 1e-3)
+
+        axes = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, -1.0], [1.0, 0.0, 0.0], [0.0, -1.0, 0.0]])
+        np.testing.assert_almost_equal(vertex_compression.decode_normals(vertex_compression.encode_normals(axes)[0]), axes)
+
+    def test_tangents(self):
+        data, fmt = vertex_compression.encode_tangents(self.tangents)
+        self.assertEqual((data.dtype, data.shape, fmt), (np.dtype('u4'), (256,), '4ni10'))
+        decoded = vertex_compression.decode_tangents(data)
+        np.testing.assert_equal(decoded[:, 3], self.tangents[:, 3])
+
+        directions = self.tangents[:, :3] / np.linalg.norm(self.tangents[:, :3], axis=1, keepdims=True)
+        self.assertLess(np.abs(decoded[:, :3] - directions).max(), 4.0 / 511.0)
+
+    def test_uvs_and_colors(self):
+        data, fmt, offset, scale = vertex_compression.encode_uvs(self.uvs)
+        self.assertEqual((data.shape, fmt), ((256, 2), '2nu2'))
+        self.assertLess(np.abs(vertex_compression.decode_uvs(data, offset, scale) - self.uvs).max(), 4.0 / 65535.0)
+
+        data, fmt = vertex_compression.encode_colors([[1.0, 0.5, 2.0], [-1.0, 0.0, 0.25]])
+        self.assertEqual(fmt, '3f11')
+        np.testing.assert_equal(vertex_compression.decode_colors(data), [[1.0, 0.5, 2.0], [0.0, 0.0, 0.25]])
+
+    def test_negative_zero_colors(self):
+        data, fmt = vertex_compression.encode_colors([[-0.0, 0.0, 1.0]])
+        np.testing.assert_equal(vertex_compression.decode_colors(data), [[0.0, 0.0, 1.0]])
+
+    def test_report(self):
+        report = vertex_compression.compression_report(normals=self.normals, tangents=self.tangents)
+        self.assertEqual(sorted(report), ['normals', 'tangents'])
+        self.assertEqual((report['normals']['size'], report['normals']['original_size']), (4, 12))
+        self.assertEqual((report['tangents']['size'], report['tangents']['original_size']), (4, 16))
+        self.assertLess(report['normals']['max_error'], 0.1)
+        self.assertLess(report['tangents']['max_error'], 0.5)
+        self.assertLessEqual(report['tangents']['mean_error'], report['tangents']['max_error'])
+
+        with self.assertRaises(ValueError):
+            vertex_compression.compression_report(positions=self.uvs)
+
+
+if __name__ == '__main__':
+    unittest.main()
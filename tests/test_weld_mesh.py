@@ -0,0 +1,43 @@
+import struct
+import unittest
+
+import moderngl
+import numpy as np
+
+from common import get_context
+from moderngl import mesh_optimizer
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+        cls.prog = cls.ctx.program(
+            vertex_shader='''
+                #version 330
+                in vec2 in_vert;
+                in float in_value;
+                out float out_value;
+                void main() {
+                    out_value = in_vert.x + in_vert.y * 10.0 + in_value * 100.0;
+                }
+            ''',
+            varyings=['out_value'],
+        )
+
+    def test_weld_mesh(self):
+        quad = [(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 0, 1), (1, 1, 1), (0, 1, 1)]
+        data = b''.join(struct.pack('2f1f', *vertex) for vertex in quad)
+
+        vbo, ibo, vao = mesh_optimizer.weld_mesh(self.ctx, self.prog, data, '2f 1f', 'in_vert', 'in_value')
+        self.assertEqual((vbo.size, ibo.size, vao.vertices), (4 * 12, 6, 6))
+
+        res = self.ctx.buffer(reserve=24)
+        vao.transform(res, moderngl.TRIANGLES)
+        values = sorted(np.frombuffer(res.read(), dtype='f4').tolist())
+        self.assertEqual(values, sorted(x + y * 10.0 + v * 100.0 for x, y, v in quad))
+
+
+if __name__ == '__main__':
+    unittest.main()